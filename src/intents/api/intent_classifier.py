@@ -1,5 +1,5 @@
 import logging
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 
 # Import normalizer from trainings directory
 import sys
@@ -11,7 +11,9 @@ print("✅ normalization.normalizer imported from intent_classifier")
 
 # Import our modular services
 from .rasa_service import RasaService
+from .request_parsing import parse_classify_batch, parse_sender_id, parse_validate
 from ..core.orchestrator import IntentOrchestrator
+from ..config.settings import CLASSIFY_BATCH_MAX_ITEMS
 
 
 # Setup logging
@@ -43,19 +45,10 @@ def classify_route():
     try:
         data = request.get_json(force=True)
         text = (data.get("text") or "").strip()
-        sender_id = (data.get("sender_id") or "intent_classifier").strip() or "intent_classifier"
-        validate = data.get("validate", False)
-        
-        # Normalize validate parameter: accept both boolean and string values
-        if isinstance(validate, str):
-            if validate.lower() == "true":
-                validate = True
-            elif validate.lower() == "false":
-                validate = False
-            elif validate.lower() != "force":
-                return jsonify({"error": "validate must be false, true, force, or their string equivalents"}), 400
-        elif validate not in [False, True, "force"]:
-            return jsonify({"error": "validate must be false, true, force, or their string equivalents"}), 400
+        sender_id = parse_sender_id(data.get("sender_id"))
+        validate, error = parse_validate(data.get("validate", False))
+        if error:
+            return jsonify({"error": error}), 400
         
         if not text:
             return jsonify({"error": "text required"}), 400
@@ -84,6 +77,31 @@ def classify_route():
         }), 500
 
 
+@app.route("/classify/batch", methods=["POST"])
+def classify_batch_route():
+    """Classify many utterances: {"items": [{"text", "sender_id"}], "validate"}.
+
+    Results come back in item order; items of one sender are applied to
+    slot memory in order, as if sent one by one to /classify.
+    """
+    try:
+        data = request.get_json(force=True)
+        batch, error = parse_classify_batch(data, CLASSIFY_BATCH_MAX_ITEMS)
+        if error:
+            return jsonify({"error": error}), 400
+
+        results = orchestrator.classify_batch(batch["items"], batch["validate"])
+        return jsonify({
+            "success": all(result["success"] for result in results),
+            "count": len(results),
+            "results": results,
+        })
+
+    except Exception as e:
+        logger.exception("Batch classification failed")
+        return jsonify({"success": False, "error": str(e), "results": []}), 500
+
+
 @app.route("/", methods=["POST"])
 def rasa_api():
     """Main Rasa API entrypoint."""
@@ -95,6 +113,15 @@ def rasa_api():
     return _resp(status_code, result)
 
 
+@app.route("/train/<job_id>", methods=["GET"])
+def training_job_status(job_id):
+    """Status of a background training job (any worker)"""
+    job = rasa_service.get_training_job(job_id)
+    if job is None:
+        return jsonify({"error": f"Unknown training job '{job_id}'."}), 404
+    return jsonify(job)
+
+
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint"""
@@ -104,6 +131,16 @@ def health():
     })
 
 
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Rasa parse latency histograms and LLM validation counters (Prometheus text format)"""
+    return Response(
+        rasa_service.parse_runner.render_prometheus()
+        + orchestrator.validator.render_prometheus(),
+        mimetype="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 def _resp(code, body):
     return jsonify(body), code
 
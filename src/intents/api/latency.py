@@ -0,0 +1,93 @@
+"""
+Latency histograms for the intent classifier's /metrics.
+
+Same histogram as luma/metrics.py (LatencyHistogram): Prometheus-style
+cumulative buckets plus a sliding window of recent samples for p50/p95/p99.
+It cannot be imported from there: the intent classifier image is built from
+src/intents alone and does not contain the luma package. Keep the bucket,
+quantile and rendering logic of the two in step.
+
+Usage:
+    histogram = LatencyHistogram()
+    histogram.observe(0.012)
+    lines = []
+    render_histogram(lines, "rasa_parse_duration_seconds", "Duration of parses.", histogram.snapshot())
+"""
+import math
+import threading
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+# Upper bounds in seconds (Prometheus "le" labels); +Inf is implicit
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """Thread-safe latency histogram with a sliding quantile window."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, window: int = 2048):
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_counts = [0] * len(self.buckets)
+        self._samples = deque(maxlen=window)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        with self._lock:
+            self._count += 1
+            self._sum += seconds
+            self._samples.append(seconds)
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    self._bucket_counts[index] += 1
+                    break
+
+    def snapshot(self) -> Dict[str, Any]:
+        """{"count", "sum", "buckets": [(le, cumulative count)], "quantiles": {q: seconds}}"""
+        with self._lock:
+            count = self._count
+            total = self._sum
+            bucket_counts = list(self._bucket_counts)
+            samples = sorted(self._samples)
+
+        cumulative: List[Tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets, bucket_counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+
+        quantiles = {}
+        if samples:
+            for q in QUANTILES:
+                # Nearest-rank quantile over the recent window
+                rank = max(math.ceil(q * len(samples)) - 1, 0)
+                quantiles[q] = samples[rank]
+
+        return {"count": count, "sum": total, "buckets": cumulative, "quantiles": quantiles}
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != float("inf") else "+Inf"
+
+
+def render_histogram(lines: List[str], name: str, help_text: str, snap: Dict[str, Any]) -> None:
+    """Append one histogram snapshot and its quantile summary in the Prometheus text format."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for bound, count in snap["buckets"]:
+        lines.append(f'{name}_bucket{{le="{_format_value(bound)}"}} {count}')
+    lines.append(f'{name}_bucket{{le="+Inf"}} {snap["count"]}')
+    lines.append(f"{name}_sum {_format_value(snap['sum'])}")
+    lines.append(f"{name}_count {snap['count']}")
+
+    quantile_name = f"{name}_quantile"
+    lines.append(f"# HELP {quantile_name} {help_text[:-1]} (p50/p95/p99 over recent samples).")
+    lines.append(f"# TYPE {quantile_name} gauge")
+    for q, seconds in snap["quantiles"].items():
+        lines.append(f'{quantile_name}{{quantile="{q}"}} {_format_value(seconds)}')
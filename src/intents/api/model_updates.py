@@ -0,0 +1,254 @@
+"""
+Background training jobs and cross-worker model updates for RasaService.
+
+Training used to run inside the /train request (blocking it for up to five
+minutes) and then replace the agent of the one worker that served it.
+Now:
+
+* TrainingJobStore keeps one JSON status file per job in a directory on the
+  shared model volume, so any gunicorn worker can answer GET /train/<job_id>.
+* Jobs run in the worker that queued them and die with it (recycled, killed
+  on timeout, OOM). JobHeartbeat refreshes heartbeat_at of a worker's
+  queued and running jobs; a job whose heartbeat is older than stale_after
+  is marked failed when it is read and when a worker starts.
+* After a job has trained, loaded and warmed the new model, publish_model
+  writes the model path to a marker file next to the models.
+* ModelWatcher polls that marker in every worker and hands a new path to a
+  callback that loads, warms and swaps the agent. No worker retrains and
+  parses keep running on the old agent until the swap.
+
+Files are written to a temporary name and moved into place with os.replace,
+so readers never see a partial file.
+"""
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Atomically replace path with data as JSON."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+class TrainingJobStore:
+    """Training job status files shared by all workers."""
+
+    def __init__(self, directory: Path, stale_after: float = 120.0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.stale_after = stale_after
+        self._lock = threading.Lock()
+
+    def _path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def create(self, intent: str, examples_count: int) -> Dict[str, Any]:
+        """Record a new queued job, owned by this worker, and return it."""
+        now = time.time()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": JOB_QUEUED,
+            "intent": intent,
+            "examples": examples_count,
+            "model_path": None,
+            "error": None,
+            "worker_pid": os.getpid(),
+            "created_at": now,
+            "heartbeat_at": now,
+            "started_at": None,
+            "finished_at": None,
+        }
+        with self._lock:
+            _write_json(self._path(job["job_id"]), job)
+        return job
+
+    def update(self, job_id: str, **fields: Any) -> Dict[str, Any]:
+        """Merge fields into the job and return it."""
+        with self._lock:
+            job = _read_json(self._path(job_id)) or {"job_id": job_id}
+            job.update(fields)
+            _write_json(self._path(job_id), job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The job's status, or None for an unknown id."""
+        # Ids are uuid4 hex; anything else cannot name a job file
+        if not job_id or not job_id.isalnum():
+            return None
+        job = _read_json(self._path(job_id))
+        if job is not None and self._is_stale(job):
+            job = self._fail_stale(job)
+        return job
+
+    def heartbeat(self, job_ids: Iterable[str]) -> None:
+        """Mark the jobs as still owned by a live worker."""
+        now = time.time()
+        for job_id in job_ids:
+            self.update(job_id, heartbeat_at=now)
+
+    def fail_stale_jobs(self) -> int:
+        """Mark queued or running jobs whose worker stopped as failed; returns how many."""
+        failed = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                job = _read_json(path)
+            except (OSError, ValueError):
+                logger.warning("Unreadable training job file %s", path)
+                continue
+            if job is not None and self._is_stale(job):
+                self._fail_stale(job)
+                failed += 1
+        return failed
+
+    def _is_stale(self, job: Dict[str, Any]) -> bool:
+        if job.get("status") not in (JOB_QUEUED, JOB_RUNNING):
+            return False
+        last_seen = job.get("heartbeat_at")
+        if last_seen is None:
+            last_seen = job.get("created_at") or 0
+        return time.time() - last_seen > self.stale_after
+
+    def _fail_stale(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        logger.warning("Training job %s lost its worker (pid %s)", job["job_id"], job.get("worker_pid"))
+        return self.update(
+            job["job_id"],
+            status=JOB_FAILED,
+            error="Training worker stopped before the job finished",
+            finished_at=time.time(),
+        )
+
+
+class JobHeartbeat:
+    """Daemon thread refreshing the heartbeat of this worker's unfinished jobs."""
+
+    def __init__(self, store: TrainingJobStore, interval: float = 30.0):
+        self.store = store
+        self.interval = interval
+        self._job_ids: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, job_id: str) -> None:
+        with self._lock:
+            self._job_ids.add(job_id)
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._job_ids.discard(job_id)
+
+    def beat(self) -> None:
+        with self._lock:
+            job_ids = list(self._job_ids)
+        try:
+            self.store.heartbeat(job_ids)
+        except (OSError, ValueError):
+            logger.exception("Failed to refresh training job heartbeats")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.beat()
+
+    def start(self) -> "JobHeartbeat":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="rasa-job-heartbeat", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def publish_model(marker_path: Path, model_path: str) -> None:
+    """Tell every worker that model_path is the current model."""
+    _write_json(Path(marker_path), {"model_path": str(model_path), "published_at": time.time()})
+
+
+def read_published_model(marker_path: Path) -> Optional[str]:
+    """Model path last passed to publish_model, or None."""
+    try:
+        data = _read_json(Path(marker_path))
+    except (OSError, ValueError):
+        logger.warning("Unreadable model marker %s", marker_path)
+        return None
+    return (data or {}).get("model_path")
+
+
+class ModelWatcher:
+    """Daemon thread calling on_change(model_path) when the published model changes."""
+
+    def __init__(
+        self,
+        marker_path: Path,
+        current_model: Callable[[], Optional[str]],
+        on_change: Callable[[str], Any],
+        interval: float = 5.0,
+    ):
+        self.marker_path = Path(marker_path)
+        self.current_model = current_model
+        self.on_change = on_change
+        self.interval = interval
+        self._failed: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> bool:
+        """Hand a newly published model to on_change; True if it was taken."""
+        model_path = read_published_model(self.marker_path)
+        if (
+            not model_path
+            or model_path == self.current_model()
+            or model_path == self._failed
+            or not os.path.exists(model_path)
+        ):
+            return False
+        try:
+            self.on_change(model_path)
+        except Exception:
+            # Not retried until another model is published
+            logger.exception("Failed to switch to published model %s", model_path)
+            self._failed = model_path
+            return False
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> "ModelWatcher":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="rasa-model-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
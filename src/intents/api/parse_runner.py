@@ -0,0 +1,133 @@
+"""
+Persistent event loops for Rasa parses.
+
+RasaService.parse_text_sync used to create a new asyncio event loop for
+every /classify and predict call, run one agent.parse_message on it and
+throw it away. ParseRunner keeps a fixed pool of parse threads instead,
+each with its own long-lived event loop, so a parse is just a submit.
+
+At most `concurrency` parses run at once; further callers queue for a free
+thread. Every parse records how long it waited for a thread and how long it
+ran in latency histograms (api/latency.py, served by /metrics).
+
+Usage:
+    runner = ParseRunner(concurrency=4, timeout=30)
+    nlu = runner.run(agent.parse_message, "add 2 bags of rice")
+    runner.render_prometheus()
+"""
+import asyncio
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .latency import LatencyHistogram, render_histogram
+
+class ParseRunner:
+    """Runs coroutines on a fixed pool of threads with long-lived event loops."""
+
+    def __init__(self, concurrency: int = 4, timeout: Optional[float] = None, window: int = 2048):
+        self.concurrency = max(1, int(concurrency))
+        self.timeout = timeout
+        self.wait_seconds = LatencyHistogram(window=window)
+        self.parse_seconds = LatencyHistogram(window=window)
+        self._local = threading.local()
+        self._loops: List[asyncio.AbstractEventLoop] = []
+        self._loops_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency,
+            thread_name_prefix="rasa-parse",
+            initializer=self._start_loop,
+        )
+
+    def _start_loop(self) -> None:
+        """Give the current parse thread its event loop (once, on thread start)."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._local.loop = loop
+        with self._loops_lock:
+            self._loops.append(loop)
+
+    def _run_in_thread(self, submitted: float, coro_fn: Callable[..., Awaitable], args: tuple) -> Any:
+        started = time.perf_counter()
+        self.wait_seconds.observe(started - submitted)
+        try:
+            return self._local.loop.run_until_complete(coro_fn(*args))
+        finally:
+            self.parse_seconds.observe(time.perf_counter() - started)
+
+    def run(self, coro_fn: Callable[..., Awaitable], *args: Any) -> Any:
+        """
+        Await coro_fn(*args) on a parse thread and return its result.
+
+        Blocks until a parse thread is free and the coroutine finishes.
+
+        Raises:
+            concurrent.futures.TimeoutError: no result within `timeout` seconds
+                (a parse still queued is dropped; one already running
+                finishes on its thread)
+        """
+        future = self._executor.submit(self._run_in_thread, time.perf_counter(), coro_fn, args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def map(self, coro_fn: Callable[..., Awaitable], args_list: List[tuple]) -> List[Tuple[Any, Optional[Exception]]]:
+        """
+        Await coro_fn(*args) for every args in args_list, up to `concurrency` at once.
+
+        Returns:
+            (result, None) or (None, error) per args, in input order. Each
+            call gets `timeout` seconds per round of `concurrency` calls.
+        """
+        submitted = time.perf_counter()
+        futures = [
+            self._executor.submit(self._run_in_thread, submitted, coro_fn, tuple(args))
+            for args in args_list
+        ]
+        deadline = None
+        if self.timeout is not None:
+            rounds = math.ceil(len(futures) / self.concurrency)
+            deadline = submitted + self.timeout * max(rounds, 1)
+
+        results: List[Tuple[Any, Optional[Exception]]] = []
+        for future in futures:
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            try:
+                results.append((future.result(timeout=remaining), None))
+            except Exception as e:
+                # Nobody waits for a timed-out parse: drop it if still queued
+                future.cancel()
+                results.append((None, e))
+        return results
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """{"wait": snapshot, "parse": snapshot}"""
+        return {"wait": self.wait_seconds.snapshot(), "parse": self.parse_seconds.snapshot()}
+
+    def render_prometheus(self) -> str:
+        """Render the wait and parse histograms in the Prometheus text format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        render_histogram(
+            lines, "rasa_parse_wait_seconds",
+            "Time Rasa parses waited for a free parse thread.", snapshot["wait"])
+        render_histogram(
+            lines, "rasa_parse_duration_seconds",
+            "Duration of Rasa agent.parse_message calls.", snapshot["parse"])
+        lines.append("# HELP rasa_parse_concurrency Maximum concurrent Rasa parses.")
+        lines.append("# TYPE rasa_parse_concurrency gauge")
+        lines.append(f"rasa_parse_concurrency {self.concurrency}")
+        return "\n".join(lines) + "\n"
+
+    def shutdown(self) -> None:
+        """Wait for running parses, stop the threads and close their loops."""
+        self._executor.shutdown(wait=True)
+        with self._loops_lock:
+            loops, self._loops = self._loops, []
+        for loop in loops:
+            loop.close()
+
@@ -3,10 +3,11 @@ Rasa NLU Service - Pure Rasa functionality
 """
 import os
 import sys
-import asyncio
 import logging
 import shutil
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from filelock import FileLock, Timeout as FileLockTimeout
@@ -23,6 +24,24 @@ from rasa.core.agent import Agent
 sys.path.insert(0, str(Path(__file__).parent.parent / "trainings"))
 import normalization.normalizer  # Ensures it's registered
 
+from .parse_runner import ParseRunner
+from .model_updates import (
+    JOB_FAILED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    JobHeartbeat,
+    ModelWatcher,
+    TrainingJobStore,
+    publish_model,
+)
+from ..config.settings import (
+    RASA_JOB_HEARTBEAT_SECONDS,
+    RASA_JOB_STALE_SECONDS,
+    RASA_MODEL_POLL_SECONDS,
+    RASA_PARSE_CONCURRENCY,
+    RASA_PARSE_TIMEOUT,
+)
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
@@ -35,6 +54,12 @@ Path(os.environ["MPLCONFIGDIR"]).mkdir(parents=True, exist_ok=True)
 BASE_DIR = Path("/app/storage")
 MODEL_DIR = BASE_DIR
 NLU_DATA_FILE = BASE_DIR / "nlu_data.yml"
+# Shared by all workers: training job status files and the current model
+TRAINING_JOBS_DIR = BASE_DIR / "training_jobs"
+MODEL_MARKER_FILE = MODEL_DIR / "current_model.json"
+
+# Parsed once by a freshly loaded agent before it serves requests
+WARMUP_TEXT = "hello"
 
 # Trainings directory lives under the intents package alongside this file
 _TRAININGS_DIR = Path(__file__).resolve().parent.parent / "trainings"
@@ -90,7 +115,22 @@ class RasaService:
     
     def __init__(self):
         self.agent = None
+        self.model_path = None
+        self.parse_runner = ParseRunner(RASA_PARSE_CONCURRENCY, RASA_PARSE_TIMEOUT)
+        self.training_jobs = TrainingJobStore(TRAINING_JOBS_DIR, RASA_JOB_STALE_SECONDS)
+        # Jobs of a worker that was recycled or killed would stay "running" forever
+        stale_jobs = self.training_jobs.fail_stale_jobs()
+        if stale_jobs:
+            logger.warning(f"⚠️ Marked {stale_jobs} training job(s) of stopped workers as failed")
+        self.job_heartbeat = JobHeartbeat(self.training_jobs, RASA_JOB_HEARTBEAT_SECONDS).start()
+        # One training job at a time per worker (FileLock serializes workers)
+        self._train_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rasa-train-job")
+        self._swap_lock = threading.Lock()
         self.initialize()
+        # Pick up models trained by other workers
+        self.model_watcher = ModelWatcher(
+            MODEL_MARKER_FILE, lambda: self.model_path, self.swap_agent, RASA_MODEL_POLL_SECONDS
+        ).start()
     
     def initialize(self):
         """Initialize the Rasa service by loading or training a model."""
@@ -145,17 +185,44 @@ class RasaService:
             if model_path:
                 _global_agent = Agent.load(model_path)
                 self.agent = _global_agent
+                self.model_path = str(model_path)
                 return True
             logger.warning("No model path found.")
         except Exception as e:
             logger.error(f"Failed to load global agent: {e}")
         _global_agent = None
         self.agent = None
+        self.model_path = None
         return False
 
+    def swap_agent(self, model_path):
+        """Load and warm model_path, then atomically replace the serving agent.
+
+        Parses that already hold the old agent finish on it.
+        """
+        global _global_agent
+        logger.info(f"🔄 Loading model for hot swap: {model_path}")
+        agent = Agent.load(model_path)
+        # First parse pays for lazy component setup; keep it off live requests
+        self.parse_runner.run(agent.parse_message, WARMUP_TEXT)
+        with self._swap_lock:
+            _global_agent = agent
+            self.agent = agent
+            self.model_path = str(model_path)
+        logger.info(f"✅ Now serving model: {model_path}")
+
     def reload_agent(self):
-        """Reload the global agent after training."""
-        return self.load_agent()
+        """Swap in the latest model without interrupting parses."""
+        try:
+            model_path = get_latest_model(str(MODEL_DIR))
+            if not model_path:
+                logger.warning("No model path found.")
+                return False
+            self.swap_agent(model_path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to reload agent: {e}")
+            return False
 
     def get_agent(self):
         """Return the loaded agent or try to load one."""
@@ -304,72 +371,92 @@ class RasaService:
         return await agent.parse_message(text)
 
     def parse_text_sync(self, text):
-        """Run async parse_text in sync context (for Flask)."""
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            return loop.run_until_complete(self.parse_text_async(text))
-        finally:
-            asyncio.set_event_loop(None)
+        """Run async parse_text on a persistent parse loop (for Flask)."""
+        return self.parse_runner.run(self.parse_text_async, text)
 
     def train_intent(self, intent, examples):
-        """Train a new intent with examples."""
+        """Queue training of a new intent; poll get_training_job for the result."""
+        try:
+            job = self.training_jobs.create(intent, len(examples))
+            self.job_heartbeat.add(job["job_id"])
+            self._train_executor.submit(self._run_training_job, job["job_id"], intent, examples)
+            logger.info(f"📥 Queued training job {job['job_id']} for intent '{intent}'")
+            return {"ok": True, "job_id": job["job_id"], "status": job["status"]}
+        except Exception as e:
+            logger.exception("Failed to queue training.")
+            return {"error": f"Training failed: {str(e)}"}
+
+    def get_training_job(self, job_id):
+        """Status of a training job queued by any worker, or None."""
+        return self.training_jobs.get(job_id)
+
+    def _run_training_job(self, job_id, intent, examples):
+        """Train, load and warm the new model, swap it in and tell the other workers."""
+        self.training_jobs.update(job_id, status=JOB_RUNNING, started_at=time.time())
         try:
-            self.append_to_training_file(intent, examples)
+            # Cross-process lock: the NLU file and the training run are shared
+            with FileLock(TRAIN_LOCK_FILE, timeout=900):
+                logger.info(f"🔒 Acquired training lock (job {job_id}).")
+                self.append_to_training_file(intent, examples)
 
-            # Ensure multiple intents exist
-            if NLU_DATA_FILE.exists():
+                # Ensure multiple intents exist
                 data = load_data(str(NLU_DATA_FILE))
                 unique_intents = set(ex.get("intent") for ex in data.training_examples if ex.get("intent"))
                 if len(unique_intents) <= 1:
                     self.append_to_training_file("goodbye", ["bye", "goodbye", "see you later"])
 
-            # Cross-process lock to serialize training from API calls too
-            train_lock = FileLock(TRAIN_LOCK_FILE, timeout=900)
-            training_completed = threading.Event()
-            training_result = [None]
-            training_exception = [None]
-
-            def training_worker():
-                logger.info("📦 Background training thread started...")
-                try:
-                    with train_lock:
-                        logger.info("🔒 Acquired training lock (API).")
-                        result = self.train_model_with_lock()
-                        training_result[0] = result
-                        logger.info("📦 Background training completed.")
-                except FileLockTimeout:
-                    logger.error("⏳ Could not acquire training lock (API) in time.")
-                    training_exception[0] = RuntimeError("Training lock timeout")
-                except Exception as e:
-                    logger.exception("❌ Training failed.")
-                    training_exception[0] = e
-                finally:
-                    training_completed.set()
-
-            t = threading.Thread(target=training_worker, name="rasa-train-api-thread", daemon=True)
-            t.start()
-
-            if training_completed.wait(timeout=300):
-                if training_exception[0]:
-                    raise training_exception[0]
-                model_path = training_result[0]
-                self.reload_agent()
-                return {"ok": True, "model_path": model_path}
-            else:
-                logger.error("Training timed out after 5 minutes")
-                return {"error": "Training timed out after 5 minutes"}
+                model_path = self.train_model_with_lock()
+            if not model_path:
+                raise RuntimeError("Training produced no model")
 
+            self.swap_agent(model_path)
+            publish_model(MODEL_MARKER_FILE, model_path)
+            self.training_jobs.update(
+                job_id, status=JOB_SUCCEEDED, model_path=str(model_path), finished_at=time.time()
+            )
+            logger.info(f"📦 Training job {job_id} completed: {model_path}")
+        except FileLockTimeout:
+            logger.error(f"⏳ Could not acquire training lock in time (job {job_id}).")
+            self.training_jobs.update(
+                job_id, status=JOB_FAILED, error="Training lock timeout", finished_at=time.time()
+            )
         except Exception as e:
-            logger.exception("Training failed.")
-            return {"error": f"Training failed: {str(e)}"}
+            logger.exception(f"❌ Training job {job_id} failed.")
+            self.training_jobs.update(
+                job_id, status=JOB_FAILED, error=f"Training failed: {str(e)}", finished_at=time.time()
+            )
+        finally:
+            self.job_heartbeat.discard(job_id)
 
     def predict(self, text, sender_id="anonymous"):
         """Predict intent and entities for given text with slot support."""
         try:
             # Parse with local NLU model
             nlu = self.parse_text_sync(text)
-            
+        except Exception as e:
+            logger.exception("Prediction failed.")
+            return {"error": f"Prediction error: {str(e)}"}
+        return self._predict_from_nlu(text, nlu, sender_id)
+
+    def predict_batch(self, items):
+        """Predict many (text, sender_id) pairs.
+
+        Parses run concurrently on the parse threads; slot memory is then
+        updated in input order, so each sender's turns apply in sequence.
+        """
+        parsed = self.parse_runner.map(self.parse_text_async, [(text,) for text, _ in items])
+        results = []
+        for (text, sender_id), (nlu, error) in zip(items, parsed):
+            if error is not None:
+                logger.error(f"Prediction failed for '{text}': {error!r}")
+                results.append({"error": f"Prediction error: {str(error)}"})
+            else:
+                results.append(self._predict_from_nlu(text, nlu, sender_id))
+        return results
+
+    def _predict_from_nlu(self, text, nlu, sender_id):
+        """Build the prediction for a parsed text and update the sender's slots."""
+        try:
             # Get entities and intent from Rasa result
             entities = nlu.get("entities") or []
             intent = nlu.get("intent", {}).get("name") if nlu.get("intent") else None
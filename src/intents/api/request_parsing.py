@@ -0,0 +1,67 @@
+"""
+Request body parsing for the intent classifier API.
+
+Kept free of Flask and Rasa so the rules can be tested on their own.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_SENDER_ID = "intent_classifier"
+
+VALIDATE_ERROR = "validate must be false, true, force, or their string equivalents"
+
+
+def parse_validate(value: Any) -> Tuple[Any, Optional[str]]:
+    """
+    Normalize the validate parameter: accept both boolean and string values.
+
+    Returns:
+        (validate, None) or (None, error message)
+    """
+    if isinstance(value, str):
+        if value.lower() == "true":
+            return True, None
+        if value.lower() == "false":
+            return False, None
+        if value.lower() != "force":
+            return None, VALIDATE_ERROR
+        return value, None
+    if value not in [False, True, "force"]:
+        return None, VALIDATE_ERROR
+    return value, None
+
+
+def parse_sender_id(value: Any) -> str:
+    return (value or DEFAULT_SENDER_ID).strip() or DEFAULT_SENDER_ID
+
+
+def parse_classify_batch(data: Any, max_items: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Validate a /classify/batch body: {"items": [{"text", "sender_id"?}], "validate"?}.
+
+    Returns:
+        ({"items": [{"text", "sender_id"}], "validate": ...}, None) or (None, error message)
+    """
+    if not isinstance(data, dict):
+        return None, "request body must be a JSON object"
+    raw_items = data.get("items")
+    if not isinstance(raw_items, list) or not raw_items:
+        return None, "items must be a non-empty list"
+    if len(raw_items) > max_items:
+        return None, f"items must contain at most {max_items} entries"
+
+    validate, error = parse_validate(data.get("validate", False))
+    if error:
+        return None, error
+
+    items: List[Dict[str, str]] = []
+    for index, raw in enumerate(raw_items):
+        if not isinstance(raw, dict):
+            return None, f"items[{index}] must be an object"
+        text = raw.get("text")
+        if not isinstance(text, str) or not text.strip():
+            return None, f"items[{index}].text required"
+        sender_id = raw.get("sender_id")
+        if sender_id is not None and not isinstance(sender_id, str):
+            return None, f"items[{index}].sender_id must be a string"
+        items.append({"text": text.strip(), "sender_id": parse_sender_id(sender_id)})
+    return {"items": items, "validate": validate}, None
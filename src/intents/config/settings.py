@@ -13,8 +13,33 @@ FALLBACK_THRESHOLD = 1  # >= medium considered sufficient
 # Rasa confidence threshold for avoiding LLM fallback
 RASA_CONFIDENCE_THRESHOLD = 0.85
 
+# Concurrent LLM validation calls in a grouped (batch) request
+LLM_VALIDATION_CONCURRENCY = int(os.getenv("LLM_VALIDATION_CONCURRENCY", "8"))
+
+# LLM validation answers cache (entries, seconds) and timeouts: per LLM call,
+# and overall for the validations of one batch request
+LLM_VALIDATION_CACHE_SIZE = int(os.getenv("LLM_VALIDATION_CACHE_SIZE", "1024"))
+LLM_VALIDATION_CACHE_TTL = float(os.getenv("LLM_VALIDATION_CACHE_TTL", "3600"))
+LLM_VALIDATION_TIMEOUT = float(os.getenv("LLM_VALIDATION_TIMEOUT", "20"))
+LLM_VALIDATION_BUDGET = float(os.getenv("LLM_VALIDATION_BUDGET", "60"))
+
 # API settings
 PORT = int(os.getenv("INTENT_CLASSIFIER_PORT", "9000"))
+
+# Rasa parse threads (each keeps its own event loop) and per-parse timeout
+RASA_PARSE_CONCURRENCY = int(os.getenv("RASA_PARSE_CONCURRENCY", "4"))
+RASA_PARSE_TIMEOUT = float(os.getenv("RASA_PARSE_TIMEOUT", "30"))
+
+# Maximum items in one /classify/batch request
+CLASSIFY_BATCH_MAX_ITEMS = int(os.getenv("CLASSIFY_BATCH_MAX_ITEMS", "500"))
+
+# How often each worker checks for a model trained by another worker
+RASA_MODEL_POLL_SECONDS = float(os.getenv("RASA_MODEL_POLL_SECONDS", "5"))
+
+# Training jobs refresh a heartbeat while their worker lives; a queued or
+# running job without one for RASA_JOB_STALE_SECONDS is reported as failed
+RASA_JOB_HEARTBEAT_SECONDS = float(os.getenv("RASA_JOB_HEARTBEAT_SECONDS", "15"))
+RASA_JOB_STALE_SECONDS = float(os.getenv("RASA_JOB_STALE_SECONDS", "90"))
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
 
@@ -0,0 +1,262 @@
+"""
+LLM validation of extracted actions, with a response cache.
+
+IntentOrchestrator asks the LLM to confirm or correct the actions Rasa
+extracted for low-confidence (or routed) utterances. Every call used to be
+a blocking ChatOpenAI.invoke, and the same utterance was revalidated every
+time it came back. LLMValidator wraps the structured-output LLM with:
+
+* a bounded LRU cache (with optional TTL) keyed on the normalized text, the
+  extracted actions, the domain and the slots the prompt shows the LLM
+  (e.g. last_mentioned_product, which resolves "add it"). The conversation
+  turn counter is left out: it changes on every message, so keying on it
+  would make every request a miss;
+* request coalescing: identical requests that arrive while one is in
+  flight wait for its answer instead of calling the LLM again;
+* an async path (validate_many / avalidate_many) that runs a batch
+  concurrently under a semaphore and an overall timeout budget. A request
+  that fails or runs out of budget returns None, and the caller keeps the
+  original actions (fail-open).
+
+Only successful answers are cached. The LLM only needs invoke(messages) and
+ainvoke(messages) returning an object with .actions (items with .dict()),
+so tests can pass a local fake.
+"""
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Slots that change on every message and don't affect the answer
+UNKEYED_SLOTS = frozenset({"conversation_turn"})
+
+
+@dataclass
+class ValidationRequest:
+    """One validation: the cache key parts and the LLM messages."""
+    text: str
+    actions: List[dict]
+    domain: str
+    messages: List[dict]
+    slots: Dict[str, Any] = field(default_factory=dict)
+
+    def cache_key(self) -> Tuple[str, str, str, str]:
+        text = _WHITESPACE_RE.sub(" ", self.text).strip().lower()
+        actions = json.dumps(self.actions, sort_keys=True, default=str)
+        slots = json.dumps(
+            {k: v for k, v in self.slots.items() if k not in UNKEYED_SLOTS},
+            sort_keys=True, default=str)
+        return text, actions, self.domain, slots
+
+
+def _result_actions(result: Any) -> List[dict]:
+    return [a.dict() for a in result.actions]
+
+
+class LLMValidator:
+    """Cached, coalesced LLM validation (thread-safe; async path per call)."""
+
+    def __init__(
+        self,
+        llm: Any,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        concurrency: int = 8,
+        budget: Optional[float] = None,
+    ):
+        self.llm = llm
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.concurrency = max(1, int(concurrency))
+        self.budget = budget
+        # cache key -> (stored at, validated actions)
+        self._cache: "OrderedDict[Tuple[str, str, str, str], Tuple[float, List[dict]]]" = OrderedDict()
+        # cache key -> answer of the call in flight
+        self._in_flight: Dict[Tuple[str, str, str, str], Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    # --- cache ---
+
+    def _cached(self, key) -> Optional[List[dict]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, actions = entry
+        if self.cache_ttl is not None and time.monotonic() - stored_at > self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return actions
+
+    def _store(self, key, actions: List[dict]) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = (time.monotonic(), actions)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _claim(self, key) -> Tuple[Optional[List[dict]], Optional[Future], bool]:
+        """(cached actions, future to wait on or fill, True if this caller calls the LLM)"""
+        with self._lock:
+            cached = self._cached(key)
+            if cached is not None:
+                self.hits += 1
+                return cached, None, False
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future, False
+            self.misses += 1
+            future = Future()
+            # A running future cannot be cancelled by a waiter giving up
+            future.set_running_or_notify_cancel()
+            self._in_flight[key] = future
+            return None, future, True
+
+    def _settle(self, key, future: Future, actions: Optional[List[dict]], error: Optional[BaseException]) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if error is None:
+                self._store(key, actions)
+            else:
+                self.failures += 1
+        if error is None:
+            future.set_result(actions)
+        else:
+            future.set_exception(error)
+
+    @staticmethod
+    def _copy(actions: List[dict]) -> List[dict]:
+        # Callers get their own dicts; the cached answer stays untouched
+        return [dict(a) for a in actions]
+
+    # --- sync path ---
+
+    def validate(self, request: ValidationRequest) -> Optional[List[dict]]:
+        """Validated actions for request, or None if the LLM call failed."""
+        key = request.cache_key()
+        cached, future, leader = self._claim(key)
+        if cached is not None:
+            return self._copy(cached)
+        if not leader:
+            try:
+                return self._copy(future.result(timeout=self.budget))
+            except Exception:
+                return None
+
+        try:
+            actions = _result_actions(self.llm.invoke(request.messages))
+        except Exception as e:
+            logger.exception("LLM validation failed")
+            self._settle(key, future, None, e)
+            return None
+        except BaseException:
+            self._settle(key, future, None, RuntimeError("LLM validation interrupted"))
+            raise
+        self._settle(key, future, actions, None)
+        return self._copy(actions)
+
+    def validate_many(self, requests: Sequence[ValidationRequest]) -> List[Optional[List[dict]]]:
+        """validate for many requests, run concurrently on the async path."""
+        if not requests:
+            return []
+        return asyncio.run(self.avalidate_many(requests))
+
+    # --- async path ---
+
+    async def avalidate(self, request: ValidationRequest) -> Optional[List[dict]]:
+        """Async validate (the LLM's ainvoke); None if the call failed."""
+        key = request.cache_key()
+        cached, future, leader = self._claim(key)
+        if cached is not None:
+            return self._copy(cached)
+        if not leader:
+            try:
+                return self._copy(await asyncio.wrap_future(future))
+            except Exception:
+                return None
+
+        try:
+            actions = _result_actions(await self.llm.ainvoke(request.messages))
+        except Exception as e:
+            logger.exception("LLM validation failed")
+            self._settle(key, future, None, e)
+            return None
+        except BaseException:
+            # Cancelled when the budget runs out: release the waiters too
+            self._settle(key, future, None, RuntimeError("LLM validation interrupted"))
+            raise
+        self._settle(key, future, actions, None)
+        return self._copy(actions)
+
+    async def avalidate_many(
+        self, requests: Sequence[ValidationRequest], budget: Optional[float] = None
+    ) -> List[Optional[List[dict]]]:
+        """
+        Validate requests concurrently (at most `concurrency` LLM calls at once).
+
+        Requests still running when `budget` seconds (default: self.budget)
+        have passed are cancelled and return None.
+        """
+        budget = self.budget if budget is None else budget
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(request: ValidationRequest) -> Optional[List[dict]]:
+            async with semaphore:
+                return await self.avalidate(request)
+
+        tasks = [asyncio.ensure_future(bounded(request)) for request in requests]
+        if not tasks:
+            return []
+        done, pending = await asyncio.wait(tasks, timeout=budget)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning("LLM validation budget of %ss ran out for %d of %d requests",
+                           budget, len(pending), len(tasks))
+            await asyncio.gather(*pending, return_exceptions=True)
+        return [task.result() if task in done else None for task in tasks]
+
+    # --- stats ---
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "failures": self.failures,
+            }
+
+    def render_prometheus(self) -> str:
+        """Cache counters in the Prometheus text format."""
+        stats = self.stats()
+        lines = [
+            "# HELP llm_validation_requests_total LLM validation requests by outcome.",
+            "# TYPE llm_validation_requests_total counter",
+        ]
+        for outcome in ("hits", "misses", "coalesced"):
+            lines.append(f'llm_validation_requests_total{{outcome="{outcome}"}} {stats[outcome]}')
+        lines.append("# HELP llm_validation_failures_total Failed LLM validation calls.")
+        lines.append("# TYPE llm_validation_failures_total counter")
+        lines.append(f"llm_validation_failures_total {stats['failures']}")
+        lines.append("# HELP llm_validation_cache_size Cached LLM validation answers.")
+        lines.append("# TYPE llm_validation_cache_size gauge")
+        lines.append(f"llm_validation_cache_size {stats['size']}")
+        return "\n".join(lines) + "\n"
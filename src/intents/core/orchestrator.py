@@ -1,12 +1,21 @@
 """
 Intent Orchestrator - Business logic and LLM validation
 """
+import copy
 import logging
 from typing import Dict, Any, List
 
 from .prompts import validator_prompt
 from .models import ValidationResult, Action
-from ..config.settings import RASA_CONFIDENCE_THRESHOLD
+from .llm_validation import LLMValidator, ValidationRequest
+from ..config.settings import (
+    LLM_VALIDATION_BUDGET,
+    LLM_VALIDATION_CACHE_SIZE,
+    LLM_VALIDATION_CACHE_TTL,
+    LLM_VALIDATION_CONCURRENCY,
+    LLM_VALIDATION_TIMEOUT,
+    RASA_CONFIDENCE_THRESHOLD,
+)
 from langchain_openai import ChatOpenAI
 
 logger = logging.getLogger(__name__)
@@ -17,7 +26,17 @@ class IntentOrchestrator:
 
     def __init__(self, rasa_service):
         self.rasa_service = rasa_service
-        self.llm = ChatOpenAI(model="gpt-4o", temperature=0).with_structured_output(ValidationResult)
+        self.llm = ChatOpenAI(
+            model="gpt-4o", temperature=0, timeout=LLM_VALIDATION_TIMEOUT
+        ).with_structured_output(ValidationResult)
+        # Cached, coalesced validation calls
+        self.validator = LLMValidator(
+            self.llm,
+            cache_size=LLM_VALIDATION_CACHE_SIZE,
+            cache_ttl=LLM_VALIDATION_CACHE_TTL,
+            concurrency=LLM_VALIDATION_CONCURRENCY,
+            budget=LLM_VALIDATION_BUDGET,
+        )
         # Simple in-memory slot storage
         self._slot_memory = {}
 
@@ -66,240 +85,276 @@ class IntentOrchestrator:
         except Exception:
             return 0.0
 
-    def _maybe_validate_actions(self, text: str, actions: list, validate: bool, nlu: dict, slots: dict) -> list:
-        """Optionally validate actions with LLM if confidence below threshold."""
-        if not validate:
-            return actions
-        score = self._get_confidence_score(nlu)
-        if score >= RASA_CONFIDENCE_THRESHOLD:
-            return actions
-        try:
-            # Infer domain and allowed attributes for guidance
-            entities = (nlu or {}).get("entities", []) or []
-            domain, allowed_attrs = self._infer_domain_and_allowed_attributes(entities, actions)
-            messages = [
-                {"role": "system", "content": validator_prompt()},
-                {
-                    "role": "user",
-                    "content": (
-                        f'User said: "{text}"\n'
-                        f'Rasa extracted: {actions}\n'
-                        f'Slots: {slots}\n'
-                        f'Domain: {domain}\n'
-                        f'Allowed attributes for this domain: {allowed_attrs}\n'
-                        'If a candidate attribute is not in the allowed list, omit it.\n'
-                        'Is this mapping correct? If not, return corrected actions.'
-                    )
-                },
-            ]
-            result = self.llm.invoke(messages)
-            return [a.dict() for a in result.actions]
-        except Exception:
-            # Fail-open: keep original actions
-            return actions
-
-    def _validate_actions_with_llm(self, text: str, actions: list, slots: dict) -> list:
-        """Validate actions with LLM (always performs validation)."""
-        try:
-            # Attempt to infer domain from actions (with attributes) when available
-            domain, allowed_attrs = self._infer_domain_and_allowed_attributes([], actions)
-            messages = [
-                {"role": "system", "content": validator_prompt()},
-                {
-                    "role": "user",
-                    "content": (
-                        f'User said: "{text}"\n'
-                        f'Rasa extracted: {actions}\n'
-                        f'Slots: {slots}\n'
-                        f'Domain: {domain}\n'
-                        f'Allowed attributes for this domain: {allowed_attrs}\n'
-                        'If a candidate attribute is not in the allowed list, omit it.\n'
-                        'Is this mapping correct? If not, return corrected actions.'
-                    )
-                },
-            ]
-            result = self.llm.invoke(messages)
-            return [a.dict() for a in result.actions]
-        except Exception:
-            logger.exception("LLM validation failed")
-            return actions
+    def _validation_request(self, text: str, actions: list, slots: dict, entities: list) -> ValidationRequest:
+        """LLM validation asking to confirm or correct the extracted actions."""
+        # Infer domain and allowed attributes for guidance
+        domain, allowed_attrs = self._infer_domain_and_allowed_attributes(entities, actions)
+        messages = [
+            {"role": "system", "content": validator_prompt()},
+            {
+                "role": "user",
+                "content": (
+                    f'User said: "{text}"\n'
+                    f'Rasa extracted: {actions}\n'
+                    f'Slots: {slots}\n'
+                    f'Domain: {domain}\n'
+                    f'Allowed attributes for this domain: {allowed_attrs}\n'
+                    'If a candidate attribute is not in the allowed list, omit it.\n'
+                    'Is this mapping correct? If not, return corrected actions.'
+                )
+            },
+        ]
+        return ValidationRequest(text=text, actions=actions, domain=domain, messages=messages, slots=slots)
 
     def classify(self, text: str, sender_id: str = "intent_classifier", validate=False) -> Dict[str, Any]:
         """Classify intent with optional LLM validation"""
         try:
             rasa_result = self.rasa_service.predict(text, sender_id)
+            response, pending = self._begin_classification(text, sender_id, validate, rasa_result)
+            if response is not None:
+                return response
+            request = pending["plan"]["request"]
+            validated = self.validator.validate(request) if request is not None else None
+            return self._finish_classification(pending, validated)
+        except Exception as e:
+            logger.exception("Classification failed")
+            return self._classification_error(sender_id, validate, e)
 
-            if "error" in rasa_result:
-                return {
-                    "success": False,
-                    "error": rasa_result["error"],
-                    "result": {
-                        "source": "error",
-                        "sender_id": sender_id,
-                        "intent": "NONE",
-                        "confidence_score": 0.0,
-                        "actions": [],
-                        "slots": {},
-                        "validation_performed": False,
-                        "validation_mode": validate
-                    }
-                }
+    def classify_batch(self, items: List[Dict[str, str]], validate=False) -> List[Dict[str, Any]]:
+        """Classify many {"text", "sender_id"} items, same results as classify in order.
 
-            nlu = rasa_result.get("nlu", {})
-            intent = rasa_result.get("intent")
-            confidence_score = self._get_confidence_score(nlu)
+        Rasa parses run concurrently, slot memory is updated item by item in
+        input order (so each sender's turns apply in sequence) and all LLM
+        validations run concurrently within the LLM_VALIDATION_BUDGET.
+        """
+        results: List[Dict[str, Any]] = [None] * len(items)
+        predictions = self.rasa_service.predict_batch(
+            [(item["text"], item["sender_id"]) for item in items]
+        )
 
-            # Update slot memory BEFORE action parsing so action parser can use it
-            updated_slots = self._get_updated_slots(sender_id, intent, rasa_result.get("entities", []), text)
-            print(f"DEBUG: Orchestrator updated_slots: {updated_slots}")
-            
-            actions: List[dict] = []
-
-            # Handle modify_cart with mapper (now with slot memory available)
-            if intent and intent.upper() in ("MODIFY_CART", "SHOPPING_COMMAND"):
-                from .post_nlu_processor import map_rasa_to_actions
-                mapped = map_rasa_to_actions({"nlu": nlu, "slots": updated_slots, "text": text})
-                actions = [a.dict() if isinstance(a, Action) else a for a in mapped]
-
-            # Handle inquire_product (action + product)
-            elif intent and intent.upper() == "INQUIRE_PRODUCT":
-                entities = rasa_result.get("entities", [])
-                products = [e for e in entities if e.get("entity") == "product"]
-                variants = [e for e in entities if e.get("entity") == "variant"]
-                sizes = [e for e in entities if e.get("entity") == "size"]
-                colors = [e for e in entities if e.get("entity") == "color"]
-                fits = [e for e in entities if e.get("entity") == "fit"]
-                flavors = [e for e in entities if e.get("entity") == "flavor"]
-                diets = [e for e in entities if e.get("entity") == "diet"]
-                roasts = [e for e in entities if e.get("entity") == "roast"]
-                actions_ents = [e for e in entities if e.get("entity") == "action"]
-
-                # Deduplicate actions by action value
-                seen_actions = set()
-                
-                # Create actions for each product-action pair
-                for act in actions_ents:
-                    action_val = act.get("value")
-                    
-                    # Skip if we've already seen this action
-                    if action_val in seen_actions:
-                        continue
-                    seen_actions.add(action_val)
-                    
-                    # match with next product if available; attach a variant if present
-                    if products:
-                        product = products.pop(0).get("value")
-                        variant = variants.pop(0).get("value") if variants else None
-                        size = sizes.pop(0).get("value") if sizes else None
-                        color = colors.pop(0).get("value") if colors else None
-                        fit = fits.pop(0).get("value") if fits else None
-                        flavor = flavors.pop(0).get("value") if flavors else None
-                        diet = diets.pop(0).get("value") if diets else None
-                        roast = roasts.pop(0).get("value") if roasts else None
-                        action = {
-                            "action": action_val,
-                            "confidence": "high",
-                            "confidence_score": confidence_score,
-                            "product": product
-                        }
-                        # Build attributes map only
-                        attributes: dict[str, str] = {}
-                        for k, v in (
-                            ("variant", variant), ("size", size), ("color", color), ("fit", fit),
-                            ("flavor", flavor), ("diet", diet), ("roast", roast)
-                        ):
-                            if isinstance(v, str) and v.strip():
-                                attributes[k] = v
-                        if attributes:
-                            action["attributes"] = attributes
-                        actions.append(action)
-                    else:
-                        # If no explicit product, try to get from slot memory
-                        product_from_slots = updated_slots.get("last_mentioned_product") or updated_slots.get("last_inquired_product")
-                        if product_from_slots:
-                            action = {
-                                "action": action_val,
-                                "confidence": "high",
-                                "confidence_score": confidence_score,
-                                "product": product_from_slots
-                            }
-                            print(f"DEBUG: Using product from slot memory for inquire_product: {product_from_slots}")
-                        else:
-                            # If no product in slots either, create action without product field
-                            action = {
-                                "action": action_val,
-                                "confidence": "high",
-                                "confidence_score": confidence_score
-                            }
-                            print(f"DEBUG: No product available for inquire_product action")
-                        actions.append(action)
-
-            # Handle cart_action (action + container)
-            elif intent and intent.upper() == "CART_ACTION":
-                entities = rasa_result.get("entities", [])
-                containers = [e for e in entities if e.get("entity") == "container"]
-                actions_ents = [e for e in entities if e.get("entity") == "action"]
-
-                for act in actions_ents:
-                    action_val = act.get("value")
-                    # match with container if available
-                    container = containers[0].get("value") if containers else None
-                    actions.append({
-                        "action": action_val,
-                        "confidence": "high",
-                        "confidence_score": confidence_score,
-                        "container": container
-                    })
+        pending = []
+        for index, (item, rasa_result) in enumerate(zip(items, predictions)):
+            try:
+                response, state = self._begin_classification(
+                    item["text"], item["sender_id"], validate, rasa_result
+                )
+            except Exception as e:
+                logger.exception("Classification failed")
+                results[index] = self._classification_error(item["sender_id"], validate, e)
+                continue
+            if response is not None:
+                results[index] = response
+            else:
+                pending.append((index, state))
 
-            # Determine if we should route to LLM and handle routing/validation
-            actions, source, validation_performed = self._handle_routing_and_validation(
-                text, intent, confidence_score, actions, validate, nlu, updated_slots
-            )
+        to_validate = [(index, state) for index, state in pending if state["plan"]["request"] is not None]
+        validated = self.validator.validate_many([state["plan"]["request"] for _, state in to_validate])
+        validated_by_index = {index: result for (index, _), result in zip(to_validate, validated)}
 
-            # Reconcile slot memory using finalized actions so we don't store partials like "red"
-            updated_slots = self._update_slots_with_actions(updated_slots, intent or "", actions)
+        for index, state in pending:
+            try:
+                results[index] = self._finish_classification(state, validated_by_index.get(index))
+            except Exception as e:
+                logger.exception("Classification failed")
+                results[index] = self._classification_error(state["sender_id"], validate, e)
+        return results
 
-            
-            return {
-                "success": True,
-                "result": {
-                    "source": source,
-                    "sender_id": sender_id,
-                    "intent": intent,
-                    "confidence_score": confidence_score,
-                    "actions": actions,
-                    "slots": updated_slots,  # Use reconciled slots from final actions
-                    "validation_performed": validation_performed,
-                    "validation_mode": validate
-                }
-            }
+    def _begin_classification(self, text: str, sender_id: str, validate, rasa_result: Dict[str, Any]) -> tuple:
+        """Everything up to the LLM call: slot memory, action mapping and the validation plan.
 
-        except Exception as e:
-            logger.exception("Classification failed")
-            # Try to get existing slots even on error
-            try:
-                import sys
-                import os
-                sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-                from simple_slot_memory import slot_memory
-                existing_slots = slot_memory.get_slots(sender_id)
-            except:
-                existing_slots = {}
-            
+        Returns:
+            tuple: (error response, None) or (None, pending classification)
+        """
+        if "error" in rasa_result:
             return {
                 "success": False,
-                "error": str(e),
+                "error": rasa_result["error"],
                 "result": {
                     "source": "error",
                     "sender_id": sender_id,
                     "intent": "NONE",
                     "confidence_score": 0.0,
                     "actions": [],
-                    "slots": existing_slots,
+                    "slots": {},
                     "validation_performed": False,
                     "validation_mode": validate
                 }
+            }, None
+
+        nlu = rasa_result.get("nlu", {})
+        intent = rasa_result.get("intent")
+        confidence_score = self._get_confidence_score(nlu)
+
+        # Update slot memory BEFORE action parsing so action parser can use it.
+        # Deep copy: classify_batch finishes items after later turns of the same
+        # sender have updated the memory (e.g. its shopping_list)
+        updated_slots = copy.deepcopy(
+            self._get_updated_slots(sender_id, intent, rasa_result.get("entities", []), text)
+        )
+        print(f"DEBUG: Orchestrator updated_slots: {updated_slots}")
+        
+        actions: List[dict] = []
+
+        # Handle modify_cart with mapper (now with slot memory available)
+        if intent and intent.upper() in ("MODIFY_CART", "SHOPPING_COMMAND"):
+            from .post_nlu_processor import map_rasa_to_actions
+            mapped = map_rasa_to_actions({"nlu": nlu, "slots": updated_slots, "text": text})
+            actions = [a.dict() if isinstance(a, Action) else a for a in mapped]
+
+        # Handle inquire_product (action + product)
+        elif intent and intent.upper() == "INQUIRE_PRODUCT":
+            entities = rasa_result.get("entities", [])
+            products = [e for e in entities if e.get("entity") == "product"]
+            variants = [e for e in entities if e.get("entity") == "variant"]
+            sizes = [e for e in entities if e.get("entity") == "size"]
+            colors = [e for e in entities if e.get("entity") == "color"]
+            fits = [e for e in entities if e.get("entity") == "fit"]
+            flavors = [e for e in entities if e.get("entity") == "flavor"]
+            diets = [e for e in entities if e.get("entity") == "diet"]
+            roasts = [e for e in entities if e.get("entity") == "roast"]
+            actions_ents = [e for e in entities if e.get("entity") == "action"]
+
+            # Deduplicate actions by action value
+            seen_actions = set()
+            
+            # Create actions for each product-action pair
+            for act in actions_ents:
+                action_val = act.get("value")
+                
+                # Skip if we've already seen this action
+                if action_val in seen_actions:
+                    continue
+                seen_actions.add(action_val)
+                
+                # match with next product if available; attach a variant if present
+                if products:
+                    product = products.pop(0).get("value")
+                    variant = variants.pop(0).get("value") if variants else None
+                    size = sizes.pop(0).get("value") if sizes else None
+                    color = colors.pop(0).get("value") if colors else None
+                    fit = fits.pop(0).get("value") if fits else None
+                    flavor = flavors.pop(0).get("value") if flavors else None
+                    diet = diets.pop(0).get("value") if diets else None
+                    roast = roasts.pop(0).get("value") if roasts else None
+                    action = {
+                        "action": action_val,
+                        "confidence": "high",
+                        "confidence_score": confidence_score,
+                        "product": product
+                    }
+                    # Build attributes map only
+                    attributes: dict[str, str] = {}
+                    for k, v in (
+                        ("variant", variant), ("size", size), ("color", color), ("fit", fit),
+                        ("flavor", flavor), ("diet", diet), ("roast", roast)
+                    ):
+                        if isinstance(v, str) and v.strip():
+                            attributes[k] = v
+                    if attributes:
+                        action["attributes"] = attributes
+                    actions.append(action)
+                else:
+                    # If no explicit product, try to get from slot memory
+                    product_from_slots = updated_slots.get("last_mentioned_product") or updated_slots.get("last_inquired_product")
+                    if product_from_slots:
+                        action = {
+                            "action": action_val,
+                            "confidence": "high",
+                            "confidence_score": confidence_score,
+                            "product": product_from_slots
+                        }
+                        print(f"DEBUG: Using product from slot memory for inquire_product: {product_from_slots}")
+                    else:
+                        # If no product in slots either, create action without product field
+                        action = {
+                            "action": action_val,
+                            "confidence": "high",
+                            "confidence_score": confidence_score
+                        }
+                        print(f"DEBUG: No product available for inquire_product action")
+                    actions.append(action)
+
+        # Handle cart_action (action + container)
+        elif intent and intent.upper() == "CART_ACTION":
+            entities = rasa_result.get("entities", [])
+            containers = [e for e in entities if e.get("entity") == "container"]
+            actions_ents = [e for e in entities if e.get("entity") == "action"]
+
+            for act in actions_ents:
+                action_val = act.get("value")
+                # match with container if available
+                container = containers[0].get("value") if containers else None
+                actions.append({
+                    "action": action_val,
+                    "confidence": "high",
+                    "confidence_score": confidence_score,
+                    "container": container
+                })
+
+        # Decide routing/validation; the LLM call itself is made by the caller
+        plan = self._plan_routing_and_validation(
+            text, intent, confidence_score, actions, validate, nlu, updated_slots
+        )
+        return None, {
+            "sender_id": sender_id,
+            "validate": validate,
+            "intent": intent,
+            "confidence_score": confidence_score,
+            "actions": actions,
+            "slots": updated_slots,
+            "plan": plan,
+        }
+
+    def _finish_classification(self, pending: Dict[str, Any], validated) -> Dict[str, Any]:
+        """Apply the LLM result (None if not called or failed) and build the response."""
+        actions, source, validation_performed = self._apply_validation(
+            pending["plan"], pending["actions"], validated
+        )
+        intent = pending["intent"]
+
+        # Reconcile slot memory using finalized actions so we don't store partials like "red"
+        updated_slots = self._update_slots_with_actions(pending["slots"], intent or "", actions)
+
+        return {
+            "success": True,
+            "result": {
+                "source": source,
+                "sender_id": pending["sender_id"],
+                "intent": intent,
+                "confidence_score": pending["confidence_score"],
+                "actions": actions,
+                "slots": updated_slots,  # Use reconciled slots from final actions
+                "validation_performed": validation_performed,
+                "validation_mode": pending["validate"]
+            }
+        }
+
+    def _classification_error(self, sender_id: str, validate, error: Exception) -> Dict[str, Any]:
+        """Error response for a classification that raised."""
+        # Try to get existing slots even on error
+        try:
+            import sys
+            import os
+            sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+            from simple_slot_memory import slot_memory
+            existing_slots = slot_memory.get_slots(sender_id)
+        except:
+            existing_slots = {}
+
+        return {
+            "success": False,
+            "error": str(error),
+            "result": {
+                "source": "error",
+                "sender_id": sender_id,
+                "intent": "NONE",
+                "confidence_score": 0.0,
+                "actions": [],
+                "slots": existing_slots,
+                "validation_performed": False,
+                "validation_mode": validate
             }
+        }
 
     def handle_rasa_request(self, action: str, **kwargs) -> Dict[str, Any]:
         """Handle Rasa API requests (train, predict)"""
@@ -310,10 +365,11 @@ class IntentOrchestrator:
             if not intent or not examples:
                 return {"error": "Both 'intent' and 'examples' are required."}, 400
 
+            # Training runs in the background; poll GET /train/<job_id>
             result = self.rasa_service.train_intent(intent, examples)
             if "error" in result:
                 return result, 500
-            return result, 200
+            return result, 202
 
         elif action == "predict":
             text = kwargs.get("text", "").strip()
@@ -415,43 +471,59 @@ class IntentOrchestrator:
         text_lower = text.lower()
         return any(phrase in text_lower for phrase in contextual_phrases)
     
-    def _handle_routing_and_validation(self, text: str, intent: str, confidence_score: float, 
-                                     actions: List[dict], validate: bool, nlu: dict, slots: dict) -> tuple:
+    def _plan_routing_and_validation(self, text: str, intent: str, confidence_score: float,
+                                     actions: List[dict], validate: bool, nlu: dict, slots: dict) -> dict:
         """
-        Handle routing to LLM based on criteria and perform validation.
-        
+        Decide routing and validation without calling the LLM.
+
         Returns:
-            tuple: (updated_actions, source, validation_performed)
+            dict: {"source": str, "request": ValidationRequest or None,
+                   "always_performed": validation counts as performed even if
+                   the LLM keeps the actions}
         """
         # Check if we should route to LLM (pass validate parameter)
         route_result = self._should_route_to_llm(text, intent, confidence_score, actions, validate)
         
         if route_result["should_route"]:
             print(f"DEBUG: Routing to LLM - Reason: {route_result['reason']}")
-            updated_actions = self._validate_actions_with_llm(text, actions, slots)
-            source = f"llm_routed_{route_result['reason']}"
-            validation_performed = True
-            return updated_actions, source, validation_performed
-        else:
-            # Original validation logic (only for modify_cart when not routed)
-            validation_performed = False
-            source = "rasa"
-
-            if intent and intent.upper() == "MODIFY_CART":
-                if validate == "force":
-                    updated_actions = self._validate_actions_with_llm(text, actions, slots)
-                    validation_performed = True
-                    source = "rasa_force_validated"
-                elif validate is True:
-                    original_actions = actions.copy()
-                    updated_actions = self._maybe_validate_actions(text, actions, True, nlu, slots)
-                    validation_performed = (updated_actions != original_actions)
-                else:
-                    updated_actions = actions
-            else:
-                updated_actions = actions
+            return {
+                "source": f"llm_routed_{route_result['reason']}",
+                "request": self._validation_request(text, actions, slots, []),
+                "always_performed": True,
+            }
 
-            return updated_actions, source, validation_performed
+        # Original validation logic (only for modify_cart when not routed)
+        if intent and intent.upper() == "MODIFY_CART":
+            if validate == "force":
+                return {
+                    "source": "rasa_force_validated",
+                    "request": self._validation_request(text, actions, slots, []),
+                    "always_performed": True,
+                }
+            # Validate only below the Rasa confidence threshold
+            if validate is True and self._get_confidence_score(nlu) < RASA_CONFIDENCE_THRESHOLD:
+                entities = (nlu or {}).get("entities", []) or []
+                return {
+                    "source": "rasa",
+                    "request": self._validation_request(text, actions, slots, entities),
+                    "always_performed": False,
+                }
+
+        return {"source": "rasa", "request": None, "always_performed": False}
+
+    def _apply_validation(self, plan: dict, actions: List[dict], validated) -> tuple:
+        """
+        Combine a plan with its LLM result (None if not called or failed).
+
+        Returns:
+            tuple: (updated_actions, source, validation_performed)
+        """
+        if plan["request"] is None:
+            return actions, plan["source"], False
+        # Fail-open: keep original actions
+        updated_actions = validated if validated is not None else actions
+        validation_performed = plan["always_performed"] or updated_actions != actions
+        return updated_actions, plan["source"], validation_performed
     
     def _should_route_to_llm(self, text: str, intent: str, confidence_score: float, actions: List[dict], validate: bool = False) -> dict:
         """
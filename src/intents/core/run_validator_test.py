@@ -18,6 +18,7 @@ from intents.core.validator import (
     extract_quantities,
     extract_products,
     call_rasa_api,
+    call_rasa_api_batch,
     load_test_scenarios,
     setup_validator_logging,
     write_detailed_results_file,
@@ -68,11 +69,16 @@ def main():
     print(f"🧪 Running validation on {len(scenarios)} scenarios...\n")
     logger.info("Starting validation on %d scenarios", len(scenarios))
 
+    # Classify every scenario up front through /classify/batch
+    cases = [i for i, scenario in enumerate(scenarios, 1) if scenario.get("text", "").strip()]
+    responses = call_rasa_api_batch([scenarios[i - 1]["text"] for i in cases])
+    rasa_responses = dict(zip(cases, responses))
+
     for i, scenario in enumerate(scenarios, 1):
         text = scenario.get("text", "")
         expected_actions = scenario.get("expected_actions", [])
         
-        if not text:
+        if not text.strip():
             print(f"⚠️  Skipping scenario {i}: empty text")
             logger.warning("Skipping scenario %d: empty text", i)
             all_test_results.append({
@@ -88,7 +94,7 @@ def main():
             })
             continue
             
-        rasa_resp = call_rasa_api(text)
+        rasa_resp = rasa_responses.get(i)
         if not rasa_resp or not rasa_resp.get("success"):
             print(f"❌ API call failed for scenario {i}: {text}")
             logger.error("API call failed for scenario %d: %s", i, text)
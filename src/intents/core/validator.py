@@ -639,6 +639,29 @@ def call_rasa_api(text: str, api_url: str = "http://localhost:9000") -> Dict[str
         print(f"❌ API call failed: {e}")
         return None
 
+def call_rasa_api_batch(texts: List[str], api_url: str = "http://localhost:9000", batch_size: int = 100) -> List[Dict[str, Any]]:
+    """
+    Classify texts via /classify/batch; one response per text, None where a request failed.
+
+    Texts must be non-blank: /classify/batch rejects the whole chunk otherwise.
+    """
+    responses: List[Dict[str, Any]] = []
+    for start in range(0, len(texts), batch_size):
+        chunk = texts[start:start + batch_size]
+        try:
+            url = f"{api_url}/classify/batch"
+            payload = {
+                "items": [{"text": text, "sender_id": "validator_test"} for text in chunk],
+                "validate": False,
+            }
+            response = requests.post(url, json=payload, timeout=10 + len(chunk))
+            response.raise_for_status()
+            responses.extend(response.json()["results"])
+        except (requests.RequestException, json.JSONDecodeError, ValueError, KeyError) as e:
+            print(f"❌ Batch API call failed: {e}")
+            responses.extend([None] * len(chunk))
+    return responses
+
 # -------------------------------
 # Interactive Main
 # -------------------------------
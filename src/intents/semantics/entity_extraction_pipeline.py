@@ -28,6 +28,7 @@ sys.path.append(current_dir)
 
 from nlp_processor import (
     init_nlp_with_entities, 
+    build_entity_index,
     extract_entities_with_parameterization
 )
 from ner_inference import process_text
@@ -38,20 +39,29 @@ from llm_extractor import extract_cart_and_check_entities
 # Global model cache
 _nlp_model = None
 _entities_data = None
+_entity_index = None
 
 
 def get_cached_models(force_reload=False):
     """Get cached NLP model and entities data, loading them if not already cached."""
-    global _nlp_model, _entities_data
+    global _nlp_model, _entities_data, _entity_index
     
     if force_reload or _nlp_model is None or _entities_data is None:
         debug_print("[INFO] Loading NLP models (first time only)...")
         _nlp_model, _entities_data = init_nlp_with_entities()
+        # Catalog lookups for extract_entities, built with the models
+        _entity_index = build_entity_index(_entities_data)
         debug_print("[INFO] NLP models loaded and cached!")
     
     return _nlp_model, _entities_data
 
 
+def get_cached_entity_index():
+    """EntityIndex of the cached entities data (loads the models if needed)."""
+    get_cached_models()
+    return _entity_index
+
+
 def warmup_models():
     """Preload models to avoid first-request delay."""
     debug_print("[INFO] Warming up models...")
@@ -329,9 +339,10 @@ def extract_entities(sentence: str) -> Dict[str, Any]:
     try:
         # Step 1: Get cached NLP processor (loads only on first call)
         nlp, entities = get_cached_models()
+        entity_index = get_cached_entity_index()
         
         # Step 2: Extract entities and create parameterized sentence
-        nlp_result = extract_entities_with_parameterization(nlp, sentence, entities)
+        nlp_result = extract_entities_with_parameterization(nlp, sentence, entities, index=entity_index)
         extraction_result["nlp_entities"] = nlp_result
         extraction_result["parameterized_sentence"] = nlp_result.get("psentence", "")
         
@@ -9,6 +9,9 @@ from rapidfuzz import fuzz, process
 
 import re
 import unicodedata
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
 
 # ===== LOGGING CONFIGURATION =====
 # Set DEBUG_NLP=1 in environment to enable debug logs
@@ -19,6 +22,13 @@ def debug_print(*args, **kwargs):
     if DEBUG_ENABLED:
         print(*args, **kwargs)
 
+# ===== SPACY PIPELINE MODE =====
+# SPACY_PIPELINE_MODE=ruler_only drops components whose output is never read.
+# extract_entities() relies on POS tags, lemmas and statistical NER labels, so
+# only the dependency parser can be excluded here.
+SPACY_PIPELINE_MODE = os.environ.get("SPACY_PIPELINE_MODE", "full").lower()
+RULER_ONLY_EXCLUDE = ["parser"]
+
 def normalize_hyphens(text: str) -> str:
     """
     Normalize all dash-like characters to a simple hyphen and
@@ -96,7 +106,10 @@ def customize_tokenizer(nlp):
 
 
 def init_nlp_with_entities():
-    nlp = spacy.load("en_core_web_sm")
+    if SPACY_PIPELINE_MODE == "ruler_only":
+        nlp = spacy.load("en_core_web_sm", exclude=RULER_ONLY_EXCLUDE)
+    else:
+        nlp = spacy.load("en_core_web_sm")
     nlp.tokenizer = customize_tokenizer(nlp)
     entities = load_global_entities()
     patterns = build_entity_patterns(entities)
@@ -286,6 +299,72 @@ def build_global_synonym_map(entities):
 
     return synonym_map
 
+
+@dataclass(frozen=True)
+class EntityIndex:
+    """
+    Read-only lookups derived from the entity catalog.
+
+    Build it once per catalog with build_entity_index() and pass it to
+    extract_entities / extract_entities_with_parameterization, so a request
+    no longer rebuilds the maps from the whole catalog.
+    """
+    unit_map: Mapping[str, str]
+    variant_map: Mapping[str, str]
+    product_map: Mapping[str, str]
+    brand_map: Mapping[str, str]
+    noise_set: FrozenSet[str]
+    unambiguous_units: FrozenSet[str]
+    ambiguous_units: FrozenSet[str]
+    unambiguous_variants: FrozenSet[str]
+    ambiguous_variants: FrozenSet[str]
+    ambiguous_brands: FrozenSet[str]
+    # Terms classify_productbrands looks for after a productbrand
+    product_lex: FrozenSet[str]
+    unit_lex: FrozenSet[str]
+    synonym_map: Mapping[str, str]
+    # Context words for classify_ambiguous_units / classify_ambiguous_variants
+    brand_words: FrozenSet[str]
+    product_words: FrozenSet[str]
+
+
+def _type_words(entities, entity_type):
+    """Lowercased canonicals and synonyms of entities whose type is entity_type."""
+    words = set()
+    for ent in entities:
+        if ent["type"] == entity_type:
+            words.add(ent["canonical"].lower())
+            words.update(s.lower() for s in ent.get("synonyms", []))
+    return words
+
+
+def build_entity_index(entities):
+    """Build the EntityIndex for a catalog (once, not per request)."""
+    (
+        unit_map, variant_map, product_map, brand_map, noise_set,
+        unambiguous_units, ambiguous_units,
+        unambiguous_variants, ambiguous_variants, ambiguous_brands
+    ) = build_support_maps(entities)
+
+    return EntityIndex(
+        unit_map=MappingProxyType(unit_map),
+        variant_map=MappingProxyType(variant_map),
+        product_map=MappingProxyType(product_map),
+        brand_map=MappingProxyType(brand_map),
+        noise_set=frozenset(noise_set),
+        unambiguous_units=frozenset(unambiguous_units),
+        ambiguous_units=frozenset(ambiguous_units),
+        unambiguous_variants=frozenset(unambiguous_variants),
+        ambiguous_variants=frozenset(ambiguous_variants),
+        ambiguous_brands=frozenset(ambiguous_brands),
+        product_lex=frozenset(product_map.keys()),
+        unit_lex=frozenset(unit_map.keys()),
+        synonym_map=MappingProxyType(build_global_synonym_map(entities)),
+        brand_words=frozenset(_type_words(entities, "brand")),
+        product_words=frozenset(_type_words(entities, "product")),
+    )
+
+
 def add_entity_with_tracking(result, entity_counts, entity_type, text, position, debug_units=False, length=1):
     # Always dict with position (+ span length for parameterization)
     if entity_type not in entity_counts:
@@ -306,15 +385,17 @@ def add_entity_with_tracking(result, entity_counts, entity_type, text, position,
         debug_print(f"[DEBUG] Added {entity_type}: {entity_obj}")
 
 
-def extract_entities(nlp, text: str, entities: list, debug_units=False):
+def extract_entities(nlp, text: str, entities: list, debug_units=False, index=None):
     doc = nlp(text)
 
-    (
-        unit_map, variant_map, product_map,
-        brand_map, noise_set,
-        unambiguous_units, ambiguous_units,
-        unambiguous_variants, ambiguous_variants, ambiguous_brands
-    ) = build_support_maps(entities)
+    # ✅ Pass a prebuilt EntityIndex; building one walks the whole catalog
+    if index is None:
+        index = build_entity_index(entities)
+    unit_map, product_map, brand_map = index.unit_map, index.product_map, index.brand_map
+    variant_map, noise_set = index.variant_map, index.noise_set
+    unambiguous_units, ambiguous_units = index.unambiguous_units, index.ambiguous_units
+    unambiguous_variants, ambiguous_variants = index.unambiguous_variants, index.ambiguous_variants
+    ambiguous_brands = index.ambiguous_brands
 
     result = {
         "brands": [],
@@ -371,9 +452,7 @@ def extract_entities(nlp, text: str, entities: list, debug_units=False):
     
     # === Step 1b: Classify and promote PRODUCTBRAND spans ===
     if result["productbrands"]:
-        product_lex = set(product_map.keys())
-        unit_lex = set(unit_map.keys())
-        pb_decisions = classify_productbrands(doc, result["productbrands"], product_lex, unit_lex, debug=debug_units)
+        pb_decisions = classify_productbrands(doc, result["productbrands"], index.product_lex, index.unit_lex, debug=debug_units)
         for d in pb_decisions:
             if d["label"] == "brand":
                 add_entity_with_tracking(result, entity_counts, "brands", d["text"], d["position"], debug_units, length=d["length"])
@@ -428,7 +507,8 @@ def extract_entities(nlp, text: str, entities: list, debug_units=False):
     # (keep existing units, variants, brands logic)
     if candidate_ambiguous_units:
         entity_texts = [lemma for lemma, _ in candidate_ambiguous_units]
-        classification_result = classify_ambiguous_units(text, entity_texts, ambiguous_units, entities, debug=debug_units)
+        classification_result = classify_ambiguous_units(text, entity_texts, ambiguous_units, entities, debug=debug_units,
+                                                         brand_words=index.brand_words)
         for lemma, pos in candidate_ambiguous_units:
             if any(u["entity"] == lemma and u["position"] == pos for u in classification_result["units"]):
                 add_entity_with_tracking(result, entity_counts, "units", lemma, pos, debug_units)
@@ -437,7 +517,9 @@ def extract_entities(nlp, text: str, entities: list, debug_units=False):
 
     if candidate_ambiguous_variants:
         entity_texts = [lemma for lemma, _ in candidate_ambiguous_variants]
-        classification_result = classify_ambiguous_variants(text, entity_texts, ambiguous_variants, entities, debug=debug_units)
+        classification_result = classify_ambiguous_variants(text, entity_texts, ambiguous_variants, entities, debug=debug_units,
+                                                            brand_words=index.brand_words,
+                                                            product_words=index.product_words)
         for lemma, pos in candidate_ambiguous_variants:
             if any(v["entity"] == lemma and v["position"] == pos for v in classification_result["variants"]):
                 add_entity_with_tracking(result, entity_counts, "variants", lemma, pos, debug_units)
@@ -455,9 +537,7 @@ def extract_entities(nlp, text: str, entities: list, debug_units=False):
 
     # === Step 3d: Handle productbrand disambiguation (brand vs product)
     if candidate_productbrands:
-        product_lex = set(product_map.keys())
-        unit_lex = set(unit_map.keys())
-        classification_result = classify_productbrands(doc, candidate_productbrands, product_lex, unit_lex, debug=debug_units)
+        classification_result = classify_productbrands(doc, candidate_productbrands, index.product_lex, index.unit_lex, debug=debug_units)
         for pb in candidate_productbrands:
             if any(b["position"] == pb["position"] for b in classification_result["brands"]):
                 add_entity_with_tracking(result, entity_counts, "brands", pb["text"], pb["position"], debug_units)
@@ -731,7 +811,7 @@ def simplify_result(result, doc):
 
 
 
-def extract_entities_with_parameterization(nlp, text: str, entities: list, debug_units=False):
+def extract_entities_with_parameterization(nlp, text: str, entities: list, debug_units=False, index=None):
     """
     Extract entities and return simplified result with parameterized sentence.
     Includes:
@@ -739,7 +819,12 @@ def extract_entities_with_parameterization(nlp, text: str, entities: list, debug
       - Longest-phrase synonym normalization
       - spaCy entity extraction
       - Canonicalization of detected entities
+
+    index is the catalog's EntityIndex (build_entity_index); built here if omitted.
     """
+    if index is None:
+        index = build_entity_index(entities)
+
     text = normalize_hyphens(text)
 
     # Step 1️⃣ — Pre-normalize the input
@@ -748,9 +833,8 @@ def extract_entities_with_parameterization(nlp, text: str, entities: list, debug
     normalized_text = normalize_plural_to_singular(normalized_text, nlp)
 
 
-    # Step 2️⃣ — Build synonym map and normalize longest valid phrases
-    synonym_map = build_global_synonym_map(entities)
-    normalized_text = normalize_longest_phrases(normalized_text, synonym_map)
+    # Step 2️⃣ — Normalize longest valid phrases with the global synonym map
+    normalized_text = normalize_longest_phrases(normalized_text, index.synonym_map)
 
     if debug_units:
         debug_print("\n[DEBUG] === Normalized Input ===")
@@ -759,21 +843,14 @@ def extract_entities_with_parameterization(nlp, text: str, entities: list, debug
 
     # Step 3️⃣ — spaCy entity detection
     doc = nlp(normalized_text)
-    result = extract_entities(nlp, normalized_text, entities, debug_units)
+    result = extract_entities(nlp, normalized_text, entities, debug_units, index=index)
 
     # Step 4️⃣ — Simplify + parameterize
     simplified_result = simplify_result(result, doc)
     final_result = {k: v for k, v in simplified_result.items() if k != "noise_tokens"}
 
     # Step 5️⃣ — Canonicalize entities AFTER parameterization
-    (
-        unit_map, variant_map, product_map, brand_map, noise_set,
-        _, _,  # unambiguous_units, ambiguous_units (not used here)
-        _, _,  # unambiguous_variants, ambiguous_variants (not used here)
-        _      # ambiguous_brands (not used here)
-    ) = build_support_maps(entities)
-
-    result = canonicalize_entities(result, unit_map, variant_map, product_map, brand_map, debug_units)
+    result = canonicalize_entities(result, index.unit_map, index.variant_map, index.product_map, index.brand_map, debug_units)
 
     # Step 6️⃣ — Attach canonicalized entities to simplified output (sorted by position)
     final_result["brands"] = [e["text"] if isinstance(e, dict) else e for e in sorted(result["brands"], key=lambda x: x.get("position", 0) if isinstance(x, dict) else 0)]
@@ -844,21 +921,19 @@ def canonicalize_entities(result, unit_map, variant_map, product_map, brand_map,
     return result
 
 
-def classify_ambiguous_units(sentence, entity_list, ambiguous_units, entities, debug=False):
+def classify_ambiguous_units(sentence, entity_list, ambiguous_units, entities, debug=False, brand_words=None):
     """
     Classify ambiguous entities as units or products.
     Returns two lists:
       - products: includes "product" and "ignored"
       - units: includes "unit"
+    brand_words defaults to the brand words of entities (EntityIndex.brand_words).
     """
     tokens = sentence.lower().replace(',', ' ,').replace('.', ' .').split()
     
     # Extract brand words from global entities
-    brand_words = set()
-    for ent in entities:
-        if ent["type"] == "brand":
-            brand_words.add(ent["canonical"].lower())
-            brand_words.update(s.lower() for s in ent.get("synonyms", []))
+    if brand_words is None:
+        brand_words = _type_words(entities, "brand")
 
     results = {"products": [], "units": []}
 
@@ -921,24 +996,22 @@ def classify_ambiguous_units(sentence, entity_list, ambiguous_units, entities, d
     return results
 
 
-def classify_ambiguous_variants(sentence, entity_list, ambiguous_variants, entities, debug=False):
+def classify_ambiguous_variants(sentence, entity_list, ambiguous_variants, entities, debug=False,
+                                brand_words=None, product_words=None):
     """
     Classify ambiguous entities as variants or products based on context.
     Returns two lists:
       - products: includes "product" and "ignored"
       - variants: includes "variant"
+    brand_words / product_words default to those of entities (see EntityIndex).
     """
     tokens = sentence.lower().replace(',', ' ,').replace('.', ' .').split()
 
     # Extract brand and product words from global entities
-    brand_words, product_words = set(), set()
-    for ent in entities:
-        if ent["type"] == "brand":
-            brand_words.add(ent["canonical"].lower())
-            brand_words.update(s.lower() for s in ent.get("synonyms", []))
-        elif ent["type"] == "product":
-            product_words.add(ent["canonical"].lower())
-            product_words.update(s.lower() for s in ent.get("synonyms", []))
+    if brand_words is None:
+        brand_words = _type_words(entities, "brand")
+    if product_words is None:
+        product_words = _type_words(entities, "product")
 
     results = {"products": [], "variants": []}
 
@@ -1258,6 +1331,7 @@ def main():
 
 
     nlp, entities = init_nlp_with_entities()   # load spaCy + entity patterns once
+    index = build_entity_index(entities)
 
     # Run ambiguous unit classification tests first
     print("=" * 60)
@@ -1274,7 +1348,7 @@ def main():
         debug_mode = (i == 1)
         if debug_mode:
             print("=== DEBUG MODE ENABLED ===")
-        result = extract_entities_with_parameterization(nlp, s, entities, debug_units=debug_mode)
+        result = extract_entities_with_parameterization(nlp, s, entities, debug_units=debug_mode, index=index)
         print(result)
         print()
 
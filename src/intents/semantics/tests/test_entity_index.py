@@ -0,0 +1,126 @@
+"""
+Tests for the precomputed EntityIndex used by nlp_processor.extract_entities.
+
+A whitespace stand-in for the spaCy pipeline tags catalog terms, so the
+results with and without a prebuilt index can be compared without models.
+"""
+import os
+import random
+import sys
+
+import pytest
+
+pytest.importorskip("spacy")
+pytest.importorskip("rapidfuzz")
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from nlp_processor import (  # noqa: E402
+    build_entity_index,
+    build_global_synonym_map,
+    build_support_maps,
+    extract_entities,
+    extract_entities_with_parameterization,
+)
+
+ENTITIES = [
+    {"canonical": "rice", "type": ["product"], "synonyms": ["rices"]},
+    {"canonical": "milk", "type": ["product"], "synonyms": []},
+    {"canonical": "beans", "type": ["product"], "synonyms": ["bean"]},
+    {"canonical": "kg", "type": ["unit"], "synonyms": ["kilo", "kilogram"]},
+    {"canonical": "tin", "type": ["unit"], "synonyms": ["tins"]},
+    {"canonical": "bag", "type": ["unit", "product"], "synonyms": ["bags"]},
+    {"canonical": "red", "type": ["variant", "product"], "synonyms": []},
+    {"canonical": "large", "type": ["variant"], "synonyms": ["big"]},
+    {"canonical": "peak", "type": ["brand"], "synonyms": []},
+    {"canonical": "gucci", "type": ["brand", "product"], "synonyms": []},
+    {"canonical": "please", "type": ["noise"], "synonyms": []},
+    {"canonical": "soft drink", "type": ["global_synonym"], "synonyms": ["soda"]},
+]
+
+# Ruler labels the stand-in pipeline assigns
+LABELS = {"rice": "PRODUCT", "milk": "PRODUCT", "kg": "UNIT", "tin": "UNIT",
+          "large": "VARIANT", "peak": "BRAND", "gucci": "PRODUCTBRAND"}
+
+
+class _Token:
+    def __init__(self, text, i, ent_type):
+        self.text = text
+        self.i = i
+        self.lemma_ = text.lower()
+        self.ent_type_ = ent_type
+        if text.isdigit():
+            self.pos_ = "NUM"
+        elif text[:1].isupper():
+            self.pos_ = "PROPN"
+        else:
+            self.pos_ = "NOUN" if len(text) > 4 else "ADJ"
+
+
+class _Span:
+    def __init__(self, text, label, start):
+        self.text = text
+        self.label_ = label
+        self.start = start
+        self.end = start + 1
+
+
+class _Doc(list):
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.ents = []
+        for i, word in enumerate(text.split()):
+            label = LABELS.get(word.lower(), "")
+            self.append(_Token(word, i, label))
+            if label:
+                self.ents.append(_Span(word, label, i))
+
+
+def _nlp(text):
+    return _Doc(text)
+
+
+def test_results_match_with_and_without_index():
+    index = build_entity_index(ENTITIES)
+    words = ["add", "2", "3", "of", "rice", "Rice", "milk", "beans", "kg", "kilo", "tins",
+             "bag", "bags", "red", "large", "big", "peak", "Gucci", "please", "soda", "and"]
+    rng = random.Random(7)
+    for _ in range(300):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 9)))
+        assert extract_entities(_nlp, text, ENTITIES, index=index) == \
+            extract_entities(_nlp, text, ENTITIES)
+
+
+def test_parameterization_uses_the_index():
+    index = build_entity_index(ENTITIES)
+    for text in ("add 2 kg of rice and Gucci milk please", "3 bags of soda", "peak milk big tin"):
+        assert extract_entities_with_parameterization(_nlp, text, ENTITIES, index=index) == \
+            extract_entities_with_parameterization(_nlp, text, ENTITIES)
+
+
+def test_index_matches_the_support_maps():
+    index = build_entity_index(ENTITIES)
+    (unit_map, variant_map, product_map, brand_map, noise_set,
+     unambiguous_units, ambiguous_units,
+     unambiguous_variants, ambiguous_variants, ambiguous_brands) = build_support_maps(ENTITIES)
+
+    assert dict(index.unit_map) == unit_map
+    assert dict(index.product_map) == product_map
+    assert index.ambiguous_units == ambiguous_units
+    assert index.product_lex == set(product_map)
+    assert index.unit_lex == set(unit_map)
+    assert dict(index.synonym_map) == build_global_synonym_map(ENTITIES)
+
+
+def test_index_is_read_only():
+    index = build_entity_index(ENTITIES)
+    with pytest.raises(TypeError):
+        index.product_map["sugar"] = "sugar"
+    with pytest.raises(TypeError):
+        index.synonym_map["pop"] = "soft drink"
+    with pytest.raises(AttributeError):
+        index.noise_set.add("hello")
+    with pytest.raises(AttributeError):
+        index.product_lex.add("sugar")
+    with pytest.raises(AttributeError):
+        index.unit_map = {}
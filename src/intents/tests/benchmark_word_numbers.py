@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: SimpleTextNormalizer word-number conversion.
+
+Runs every example of trainings/initial_training_data.yml (lowercased, as
+the normalizer sees it) through the old sequential loops (one ``re.sub``
+per (word, unit) pair, then one per word) and through WordNumberEngine,
+checks that both give the same text and prints the time per message.
+
+Usage:
+    python tests/benchmark_word_numbers.py [--repeat N]
+"""
+import argparse
+import time
+
+from test_normalizer_word_numbers import (
+    NUMBER_UNITS,
+    NUMBER_WORDS,
+    WordNumberEngine,
+    _sequential,
+    _training_examples,
+)
+
+
+def _per_message_us(normalize, texts, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            normalize(text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+
+def main():
+    """Entry point for the benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Compare sequential and single-scan word-number conversion"
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Passes over the training corpus (default: 5)'
+    )
+    args = parser.parse_args()
+
+    texts = [text.lower() for text in _training_examples()]
+    engine = WordNumberEngine(NUMBER_WORDS, NUMBER_UNITS)
+    mismatches = [text for text in texts if engine.apply(text) != _sequential(text)]
+    if mismatches:
+        raise SystemExit(f"{len(mismatches)} messages differ, e.g. {mismatches[0]!r}")
+
+    sequential = _per_message_us(_sequential, texts, args.repeat)
+    single_scan = _per_message_us(engine.apply, texts, args.repeat)
+    print(f"{len(texts)} training messages x {args.repeat}")
+    print(f"  sequential re.sub loops: {sequential:8.1f} us/message")
+    print(f"  WordNumberEngine:        {single_scan:8.1f} us/message")
+    print(f"  speedup:                 {sequential / single_scan:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ def run_rasa_validator_test():
             extract_quantities,
             extract_products,
             call_rasa_api,
+            call_rasa_api_batch,
             load_test_scenarios,
             _ensure_action_synonyms_loaded,
             _ensure_normalization_data_loaded,
@@ -113,12 +114,19 @@ def run_rasa_validator_test():
         
         print(f"\n🧪 Running all {len(scenarios)} scenarios...")
         print("=" * 60)
+
+        # Classify every scenario up front through /classify/batch
+        rasa_responses = {}
+        if api_available:
+            cases = [i for i, scenario in enumerate(scenarios, 1) if scenario.get("text", "").strip()]
+            responses = call_rasa_api_batch([scenarios[i - 1]["text"] for i in cases])
+            rasa_responses = dict(zip(cases, responses))
         
         for i, scenario in enumerate(scenarios, 1):
             text = scenario.get("text", "")
             expected_actions = scenario.get("expected_actions", [])
             
-            if not text:
+            if not text.strip():
                 print(f"⚠️  Skipping scenario {i}: empty text")
                 skipped_cases += 1
                 continue
@@ -127,14 +135,9 @@ def run_rasa_validator_test():
             
             # Call Rasa API
             if api_available:
-                try:
-                    rasa_resp = call_rasa_api(text)
-                    if not rasa_resp or not rasa_resp.get("success"):
-                        print(f"❌ API call failed for scenario {i}: {text}")
-                        api_failed_cases += 1
-                        continue
-                except (ConnectionError, TimeoutError, OSError) as e:
-                    print(f"❌ API call failed for scenario {i}: {e}")
+                rasa_resp = rasa_responses.get(i)
+                if not rasa_resp or not rasa_resp.get("success"):
+                    print(f"❌ API call failed for scenario {i}: {text}")
                     api_failed_cases += 1
                     continue
             else:
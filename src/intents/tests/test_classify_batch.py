@@ -0,0 +1,64 @@
+"""
+Tests for IntentOrchestrator.classify_batch against sequential classify.
+
+Needs the orchestrator's dependencies (langchain-openai, pydantic, PyYAML);
+Rasa is replaced by a fake that returns canned parses.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("langchain_openai")
+pytest.importorskip("pydantic")
+pytest.importorskip("yaml")
+
+INTENTS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(INTENTS_DIR.parent))
+from intents.core.orchestrator import IntentOrchestrator  # noqa: E402
+
+
+class FakeRasa:
+    """Confident modify_cart parses: "add <product>"."""
+
+    def predict(self, text, sender_id):
+        verb, product = text.split(maxsplit=1)
+        entities = [
+            {"entity": "verb", "value": verb, "start": 0, "end": len(verb)},
+            {"entity": "product", "value": product, "start": len(verb) + 1, "end": len(text)},
+        ]
+        nlu = {
+            "text": text,
+            "intent": {"name": "modify_cart", "confidence": 0.99},
+            "entities": entities,
+        }
+        return {"nlu": nlu, "intent": "modify_cart", "entities": entities, "slots": {}, "sender_id": sender_id}
+
+    def predict_batch(self, items):
+        return [self.predict(text, sender_id) for text, sender_id in items]
+
+
+@pytest.fixture
+def make_orchestrator(monkeypatch):
+    # ChatOpenAI needs a key to construct; validate=False never calls it
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    # The action mapper finds trainings/initial_training_data.yml from the cwd
+    monkeypatch.chdir(INTENTS_DIR)
+    return lambda: IntentOrchestrator(FakeRasa())
+
+
+def test_same_sender_turns_match_sequential_classify(make_orchestrator):
+    items = [
+        {"text": "add rice", "sender_id": "s1"},
+        {"text": "add beans", "sender_id": "s1"},
+        {"text": "add yam", "sender_id": "s2"},
+    ]
+    sequential = make_orchestrator()
+    expected = [sequential.classify(item["text"], item["sender_id"]) for item in items]
+
+    batch = make_orchestrator().classify_batch(items)
+
+    assert batch == expected
+    # A later turn of the same sender must not leak into an earlier response
+    assert batch[0]["result"]["slots"]["shopping_list"] == ["rice"]
+    assert batch[1]["result"]["slots"]["shopping_list"] == ["rice", "beans"]
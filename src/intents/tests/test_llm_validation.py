@@ -0,0 +1,224 @@
+"""
+Tests for the cached, coalesced LLM validation layer.
+
+core/llm_validation.py is loaded by path: the package __init__ imports Rasa.
+A local fake stands in for the structured-output ChatOpenAI.
+"""
+import asyncio
+import importlib.util
+import threading
+import time
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "llm_validation", Path(__file__).resolve().parent.parent / "core" / "llm_validation.py")
+llm_validation = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(llm_validation)
+
+
+class _Action:
+    def __init__(self, data):
+        self.data = data
+
+    def dict(self):
+        return dict(self.data)
+
+
+class _Result:
+    def __init__(self, actions):
+        self.actions = [_Action(a) for a in actions]
+
+
+class FakeLLM:
+    """Answers with the product "checked"; fails for texts containing "boom"."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def _answer(self, messages):
+        if "boom" in messages[1]["content"]:
+            raise RuntimeError("llm down")
+        return _Result([{"action": "add", "product": "checked"}])
+
+    def invoke(self, messages):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self._answer(messages)
+
+    async def ainvoke(self, messages):
+        with self._lock:
+            self.calls += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            return self._answer(messages)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def _request(text, actions=None, domain="food", slots=None):
+    actions = actions if actions is not None else [{"action": "add", "product": "rice"}]
+    messages = [{"role": "system", "content": "validate"}, {"role": "user", "content": text}]
+    return llm_validation.ValidationRequest(
+        text=text, actions=actions, domain=domain, messages=messages, slots=slots or {})
+
+
+def test_normalized_text_hits_the_cache():
+    llm = FakeLLM()
+    validator = llm_validation.LLMValidator(llm)
+    first = validator.validate(_request("Add rice"))
+    again = validator.validate(_request("  add   RICE "))
+    assert first == again == [{"action": "add", "product": "checked"}]
+    assert llm.calls == 1
+    assert validator.stats()["hits"] == 1
+
+    # Different actions or domain are different validations
+    validator.validate(_request("add rice", actions=[{"action": "add", "product": "beans"}]))
+    validator.validate(_request("add rice", domain="beauty"))
+    assert llm.calls == 3
+
+
+def test_slots_shown_to_the_llm_are_part_of_the_key():
+    llm = FakeLLM()
+    validator = llm_validation.LLMValidator(llm)
+    validator.validate(_request("add it", slots={"last_mentioned_product": "rice", "conversation_turn": 1}))
+    # Only the turn counter changed: same answer
+    validator.validate(_request("add it", slots={"last_mentioned_product": "rice", "conversation_turn": 2}))
+    assert llm.calls == 1
+    # "it" now refers to another product
+    validator.validate(_request("add it", slots={"last_mentioned_product": "beans", "conversation_turn": 3}))
+    assert llm.calls == 2
+
+
+def test_callers_cannot_change_the_cached_answer():
+    validator = llm_validation.LLMValidator(FakeLLM())
+    validator.validate(_request("add rice"))[0]["product"] = "changed"
+    assert validator.validate(_request("add rice"))[0]["product"] == "checked"
+
+
+def test_cache_is_bounded_lru():
+    llm = FakeLLM()
+    validator = llm_validation.LLMValidator(llm, cache_size=2)
+    for text in ("a", "b", "a", "c"):
+        validator.validate(_request(text))
+    assert llm.calls == 3
+    assert validator.stats()["size"] == 2
+    validator.validate(_request("a"))  # recently used: kept
+    assert llm.calls == 3
+    validator.validate(_request("b"))  # least recently used: evicted
+    assert llm.calls == 4
+
+
+def test_cache_entries_expire():
+    llm = FakeLLM()
+    validator = llm_validation.LLMValidator(llm, cache_ttl=0.05)
+    validator.validate(_request("add rice"))
+    validator.validate(_request("add rice"))
+    assert llm.calls == 1
+    time.sleep(0.1)
+    validator.validate(_request("add rice"))
+    assert llm.calls == 2
+
+
+def test_failures_are_not_cached():
+    llm = FakeLLM()
+    validator = llm_validation.LLMValidator(llm)
+    assert validator.validate(_request("boom")) is None
+    assert validator.validate(_request("boom")) is None
+    assert llm.calls == 2
+    assert validator.stats()["failures"] == 2
+    assert validator.stats()["size"] == 0
+
+
+def test_concurrent_identical_requests_share_one_call():
+    llm = FakeLLM(delay=0.2)
+    validator = llm_validation.LLMValidator(llm)
+    results = []
+
+    def worker():
+        results.append(validator.validate(_request("add rice")))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert llm.calls == 1
+    assert results == [[{"action": "add", "product": "checked"}]] * 5
+    assert validator.stats()["coalesced"] == 4
+
+
+def test_coalesced_waiters_see_the_failure():
+    llm = FakeLLM(delay=0.1)
+    validator = llm_validation.LLMValidator(llm)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(validator.validate(_request("boom"))))
+        for _ in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [None, None, None]
+    assert llm.calls == 1
+
+
+def test_validate_many_runs_concurrently_with_a_cap():
+    llm = FakeLLM(delay=0.05)
+    validator = llm_validation.LLMValidator(llm, concurrency=2)
+    requests = [_request(f"add item {i}") for i in range(6)] + [_request("add item 0"), _request("boom")]
+    results = validator.validate_many(requests)
+
+    assert results[:7] == [[{"action": "add", "product": "checked"}]] * 7
+    assert results[7] is None
+    # The duplicate coalesced with (or hit) the first request
+    assert llm.calls == 7
+    assert llm.max_running == 2
+
+
+def test_budget_cancels_slow_validations():
+    llm = FakeLLM(delay=1.0)
+    validator = llm_validation.LLMValidator(llm, budget=0.1)
+    started = time.perf_counter()
+    assert validator.validate_many([_request("add rice"), _request("add beans")]) == [None, None]
+    assert time.perf_counter() - started < 0.5
+
+    # Nothing cached or left in flight: the next call asks the LLM again
+    llm.delay = 0.0
+    assert validator.validate(_request("add rice")) == [{"action": "add", "product": "checked"}]
+    assert llm.calls == 3
+
+
+def test_async_waiter_released_when_leader_is_cancelled():
+    llm = FakeLLM(delay=1.0)
+    validator = llm_validation.LLMValidator(llm)
+
+    async def scenario():
+        leader = asyncio.ensure_future(validator.avalidate(_request("add rice")))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(validator.avalidate(_request("add rice")))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await asyncio.wait_for(waiter, timeout=0.5)
+
+    assert asyncio.run(scenario()) is None
+    assert llm.calls == 1
+
+
+def test_render_prometheus():
+    validator = llm_validation.LLMValidator(FakeLLM())
+    validator.validate(_request("add rice"))
+    validator.validate(_request("add rice"))
+    text = validator.render_prometheus()
+    assert 'llm_validation_requests_total{outcome="hits"} 1' in text
+    assert 'llm_validation_requests_total{outcome="misses"} 1' in text
+    assert "llm_validation_cache_size 1" in text
@@ -0,0 +1,131 @@
+"""
+Tests for background training jobs and cross-worker model updates.
+
+api/model_updates.py is loaded by path: the package __init__ imports Rasa.
+"""
+import importlib.util
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "model_updates", Path(__file__).resolve().parent.parent / "api" / "model_updates.py")
+model_updates = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(model_updates)
+
+
+def test_job_status_is_shared_through_files(tmp_path):
+    store = model_updates.TrainingJobStore(tmp_path / "jobs")
+    job = store.create("greet", 3)
+    assert job["status"] == model_updates.JOB_QUEUED
+
+    # Another worker reads the same directory
+    other = model_updates.TrainingJobStore(tmp_path / "jobs")
+    assert other.get(job["job_id"]) == job
+
+    store.update(job["job_id"], status=model_updates.JOB_SUCCEEDED, model_path="/m/1.tar.gz")
+    done = other.get(job["job_id"])
+    assert done["status"] == model_updates.JOB_SUCCEEDED
+    assert done["model_path"] == "/m/1.tar.gz"
+    assert done["intent"] == "greet"
+    assert not list((tmp_path / "jobs").glob(".*.tmp"))
+
+
+def test_unknown_or_malformed_job_ids(tmp_path):
+    store = model_updates.TrainingJobStore(tmp_path / "jobs")
+    (tmp_path / "secret.json").write_text("{}")
+    assert store.get("0" * 32) is None
+    assert store.get("../secret") is None
+    assert store.get("") is None
+
+
+def test_watcher_swaps_to_newly_published_models(tmp_path):
+    marker = tmp_path / "current_model.json"
+    models = [tmp_path / "a.tar.gz", tmp_path / "b.tar.gz", tmp_path / "broken.tar.gz"]
+    for model in models:
+        model.write_text("")
+
+    current = {"path": str(models[0])}
+    swapped = []
+
+    def swap(model_path):
+        if "broken" in model_path:
+            raise RuntimeError("cannot load")
+        swapped.append(model_path)
+        current["path"] = model_path
+
+    watcher = model_updates.ModelWatcher(marker, lambda: current["path"], swap)
+    assert not watcher.check()  # nothing published yet
+
+    model_updates.publish_model(marker, str(models[0]))
+    assert not watcher.check()  # already serving it
+
+    model_updates.publish_model(marker, str(models[1]))
+    assert watcher.check()
+    assert not watcher.check()
+    assert swapped == [str(models[1])]
+
+    # A model that fails to load is not retried until the next publish
+    model_updates.publish_model(marker, str(models[2]))
+    assert not watcher.check()
+    assert not watcher.check()
+    model_updates.publish_model(marker, str(tmp_path / "missing.tar.gz"))
+    assert not watcher.check()
+    model_updates.publish_model(marker, str(models[0]))
+    assert watcher.check()
+    assert swapped == [str(models[1]), str(models[0])]
+
+
+def test_watcher_thread_polls_the_marker(tmp_path):
+    marker = tmp_path / "current_model.json"
+    model = tmp_path / "a.tar.gz"
+    model.write_text("")
+    seen = []
+    watcher = model_updates.ModelWatcher(
+        marker, lambda: seen[-1] if seen else None, seen.append, interval=0.01).start()
+    try:
+        model_updates.publish_model(marker, str(model))
+        for _ in range(500):
+            if seen:
+                break
+            watcher._stop.wait(0.01)
+    finally:
+        watcher.stop()
+    assert seen == [str(model)]
+
+
+def test_jobs_of_a_stopped_worker_fail(tmp_path):
+    store = model_updates.TrainingJobStore(tmp_path / "jobs", stale_after=60)
+    alive = store.create("greet", 3)
+    dead = store.create("bye", 2)
+    done = store.create("thanks", 1)
+    store.update(done["job_id"], status=model_updates.JOB_SUCCEEDED)
+    # The worker running "dead" stopped refreshing its heartbeat long ago
+    store.update(dead["job_id"], status=model_updates.JOB_RUNNING, heartbeat_at=0)
+    store.update(done["job_id"], heartbeat_at=0)
+
+    # A freshly started worker sweeps the directory
+    fresh = model_updates.TrainingJobStore(tmp_path / "jobs", stale_after=60)
+    assert fresh.fail_stale_jobs() == 1
+    assert fresh.get(dead["job_id"])["status"] == model_updates.JOB_FAILED
+    assert "stopped" in fresh.get(dead["job_id"])["error"]
+    assert fresh.get(alive["job_id"])["status"] == model_updates.JOB_QUEUED
+    assert fresh.get(done["job_id"])["status"] == model_updates.JOB_SUCCEEDED
+
+    # Polling reports a job as failed once its heartbeat goes stale
+    store.update(alive["job_id"], heartbeat_at=0)
+    assert store.get(alive["job_id"])["status"] == model_updates.JOB_FAILED
+
+
+def test_heartbeat_keeps_jobs_alive(tmp_path):
+    store = model_updates.TrainingJobStore(tmp_path / "jobs", stale_after=60)
+    job = store.create("greet", 3)
+    store.update(job["job_id"], status=model_updates.JOB_RUNNING, heartbeat_at=0)
+
+    heartbeat = model_updates.JobHeartbeat(store)
+    heartbeat.add(job["job_id"])
+    heartbeat.beat()
+    assert store.get(job["job_id"])["status"] == model_updates.JOB_RUNNING
+
+    heartbeat.discard(job["job_id"])
+    store.update(job["job_id"], heartbeat_at=0)
+    heartbeat.beat()
+    assert store.get(job["job_id"])["status"] == model_updates.JOB_FAILED
@@ -0,0 +1,194 @@
+"""
+Tests for the single-scan ReplacementEngine.
+
+Every case is compared against the sequential implementation it replaces
+(one ``\\bform\\b`` subn per form, symbol patterns last, stop after the
+pattern that reaches max_replacements_per_text).
+
+trainings/normalization/replacements.py is loaded by path: the package
+__init__ imports Rasa.
+"""
+import importlib.util
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+TRAININGS_DIR = Path(__file__).resolve().parent.parent / "trainings"
+TRAINING_DATA = TRAININGS_DIR / "initial_training_data.yml"
+
+_spec = importlib.util.spec_from_file_location(
+    "normalizer_replacements", TRAININGS_DIR / "normalization" / "replacements.py")
+replacements = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(replacements)
+ReplacementEngine = replacements.ReplacementEngine
+
+# normalization.yml (products are the commented-out catalog)
+PRODUCTS = {
+    "garri": ["gari", "garry", "gárì", "gári"],
+    "semovita": ["semo", "semovitta"],
+    "plantain": ["plantin", "plaintain", "plantains"],
+    "noodles": ["indomiee", "indomie", "noodels"],
+    "rice": ["rice"],
+    "beans": ["beans"],
+    "tomatoes": ["tomatoes"],
+}
+UNITS = {
+    "kg": ["kgs", "kilogram", "kilo"],
+    "carton": ["ctn", "cartn", "cartoon"],
+    "bottle": ["bottles"],
+    "tin": ["tins"],
+    "crate": ["crates"],
+    "bag": ["bags"],
+    "bunch": ["bunches"],
+    "packet": ["packets"],
+    "pack": ["packs"],
+}
+SYNONYMS = {
+    "remove": ["take out", "drop"],
+    "add": ["put in", "include"],
+}
+SYMBOLS = {"+": ["add"], "-": ["remove"], "=": ["set"]}
+
+SENTENCES = [
+    "add 2 kgs of rice",
+    "Add 3 Kilogram of GARRI and 2 cartoons of indomie",
+    "remove 1 ctn of noodels",
+    "-rice +yam",
+    "+ 2 bags beans",
+    "rice- and beans",
+    "set milk = 3 tins",
+    "take out the semo and put in 4 packs of plantains",
+    "i want kilo kilo kilo kg kgs of gári",
+    "bottles bottle bottles, crates; bunches.",
+    "drop the cartn",
+    "",
+]
+
+
+def _word_rules(*maps):
+    rules = []
+    for entries in maps:
+        for canonical, variants in entries.items():
+            forms = set([canonical] + variants)
+            for form in sorted(forms, key=lambda f: (-len(f), f)):
+                rules.append((form, canonical))
+    return rules
+
+
+def _symbol_rules(symbol_map):
+    rules = []
+    for symbol, values in symbol_map.items():
+        canonical = values[0]
+        escaped = re.escape(symbol)
+        rules.append((re.compile(rf"(?<!\w){escaped}(?=\w)"), f"{canonical} "))
+        rules.append((re.compile(rf"^{escaped}(?=\s)"), f"{canonical}"))
+        rules.append((re.compile(rf"(?<=\s){escaped}(?=\s)"), f"{canonical}"))
+        rules.append((re.compile(rf"(?<=\w){escaped}(?!\w)"), f" {canonical}"))
+    return rules
+
+
+def _sequential(text, word_rules, symbol_rules, max_replacements):
+    """The SimpleTextNormalizer._apply_replacements loop being replaced."""
+    patterns = [
+        (re.compile(rf"\b{re.escape(form)}\b", flags=re.IGNORECASE), target)
+        for form, target in word_rules
+    ] + symbol_rules
+    replaced = 0
+    for pattern, target in patterns:
+        text, n = pattern.subn(target, text)
+        if n:
+            replaced += n
+        if replaced >= max_replacements:
+            break
+    return text
+
+
+def _training_examples():
+    """Example texts from the Rasa training data, annotations stripped."""
+    examples = []
+    for line in TRAINING_DATA.read_text(encoding="utf-8").splitlines():
+        match = re.match(r"^\s+- (.+)$", line)
+        if match:
+            text = re.sub(r"\[([^\]]+)\]\([^)]*\)", r"\1", match.group(1))
+            text = re.sub(r"\[([^\]]+)\]\{[^}]*\}", r"\1", text)
+            examples.append(text.strip().strip('"'))
+    return examples
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    word_rules = _word_rules(PRODUCTS, UNITS, SYNONYMS)
+    symbol_rules = _symbol_rules(SYMBOLS)
+    return word_rules, symbol_rules, ReplacementEngine(word_rules, symbol_rules)
+
+
+def test_catalog_compiles_to_single_scan(catalog):
+    _, _, engine = catalog
+    assert engine.single_scan, engine.conflict
+
+
+@pytest.mark.parametrize("max_replacements", [50, 0, 1, 2, 3, 5])
+def test_matches_sequential_on_sentences(catalog, max_replacements):
+    word_rules, symbol_rules, engine = catalog
+    for text in SENTENCES:
+        for variant in (text, text.lower()):
+            assert engine.apply(variant, max_replacements) == \
+                _sequential(variant, word_rules, symbol_rules, max_replacements), variant
+
+
+def test_matches_sequential_on_training_data(catalog):
+    word_rules, symbol_rules, engine = catalog
+    examples = _training_examples()
+    assert len(examples) > 100
+    for text in examples:
+        for variant in (text, text.lower()):
+            for max_replacements in (50, 2):
+                assert engine.apply(variant, max_replacements) == \
+                    _sequential(variant, word_rules, symbol_rules, max_replacements), variant
+
+
+def test_matches_sequential_on_generated_text(catalog):
+    word_rules, symbol_rules, engine = catalog
+    vocabulary = sorted({form for form, _ in word_rules}) + [
+        "of", "and", "the", "2", "3.5", "kgx", "ricey", "+", "-", "=", ",", "+rice", "tin-"]
+    rng = random.Random(1234)
+    for _ in range(2000):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(1, 14))]
+        text = " ".join(words)
+        max_replacements = rng.choice([1, 2, 3, 4, 8, 50])
+        assert engine.apply(text, max_replacements) == \
+            _sequential(text, word_rules, symbol_rules, max_replacements), (text, max_replacements)
+
+
+@pytest.mark.parametrize("maps", [
+    # "pepper" is a word of another form and of another target
+    ({"bell pepper": ["green pepper"], "pepper": ["peper"]},),
+    # Same form, different targets (products vs synonyms)
+    ({"rice": ["rice"]}, {"white rice": ["rice"]}),
+    # Forms that do not end in a word character
+    ({"kg": ["kg."]},),
+])
+def test_conflicting_rules_fall_back_to_sequential(maps):
+    word_rules = _word_rules(*maps)
+    engine = ReplacementEngine(word_rules)
+    assert not engine.single_scan
+    for text in ["green pepper", "bell pepper and peper", "rice and white rice", "2 kg. of kg"]:
+        assert engine.apply(text, 50) == _sequential(text, word_rules, [], 50)
+
+
+def test_identity_rules_count_towards_the_limit():
+    # Sequentially "kilogram" -> "kg" is matched again by the later "kg" rule
+    word_rules = _word_rules({"kg": ["kilogram"], "bag": ["bags"]})
+    engine = ReplacementEngine(word_rules)
+    assert engine.single_scan
+    text = "kilogram bags"
+    assert engine.apply(text, 2) == _sequential(text, word_rules, [], 2) == "kg bags"
+
+
+def test_regex_case_folding_matches_resolve(catalog):
+    # re.IGNORECASE matches "ſ" to "s" and "İ" to "i"; str.lower() does not
+    word_rules, symbol_rules, engine = catalog
+    for text in ["2 beanſ", "RİCE and ſemo"]:
+        assert engine.apply(text, 50) == _sequential(text, word_rules, symbol_rules, 50)
@@ -0,0 +1,112 @@
+"""
+Tests for the single-scan WordNumberEngine.
+
+Every case is compared against the two sequential loops it replaces in
+SimpleTextNormalizer._normalize_word_numbers (one ``re.sub`` per
+(word, unit) pair, then one per word).
+
+trainings/normalization/replacements.py is loaded by path: the package
+__init__ imports Rasa.
+"""
+import importlib.util
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+TRAININGS_DIR = Path(__file__).resolve().parent.parent / "trainings"
+TRAINING_DATA = TRAININGS_DIR / "initial_training_data.yml"
+
+_spec = importlib.util.spec_from_file_location(
+    "normalizer_replacements", TRAININGS_DIR / "normalization" / "replacements.py")
+replacements = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(replacements)
+WordNumberEngine = replacements.WordNumberEngine
+
+# trainings/normalization/normalizer.py
+NUMBER_WORDS = {
+    "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
+    "six": "6", "seven": "7", "eight": "8", "nine": "9", "ten": "10",
+    "eleven": "11", "twelve": "12", "thirteen": "13", "fourteen": "14", "fifteen": "15",
+    "sixteen": "16", "seventeen": "17", "eighteen": "18", "nineteen": "19", "twenty": "20",
+    "thirty": "30", "forty": "40", "fifty": "50", "sixty": "60", "seventy": "70",
+    "eighty": "80", "ninety": "90", "hundred": "100"
+}
+NUMBER_UNITS = ['bunch', 'packet', 'bottle', 'kg', 'bag', 'crate', 'carton', 'tin', 'pack']
+
+SENTENCES = [
+    "add fivebunch of plantain",
+    "Add ThreeKG rice and twopacket of noodles",
+    "fivepack fivepacket fivepacks",
+    "sixteen bags, six teen bags, sixteenbag",
+    "one hundred and twenty tins",
+    "someone has twentyone oneself",
+    "add two-kg and seven_bag",
+    "FORTY CRATES; fortycrate.",
+    "ſix beanſ and FİVE",
+    "",
+]
+
+
+def _sequential(text):
+    """The SimpleTextNormalizer._normalize_word_numbers loops being replaced."""
+    for word, digit in NUMBER_WORDS.items():
+        for unit in NUMBER_UNITS:
+            pattern = rf'\b{re.escape(word)}{re.escape(unit)}\b'
+            text = re.sub(pattern, f'{digit} {unit}', text, flags=re.IGNORECASE)
+    for word, digit in NUMBER_WORDS.items():
+        pattern = rf'\b{re.escape(word)}\b'
+        text = re.sub(pattern, digit, text, flags=re.IGNORECASE)
+    return text
+
+
+def _training_examples():
+    """Example texts from the Rasa training data, annotations stripped."""
+    examples = []
+    for line in TRAINING_DATA.read_text(encoding="utf-8").splitlines():
+        match = re.match(r"^\s+- (.+)$", line)
+        if match:
+            text = re.sub(r"\[([^\]]+)\]\([^)]*\)", r"\1", match.group(1))
+            text = re.sub(r"\[([^\]]+)\]\{[^}]*\}", r"\1", text)
+            examples.append(text.strip().strip('"'))
+    return examples
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return WordNumberEngine(NUMBER_WORDS, NUMBER_UNITS)
+
+
+def test_matches_sequential_on_sentences(engine):
+    for text in SENTENCES:
+        for variant in (text, text.lower()):
+            assert engine.apply(variant) == _sequential(variant), variant
+
+
+def test_matches_sequential_on_training_data(engine):
+    examples = _training_examples()
+    assert len(examples) > 100
+    for text in examples:
+        for variant in (text, text.lower()):
+            assert engine.apply(variant) == _sequential(variant), variant
+
+
+def test_matches_sequential_on_generated_text(engine):
+    vocabulary = list(NUMBER_WORDS) + NUMBER_UNITS + [
+        "of", "and", "rice", "2", "x", "-", "_", ",", "s", "teen", "ty"]
+    rng = random.Random(1234)
+    for _ in range(2000):
+        pieces = [rng.choice(vocabulary) for _ in range(rng.randint(1, 10))]
+        # Glue some neighbours together ("five" + "bunch")
+        text = "".join(piece + rng.choice([" ", " ", ""]) for piece in pieces)
+        if rng.random() < 0.3:
+            text = text.upper()
+        assert engine.apply(text) == _sequential(text), text
+
+
+def test_glued_units_split_before_words_convert(engine):
+    assert engine.apply("fivebunch and twenty") == "5 bunch and 20"
+    assert engine.apply("THREEKG") == "3 kg"
+    # Only whole runs of word characters are converted
+    assert engine.apply("someone fivebunches") == "someone fivebunches"
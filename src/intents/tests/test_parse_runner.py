@@ -0,0 +1,136 @@
+"""
+Tests for ParseRunner (persistent parse loops for RasaService).
+
+intents.api.parse_runner imports only the standard library and
+intents.api.latency, so it is imported as a package module without Rasa.
+"""
+import asyncio
+import concurrent.futures
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+from intents.api.parse_runner import ParseRunner  # noqa: E402
+
+
+@pytest.fixture
+def runner():
+    runner = ParseRunner(concurrency=2, timeout=5)
+    yield runner
+    runner.shutdown()
+
+
+def test_reuses_one_loop_per_thread(runner):
+    async def current_loop():
+        await asyncio.sleep(0)
+        return threading.get_ident(), asyncio.get_running_loop()
+
+    seen = {}
+    for _ in range(20):
+        thread, loop = runner.run(current_loop)
+        assert seen.setdefault(thread, loop) is loop
+    assert 1 <= len(seen) <= 2
+    assert not any(loop.is_closed() for loop in seen.values())
+
+
+def test_limits_concurrent_parses(runner):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    async def parse(text):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        with lock:
+            active -= 1
+        return {"text": text}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=6) as callers:
+        results = list(callers.map(lambda i: runner.run(parse, f"msg {i}"), range(6)))
+
+    assert results == [{"text": f"msg {i}"} for i in range(6)]
+    assert peak == 2
+    snapshot = runner.snapshot()
+    assert snapshot["parse"]["count"] == snapshot["wait"]["count"] == 6
+    # Four of the six callers had to queue behind a running parse
+    assert snapshot["wait"]["quantiles"][0.99] >= 0.04
+
+
+def test_errors_and_timeouts_reach_the_caller():
+    runner = ParseRunner(concurrency=1, timeout=0.05)
+    try:
+        async def fail():
+            raise RuntimeError("No model available")
+
+        async def slow():
+            await asyncio.sleep(0.5)
+
+        with pytest.raises(RuntimeError, match="No model available"):
+            runner.run(fail)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            runner.run(slow)
+    finally:
+        runner.shutdown()
+    assert runner.snapshot()["parse"]["count"] == 2
+
+
+def test_timed_out_queued_parse_never_runs():
+    runner = ParseRunner(concurrency=1, timeout=0.05)
+    started = threading.Event()
+    release = threading.Event()
+    ran = []
+
+    async def busy():
+        started.set()
+        await asyncio.get_running_loop().run_in_executor(None, release.wait, 5)
+
+    async def parse(text):
+        ran.append(text)
+
+    # Occupy the only parse thread; map returns once its deadline passes
+    blocker = threading.Thread(target=runner.map, args=(busy, [()]))
+    blocker.start()
+    try:
+        assert started.wait(5)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            runner.run(parse, "queued")
+        [(_, error)] = runner.map(parse, [("mapped",)])
+        assert isinstance(error, concurrent.futures.TimeoutError)
+        release.set()
+        blocker.join()
+        runner.run(parse, "later")
+    finally:
+        release.set()
+        runner.shutdown()
+    assert ran == ["later"]
+
+
+def test_renders_prometheus_histograms(runner):
+    async def parse():
+        return {}
+
+    runner.run(parse)
+    text = runner.render_prometheus()
+    assert "# TYPE rasa_parse_duration_seconds histogram" in text
+    assert 'rasa_parse_duration_seconds_bucket{le="+Inf"} 1' in text
+    assert "rasa_parse_wait_seconds_count 1" in text
+    assert "rasa_parse_concurrency 2" in text
+
+
+def test_map_keeps_input_order_and_reports_errors(runner):
+    async def parse(text):
+        await asyncio.sleep(0.01 * (5 - len(text)))
+        if text == "bad":
+            raise ValueError(text)
+        return text.upper()
+
+    results = runner.map(parse, [("a",), ("bad",), ("ccc",), ("dddd",)])
+    assert [result for result, _ in results] == ["A", None, "CCC", "DDDD"]
+    assert [type(error) for _, error in results] == [type(None), ValueError, type(None), type(None)]
+    assert runner.map(parse, []) == []
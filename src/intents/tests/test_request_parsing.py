@@ -0,0 +1,61 @@
+"""
+Tests for intent classifier request parsing.
+
+api/request_parsing.py is loaded by path: the package __init__ imports Rasa.
+"""
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    "request_parsing", Path(__file__).resolve().parent.parent / "api" / "request_parsing.py")
+request_parsing = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(request_parsing)
+
+
+@pytest.mark.parametrize("value, expected", [
+    (False, False), (True, True), ("force", "force"), ("true", True), ("False", False), ("FORCE", "FORCE"),
+])
+def test_parse_validate_accepts_booleans_and_strings(value, expected):
+    assert request_parsing.parse_validate(value) == (expected, None)
+
+
+@pytest.mark.parametrize("value", ["maybe", 2, None, []])
+def test_parse_validate_rejects_other_values(value):
+    validate, error = request_parsing.parse_validate(value)
+    assert validate is None and error == request_parsing.VALIDATE_ERROR
+
+
+def test_parse_classify_batch_normalizes_items():
+    batch, error = request_parsing.parse_classify_batch({
+        "items": [
+            {"text": " add rice ", "sender_id": "u1"},
+            {"text": "make it 2kg"},
+            {"text": "remove beans", "sender_id": "  "},
+        ],
+        "validate": "true",
+    }, max_items=10)
+    assert error is None
+    assert batch == {
+        "items": [
+            {"text": "add rice", "sender_id": "u1"},
+            {"text": "make it 2kg", "sender_id": "intent_classifier"},
+            {"text": "remove beans", "sender_id": "intent_classifier"},
+        ],
+        "validate": True,
+    }
+
+
+@pytest.mark.parametrize("data, message", [
+    ([], "request body must be a JSON object"),
+    ({}, "items must be a non-empty list"),
+    ({"items": []}, "items must be a non-empty list"),
+    ({"items": [{"text": "a"}] * 3}, "items must contain at most 2 entries"),
+    ({"items": [{"text": "a"}], "validate": "maybe"}, request_parsing.VALIDATE_ERROR),
+    ({"items": ["add rice"]}, "items[0] must be an object"),
+    ({"items": [{"text": "a"}, {"text": "  "}]}, "items[1].text required"),
+    ({"items": [{"text": "a", "sender_id": 7}]}, "items[0].sender_id must be a string"),
+])
+def test_parse_classify_batch_rejects_malformed_bodies(data, message):
+    assert request_parsing.parse_classify_batch(data, max_items=2) == (None, message)
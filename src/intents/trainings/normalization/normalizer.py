@@ -15,6 +15,8 @@ from rasa.engine.storage.storage import ModelStorage
 from rasa.shared.nlu.training_data.message import Message
 from rasa.shared.nlu.training_data.training_data import TrainingData
 
+from .replacements import ReplacementEngine, WordNumberEngine
+
 logger = logging.getLogger(__name__)
 
 NUMERIC = r"(?P<num>\d+(?:[.,]\d+)?)"
@@ -29,6 +31,9 @@ NUMBER_WORDS = {
     "eighty": "80", "ninety": "90", "hundred": "100"
 }
 
+# Units split off a glued number word ("fivebunch" -> "5 bunch")
+NUMBER_UNITS = ['bunch', 'packet', 'bottle', 'kg', 'bag', 'crate', 'carton', 'tin', 'pack']
+
 
 @DefaultV1Recipe.register(
     component_types=[DefaultV1Recipe.ComponentType.MESSAGE_FEATURIZER],
@@ -64,12 +69,13 @@ class SimpleTextNormalizer(GraphComponent):
         self.synonym_map: Dict[str, List[str]] = maps["synonyms"]
         self.symbol_map: Dict[str, List[str]] = maps["symbols"]
 
-        self._replacements: List[Tuple[re.Pattern, str]] = self._compile_replacements(
+        self._replacements: ReplacementEngine = self._compile_replacements(
             self.product_map, self.unit_map, self.synonym_map, self.symbol_map
         )
         self._unit_group_pattern: re.Pattern | None = self._build_unit_group_pattern(
             self.unit_map
         )
+        self._word_numbers = WordNumberEngine(NUMBER_WORDS, NUMBER_UNITS)
 
         logger.info(
             "✅ SimpleTextNormalizer initialized "
@@ -173,14 +179,15 @@ class SimpleTextNormalizer(GraphComponent):
         unit_map: Dict[str, List[str]],
         synonym_map: Dict[str, List[str]],
         symbol_map: Dict[str, List[str]],
-    ) -> List[Tuple[re.Pattern, str]]:
+    ) -> ReplacementEngine:
+        # Word rules (form -> canonical), longest form first within each entry
+        word_rules: List[Tuple[str, str]] = []
         reps: List[Tuple[re.Pattern, str]] = []
 
         def add_pairs(canonical: str, variants: List[str]) -> None:
             all_forms = set([canonical] + variants)
-            for v in sorted(all_forms, key=len, reverse=True):
-                pat = re.compile(rf"\b{re.escape(v)}\b", flags=re.IGNORECASE)
-                reps.append((pat, canonical))
+            for v in sorted(all_forms, key=lambda form: (-len(form), form)):
+                word_rules.append((v, canonical))
 
         for tgt, vars_ in product_map.items():
             add_pairs(tgt, vars_)
@@ -216,7 +223,13 @@ class SimpleTextNormalizer(GraphComponent):
                 pat4 = re.compile(rf"(?<=\w){re.escape(symbol)}(?!\w)")
                 reps.append((pat4, f" {canonical}"))
 
-        return reps
+        engine = ReplacementEngine(word_rules, reps)
+        logger.info(
+            "Compiled %d replacement forms (%s)",
+            len(word_rules),
+            "single scan" if engine.single_scan else "sequential",
+        )
+        return engine
 
     def _build_unit_group_pattern(
         self, unit_map: Dict[str, List[str]]
@@ -250,31 +263,13 @@ class SimpleTextNormalizer(GraphComponent):
         return self._unit_group_pattern.sub(repl, text)
 
     def _normalize_word_numbers(self, text: str) -> str:
-        """Convert word numbers to digits."""
-        # First, split concatenated number+unit patterns
-        number_units = ['bunch', 'packet', 'bottle', 'kg', 'bag', 'crate', 'carton', 'tin', 'pack']
-        for word, digit in NUMBER_WORDS.items():
-            for unit in number_units:
-                # Handle patterns like "fivebunch", "threekg", "twopacket"
-                pattern = rf'\b{re.escape(word)}{re.escape(unit)}\b'
-                text = re.sub(pattern, f'{digit} {unit}', text, flags=re.IGNORECASE)
-        
-        # Then convert remaining word numbers
-        for word, digit in NUMBER_WORDS.items():
-            # Use word boundaries to avoid partial matches
-            pattern = rf'\b{re.escape(word)}\b'
-            text = re.sub(pattern, digit, text, flags=re.IGNORECASE)
-        return text
+        """Convert word numbers to digits ("fivebunch" -> "5 bunch", "two" -> "2")."""
+        return self._word_numbers.apply(text)
 
     def _apply_replacements(self, text: str) -> str:
-        replaced = 0
-        for pat, tgt in self._replacements:
-            text, n = pat.subn(tgt, text)
-            if n:
-                replaced += n
-            if replaced >= int(self.config.get("max_replacements_per_text", 50)):
-                break
-        return text
+        return self._replacements.apply(
+            text, int(self.config.get("max_replacements_per_text", 50))
+        )
 
     def _normalize_text(self, text: str) -> str:
         original = text
@@ -0,0 +1,249 @@
+"""
+Single-scan replacement engine for SimpleTextNormalizer.
+
+SimpleTextNormalizer used to run one ``\\bvariant\\b`` ``subn`` per product,
+unit and synonym form, so the cost of every message grew with the catalog.
+``ReplacementEngine`` compiles all word forms into one alternation, longest
+first so that at each position the longest form wins. A dict lookup then
+maps each match back to its target. Each message is scanned once, however
+large the catalog.
+
+The single scan gives exactly the sequential result (including the
+``max_replacements_per_text`` cut-off) when replacements cannot feed into
+each other. Concretely:
+
+* every form and target starts and ends with a word character,
+* no two different forms share a word,
+* no target shares a word with any form other than itself,
+* every form maps to one target.
+
+Chains that break these rules ("green pepper" -> "bell pepper" while
+"pepper" is a form of another target) depend on rule order. For those maps
+the engine logs the first conflict and keeps the sequential patterns.
+
+Symbol rules ("+" -> "add") are context patterns with look-arounds. There
+are only a handful, so they still run sequentially after the word scan, as
+before.
+
+``WordNumberEngine`` does the same for number words: "fivebunch" -> "5 bunch"
+and "twenty" -> "20" used to be one ``re.sub`` per (word, unit) pair and then
+one per word, each with a freshly built pattern.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _words(text: str) -> Set[str]:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+def _is_word_bounded(text: str) -> bool:
+    return bool(text) and _WORD_RE.match(text[0]) is not None and _WORD_RE.match(text[-1]) is not None
+
+
+def _lookup_key(lookup: Dict[str, object], matched: str) -> str:
+    """Key of lookup that an IGNORECASE alternation over its keys matched."""
+    key = matched.lower()
+    if key in lookup:
+        return key
+    # str.lower() and the regex case folding disagree on a few characters
+    # ("\u017f" matches "s", "\u0130" matches "i"): find the key that matched
+    for candidate in lookup:
+        if re.fullmatch(re.escape(candidate), matched, flags=re.IGNORECASE):
+            return candidate
+    raise KeyError(matched)
+
+
+def find_conflict(word_rules: Iterable[Tuple[str, str]]) -> Optional[str]:
+    """
+    Why word_rules cannot run as a single scan, or None if they can.
+
+    Args:
+        word_rules: (form, target) pairs in sequential order
+    """
+    targets: Dict[str, str] = {}
+    word_owner: Dict[str, str] = {}
+    for form, target in word_rules:
+        key = form.lower()
+        if not _is_word_bounded(form) or not _is_word_bounded(target):
+            return f"{form!r} -> {target!r} does not start and end with a word character"
+        if targets.setdefault(key, target) != target:
+            return f"{form!r} maps to both {targets[key]!r} and {target!r}"
+        for word in _words(form):
+            owner = word_owner.setdefault(word, key)
+            if owner != key:
+                return f"forms {owner!r} and {form!r} share the word {word!r}"
+
+    for key, target in targets.items():
+        for word in _words(target):
+            owner = word_owner.get(word)
+            if owner is not None and owner != target.lower():
+                return f"target {target!r} contains {word!r} from form {owner!r}"
+    return None
+
+
+class ReplacementEngine:
+    """
+    Applies ordered (form -> target) word rules, then symbol patterns.
+
+    Produces the same text as running every rule as its own
+    ``re.compile(rf"\\b{re.escape(form)}\\b", re.IGNORECASE).subn`` in
+    order, stopping after the rule that reaches max_replacements.
+    """
+
+    def __init__(
+        self,
+        word_rules: List[Tuple[str, str]],
+        symbol_rules: Optional[List[Tuple[re.Pattern, str]]] = None,
+    ) -> None:
+        self.symbol_rules: List[Tuple[re.Pattern, str]] = list(symbol_rules or [])
+        self.conflict = find_conflict(word_rules)
+        self.single_scan = self.conflict is None
+
+        # Sequential fallback (and the reference behaviour)
+        self._sequential: List[Tuple[re.Pattern, str]] = []
+        self._alternation: Optional[re.Pattern] = None
+        # lowercased form -> (rule index, target)
+        self._lookup: Dict[str, Tuple[int, str]] = {}
+        # rule index -> later rules whose form is its target (they re-match
+        # and count every replacement it makes)
+        self._echo: Dict[int, List[int]] = {}
+
+        if not self.single_scan:
+            logger.warning(
+                "Normalization replacements fall back to sequential patterns: %s",
+                self.conflict,
+            )
+            self._sequential = [
+                (re.compile(rf"\b{re.escape(form)}\b", flags=re.IGNORECASE), target)
+                for form, target in word_rules
+            ] + self.symbol_rules
+            return
+
+        rules_by_form: Dict[str, List[int]] = {}
+        for index, (form, target) in enumerate(word_rules):
+            self._lookup.setdefault(form.lower(), (index, target))
+            rules_by_form.setdefault(form.lower(), []).append(index)
+        for index, (_form, target) in enumerate(word_rules):
+            echo = [later for later in rules_by_form.get(target.lower(), []) if later > index]
+            if echo:
+                self._echo[index] = echo
+
+        if self._lookup:
+            alternatives = sorted(self._lookup, key=lambda form: (-len(form), form))
+            self._alternation = re.compile(
+                r"\b(?:" + "|".join(re.escape(form) for form in alternatives) + r")\b",
+                flags=re.IGNORECASE,
+            )
+
+    def apply(self, text: str, max_replacements: int) -> str:
+        """Apply the rules to text, stopping once max_replacements is reached."""
+        if not self.single_scan:
+            return self._apply_sequential(text, self._sequential, 0, max_replacements)
+
+        replaced = 0
+        if self._alternation is not None:
+            text, replaced, stopped = self._apply_words(text, max_replacements)
+            if stopped:
+                return text
+        return self._apply_sequential(text, self.symbol_rules, replaced, max_replacements)
+
+    def _apply_words(self, text: str, max_replacements: int) -> Tuple[str, int, bool]:
+        """One scan for all word rules: (text, replacements counted, cut-off reached)."""
+        matches = [
+            (match.start(), match.end(), self._lookup[_lookup_key(self._lookup, match.group(0))])
+            for match in self._alternation.finditer(text)
+        ]
+
+        # Per-rule counts as the sequential loop would see them
+        counts: Dict[int, int] = {}
+        for _start, _end, (index, _target) in matches:
+            counts[index] = counts.get(index, 0) + 1
+            for later in self._echo.get(index, ()):
+                counts[later] = counts.get(later, 0) + 1
+
+        # The sequential loop stops after the first rule that reaches the cap
+        last_rule = None
+        replaced = 0
+        if max_replacements <= 0:
+            last_rule = 0
+        else:
+            for index in sorted(counts):
+                replaced += counts[index]
+                if replaced >= max_replacements:
+                    last_rule = index
+                    break
+
+        pieces = []
+        position = 0
+        for start, end, (index, target) in matches:
+            if last_rule is not None and index > last_rule:
+                continue
+            pieces.append(text[position:start])
+            pieces.append(target)
+            position = end
+        pieces.append(text[position:])
+        return "".join(pieces), replaced, last_rule is not None
+
+    @staticmethod
+    def _apply_sequential(
+        text: str,
+        rules: List[Tuple[re.Pattern, str]],
+        replaced: int,
+        max_replacements: int,
+    ) -> str:
+        for pattern, target in rules:
+            text, n = pattern.subn(target, text)
+            replaced += n
+            if replaced >= max_replacements:
+                break
+        return text
+
+
+class WordNumberEngine:
+    """
+    Converts number words to digits in one scan.
+
+    Produces the same text as the two sequential loops it replaces: first
+    ``\\b{word}{unit}\\b`` -> "{digit} {unit}" for every (word, unit) pair,
+    then ``\\b{word}\\b`` -> "{digit}" for every word, all IGNORECASE.
+
+    Every pattern is made of letters between two word boundaries, so a match
+    is always a whole run of word characters, and no replacement creates a
+    run another pattern matches. Each run therefore has at most one
+    replacement, found by one alternation and a dict lookup.
+    """
+
+    def __init__(self, number_words: Dict[str, str], units: Iterable[str]) -> None:
+        units = list(units)
+        # lowercased token -> replacement; glued forms first, as before
+        self._lookup: Dict[str, str] = {}
+        for word, digit in number_words.items():
+            for unit in units:
+                self._lookup.setdefault(f"{word}{unit}".lower(), f"{digit} {unit}")
+        for word, digit in number_words.items():
+            self._lookup.setdefault(word.lower(), digit)
+
+        self._pattern: Optional[re.Pattern] = None
+        if self._lookup:
+            alternatives = sorted(self._lookup, key=lambda token: (-len(token), token))
+            self._pattern = re.compile(
+                r"\b(?:" + "|".join(re.escape(token) for token in alternatives) + r")\b",
+                flags=re.IGNORECASE,
+            )
+
+    def _replace(self, match: re.Match) -> str:
+        return self._lookup[_lookup_key(self._lookup, match.group(0))]
+
+    def apply(self, text: str) -> str:
+        """Replace number words (and number words glued to a unit) with digits."""
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(self._replace, text)
@@ -13,12 +13,13 @@ A Flask-based REST API for service/reservation booking processing with support f
 Usage:
     python luma/api.py
     
-    or
+    or (models loaded once in the master and shared by the forked workers)
     
-    gunicorn -w 4 -b 0.0.0.0:9001 luma.api:app
+    gunicorn -c luma/gunicorn.conf.py luma.api:app
 
 Endpoints:
     POST /book - Process service/reservation booking request
+    POST /book/batch - Process many booking requests in one call
     GET /health - Health check
     GET /info - API information
 """
@@ -32,16 +33,23 @@ if __name__ == "__main__":
         sys.path.insert(0, str(src_path))
 
 import time  # noqa: E402
-from datetime import datetime  # noqa: E402
-from flask import Flask, request, jsonify, g  # noqa: E402
-from luma.calendar.calendar_binder import bind_calendar  # noqa: E402
-from luma.resolution.semantic_resolver import resolve_semantics  # noqa: E402
-from luma.grouping.appointment_grouper import group_appointment  # noqa: E402
-from luma.structure.interpreter import interpret_structure  # noqa: E402
+from flask import Flask, Response, request, jsonify, g  # noqa: E402
 from luma.grouping.reservation_intent_resolver import ReservationIntentResolver  # noqa: E402
-from luma.extraction.matcher import EntityMatcher  # noqa: E402
-from luma.clarification import render_clarification  # noqa: E402
+from luma.extraction.matcher_registry import registry_info  # noqa: E402
+from luma.pipeline import (  # noqa: E402
+    api_info,
+    get_entity_file,
+    parse_batch_request,
+    parse_response_fields,
+    process_booking,
+    process_booking_batch,
+    validate_booking_item,
+    warm_pipeline,
+)
 from luma.config import config  # noqa: E402
+from luma.json_response import MIMETYPE, dumps  # noqa: E402
+from luma.metrics import metrics  # noqa: E402
+from luma.result_cache import result_cache  # noqa: E402
 from luma.logging_config import setup_logging, generate_request_id  # noqa: E402
 
 # Apply config settings
@@ -59,7 +67,7 @@ logger = setup_logging(
 )
 
 # Global pipeline components
-entity_matcher = None
+# Entity matchers are shared per worker via luma.extraction.matcher_registry
 intent_resolver = None
 
 
@@ -74,6 +82,11 @@ def before_request():
 @app.after_request
 def after_request(response):
     """Log request completion with timing and status."""
+    if hasattr(g, 'start_time') and config.ENABLE_METRICS:
+        # Label by route pattern, not raw path (unknown paths share one label)
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe_request(endpoint, time.time() - g.start_time)
+    
     if hasattr(g, 'start_time') and config.ENABLE_REQUEST_LOGGING:
         duration_ms = round((time.time() - g.start_time) * 1000, 2)
         
@@ -102,41 +115,9 @@ def after_request(response):
     return response
 
 
-def find_normalization_dir():
-    """Find the normalization directory."""
-    current_file = Path(__file__).resolve()
-    store_dir = current_file.parent / "store" / "normalization"
-    if store_dir.exists():
-        return store_dir
-    src_dir = current_file.parent.parent
-    intents_norm = src_dir / "intents" / "normalization"
-    if intents_norm.exists():
-        return intents_norm
-    return None
-
-
-def _localize_datetime(dt: datetime, timezone: str) -> datetime:
-    """Localize datetime to timezone."""
-    try:
-        from zoneinfo import ZoneInfo
-        tz = ZoneInfo(timezone)
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=tz)
-        return dt.astimezone(tz)
-    except Exception:
-        try:
-            import pytz
-            tz = pytz.timezone(timezone)
-            if dt.tzinfo is None:
-                return tz.localize(dt)
-            return dt.astimezone(tz)
-        except Exception:
-            return dt
-
-
 def init_pipeline():
     """Initialize the pipeline components."""
-    global entity_matcher, intent_resolver  # noqa: PLW0603
+    global intent_resolver  # noqa: PLW0603
     
     logger.info("=" * 60)
     logger.info("Initializing Luma Service/Reservation Booking Pipeline")
@@ -144,19 +125,33 @@ def init_pipeline():
     try:
         # Initialize intent resolver (lightweight, no file I/O)
         intent_resolver = ReservationIntentResolver()
-        
-        # Entity matcher will be initialized per-request with entity file
-        logger.info("Pipeline components initialized successfully")
-        return True
     except Exception as e:  # noqa: BLE001
         logger.error(f"Failed to initialize pipeline: {e}", exc_info=True)
         return False
+    
+    # Warm shared entity matchers (spaCy + entity ruler) and stage configs before the first request
+    if config.WARMUP_ON_STARTUP and not config.LAZY_LOAD_MODELS:
+        entity_file = get_entity_file()
+        try:
+            count = warm_pipeline(entity_file)
+            logger.info(f"Warmed {count} entity matcher(s)")
+        except Exception as e:  # noqa: BLE001
+            # Not fatal: matchers are built lazily on first request instead
+            logger.error(f"Pipeline warmup failed: {e}", exc_info=True)
+    
+    logger.info("Pipeline components initialized successfully")
+    return True
+
+
+def json_response(body, status: int = 200) -> Response:
+    """Encode a /book response body with luma.json_response (orjson when available)."""
+    return Response(dumps(body), status=status, mimetype=MIMETYPE)
 
 
 @app.route("/health", methods=["GET"])
 def health():
     """Health check endpoint."""
-    if entity_matcher is None and intent_resolver is None:
+    if intent_resolver is None:
         return jsonify({
             "status": "unhealthy",
             "message": "Pipeline components not initialized"
@@ -166,41 +161,25 @@ def health():
         "status": "healthy",
         "components": {
             "intent_resolver": intent_resolver is not None,
-            "entity_matcher": "lazy_initialized"
+            "entity_matcher": registry_info(),
+            "result_cache": result_cache.stats()
         }
     })
 
 
+@app.route("/metrics", methods=["GET"])
+def prometheus_metrics():
+    """Per-stage and per-endpoint latency histograms (Prometheus text format)."""
+    return Response(
+        metrics.render_prometheus() + result_cache.render_prometheus(),
+        mimetype="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 @app.route("/info", methods=["GET"])
 def info():
     """API information endpoint."""
-    return jsonify({
-        "name": "Luma Service/Reservation Booking API",
-        "version": "1.0.0",
-        "description": "Service and reservation booking processing with entity extraction, intent resolution, semantic resolution, and calendar binding",
-        "endpoints": {
-            "/book": {
-                "method": "POST",
-                "description": "Process service/reservation booking request",
-                "parameters": {
-                    "text": "string (required) - Booking request text",
-                    "domain": "string (optional) - 'service' or 'reservation' (default: 'service')",
-                    "timezone": "string (optional) - Timezone for calendar binding (default: 'UTC')",
-                }
-            },
-            "/health": {
-                "method": "GET",
-                "description": "Health check"
-            },
-            "/info": {
-                "method": "GET",
-                "description": "API information"
-            }
-        },
-        "configuration": {
-            "port": PORT,
-        }
-    })
+    return jsonify(api_info())
 
 
 @app.route("/book", methods=["POST"])
@@ -212,7 +191,10 @@ def book():
     {
         "text": "book haircut tomorrow at 2pm",
         "domain": "service",           // optional, default: "service"
-        "timezone": "UTC"              // optional, default: "UTC"
+        "timezone": "UTC",             // optional, default: "UTC"
+        "debug": false,                // optional, adds "timings_ms" and "trace"
+        "fields": ["calendar"],        // optional, stages to return (default: all)
+        "compact": false               // optional, same as "fields": ["intent", "calendar"]
     }
     
     Response:
@@ -246,22 +228,24 @@ def book():
     # Parse request
     try:
         data = request.get_json()
-        if not data or "text" not in data:
-            logger.warning("Missing 'text' parameter", extra={'request_id': request_id})
+        error = validate_booking_item(data)
+        if error:
+            logger.warning(error, extra={'request_id': request_id})
             return jsonify({
                 "success": False,
-                "error": "Missing 'text' parameter in request body"
+                "error": error
             }), 400
         
         text = data["text"]
         domain = data.get("domain", "service")
         timezone = data.get("timezone", "UTC")
-        
-        if not text or not isinstance(text, str):
-            logger.warning("Invalid text parameter", extra={'request_id': request_id})
+        debug = bool(data.get("debug", False))
+        fields, error = parse_response_fields(data)
+        if error:
+            logger.warning(error, extra={'request_id': request_id})
             return jsonify({
                 "success": False,
-                "error": "'text' must be a non-empty string"
+                "error": error
             }), 400
         
         # Log request
@@ -291,115 +275,25 @@ def book():
         start_time = time.time()
         
         # Find normalization directory
-        normalization_dir = find_normalization_dir()
-        if not normalization_dir:
+        entity_file = get_entity_file()
+        if not entity_file:
             return jsonify({
                 "success": False,
                 "error": "Normalization directory not found"
             }), 500
         
-        entity_file = str(normalization_dir / "101.v1.json")
-        
-        # Initialize now datetime
-        now = datetime.now()
-        now = _localize_datetime(now, timezone)
-        
-        results = {
-            "input": {
-                "sentence": text,
-                "domain": domain,
-                "timezone": timezone,
-                "now": now.isoformat()
-            },
-            "stages": {}
-        }
-        
-        # Stage 1: Entity Extraction
-        try:
-            matcher = EntityMatcher(domain=domain, entity_file=entity_file)
-            extraction_result = matcher.extract_with_parameterization(text)
-            results["stages"]["extraction"] = extraction_result
-        except Exception as e:
-            results["stages"]["extraction"] = {"error": str(e)}
-            return jsonify({"success": False, "data": results}), 500
-        
-        # Stage 2: Intent Resolution
-        try:
-            intent, confidence = intent_resolver.resolve_intent(text, extraction_result)
-            results["stages"]["intent"] = {"intent": intent, "confidence": confidence}
-        except Exception as e:
-            results["stages"]["intent"] = {"error": str(e)}
-            return jsonify({"success": False, "data": results}), 500
-        
-        # Stage 3: Structural Interpretation
-        try:
-            psentence = extraction_result.get('psentence', '')
-            structure = interpret_structure(psentence, extraction_result)
-            results["stages"]["structure"] = structure.to_dict()["structure"]
-        except Exception as e:
-            results["stages"]["structure"] = {"error": str(e)}
-            return jsonify({"success": False, "data": results}), 500
-        
-        # Stage 4: Appointment Grouping
-        try:
-            grouped_result = group_appointment(extraction_result, structure)
-            results["stages"]["grouping"] = grouped_result
-        except Exception as e:
-            results["stages"]["grouping"] = {"error": str(e)}
-            return jsonify({"success": False, "data": results}), 500
-        
-        # Stage 5: Semantic Resolution
-        try:
-            semantic_result = resolve_semantics(grouped_result, extraction_result)
-            results["stages"]["semantic"] = semantic_result.to_dict()
-        except Exception as e:
-            results["stages"]["semantic"] = {"error": str(e)}
-            return jsonify({"success": False, "data": results}), 500
-        
-        # Stage 6: Calendar Binding
-        try:
-            calendar_result = bind_calendar(
-                semantic_result,
-                now,
-                timezone,
-                intent=intent,
-                entities=extraction_result
-            )
-            results["stages"]["calendar"] = calendar_result.to_dict()
-        except Exception as e:
-            results["stages"]["calendar"] = {"error": str(e)}
-            return jsonify({"success": False, "data": results}), 500
-        
-        # Extract clarification message if needed
-        clarification = None
-        if semantic_result.needs_clarification and semantic_result.clarification:
-            try:
-                message = render_clarification(semantic_result.clarification)
-                clarification = {
-                    "needed": True,
-                    "reason": semantic_result.clarification.reason.value,
-                    "message": message
-                }
-            except Exception:
-                clarification = {
-                    "needed": True,
-                    "reason": semantic_result.clarification.reason.value
-                }
-        elif calendar_result.needs_clarification and calendar_result.clarification:
-            try:
-                message = render_clarification(calendar_result.clarification)
-                clarification = {
-                    "needed": True,
-                    "reason": calendar_result.clarification.reason.value,
-                    "message": message
-                }
-            except Exception:
-                clarification = {
-                    "needed": True,
-                    "reason": calendar_result.clarification.reason.value
-                }
-        else:
-            clarification = {"needed": False}
+        response = process_booking(
+            text,
+            intent_resolver,
+            entity_file,
+            domain=domain,
+            timezone=timezone,
+            include_timings=debug,
+            include_trace=debug,
+            fields=fields
+        )
+        if not response["success"]:
+            return json_response(response, 500)
         
         processing_time = round((time.time() - start_time) * 1000, 2)
         
@@ -410,16 +304,12 @@ def book():
                 extra={
                     'request_id': request_id,
                     'processing_time_ms': processing_time,
-                    'needs_clarification': clarification["needed"],
-                    'intent': intent
+                    'needs_clarification': response["clarification"]["needed"],
+                    'intent': response["data"]["stages"].get("intent", {}).get("intent")
                 }
             )
         
-        return jsonify({
-            "success": True,
-            "data": results,
-            "clarification": clarification
-        })
+        return json_response(response)
     
     except Exception as e:  # noqa: BLE001
         logger.error(
@@ -437,13 +327,132 @@ def book():
         }), 500
 
 
+@app.route("/book/batch", methods=["POST"])
+def book_batch():
+    """
+    Process many service/reservation booking requests in one call.
+    
+    Extraction runs through spaCy nlp.pipe; the remaining stages run per item.
+    A failing item reports its own error and never fails the batch.
+    
+    Request body:
+    {
+        "items": [
+            {"text": "book haircut tomorrow at 2pm", "domain": "service", "timezone": "UTC"},
+            ...
+        ],
+        "batch_size": 64,              // optional, default: BATCH_SIZE
+        "n_process": 1,                // optional, default: BATCH_N_PROCESS
+        "debug": false,                // optional, adds "timings_ms" and "trace" per result
+        "fields": ["calendar"],        // optional, stages to return per result (default: all)
+        "compact": false               // optional, same as "fields": ["intent", "calendar"]
+    }
+    
+    Response:
+    {
+        "success": true,
+        "count": 2,
+        "failed": 0,
+        "results": [
+            {"index": 0, "success": true, "data": {...}, "clarification": {...}},
+            {"index": 1, "success": false, "error": "..."}
+        ]
+    }
+    """
+    request_id = g.request_id if hasattr(g, 'request_id') else 'unknown'
+    
+    if intent_resolver is None:
+        logger.error("Pipeline not initialized", extra={'request_id': request_id})
+        return jsonify({
+            "success": False,
+            "error": "Pipeline not initialized"
+        }), 503
+    
+    # Parse request
+    try:
+        batch, error = parse_batch_request(request.get_json())
+        if error:
+            return jsonify({
+                "success": False,
+                "error": error
+            }), 400
+        items = batch["items"]
+    except Exception as e:  # noqa: BLE001
+        logger.error(
+            f"Invalid request format: {str(e)}",
+            extra={'request_id': request_id},
+            exc_info=True
+        )
+        return jsonify({
+            "success": False,
+            "error": f"Invalid request format: {str(e)}"
+        }), 400
+    
+    logger.info(
+        "Processing booking batch",
+        extra={'request_id': request_id, 'batch_items': len(items)}
+    )
+    
+    try:
+        start_time = time.time()
+        
+        entity_file = get_entity_file()
+        if not entity_file:
+            return jsonify({
+                "success": False,
+                "error": "Normalization directory not found"
+            }), 500
+        
+        results = process_booking_batch(
+            items,
+            intent_resolver,
+            entity_file,
+            batch_size=batch["batch_size"],
+            n_process=batch["n_process"],
+            include_timings=batch["debug"],
+            include_trace=batch["debug"],
+            fields=batch["fields"]
+        )
+        failed = sum(1 for result in results if not result["success"])
+        
+        processing_time = round((time.time() - start_time) * 1000, 2)
+        if config.LOG_PERFORMANCE_METRICS:
+            logger.info(
+                "Booking batch processed",
+                extra={
+                    'request_id': request_id,
+                    'processing_time_ms': processing_time,
+                    'batch_items': len(items),
+                    'batch_failed': failed
+                }
+            )
+        
+        return json_response({
+            "success": True,
+            "count": len(results),
+            "failed": failed,
+            "results": results
+        })
+    
+    except Exception as e:  # noqa: BLE001
+        logger.error(
+            f"Batch processing failed: {str(e)}",
+            extra={'request_id': request_id, 'error_type': type(e).__name__},
+            exc_info=True
+        )
+        return jsonify({
+            "success": False,
+            "error": f"Processing failed: {str(e)}"
+        }), 500
+
+
 @app.errorhandler(404)
 def not_found(error):  # noqa: ARG001, pylint: disable=unused-argument
     """Handle 404 errors."""
     return jsonify({
         "success": False,
         "error": "Endpoint not found",
-        "available_endpoints": ["/book", "/health", "/info"]
+        "available_endpoints": ["/book", "/book/batch", "/health", "/info", "/metrics"]
     }), 404
 
 
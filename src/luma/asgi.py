@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+"""
+Luma Service/Reservation Booking ASGI API
+
+ASGI entry point with the same /book, /book/batch, /health, /info and
+/metrics contract as the Flask API (luma/api.py).
+
+The event loop only parses requests and writes responses. The pipeline
+stages run on a BoundedWorkerPool of ASGI_POOL_PROCESSES workers. The
+workers are forked after the spaCy pipelines are warmed, so they share
+the models copy-on-write. When ASGI_MAX_PENDING requests are already
+queued or running, new ones get 503 with Retry-After. Pool queue depth
+is exported on /metrics.
+
+Run one server process per box; concurrency comes from the pool:
+    uvicorn luma.asgi:app --host 0.0.0.0 --port 9001
+
+    or
+
+    python luma/asgi.py
+
+Stage histograms are reported by the workers with each result and
+recorded here, so /metrics covers all workers. The result cache lives
+in each worker process; its /health and /metrics counters describe the
+server process only.
+"""
+import sys
+from pathlib import Path
+
+# Add src/ to path if running directly
+if __name__ == "__main__":
+    src_path = Path(__file__).parent.parent
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+
+import time  # noqa: E402
+from contextlib import asynccontextmanager  # noqa: E402
+from typing import Any, Dict, List, Optional, Tuple  # noqa: E402
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.responses import JSONResponse, PlainTextResponse, Response  # noqa: E402
+
+from luma.grouping.reservation_intent_resolver import ReservationIntentResolver  # noqa: E402
+from luma.extraction.matcher_registry import registry_info  # noqa: E402
+from luma.pipeline import (  # noqa: E402
+    api_info,
+    get_entity_file,
+    parse_batch_request,
+    parse_response_fields,
+    process_booking,
+    process_booking_batch,
+    validate_booking_item,
+    warm_pipeline,
+)
+from luma.config import config  # noqa: E402
+from luma.json_response import MIMETYPE, dumps  # noqa: E402
+from luma.metrics import metrics  # noqa: E402
+from luma.result_cache import result_cache  # noqa: E402
+from luma.worker_pool import BoundedWorkerPool, PoolSaturated  # noqa: E402
+from luma.logging_config import setup_logging, generate_request_id  # noqa: E402
+
+# Apply config settings
+PORT = config.API_PORT
+
+# Setup logging
+logger = setup_logging(
+    app_name='luma-api',
+    log_level=config.LOG_LEVEL,
+    log_format=config.LOG_FORMAT,
+    log_file=config.LOG_FILE
+)
+
+# Global pipeline components (set before the pool forks, inherited by workers)
+intent_resolver = None
+
+pool = BoundedWorkerPool(
+    processes=config.ASGI_POOL_PROCESSES,
+    max_pending=config.ASGI_MAX_PENDING
+)
+
+
+def init_pipeline() -> bool:
+    """Initialize the pipeline components (before the worker pool starts)."""
+    global intent_resolver  # noqa: PLW0603
+
+    logger.info("=" * 60)
+    logger.info("Initializing Luma Service/Reservation Booking Pipeline (ASGI)")
+
+    try:
+        intent_resolver = ReservationIntentResolver()
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"Failed to initialize pipeline: {e}", exc_info=True)
+        return False
+
+    # Load models and stage configs before forking so every worker shares them
+    if config.WARMUP_ON_STARTUP and not config.LAZY_LOAD_MODELS:
+        try:
+            count = warm_pipeline(get_entity_file())
+            logger.info(f"Warmed {count} entity matcher(s)")
+        except Exception as e:  # noqa: BLE001
+            # Not fatal: each worker builds its matchers on first request instead
+            logger.error(f"Pipeline warmup failed: {e}", exc_info=True)
+
+    logger.info("Pipeline components initialized successfully")
+    return True
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Initialize the pipeline, then fork the worker pool."""
+    if not init_pipeline():
+        raise RuntimeError("Failed to start API - pipeline initialization failed")
+    pool.start()
+    logger.info(
+        f"Worker pool ready: {pool.processes or 'thread'} worker(s), "
+        f"max {pool.max_pending} pending")
+    yield
+    pool.shutdown()
+
+
+app = FastAPI(title="Luma Service/Reservation Booking API", version="1.0.0", lifespan=lifespan)
+
+
+# ============================================================================
+# Worker jobs (run in pool workers; module-level so they pickle by name)
+# ============================================================================
+
+def _get_intent_resolver():
+    """The inherited intent resolver (built here if the worker was not forked)."""
+    global intent_resolver  # noqa: PLW0603
+    if intent_resolver is None:
+        intent_resolver = ReservationIntentResolver()
+    return intent_resolver
+
+
+def _book_job(
+    text: str,
+    domain: str,
+    timezone: str,
+    debug: bool,
+    fields: Optional[Tuple[str, ...]],
+    entity_file: str
+) -> Dict[str, Any]:
+    """Run process_booking for one request (timings always included)."""
+    return process_booking(
+        text,
+        _get_intent_resolver(),
+        entity_file,
+        domain=domain,
+        timezone=timezone,
+        include_timings=True,
+        include_trace=debug,
+        fields=fields
+    )
+
+
+def _book_batch_job(batch: Dict[str, Any], entity_file: str) -> List[Dict[str, Any]]:
+    """Run process_booking_batch for one /book/batch request (timings always included)."""
+    return process_booking_batch(
+        batch["items"],
+        _get_intent_resolver(),
+        entity_file,
+        batch_size=batch["batch_size"],
+        n_process=batch["n_process"],
+        include_timings=True,
+        include_trace=batch["debug"],
+        fields=batch["fields"]
+    )
+
+
+def _collect_timings(response: Dict[str, Any], debug: bool) -> None:
+    """
+    Record a worker's stage timings in this process's histograms.
+
+    Workers observe stages into their own registries, which /metrics never
+    sees; thread-mode jobs already observed them here.
+    """
+    timings = response.get("timings_ms") if debug else response.pop("timings_ms", None)
+    if timings and pool.uses_processes and config.ENABLE_METRICS:
+        for stage, ms in timings.items():
+            metrics.observe_stage(stage, ms / 1000)
+
+
+def _json(body: Any, status_code: int = 200) -> Response:
+    """Encode a /book response body with luma.json_response (orjson when available)."""
+    return Response(dumps(body), status_code=status_code, media_type=MIMETYPE)
+
+
+def _error(message: str, status_code: int, headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    return JSONResponse({"success": False, "error": message}, status_code=status_code, headers=headers)
+
+
+def _saturated(request_id: str, error: PoolSaturated) -> JSONResponse:
+    logger.warning(str(error), extra={'request_id': request_id})
+    return _error(str(error), 503, headers={"Retry-After": "1"})
+
+
+# ============================================================================
+# Middleware and endpoints
+# ============================================================================
+
+@app.middleware("http")
+async def track_requests(request: Request, call_next):
+    """Request ID, per-endpoint latency histogram and request logging."""
+    start_time = time.time()
+    request_id = request.headers.get('X-Request-ID') or generate_request_id()
+    request.state.request_id = request_id
+
+    response = await call_next(request)
+
+    if config.ENABLE_METRICS:
+        # Label by route pattern, not raw path (unknown paths share one label)
+        route = request.scope.get("route")
+        endpoint = route.path if route is not None else "unmatched"
+        metrics.observe_request(endpoint, time.time() - start_time)
+
+    if config.ENABLE_REQUEST_LOGGING:
+        duration_ms = round((time.time() - start_time) * 1000, 2)
+        logger.info(
+            f'{request.method} {request.url.path} {response.status_code}',
+            extra={
+                'request_id': request_id,
+                'method': request.method,
+                'path': request.url.path,
+                'status_code': response.status_code,
+                'duration_ms': duration_ms
+            }
+        )
+
+    response.headers['X-Request-ID'] = request_id
+    return response
+
+
+@app.get("/health")
+async def health():
+    """Health check endpoint."""
+    if intent_resolver is None:
+        return JSONResponse({
+            "status": "unhealthy",
+            "message": "Pipeline components not initialized"
+        }, status_code=503)
+
+    if pool.broken:
+        return JSONResponse({
+            "status": "unhealthy",
+            "message": "Worker pool is broken (a worker process died)",
+            "worker_pool": pool.stats()
+        }, status_code=503)
+
+    components = {
+        "intent_resolver": intent_resolver is not None,
+        "entity_matcher": registry_info(),
+        "worker_pool": pool.stats()
+    }
+    # Worker processes each keep their own result cache; this process's
+    # copy never sees a request, so its counters would read zero
+    if not pool.uses_processes:
+        components["result_cache"] = result_cache.stats()
+    return {"status": "healthy", "components": components}
+
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """
+    Stage/endpoint latency histograms, cache and worker pool counters (Prometheus text format).
+
+    The result cache is per worker process, so its counters are left out
+    when the pool runs processes.
+    """
+    cache = "" if pool.uses_processes else result_cache.render_prometheus()
+    return PlainTextResponse(
+        metrics.render_prometheus() + cache + pool.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@app.get("/info")
+async def info():
+    """API information endpoint."""
+    return api_info()
+
+
+@app.post("/book")
+async def book(request: Request):
+    """Process service/reservation booking request (same contract as luma/api.py)."""
+    request_id = request.state.request_id
+
+    if intent_resolver is None:
+        logger.error("Pipeline not initialized", extra={'request_id': request_id})
+        return _error("Pipeline not initialized", 503)
+
+    try:
+        data = await request.json()
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"Invalid request format: {str(e)}", extra={'request_id': request_id})
+        return _error(f"Invalid request format: {str(e)}", 400)
+
+    error = validate_booking_item(data)
+    if not error:
+        fields, error = parse_response_fields(data)
+    if error:
+        logger.warning(error, extra={'request_id': request_id})
+        return _error(error, 400)
+
+    entity_file = get_entity_file()
+    if not entity_file:
+        return _error("Normalization directory not found", 500)
+
+    text = data["text"]
+    debug = bool(data.get("debug", False))
+    try:
+        start_time = time.time()
+        response = await pool.run(
+            _book_job,
+            text,
+            data.get("domain", "service"),
+            data.get("timezone", "UTC"),
+            debug,
+            fields,
+            entity_file
+        )
+    except PoolSaturated as e:
+        return _saturated(request_id, e)
+    except Exception as e:  # noqa: BLE001
+        logger.error(
+            f"Processing failed: {str(e)}",
+            extra={'request_id': request_id, 'error_type': type(e).__name__, 'text_length': len(text)},
+            exc_info=True
+        )
+        return _error(f"Processing failed: {str(e)}", 500)
+
+    _collect_timings(response, debug)
+    if not response["success"]:
+        return _json(response, 500)
+
+    if config.LOG_PERFORMANCE_METRICS:
+        logger.info(
+            "Booking request processed successfully",
+            extra={
+                'request_id': request_id,
+                'processing_time_ms': round((time.time() - start_time) * 1000, 2),
+                'needs_clarification': response["clarification"]["needed"],
+                'intent': response["data"]["stages"].get("intent", {}).get("intent")
+            }
+        )
+    return _json(response)
+
+
+@app.post("/book/batch")
+async def book_batch(request: Request):
+    """Process many booking requests in one call (same contract as luma/api.py)."""
+    request_id = request.state.request_id
+
+    if intent_resolver is None:
+        logger.error("Pipeline not initialized", extra={'request_id': request_id})
+        return _error("Pipeline not initialized", 503)
+
+    try:
+        batch, error = parse_batch_request(await request.json())
+    except Exception as e:  # noqa: BLE001
+        logger.error(f"Invalid request format: {str(e)}", extra={'request_id': request_id})
+        return _error(f"Invalid request format: {str(e)}", 400)
+    if error:
+        return _error(error, 400)
+
+    entity_file = get_entity_file()
+    if not entity_file:
+        return _error("Normalization directory not found", 500)
+
+    try:
+        start_time = time.time()
+        results = await pool.run(_book_batch_job, batch, entity_file)
+    except PoolSaturated as e:
+        return _saturated(request_id, e)
+    except Exception as e:  # noqa: BLE001
+        logger.error(
+            f"Batch processing failed: {str(e)}",
+            extra={'request_id': request_id, 'error_type': type(e).__name__},
+            exc_info=True
+        )
+        return _error(f"Processing failed: {str(e)}", 500)
+
+    for result in results:
+        _collect_timings(result, batch["debug"])
+    failed = sum(1 for result in results if not result["success"])
+
+    if config.LOG_PERFORMANCE_METRICS:
+        logger.info(
+            "Booking batch processed",
+            extra={
+                'request_id': request_id,
+                'processing_time_ms': round((time.time() - start_time) * 1000, 2),
+                'batch_items': len(results),
+                'batch_failed': failed
+            }
+        )
+    return _json({
+        "success": True,
+        "count": len(results),
+        "failed": failed,
+        "results": results
+    })
+
+
+@app.exception_handler(404)
+async def not_found(_request: Request, _exc):
+    """Handle 404 errors."""
+    return JSONResponse({
+        "success": False,
+        "error": "Endpoint not found",
+        "available_endpoints": ["/book", "/book/batch", "/health", "/info", "/metrics"]
+    }, status_code=404)
+
+
+def main():
+    """Run the ASGI server (a single process; the worker pool provides concurrency)."""
+    import uvicorn
+
+    logger.info("=" * 60)
+    logger.info("Luma Service/Reservation Booking API (ASGI)")
+    logger.info(f"Starting server on http://localhost:{PORT}")
+    logger.info("=" * 60)
+
+    uvicorn.run(app, host=config.API_HOST, port=PORT)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Luma micro-benchmarks.
+
+Run individual benchmarks as modules, e.g.:
+    python -m luma.benchmarks.intent_resolver
+"""
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark: ReservationIntentResolver per-call cost.
+
+Compares the compiled single-scan rule families against the previous
+implementation (one uncompiled re.search per pattern) on the luma test corpus,
+and checks that both produce identical intents.
+
+Usage:
+    python -m luma.benchmarks.intent_resolver [--iterations N]
+"""
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Add src/ to path if running directly
+if __name__ == "__main__":
+    src_path = Path(__file__).parent.parent.parent
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+
+from luma.grouping.reservation_intent_resolver import ReservationIntentResolver  # noqa: E402
+
+
+_BOOKING = {
+    "service_families": [{"text": "haircut"}],
+    "dates": [{"text": "tomorrow"}],
+    "times": [{"text": "2pm"}],
+}
+_SERVICE_ONLY = {"service_families": [{"text": "haircut"}]}
+_DATE_ONLY = {"dates": [{"text": "tomorrow"}]}
+
+# Sentences from grouping/test_reservation_intent_resolver.py and luma/test.py
+CORPUS: List[Tuple[str, Dict[str, Any]]] = [
+    ("i want to pay", {}),
+    ("how do i make a payment", {}),
+    ("refund my booking", {}),
+    ("cancel my appointment", {}),
+    ("can't make it tomorrow", _DATE_ONLY),
+    ("reschedule my appointment", {}),
+    ("move my booking to tomorrow", _DATE_ONLY),
+    ("postpone my appointment", {}),
+    ("book me a haircut tomorrow", _BOOKING),
+    ("I want to book a full body massage this Friday at 4pm", _DATE_ONLY),
+    ("Schedule appointment for about 6ish", {"times": [{"text": "6ish"}]}),
+    ("are you available tomorrow?", _DATE_ONLY),
+    ("what times are available?", {}),
+    ("when is my appointment", {}),
+    ("status of my booking", {}),
+    ("how long does a haircut take", _SERVICE_ONLY),
+    ("what is your cancellation policy", {}),
+    ("how much is a haircut", _SERVICE_ONLY),
+    ("what services do you offer", {}),
+    ("haircut", _SERVICE_ONLY),
+    ("what do you recommend", {}),
+    ("hello", {}),
+    ("thanks", {}),
+    ("Book me in for a haircut tomorrow night at 10.30", _BOOKING),
+    ("Can you schedule a mani pedi for next monday morning?", _BOOKING),
+    ("Need a beard trim today around 6ish", _BOOKING),
+    ("pls book me for hair colouring on saturday at 11am", _BOOKING),
+    ("Can I get a haircut and beard trim tomorrow at 1pm?", _BOOKING),
+    ("hair cut booking for today 5.30pm", _BOOKING),
+]
+
+
+class LegacyReservationIntentResolver(ReservationIntentResolver):
+    """Previous matching strategy: one uncompiled re.search per pattern."""
+
+    def _matches_patterns(self, sentence: str, patterns: List[str]) -> bool:
+        for pattern in patterns:
+            if re.search(pattern, sentence, re.IGNORECASE):
+                return True
+        return False
+
+
+def _time_per_call(resolver, iterations: int) -> float:
+    """Mean microseconds per resolve_intent call over the corpus."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for sentence, entities in CORPUS:
+            resolver.resolve_intent(sentence, entities)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(CORPUS)) * 1e6
+
+
+def run_benchmark(iterations: int = 2000) -> Dict[str, float]:
+    """
+    Time both resolvers on the corpus.
+
+    Raises:
+        AssertionError: If the resolvers disagree on any corpus sentence
+    """
+    legacy = LegacyReservationIntentResolver()
+    compiled = ReservationIntentResolver()
+
+    for sentence, entities in CORPUS:
+        expected = legacy.resolve_intent(sentence, entities)
+        actual = compiled.resolve_intent(sentence, entities)
+        assert actual == expected, f"{sentence!r}: {actual} != {expected}"
+
+    # Warm caches (re module cache / compiled families) before timing
+    _time_per_call(legacy, 10)
+    _time_per_call(compiled, 10)
+
+    legacy_us = _time_per_call(legacy, iterations)
+    compiled_us = _time_per_call(compiled, iterations)
+    return {
+        "sentences": len(CORPUS),
+        "iterations": iterations,
+        "legacy_us_per_call": legacy_us,
+        "compiled_us_per_call": compiled_us,
+        "speedup": legacy_us / compiled_us if compiled_us else float("inf"),
+    }
+
+
+def main():
+    """Entry point for the benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark ReservationIntentResolver per-call cost"
+    )
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=2000,
+        help='Passes over the corpus (default: 2000)'
+    )
+    args = parser.parse_args()
+
+    stats = run_benchmark(args.iterations)
+    print(f"Corpus: {stats['sentences']} sentences x {stats['iterations']} iterations")
+    print(f"  legacy (re.search per pattern): {stats['legacy_us_per_call']:.2f} us/call")
+    print(f"  compiled rule families:         {stats['compiled_us_per_call']:.2f} us/call")
+    print(f"  speedup:                        {stats['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark: EntityMatcher text normalization per-call cost.
+
+Compares FusedNormalizer against the original chain (normalize_hyphens →
+pre_normalization → normalize_orthography → normalize_vocabularies →
+normalize_natural_language_variants) and checks both produce identical output.
+
+Uses the maps from global.v2.json when it can be found, otherwise the
+fixture maps from extraction/test_normalization.py. --synonyms N adds N
+synthetic service synonyms and orthography rules to show how cost scales
+with tenant vocabulary size.
+
+Usage:
+    python -m luma.benchmarks.normalization [--iterations N] [--synonyms N]
+"""
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Add src/ to path if running directly
+if __name__ == "__main__":
+    src_path = Path(__file__).parent.parent.parent
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+
+from luma.extraction.normalization import FusedNormalizer  # noqa: E402
+from luma.extraction.test_normalization import (  # noqa: E402
+    EDGE_CASES,
+    ORTHOGRAPHY_RULES,
+    SENTENCES,
+    SERVICE_FAMILIES,
+    VOCABULARIES,
+    legacy_normalize,
+)
+
+CORPUS = SENTENCES + EDGE_CASES
+
+
+def load_maps() -> Tuple[str, Tuple[Dict[str, str], ...]]:
+    """(source, (orthography_rules, synonym_map, typo_map, variant_map))."""
+    from luma.extraction.matcher import resolve_global_json_path
+    from luma.extraction.global_config import load_compiled_global_config
+
+    try:
+        global_config = load_compiled_global_config(resolve_global_json_path())
+        return str(global_config.path), (
+            global_config.orthography_rules,
+            global_config.synonym_map,
+            global_config.typo_map,
+            global_config.variant_map,
+        )
+    except ValueError:
+        from luma.extraction.entity_loading import build_natural_language_variant_map
+        from luma.extraction.vocabulary_normalization import compile_vocabulary_maps
+
+        synonym_map, typo_map, _ = compile_vocabulary_maps(VOCABULARIES)
+        return "test fixture maps", (
+            ORTHOGRAPHY_RULES,
+            synonym_map,
+            typo_map,
+            build_natural_language_variant_map(SERVICE_FAMILIES),
+        )
+
+
+def add_synthetic_rules(maps, count: int):
+    """Copy of maps with count extra multi-word variants and orthography rules."""
+    orthography_rules, synonym_map, typo_map, variant_map = maps
+    orthography_rules = dict(orthography_rules)
+    variant_map = dict(variant_map)
+    for i in range(count):
+        orthography_rules[f"svc {i} plus"] = f"svc{i}plus"
+        variant_map[f"service {i} deluxe"] = f"service{i}"
+    return orthography_rules, synonym_map, typo_map, variant_map
+
+
+def _time_per_call(normalize, iterations: int) -> float:
+    """Mean microseconds per normalize call over the corpus."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for text in CORPUS:
+            normalize(text)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(CORPUS)) * 1e6
+
+
+def run_benchmark(iterations: int = 500, synonyms: int = 0) -> Dict[str, float]:
+    """
+    Time both normalizers on the corpus.
+
+    Raises:
+        AssertionError: If the normalizers disagree on any corpus sentence
+    """
+    source, maps = load_maps()
+    if synonyms:
+        maps = add_synthetic_rules(maps, synonyms)
+        source = f"{source} + {synonyms} synthetic synonyms"
+    fused = FusedNormalizer(*maps).normalize
+
+    def legacy(text):
+        return legacy_normalize(text, *maps)
+
+    for text in CORPUS:
+        expected = legacy(text)
+        actual = fused(text)
+        assert actual == expected, f"{text!r}: {actual} != {expected}"
+
+    legacy_us = _time_per_call(legacy, iterations)
+    fused_us = _time_per_call(fused, iterations)
+    return {
+        "source": source,
+        "sentences": len(CORPUS),
+        "iterations": iterations,
+        "legacy_us_per_call": legacy_us,
+        "fused_us_per_call": fused_us,
+        "speedup": legacy_us / fused_us if fused_us else float("inf"),
+    }
+
+
+def main():
+    """Entry point for the benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark EntityMatcher text normalization per-call cost"
+    )
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        default=500,
+        help='Passes over the corpus (default: 500)'
+    )
+    parser.add_argument(
+        '--synonyms',
+        type=int,
+        default=0,
+        help='Synthetic synonyms/orthography rules to add (default: 0)'
+    )
+    args = parser.parse_args()
+
+    stats = run_benchmark(args.iterations, args.synonyms)
+    print(f"Maps: {stats['source']}")
+    print(f"Corpus: {stats['sentences']} sentences x {stats['iterations']} iterations")
+    print(f"  legacy chain:     {stats['legacy_us_per_call']:.2f} us/call")
+    print(f"  fused normalizer: {stats['fused_us_per_call']:.2f} us/call")
+    print(f"  speedup:          {stats['speedup']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark: gunicorn worker memory with and without preload.
+
+Starts luma.api under luma/gunicorn.conf.py with 1, 4 and 8 workers, sends
+booking requests so every worker has run the pipeline, then reads each
+process's /proc/<pid>/smaps_rollup:
+
+    RSS  resident pages, shared pages counted in full (what top shows)
+    PSS  shared pages divided among the processes sharing them
+    USS  pages private to the process (freed if the worker exits)
+
+With preload the workers' RSS stays close to the master's while their USS
+is small: the models are paged in once and shared. Without preload each
+worker's USS is a full copy of the models.
+
+Linux only (needs /proc/<pid>/smaps_rollup) and gunicorn, Flask and spaCy.
+
+Usage:
+    python -m luma.benchmarks.worker_memory [--workers 1 4 8] [--requests N] [--no-compare]
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List
+
+# Add src/ to path if running directly
+if __name__ == "__main__":
+    src_path = Path(__file__).parent.parent.parent
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+
+SRC_DIR = Path(__file__).resolve().parent.parent.parent
+GUNICORN_CONF = SRC_DIR / "luma" / "gunicorn.conf.py"
+
+SENTENCES = [
+    "book me a haircut tomorrow at 2pm",
+    "I want to book a full body massage this Friday at 4pm",
+    "are you available tomorrow?",
+    "cancel my appointment",
+    "book a room from 5 dec to 8 dec",
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _child_pids(pid: int) -> List[int]:
+    """PIDs whose parent is pid."""
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            stat = Path(f"/proc/{entry}/stat").read_text()
+        except OSError:
+            continue
+        # Fields after the parenthesized command name: state, ppid, ...
+        if int(stat.rsplit(")", 1)[1].split()[1]) == pid:
+            children.append(int(entry))
+    return children
+
+
+def read_memory_kb(pid: int) -> Dict[str, int]:
+    """RSS, PSS and USS of a process in kB."""
+    fields = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        fields[name] = int(value.split()[0])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _post(port: int, path: str, body: Dict) -> None:
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{port}{path}",
+        data=json.dumps(body).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        response.read()
+
+
+def _wait_healthy(port: int, timeout: float) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=5) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            pass
+        time.sleep(0.5)
+    raise RuntimeError(f"API did not become healthy within {timeout:.0f}s")
+
+
+def measure(workers: int, preload: bool, requests: int, timeout: float = 300) -> Dict[str, float]:
+    """Start gunicorn, drive requests through it and measure its processes."""
+    port = _free_port()
+    env = dict(os.environ, GUNICORN_PRELOAD="true" if preload else "false")
+    master = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", str(GUNICORN_CONF),
+         "-w", str(workers), "-b", f"127.0.0.1:{port}", "luma.api:app"],
+        cwd=str(SRC_DIR),
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_healthy(port, timeout)
+        # Enough requests that every worker has run the whole pipeline
+        for i in range(max(requests, workers * 10)):
+            _post(port, "/book", {"text": SENTENCES[i % len(SENTENCES)]})
+
+        worker_pids = _child_pids(master.pid)
+        master_memory = read_memory_kb(master.pid)
+        worker_memory = [read_memory_kb(pid) for pid in worker_pids]
+        if not worker_memory:
+            raise RuntimeError("No gunicorn workers found")
+    finally:
+        master.terminate()
+        master.wait(timeout=60)
+
+    count = len(worker_memory)
+    return {
+        "workers": count,
+        "preload": preload,
+        "master_rss_mb": master_memory["rss"] / 1024,
+        "worker_rss_mb": sum(m["rss"] for m in worker_memory) / count / 1024,
+        "worker_pss_mb": sum(m["pss"] for m in worker_memory) / count / 1024,
+        "worker_uss_mb": sum(m["uss"] for m in worker_memory) / count / 1024,
+        "total_pss_mb": (master_memory["pss"] + sum(m["pss"] for m in worker_memory)) / 1024,
+    }
+
+
+def main():
+    """Entry point for the benchmark."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Measure gunicorn worker memory with and without preload"
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        nargs='+',
+        default=[1, 4, 8],
+        help='Worker counts to measure (default: 1 4 8)'
+    )
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=200,
+        help='Booking requests sent before measuring (default: 200)'
+    )
+    parser.add_argument(
+        '--no-compare',
+        action='store_true',
+        help='Only measure preload (skip the no-preload baseline)'
+    )
+    args = parser.parse_args()
+
+    if not Path("/proc/self/smaps_rollup").exists():
+        sys.exit("This benchmark needs Linux /proc/<pid>/smaps_rollup")
+
+    modes = [True] if args.no_compare else [True, False]
+    print(f"{'workers':>7}  {'preload':>7}  {'master RSS':>10}  {'RSS/worker':>10}  "
+          f"{'PSS/worker':>10}  {'USS/worker':>10}  {'total PSS':>10}")
+    for workers in args.workers:
+        for preload in modes:
+            stats = measure(workers, preload, args.requests)
+            print(f"{stats['workers']:>7}  {'yes' if preload else 'no':>7}  "
+                  f"{stats['master_rss_mb']:>8.1f}MB  {stats['worker_rss_mb']:>8.1f}MB  "
+                  f"{stats['worker_pss_mb']:>8.1f}MB  {stats['worker_uss_mb']:>8.1f}MB  "
+                  f"{stats['total_pss_mb']:>8.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
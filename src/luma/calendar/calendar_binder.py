@@ -9,34 +9,21 @@ This layer answers: "What real dates/times does this correspond to?"
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
-import re
-
-# Try zoneinfo first (Python 3.9+), fallback to pytz
-try:
-    from zoneinfo import ZoneInfo
-    try:
-        # Test if tzdata is available
-        _ = ZoneInfo("UTC")
-        ZONEINFO_AVAILABLE = True
-    except Exception:
-        ZONEINFO_AVAILABLE = False
-except ImportError:
-    ZONEINFO_AVAILABLE = False
-
-try:
-    import pytz
-    PYTZ_AVAILABLE = True
-except ImportError:
-    PYTZ_AVAILABLE = False
+from typing import Dict, Any, Optional, Tuple
 
 
 from ..clarification import Clarification, ClarificationReason
-from ..extraction.entity_loading import (
-    load_relative_date_offsets,
-    load_time_window_bounds,
-    load_month_names,
-    load_global_vocabularies,
+from .time_grammar import (
+    parse_clock_time,
+    parse_date_parts,
+    parse_duration_minutes,
+    parse_weekday_expression,
+)
+from .timezones import get_timezone, localize_datetime
+from ..tracing import trace
+from ..extraction.global_config import (
+    CompiledGlobalConfig,
+    load_compiled_global_config,
 )
 
 
@@ -57,78 +44,43 @@ def _get_global_config_path() -> Path:
     return Path(__file__).parent.parent / "store" / "normalization" / "global.v2.json"
 
 
-# Lazy-loaded config (loaded on first use)
-_CONFIG_CACHE: Dict[str, Any] = {}
-
+def _load_config() -> CompiledGlobalConfig:
+    """
+    The compiled global config, shared with the other stages.
 
-def _load_config() -> Dict[str, Any]:
-    """Load and cache configuration from JSON."""
-    if not _CONFIG_CACHE:
-        config_path = _get_global_config_path()
-        _CONFIG_CACHE["relative_date_offsets"] = load_relative_date_offsets(
-            config_path)
-        _CONFIG_CACHE["time_window_bounds"] = load_time_window_bounds(
-            config_path)
-        _CONFIG_CACHE["month_names"] = load_month_names(config_path)
-        vocabularies = load_global_vocabularies(config_path)
-        _CONFIG_CACHE["weekday_to_number"] = vocabularies.get(
-            "weekdays", {}).get("to_number", {})
-    return _CONFIG_CACHE
+    load_compiled_global_config caches it and recompiles when the file's
+    mtime changes, so an edited global.v2.json reaches this stage too.
+    """
+    return load_compiled_global_config(_get_global_config_path())
 
 
 def _get_relative_date_offsets() -> Dict[str, int]:
     """Get relative date offsets from config."""
-    return _load_config()["relative_date_offsets"]
+    return _load_config().relative_date_offsets
 
 
 def _get_time_window_bounds() -> Dict[str, Dict[str, str]]:
     """Get time window bounds from config."""
-    return _load_config()["time_window_bounds"]
-
+    return _load_config().time_window_bounds
 
-def _get_month_names() -> Dict[str, int]:
-    """Get month name to number mapping from entity_types.date.month.to_number."""
-    return _load_config()["month_names"]
 
+def _get_month_number(month_name: str) -> Optional[int]:
+    """Month number for a canonical or variant month name (None if unknown)."""
+    return _load_config().month_numbers.get(month_name.lower())
 
-def _normalize_month_name(month_name: str) -> str:
-    """
-    Normalize month name/variant to canonical form.
-
-    Uses vocabularies.months to map variants (jan) to canonical (january).
-    Falls back to original if not found.
-    """
-    config_path = _get_global_config_path()
-    vocabularies = load_global_vocabularies(config_path)
-    months_dict = vocabularies.get("months", {})
-
-    month_lower = month_name.lower()
 
-    # Check if it's already canonical
-    if month_lower in months_dict:
-        return month_lower
+def _get_weekday_to_number() -> Dict[str, int]:
+    """Get weekday to number mapping from entity_types.date.weekday.to_number."""
+    return _load_config().weekday_to_number
 
-    # Check if it's a variant
-    for canonical, variants in months_dict.items():
-        if isinstance(variants, list) and month_lower in variants:
-            return canonical
 
-    # Not found, return original (will fail lookup later)
-    return month_lower
+_RANGE_KEYS = frozenset(("date_range", "time_range", "datetime_range"))
 
 
-def _get_weekday_to_number() -> Dict[str, int]:
-    """Get weekday to number mapping from entity_types.date.weekday.to_number."""
-    config = _load_config()
-    if "weekday_to_number" not in config:
-        # Load from entity_types
-        from ..extraction.entity_loading import load_global_entity_types
-        config_path = _get_global_config_path()
-        entity_types = load_global_entity_types(config_path)
-        weekday_to_number = entity_types.get("date", {}).get(
-            "weekday", {}).get("to_number", {})
-        config["weekday_to_number"] = weekday_to_number
-    return config["weekday_to_number"]
+def _is_flat_str_dict(value: Any) -> bool:
+    """True for a dict whose values are all str or None (a bound range)."""
+    return type(value) is dict and all(
+        v is None or type(v) is str for v in value.values())
 
 
 @dataclass
@@ -155,8 +107,17 @@ class CalendarBindingResult:
         Returns:
             Dictionary containing only JSON-serializable types
         """
-        # Serialize calendar_booking recursively
-        serialized_booking = self._serialize_value(self.calendar_booking)
+        serialized_booking = {}
+        for key, value in self.calendar_booking.items():
+            if key == "services" and type(value) is list:
+                serialized_booking[key] = [self._serialize_service(s) for s in value]
+            elif key in _RANGE_KEYS and _is_flat_str_dict(value):
+                # Ranges are already bound to ISO-8601 strings: copy, don't walk
+                serialized_booking[key] = dict(value)
+            elif value is None or type(value) in (str, int, float, bool):
+                serialized_booking[key] = value
+            else:
+                serialized_booking[key] = self._serialize_value(value)
 
         result = {
             "calendar_booking": serialized_booking,
@@ -171,6 +132,15 @@ class CalendarBindingResult:
 
         return result
 
+    def _serialize_service(self, service: Any) -> Any:
+        """Normalize a service to its minimal external shape (text + canonical)."""
+        if type(service) is dict and "text" in service and "canonical" in service:
+            text = service["text"]
+            canonical = service["canonical"]
+            if (text is None or type(text) is str) and (canonical is None or type(canonical) is str):
+                return {"text": text, "canonical": canonical}
+        return self._serialize_value(service)
+
     def _serialize_value(self, value: Any) -> Any:
         """
         Recursively serialize a value to JSON-safe types.
@@ -222,33 +192,55 @@ class CalendarBindingResult:
 
 
 def _get_timezone(timezone_str: str):
-    """Get timezone object, supporting zoneinfo and pytz."""
-    if ZONEINFO_AVAILABLE:
-        try:
-            return ZoneInfo(timezone_str)
-        except Exception:
-            from datetime import timezone
-            return timezone.utc
-    elif PYTZ_AVAILABLE:
-        try:
-            return pytz.timezone(timezone_str)
-        except Exception:
-            return pytz.UTC
-    else:
-        from datetime import timezone
-        return timezone.utc
+    """Get timezone object (cached per name), supporting zoneinfo and pytz."""
+    return get_timezone(timezone_str)
 
 
 def _localize_datetime(dt: datetime, tz: Any) -> datetime:
     """Localize a naive datetime to timezone-aware."""
-    if dt.tzinfo is not None:
-        return dt.astimezone(tz)
+    return localize_datetime(dt, tz)
 
-    # Handle pytz vs zoneinfo
-    if PYTZ_AVAILABLE and hasattr(tz, 'localize'):
-        return tz.localize(dt)
-    else:
-        return dt.replace(tzinfo=tz)
+
+# Days precomputed in BindingContext.days ("next <weekday>" reaches 13 days out)
+_BINDING_DAYS = 14
+
+
+@dataclass(frozen=True)
+class BindingContext:
+    """
+    Per-request binding state, computed once in bind_calendar.
+
+    Attributes:
+        tz: Timezone object
+        now: Localized current datetime
+        today: now at midnight
+        weekday: now.weekday() (Monday = 0)
+        days: today + 0.._BINDING_DAYS-1 days, for relative and weekday refs
+    """
+    tz: Any
+    now: datetime
+    today: datetime
+    weekday: int
+    days: Tuple[datetime, ...]
+
+    @classmethod
+    def create(cls, now: datetime, tz: Any) -> "BindingContext":
+        """Build the context for a (naive or aware) now in timezone tz."""
+        now = _localize_datetime(now, tz)
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return cls(
+            tz=tz,
+            now=now,
+            today=today,
+            weekday=now.weekday(),
+            days=tuple(today + timedelta(days=offset) for offset in range(_BINDING_DAYS))
+        )
+
+    def day(self, offset: int) -> datetime:
+        """Midnight offset days from today."""
+        if 0 <= offset < len(self.days):
+            return self.days[offset]
+        return self.today + timedelta(days=offset)
 
 
 # Intents that require calendar binding
@@ -362,10 +354,7 @@ def bind_calendar(
     """
     # Intent-guarded binding: only bind for specific intents
     if intent is not None and intent not in BINDING_INTENTS:
-        # Debug: Log intent guard failure
-        import sys
-        print(
-            f"DEBUG: Intent guard failed - intent='{intent}', BINDING_INTENTS={BINDING_INTENTS}", file=sys.stderr)
+        trace("calendar", "intent_guard_skipped", intent=intent)
         return CalendarBindingResult(
             calendar_booking={
                 "services": semantic_result.resolved_booking.get("services", []),
@@ -378,11 +367,8 @@ def bind_calendar(
             clarification=None
         )
 
-    # Get timezone object
-    tz = _get_timezone(timezone)
-
-    # Ensure now is timezone-aware
-    now = _localize_datetime(now, tz)
+    # Timezone, localized now and day tables, computed once per request
+    context = BindingContext.create(now, _get_timezone(timezone))
 
     # SHORT-CIRCUIT: If semantic resolution requires clarification, trust it
     # Calendar binding must NOT re-evaluate ambiguity
@@ -410,14 +396,12 @@ def bind_calendar(
     time_refs = resolved_booking.get("time_refs", [])
     duration = resolved_booking.get("duration")
 
-    # Debug: Log binding inputs
-    import sys
-    print(
-        f"DEBUG: date_refs={date_refs}, date_mode={date_mode}, time_refs={time_refs}, time_mode={time_mode}", file=sys.stderr)
+    trace("calendar", "input", date_refs=date_refs, date_mode=date_mode,
+          time_refs=time_refs, time_mode=time_mode)
 
     # Bind dates
-    date_range = _bind_dates(date_refs, date_mode, now, tz)
-    print(f"DEBUG: date_range={date_range}", file=sys.stderr)
+    date_range = _bind_dates(date_refs, date_mode, context)
+    trace("calendar", "dates_bound", date_range=date_range)
 
     # If date_refs exist but date_range is None, resolution failed - require clarification
     if date_refs and not date_range:
@@ -466,18 +450,18 @@ def bind_calendar(
         time_windows = entities.get("time_windows", [])
 
     # Bind times (with optional window info for bias rule)
-    time_range = _bind_times(time_refs, time_mode, now,
-                             tz, time_windows=time_windows)
-    print(f"DEBUG: time_range={time_range}", file=sys.stderr)
+    time_range = _bind_times(time_refs, time_mode, context,
+                             time_windows=time_windows)
+    trace("calendar", "times_bound", time_range=time_range)
 
     # Combine date + time into datetime range
     # NOTE: If date_range is None, datetime_range will also be None (no fallback to today)
-    datetime_range = _combine_datetime_range(date_range, time_range, now, tz)
-    print(f"DEBUG: datetime_range={datetime_range}", file=sys.stderr)
+    datetime_range = _combine_datetime_range(date_range, time_range, context)
+    trace("calendar", "datetime_combined", datetime_range=datetime_range)
 
     # Apply duration if present
     if duration and datetime_range:
-        datetime_range = _apply_duration(datetime_range, duration, tz)
+        datetime_range = _apply_duration(datetime_range, duration, context.tz)
 
     # Validate ranges (includes conflict detection)
     # NOTE: Only validation errors are checked here - ambiguity is decided by semantic resolution
@@ -529,8 +513,7 @@ def bind_calendar(
 def _bind_dates(
     date_refs: list,
     date_mode: str,
-    now: datetime,
-    tz: Any
+    context: BindingContext
 ) -> Optional[Dict[str, str]]:
     """
     Bind date references to actual calendar dates.
@@ -538,8 +521,7 @@ def _bind_dates(
     Args:
         date_refs: List of date reference strings
         date_mode: "single_day", "range", or "flexible"
-        now: Current datetime
-        tz: Timezone object
+        context: Per-request binding context
 
     Returns:
         Dict with "start_date" and "end_date" (YYYY-MM-DD) or None
@@ -549,7 +531,7 @@ def _bind_dates(
 
     if date_mode == "single_day":
         date_str = date_refs[0]
-        bound_date = _bind_single_date(date_str, now, tz)
+        bound_date = _bind_single_date(date_str, context)
         if bound_date:
             return {
                 "start_date": bound_date.strftime("%Y-%m-%d"),
@@ -558,8 +540,8 @@ def _bind_dates(
 
     elif date_mode == "range":
         if len(date_refs) >= 2:
-            start_date = _bind_single_date(date_refs[0], now, tz)
-            end_date = _bind_single_date(date_refs[1], now, tz)
+            start_date = _bind_single_date(date_refs[0], context)
+            end_date = _bind_single_date(date_refs[1], context)
             if start_date and end_date:
                 return {
                     "start_date": start_date.strftime("%Y-%m-%d"),
@@ -570,7 +552,7 @@ def _bind_dates(
     return None
 
 
-def _bind_single_date(date_str: str, now: datetime, tz: Any) -> Optional[datetime]:
+def _bind_single_date(date_str: str, context: BindingContext) -> Optional[datetime]:
     """
     Bind a single date reference to a datetime.
 
@@ -581,8 +563,7 @@ def _bind_single_date(date_str: str, now: datetime, tz: Any) -> Optional[datetim
 
     Args:
         date_str: Date reference string
-        now: Current datetime
-        tz: Timezone object
+        context: Per-request binding context
 
     Returns:
         Bound datetime or None
@@ -590,13 +571,11 @@ def _bind_single_date(date_str: str, now: datetime, tz: Any) -> Optional[datetim
     date_str_lower = date_str.lower().strip()
 
     # Handle "this <weekday>" and "next <weekday>"
-    weekday_map = _get_weekday_to_number()
-    # Use search instead of match to handle any leading/trailing text
-    match = re.search(
-        r"\b(this|next)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b", date_str_lower)
-    if match:
-        kind, weekday_str = match.group(1), match.group(2)
-        today_weekday = now.weekday()
+    weekday_expression = parse_weekday_expression(date_str_lower)
+    if weekday_expression:
+        kind, weekday_str = weekday_expression
+        weekday_map = _get_weekday_to_number()
+        today_weekday = context.weekday
         target_weekday = weekday_map[weekday_str]
         if kind == "this":
             # "this <weekday>" → upcoming weekday in current week (or today if same day)
@@ -608,23 +587,20 @@ def _bind_single_date(date_str: str, now: datetime, tz: Any) -> Optional[datetim
         else:  # "next"
             # "next <weekday>" → weekday in the following week
             days_ahead = (target_weekday - today_weekday) % 7 + 7
-        target_date = now + timedelta(days=days_ahead)
-        return target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        return context.day(days_ahead)
 
     # Check relative dates first
     relative_offsets = _get_relative_date_offsets()
     if date_str_lower in relative_offsets:
-        offset_days = relative_offsets[date_str_lower]
-        bound_date = now + timedelta(days=offset_days)
-        return bound_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        return context.day(relative_offsets[date_str_lower])
 
     # Parse absolute dates
     # Format: "15th dec" or "15 dec" or "dec 15" or "15/12" or "15/12/2025"
-    bound_date = _parse_absolute_date(date_str_lower, now, tz)
+    bound_date = _parse_absolute_date(date_str_lower, context)
     return bound_date
 
 
-def _parse_absolute_date(date_str: str, now: datetime, tz: Any) -> Optional[datetime]:
+def _parse_absolute_date(date_str: str, context: BindingContext) -> Optional[datetime]:
     """
     Parse absolute date string.
 
@@ -636,50 +612,14 @@ def _parse_absolute_date(date_str: str, now: datetime, tz: Any) -> Optional[date
 
     Prefers future dates. If date has passed this year, use next year.
     """
-    # Pattern 1: "15th dec" or "15 dec" or "15th january" or "15 january"
-    # Regex matches both abbreviations and full names, then normalizes to canonical
-    pattern1 = r"(\d{1,2})(?:st|nd|rd|th)?\s+(jan|january|feb|february|mar|march|apr|april|may|jun|june|jul|july|aug|august|sep|september|oct|october|nov|november|dec|december)(?:\s+(\d{4}))?"
-    match = re.search(pattern1, date_str)
-    if match:
-        day = int(match.group(1))
-        month_name_raw = match.group(2).lower()
-        year_str = match.group(3)
-        # Normalize month name to canonical form (jan -> january)
-        month_name = _normalize_month_name(month_name_raw)
-        month_names = _get_month_names()
-        month = month_names.get(month_name)
-        if month:
-            year = int(year_str) if year_str else None
-            return _resolve_year_month_day(year, month, day, now, tz)
-
-    # Pattern 2: "dec 15" or "december 15" or "jan 5" or "january 5"
-    # Regex matches both abbreviations and full names, then normalizes to canonical
-    pattern2 = r"(jan|january|feb|february|mar|march|apr|april|may|jun|june|jul|july|aug|august|sep|september|oct|october|nov|november|dec|december)\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s+(\d{4}))?"
-    match = re.search(pattern2, date_str)
-    if match:
-        month_name_raw = match.group(1).lower()
-        day = int(match.group(2))
-        year_str = match.group(3)
-        # Normalize month name to canonical form (jan -> january)
-        month_name = _normalize_month_name(month_name_raw)
-        month_names = _get_month_names()
-        month = month_names.get(month_name)
+    for parts in parse_date_parts(date_str):
+        if isinstance(parts.month, int):
+            # Numeric date: resolved as-is (invalid months yield None)
+            return _resolve_year_month_day(parts.year, parts.month, parts.day, context)
+        # Month variant or canonical name (jan, january) -> number
+        month = _get_month_number(parts.month)
         if month:
-            year = int(year_str) if year_str else None
-            return _resolve_year_month_day(year, month, day, now, tz)
-
-    # Pattern 3: "15/12" or "15/12/2025" or "15-12" or "15-12-2025"
-    pattern3 = r"(\d{1,2})[/-](\d{1,2})(?:[/-](\d{2,4}))?"
-    match = re.search(pattern3, date_str)
-    if match:
-        day = int(match.group(1))
-        month = int(match.group(2))
-        year_str = match.group(3)
-        year = int(year_str) if year_str else None
-        if year and year < 100:
-            # Two-digit year: assume 20xx
-            year = 2000 + year
-        return _resolve_year_month_day(year, month, day, now, tz)
+            return _resolve_year_month_day(parts.year, month, parts.day, context)
 
     return None
 
@@ -688,8 +628,7 @@ def _resolve_year_month_day(
     year: Optional[int],
     month: int,
     day: int,
-    now: datetime,
-    tz: Any
+    context: BindingContext
 ) -> Optional[datetime]:
     """
     Resolve year, month, day to a datetime.
@@ -697,14 +636,15 @@ def _resolve_year_month_day(
     If year is None, prefer future date.
     If date has passed this year, use next year.
     """
-    current_year = now.year
+    current_year = context.now.year
+    tz = context.tz
 
     if year is None:
         # Try this year first
         try:
             candidate = _localize_datetime(
                 datetime(current_year, month, day), tz)
-            if candidate >= now.replace(hour=0, minute=0, second=0, microsecond=0):
+            if candidate >= context.today:
                 return candidate
         except ValueError:
             pass
@@ -755,8 +695,7 @@ def _time_in_window(time_hhmm: str, window_name: str) -> bool:
 def _bind_times(
     time_refs: list,
     time_mode: str,
-    now: datetime,
-    tz: Any,
+    context: BindingContext,
     time_windows: Optional[list] = None
 ) -> Optional[Dict[str, str]]:
     """
@@ -768,8 +707,7 @@ def _bind_times(
     Args:
         time_refs: List of time reference strings
         time_mode: "exact", "window", "range", or "none"
-        now: Current datetime
-        tz: Timezone object
+        context: Per-request binding context
         time_windows: Optional list of time window entities (for bias rule)
 
     Returns:
@@ -862,60 +800,6 @@ def _bind_times(
     return None
 
 
-def _normalize_time_string(time_str: str) -> str:
-    """
-    Normalize time string to canonical form before parsing.
-
-    Handles space-delimited tokens like "5 . 30 pm" → "5:30 pm"
-
-    Converts:
-    - "5 . 30 pm" → "5:30 pm"
-    - "10 . 30" → "10:30"
-    - "4 pm" → "4:00 pm"
-    - "5:30 pm" → "5:30 pm" (already canonical)
-
-    Returns:
-        Normalized time string in canonical form
-    """
-    # Convert to lowercase and strip
-    normalized = time_str.lower().strip()
-
-    # Remove spaces around dots and colons
-    # "5 . 30" → "5.30"
-    normalized = re.sub(r'\s*([.:])\s*', r'\1', normalized)
-
-    # Handle "X pm" or "X am" where X is just hour
-    # "4 pm" → "4:00 pm"
-    hour_only_pattern = r'^(\d{1,2})\s+(am|pm)$'
-    match = re.match(hour_only_pattern, normalized)
-    if match:
-        hour = match.group(1)
-        meridiem = match.group(2)
-        return f"{hour}:00 {meridiem}"
-
-    # Handle "X.XX pm" or "X.XX am" (dot separator with meridiem)
-    # "5.30 pm" → "5:30 pm"
-    dot_with_meridiem_pattern = r'^(\d{1,2})\.(\d{2})\s+(am|pm)$'
-    match = re.match(dot_with_meridiem_pattern, normalized)
-    if match:
-        hour = match.group(1)
-        minute = match.group(2)
-        meridiem = match.group(3)
-        return f"{hour}:{minute} {meridiem}"
-
-    # Handle "X.XX" (dot separator, no meridiem)
-    # "5.30" → "5:30"
-    dot_no_meridiem_pattern = r'^(\d{1,2})\.(\d{2})$'
-    match = re.match(dot_no_meridiem_pattern, normalized)
-    if match:
-        hour = match.group(1)
-        minute = match.group(2)
-        return f"{hour}:{minute}"
-
-    # Return as-is if already in canonical form
-    return normalized
-
-
 def _parse_time(time_str: str) -> tuple[Optional[datetime], bool]:
     """
     Parse time string to datetime (time only, date ignored).
@@ -932,74 +816,16 @@ def _parse_time(time_str: str) -> tuple[Optional[datetime], bool]:
     - "15:00" (24-hour, unambiguous)
     - "10.30" / "10 . 30" (dot separator, no meridiem, ambiguous)
     - "5.30pm" / "5 . 30 pm" (dot separator with meridiem)
-    """
-    # Normalize time string first (handles space-delimited tokens)
-    time_str_normalized = _normalize_time_string(time_str)
-
-    # Remove remaining spaces for pattern matching (keep meridiem separate)
-    # "5:30 pm" → "5:30pm" for pattern matching
-    time_str_for_pattern = re.sub(r'\s+', '', time_str_normalized)
-
-    # Pattern 1: 12-hour format "9am" or "9:30am" or "5.30pm" (explicit AM/PM)
-    # Handles both colon and dot separators
-    pattern1 = r"(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm)"
-    match = re.search(pattern1, time_str_for_pattern)
-    if match:
-        hour = int(match.group(1))
-        minute = int(match.group(2)) if match.group(2) else 0
-        period = match.group(3)
-
-        if period == "pm" and hour != 12:
-            hour += 12
-        elif period == "am" and hour == 12:
-            hour = 0
-
-        try:
-            # Explicit meridiem
-            return datetime(2000, 1, 1, hour, minute), True
-        except ValueError:
-            return None, False
-
-    # Pattern 2: 24-hour format "09:30" or "15:00" (colon separator)
-    pattern2 = r"(\d{1,2}):(\d{2})"
-    match = re.search(pattern2, time_str_for_pattern)
-    if match:
-        hour = int(match.group(1))
-        minute = int(match.group(2))
-
-        # If hour >= 13, it's unambiguous 24-hour format
-        has_explicit_meridiem = hour >= 13
 
-        try:
-            return datetime(2000, 1, 1, hour, minute), has_explicit_meridiem
-        except ValueError:
-            return None, False
-
-    # Pattern 3: 24-hour format "10.30" or "15.00" (dot separator, no meridiem)
-    # Handles cases like "at 10.30" where dot is used instead of colon
-    # Note: Dot separator with meridiem is handled by Pattern 1
-    pattern3 = r"(\d{1,2})\.(\d{2})"
-    match = re.search(pattern3, time_str_for_pattern)
-    if match:
-        hour = int(match.group(1))
-        minute = int(match.group(2))
-
-        # If hour >= 13, it's unambiguous 24-hour format
-        has_explicit_meridiem = hour >= 13
-
-        try:
-            return datetime(2000, 1, 1, hour, minute), has_explicit_meridiem
-        except ValueError:
-            return None, False
-
-    return None, False
+    Parses are memoized per surface form (see time_grammar).
+    """
+    return parse_clock_time(time_str)
 
 
 def _combine_datetime_range(
     date_range: Optional[Dict[str, str]],
     time_range: Optional[Dict[str, str]],
-    now: datetime,
-    tz: Any
+    context: BindingContext
 ) -> Optional[Dict[str, str]]:
     """
     Combine date range and time range into datetime range.
@@ -1007,8 +833,7 @@ def _combine_datetime_range(
     Args:
         date_range: Dict with "start_date" and "end_date" (YYYY-MM-DD)
         time_range: Dict with "start_time" and "end_time" (HH:MM)
-        now: Current datetime
-        tz: Timezone object
+        context: Per-request binding context
 
     Returns:
         Dict with "start" and "end" (ISO-8601) or None
@@ -1016,6 +841,8 @@ def _combine_datetime_range(
     if not date_range and not time_range:
         return None
 
+    tz = context.tz
+
     # If only date exists → full-day range
     if date_range and not time_range:
         start_date = datetime.strptime(date_range["start_date"], "%Y-%m-%d")
@@ -1101,24 +928,7 @@ def _parse_duration(duration_text: str) -> Optional[int]:
 
     Handles: "one hour", "30 mins", "2 hours", "half hour", etc.
     """
-    duration_text = duration_text.lower().strip()
-
-    # Pattern: number + unit
-    patterns = [
-        (r"(\d+)\s*(?:hour|hr|h)", lambda m: int(m.group(1)) * 60),
-        (r"(\d+)\s*(?:minute|min|m)", lambda m: int(m.group(1))),
-        (r"one\s+hour", lambda m: 60),
-        (r"half\s+hour", lambda m: 30),
-        (r"(\d+)\s*(?:hour|hr|h)\s*(?:and\s+)?(\d+)\s*(?:minute|min|m)",
-         lambda m: int(m.group(1)) * 60 + int(m.group(2))),
-    ]
-
-    for pattern, converter in patterns:
-        match = re.search(pattern, duration_text)
-        if match:
-            return converter(match)
-
-    return None
+    return parse_duration_minutes(duration_text)
 
 
 def _validate_ranges(
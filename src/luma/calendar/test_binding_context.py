@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-request BindingContext and the shared timezone cache.
+"""
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # calendar/
+luma_dir = script_dir.parent  # luma/
+src_dir = luma_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.calendar import calendar_binder  # noqa: E402
+from luma.calendar.calendar_binder import BindingContext  # noqa: E402
+from luma.calendar.timezones import (  # noqa: E402
+    _cached_timezone,
+    get_timezone,
+    lookup_timezone,
+    localize_datetime,
+)
+from luma.extraction.global_config import load_compiled_global_config  # noqa: E402
+
+
+GLOBAL_CONFIG = {
+    "service_families": {},
+    "entity_types": {
+        "date": {
+            "relative": [
+                {"value": "today", "offset_days": 0},
+                {"value": "tomorrow", "offset_days": 1},
+                {"value": "next week", "offset_days": 7},
+                {"value": "next month", "offset_days": 30},
+            ],
+            "month": {"to_number": {"january": 1, "december": 12}}
+        }
+    },
+    "normalization": {
+        "vocabularies": {
+            "weekdays": {"to_number": {
+                "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+                "friday": 4, "saturday": 5, "sunday": 6}},
+            "months": {"january": ["jan"], "december": ["dec"]}
+        }
+    }
+}
+
+TIMEZONES = ["UTC", "America/New_York", "Europe/London", "Asia/Kolkata"]
+
+# Around the US/UK DST changes and a year boundary
+NOWS = [
+    datetime(2025, 12, 16, 10, 0),
+    datetime(2025, 10, 30, 23, 30),
+    datetime(2025, 3, 8, 0, 15),
+    datetime(2025, 12, 31, 23, 59),
+]
+
+
+@pytest.fixture
+def binder_config(tmp_path, monkeypatch):
+    path = tmp_path / "global.v2.json"
+    path.write_text(json.dumps(GLOBAL_CONFIG), encoding="utf-8")
+    monkeypatch.setattr(calendar_binder, "_get_global_config_path", lambda: path)
+    return load_compiled_global_config(path)
+
+
+def test_edited_config_reaches_the_binder(tmp_path, monkeypatch):
+    path = tmp_path / "global.v2.json"
+    path.write_text(json.dumps(GLOBAL_CONFIG), encoding="utf-8")
+    monkeypatch.setattr(calendar_binder, "_get_global_config_path", lambda: path)
+    assert calendar_binder._get_relative_date_offsets()["tomorrow"] == 1
+
+    edited = json.loads(json.dumps(GLOBAL_CONFIG))
+    edited["entity_types"]["date"]["relative"][1]["offset_days"] = 2
+    path.write_text(json.dumps(edited), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert calendar_binder._get_relative_date_offsets()["tomorrow"] == 2
+
+
+def _tz_or_skip(name):
+    tz = lookup_timezone(name)
+    if tz is None:
+        pytest.skip(f"timezone data for {name} not available")
+    return tz
+
+
+@pytest.mark.parametrize("timezone", TIMEZONES)
+@pytest.mark.parametrize("now", NOWS)
+def test_context_days_match_per_call_arithmetic(timezone, now):
+    """context.day(n) equals the old (now + n days) at midnight."""
+    tz = _tz_or_skip(timezone)
+    context = BindingContext.create(now, tz)
+    localized = localize_datetime(now, tz)
+
+    assert context.now == localized
+    assert context.weekday == localized.weekday()
+    for offset in range(0, 40):
+        expected = (localized + timedelta(days=offset)).replace(
+            hour=0, minute=0, second=0, microsecond=0)
+        assert context.day(offset) == expected
+        assert context.day(offset).isoformat() == expected.isoformat()
+
+
+@pytest.mark.parametrize("now", NOWS)
+def test_relative_and_weekday_refs_use_context(binder_config, now):
+    tz = _tz_or_skip("America/New_York")
+    context = BindingContext.create(now, tz)
+    localized = context.now
+
+    for ref, offset in binder_config.relative_date_offsets.items():
+        assert calendar_binder._bind_single_date(ref, context) == context.day(offset)
+
+    for weekday, number in binder_config.weekday_to_number.items():
+        this_offset = (number - localized.weekday()) % 7
+        assert calendar_binder._bind_single_date(
+            f"this {weekday}", context) == context.day(this_offset)
+        assert calendar_binder._bind_single_date(
+            f"next {weekday}", context) == context.day(this_offset + 7)
+
+
+def test_absolute_dates_roll_to_next_year(binder_config):
+    context = BindingContext.create(datetime(2025, 12, 16, 10, 0), get_timezone("UTC"))
+    assert calendar_binder._bind_single_date("5 jan", context).date() == \
+        datetime(2026, 1, 5).date()
+    assert calendar_binder._bind_single_date("16 dec", context).date() == \
+        datetime(2025, 12, 16).date()
+
+
+def test_timezones_are_cached():
+    _cached_timezone.cache_clear()
+    first = get_timezone("UTC")
+    assert get_timezone("UTC") is first
+    assert _cached_timezone.cache_info().hits == 1
+
+
+def test_unknown_timezone_falls_back_to_utc():
+    assert lookup_timezone("Not/AZone") is None
+    assert get_timezone("Not/AZone").utcoffset(datetime(2025, 1, 1)) == timedelta(0)
+
+
+def test_non_string_timezone_falls_back_to_utc():
+    assert lookup_timezone(["UTC"]) is None
+    assert lookup_timezone({"name": "UTC"}) is None
+    assert get_timezone(["UTC"]).utcoffset(datetime(2025, 1, 1)) == timedelta(0)
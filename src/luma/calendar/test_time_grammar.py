@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Golden-output tests for the calendar time/date grammar.
+
+The memoized grammar must parse every time, date and duration ref exactly
+like the original per-call regex chains in calendar_binder.
+"""
+import random
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # calendar/
+luma_dir = script_dir.parent  # luma/
+src_dir = luma_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.calendar.time_grammar import (  # noqa: E402
+    DateParts,
+    parse_clock_time,
+    parse_date_parts,
+    parse_duration_minutes,
+    parse_weekday_expression,
+)
+
+
+TIME_REFS = [
+    "9am", "9 am", "9:00am", "9pm", "9 pm", "12am", "12pm", "12:30 am",
+    "09:30", "9:30", "15:00", "23:59", "24:00", "10.30", "10 . 30",
+    "5.30pm", "5 . 30 pm", "5.30 pm", "4 pm", "4PM", " 10:30 ", "9", "10",
+    "13pm", "25:00", "9:60", "0:15", "123:45", "10:30 to 5pm", "at 10.30",
+    "9-10am", "noon", "", "  ", "5:3pm", "11.5", "7.45am", "8 : 15",
+]
+
+DATE_REFS = [
+    "15th dec", "15 dec", "15 december", "15th december 2025", "5 jan",
+    "25th feb", "dec 15", "dec 15th", "december 15", "december 15th 2025",
+    "jan 5", "feb 25th", "15/12", "15/12/2025", "15-12-2025", "5/1",
+    "25-2-2025", "15/12/25", "32nd dec", "dec 32", "15/13/2025", "31 sep",
+    "1st may", "may 1", "on 15th dec at 2pm", "sept 15", "15 sept",
+    "12/12/123", "tomorrow", "", "dec", "15",
+]
+
+WEEKDAY_REFS = [
+    "this friday", "next monday", "next  sunday", "this fridays",
+    "see you next tuesday", "friday", "nextmonday", "",
+]
+
+DURATION_REFS = [
+    "one hour", "30 mins", "2 hours", "half hour", "1 hr", "90 min",
+    "1 hour and 30 minutes", "One Hour", "  45m ", "an hour", "",
+]
+
+
+def legacy_parse_time(time_str):
+    """The original _normalize_time_string + _parse_time chain."""
+    normalized = time_str.lower().strip()
+    normalized = re.sub(r'\s*([.:])\s*', r'\1', normalized)
+    match = re.match(r'^(\d{1,2})\s+(am|pm)$', normalized)
+    if match:
+        normalized = f"{match.group(1)}:00 {match.group(2)}"
+    else:
+        match = re.match(r'^(\d{1,2})\.(\d{2})\s+(am|pm)$', normalized)
+        if match:
+            normalized = f"{match.group(1)}:{match.group(2)} {match.group(3)}"
+        else:
+            match = re.match(r'^(\d{1,2})\.(\d{2})$', normalized)
+            if match:
+                normalized = f"{match.group(1)}:{match.group(2)}"
+
+    compact = re.sub(r'\s+', '', normalized)
+
+    match = re.search(r"(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm)", compact)
+    if match:
+        hour = int(match.group(1))
+        minute = int(match.group(2)) if match.group(2) else 0
+        period = match.group(3)
+        if period == "pm" and hour != 12:
+            hour += 12
+        elif period == "am" and hour == 12:
+            hour = 0
+        try:
+            return datetime(2000, 1, 1, hour, minute), True
+        except ValueError:
+            return None, False
+
+    for pattern in (r"(\d{1,2}):(\d{2})", r"(\d{1,2})\.(\d{2})"):
+        match = re.search(pattern, compact)
+        if match:
+            hour = int(match.group(1))
+            minute = int(match.group(2))
+            try:
+                return datetime(2000, 1, 1, hour, minute), hour >= 13
+            except ValueError:
+                return None, False
+
+    return None, False
+
+
+_LEGACY_MONTHS = (
+    r"(jan|january|feb|february|mar|march|apr|april|may|jun|june|jul|july|"
+    r"aug|august|sep|september|oct|october|nov|november|dec|december)")
+
+
+def legacy_date_parts(date_str):
+    """Matches of the original _parse_absolute_date patterns, in order."""
+    candidates = []
+    match = re.search(
+        r"(\d{1,2})(?:st|nd|rd|th)?\s+" + _LEGACY_MONTHS + r"(?:\s+(\d{4}))?", date_str)
+    if match:
+        candidates.append(DateParts(
+            int(match.group(1)), match.group(2),
+            int(match.group(3)) if match.group(3) else None))
+    match = re.search(
+        _LEGACY_MONTHS + r"\s+(\d{1,2})(?:st|nd|rd|th)?(?:\s+(\d{4}))?", date_str)
+    if match:
+        candidates.append(DateParts(
+            int(match.group(2)), match.group(1),
+            int(match.group(3)) if match.group(3) else None))
+    match = re.search(r"(\d{1,2})[/-](\d{1,2})(?:[/-](\d{2,4}))?", date_str)
+    if match:
+        year = int(match.group(3)) if match.group(3) else None
+        if year and year < 100:
+            year = 2000 + year
+        candidates.append(DateParts(int(match.group(1)), int(match.group(2)), year))
+    return tuple(candidates)
+
+
+@pytest.mark.parametrize("time_str", TIME_REFS)
+def test_parse_clock_time_matches_legacy(time_str):
+    assert parse_clock_time(time_str) == legacy_parse_time(time_str)
+
+
+def test_parse_clock_time_matches_legacy_on_random_refs():
+    """Random digit/separator/meridiem soup parses like the regex chain."""
+    rng = random.Random(12)
+    alphabet = ["0", "1", "2", "3", "5", "9", ":", ".", " ", "am", "pm", "a", "x", "-"]
+    for _ in range(5000):
+        time_str = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+        assert parse_clock_time(time_str) == legacy_parse_time(time_str), time_str
+
+
+def test_parse_clock_time_examples():
+    assert parse_clock_time("2pm") == (datetime(2000, 1, 1, 14, 0), True)
+    assert parse_clock_time("14:30") == (datetime(2000, 1, 1, 14, 30), True)
+    assert parse_clock_time("10.30") == (datetime(2000, 1, 1, 10, 30), False)
+    assert parse_clock_time("9") == (None, False)
+
+
+@pytest.mark.parametrize("date_str", DATE_REFS)
+def test_parse_date_parts_matches_legacy(date_str):
+    assert parse_date_parts(date_str) == legacy_date_parts(date_str)
+
+
+def test_parse_date_parts_priority():
+    # "dec 20" also reads as month-day; the day-month reading comes first
+    assert parse_date_parts("15th dec 2025") == (
+        DateParts(15, "dec", 2025), DateParts(20, "dec", None))
+    assert parse_date_parts("dec 15") == (DateParts(15, "dec", None),)
+    assert parse_date_parts("15/12/25") == (DateParts(15, 12, 2025),)
+
+
+@pytest.mark.parametrize("date_str", WEEKDAY_REFS)
+def test_parse_weekday_expression_matches_legacy(date_str):
+    match = re.search(
+        r"\b(this|next)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b",
+        date_str)
+    expected = (match.group(1), match.group(2)) if match else None
+    assert parse_weekday_expression(date_str) == expected
+
+
+@pytest.mark.parametrize("duration_text", DURATION_REFS)
+def test_parse_duration_minutes(duration_text):
+    expected = {
+        "one hour": 60, "30 mins": 30, "2 hours": 120, "half hour": 30,
+        "1 hr": 60, "90 min": 90, "1 hour and 30 minutes": 60,
+        "One Hour": 60, "  45m ": 45, "an hour": None, "": None,
+    }
+    assert parse_duration_minutes(duration_text) == expected[duration_text]
+
+
+def test_parses_are_memoized():
+    parse_clock_time.cache_clear()
+    parse_clock_time("2pm")
+    parse_clock_time("2pm")
+    info = parse_clock_time.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
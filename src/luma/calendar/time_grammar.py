@@ -0,0 +1,173 @@
+"""
+Clock-time, date and duration grammar for calendar binding.
+
+Time, date and duration refs come from a small, closed set of surface forms
+("2pm", "14:30", "15th dec", "one hour"), so every parse is memoized on the
+surface string. A miss runs precompiled patterns; a hit is one dict lookup.
+
+The grammar is time-independent: it returns hour/minute and day/month/year
+parts, and the binder resolves them against `now`, the timezone and the
+global config.
+"""
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple, Union
+
+
+# Surface forms seen by one process are few; this bounds pathological input
+MEMO_SIZE = 2048
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Whole ref is one clock time: "9", "9am", "9:30", "9.30pm", "15:00"
+_CLOCK_TIME_RE = re.compile(r"(\d{1,2})(?:([:.])(\d{2}))?(am|pm)?")
+
+# Fallbacks for refs with surrounding text, tried in priority order
+_MERIDIEM_TIME_RE = re.compile(r"(\d{1,2})(?:[:.](\d{2}))?\s*(am|pm)")
+_COLON_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+_DOT_TIME_RE = re.compile(r"(\d{1,2})\.(\d{2})")
+
+_MONTH_NAMES = (
+    r"(jan|january|feb|february|mar|march|apr|april|may|jun|june|jul|july|"
+    r"aug|august|sep|september|oct|october|nov|november|dec|december)"
+)
+_ORDINAL_SUFFIX = r"(?:st|nd|rd|th)?"
+
+# "15th dec", "15 december 2025"
+_DAY_MONTH_RE = re.compile(
+    r"(\d{1,2})" + _ORDINAL_SUFFIX + r"\s+" + _MONTH_NAMES + r"(?:\s+(\d{4}))?")
+# "dec 15", "december 15th 2025"
+_MONTH_DAY_RE = re.compile(
+    _MONTH_NAMES + r"\s+(\d{1,2})" + _ORDINAL_SUFFIX + r"(?:\s+(\d{4}))?")
+# "15/12", "15-12-2025", "15/12/25"
+_NUMERIC_DATE_RE = re.compile(r"(\d{1,2})[/-](\d{1,2})(?:[/-](\d{2,4}))?")
+
+# "this friday", "next monday"
+_WEEKDAY_EXPRESSION_RE = re.compile(
+    r"\b(this|next)\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b")
+
+_DURATION_RULES = (
+    (re.compile(r"(\d+)\s*(?:hour|hr|h)"), lambda m: int(m.group(1)) * 60),
+    (re.compile(r"(\d+)\s*(?:minute|min|m)"), lambda m: int(m.group(1))),
+    (re.compile(r"one\s+hour"), lambda m: 60),
+    (re.compile(r"half\s+hour"), lambda m: 30),
+    (re.compile(r"(\d+)\s*(?:hour|hr|h)\s*(?:and\s+)?(\d+)\s*(?:minute|min|m)"),
+     lambda m: int(m.group(1)) * 60 + int(m.group(2))),
+)
+
+
+class DateParts(NamedTuple):
+    """
+    One candidate reading of an absolute date.
+
+    month is a number for numeric dates ("15/12") and the month name as
+    written for named dates ("dec"); names are resolved against the global
+    config by the binder.
+    """
+    day: int
+    month: Union[int, str]
+    year: Optional[int]
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def parse_clock_time(time_str: str) -> Tuple[Optional[datetime], bool]:
+    """
+    Parse a time ref to a time on 2000-01-01.
+
+    Returns:
+        (datetime or None, has_explicit_meridiem). 24-hour times from 13:00
+        count as explicit; "9:30" and "10.30" do not.
+    """
+    compact = _WHITESPACE_RE.sub("", time_str.lower())
+
+    match = _CLOCK_TIME_RE.fullmatch(compact)
+    if match:
+        hour_str, separator, minute_str, period = match.groups()
+        if period is None and separator is None:
+            # Bare hour ("9"): no meridiem and no minutes
+            return None, False
+        hour = int(hour_str)
+        minute = int(minute_str) if minute_str else 0
+    else:
+        match = _MERIDIEM_TIME_RE.search(compact)
+        if match:
+            hour = int(match.group(1))
+            minute = int(match.group(2)) if match.group(2) else 0
+            period = match.group(3)
+        else:
+            match = _COLON_TIME_RE.search(compact) or _DOT_TIME_RE.search(compact)
+            if not match:
+                return None, False
+            hour = int(match.group(1))
+            minute = int(match.group(2))
+            period = None
+
+    if period is None:
+        has_explicit_meridiem = hour >= 13
+    else:
+        has_explicit_meridiem = True
+        if period == "pm" and hour != 12:
+            hour += 12
+        elif period == "am" and hour == 12:
+            hour = 0
+
+    try:
+        return datetime(2000, 1, 1, hour, minute), has_explicit_meridiem
+    except ValueError:
+        return None, False
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def parse_date_parts(date_str: str) -> Tuple[DateParts, ...]:
+    """
+    Candidate readings of an absolute date ref (lowercase), in priority order.
+
+    Day-month ("15th dec") comes before month-day ("dec 15"), which comes
+    before numeric ("15/12/2025"). The binder takes the first candidate
+    whose month resolves; a numeric candidate is always last.
+    """
+    candidates = []
+
+    match = _DAY_MONTH_RE.search(date_str)
+    if match:
+        year_str = match.group(3)
+        candidates.append(DateParts(
+            int(match.group(1)), match.group(2), int(year_str) if year_str else None))
+
+    match = _MONTH_DAY_RE.search(date_str)
+    if match:
+        year_str = match.group(3)
+        candidates.append(DateParts(
+            int(match.group(2)), match.group(1), int(year_str) if year_str else None))
+
+    match = _NUMERIC_DATE_RE.search(date_str)
+    if match:
+        year_str = match.group(3)
+        year = int(year_str) if year_str else None
+        if year and year < 100:
+            # Two-digit year: assume 20xx
+            year = 2000 + year
+        candidates.append(DateParts(int(match.group(1)), int(match.group(2)), year))
+
+    return tuple(candidates)
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def parse_weekday_expression(date_str: str) -> Optional[Tuple[str, str]]:
+    """("this" | "next", weekday) for refs like "next monday", else None."""
+    match = _WEEKDAY_EXPRESSION_RE.search(date_str)
+    if match:
+        return match.group(1), match.group(2)
+    return None
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def parse_duration_minutes(duration_text: str) -> Optional[int]:
+    """Minutes for "one hour", "30 mins", "2 hours", "half hour", etc."""
+    duration_text = duration_text.lower().strip()
+    for pattern, converter in _DURATION_RULES:
+        match = pattern.search(duration_text)
+        if match:
+            return converter(match)
+    return None
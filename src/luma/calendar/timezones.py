@@ -0,0 +1,76 @@
+"""
+Timezone lookup for calendar binding.
+
+Timezone objects are cached per name (bounded), so binding a request does
+not rebuild a ZoneInfo/pytz object. The pipeline, the CLI and the calendar
+binder all share this lookup and localization logic.
+"""
+from datetime import datetime, timezone as dt_timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Optional
+
+# Try zoneinfo first (Python 3.9+), fallback to pytz
+try:
+    from zoneinfo import ZoneInfo
+    try:
+        # Test if tzdata is available
+        _ = ZoneInfo("UTC")
+        ZONEINFO_AVAILABLE = True
+    except Exception:
+        ZONEINFO_AVAILABLE = False
+except ImportError:
+    ZONEINFO_AVAILABLE = False
+
+try:
+    import pytz
+    PYTZ_AVAILABLE = True
+except ImportError:
+    PYTZ_AVAILABLE = False
+
+# Distinct timezone names seen by one process
+TIMEZONE_CACHE_SIZE = 256
+
+
+def lookup_timezone(timezone_str: Any) -> Optional[tzinfo]:
+    """Timezone for an IANA name (zoneinfo, then pytz), or None if unknown."""
+    # Request bodies can hold any JSON value; only strings can be cache keys
+    if not isinstance(timezone_str, str):
+        return None
+    return _cached_timezone(timezone_str)
+
+
+@lru_cache(maxsize=TIMEZONE_CACHE_SIZE)
+def _cached_timezone(timezone_str: str) -> Optional[tzinfo]:
+    if ZONEINFO_AVAILABLE:
+        try:
+            return ZoneInfo(timezone_str)
+        except Exception:
+            pass
+    if PYTZ_AVAILABLE:
+        try:
+            return pytz.timezone(timezone_str)
+        except Exception:
+            pass
+    return None
+
+
+def get_timezone(timezone_str: str) -> tzinfo:
+    """Timezone for an IANA name, falling back to UTC when unknown."""
+    tz = lookup_timezone(timezone_str)
+    if tz is not None:
+        return tz
+    if PYTZ_AVAILABLE and not ZONEINFO_AVAILABLE:
+        return pytz.UTC
+    return dt_timezone.utc
+
+
+def localize_datetime(dt: datetime, tz: Any) -> datetime:
+    """Attach tz to a naive datetime, or convert an aware one to tz."""
+    if dt.tzinfo is not None:
+        return dt.astimezone(tz)
+
+    # Handle pytz vs zoneinfo
+    if PYTZ_AVAILABLE and hasattr(tz, 'localize'):
+        return tz.localize(dt)
+    else:
+        return dt.replace(tzinfo=tz)
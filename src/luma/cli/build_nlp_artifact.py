@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Build the precompiled spaCy entity ruler artifact.
+
+Run as a deploy/build step so workers load the serialized pipeline instead of
+regenerating every pattern on startup. The artifact is keyed by the
+global.v2.json content hash; rerun after editing the global config.
+
+Usage:
+    python -m luma.cli.build_nlp_artifact
+    python -m luma.cli.build_nlp_artifact --global-json path/to/global.v2.json --out dir
+"""
+import sys
+from pathlib import Path
+
+# Add src/ to path if running directly
+if __name__ == "__main__":
+    src_path = Path(__file__).parent.parent.parent
+    if str(src_path) not in sys.path:
+        sys.path.insert(0, str(src_path))
+
+from luma.extraction.global_config import load_compiled_global_config
+from luma.extraction.matcher import resolve_global_json_path
+from luma.config import config
+from luma.extraction.entity_loading import PIPELINE_MODES
+from luma.extraction.nlp_artifact import build_nlp_artifact, default_artifact_dir
+
+
+def main():
+    """Entry point for the artifact build command."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Build the Luma spaCy entity ruler artifact"
+    )
+    parser.add_argument(
+        '--global-json',
+        default=None,
+        help='Path to global.v2.json (default: luma/store/normalization/global.v2.json)'
+    )
+    parser.add_argument(
+        '--out',
+        default=None,
+        help=f'Artifact directory (default: {default_artifact_dir()})'
+    )
+    parser.add_argument(
+        '--pipeline-mode',
+        default=config.SPACY_PIPELINE_MODE,
+        choices=list(PIPELINE_MODES),
+        help=f'spaCy pipeline mode (default: {config.SPACY_PIPELINE_MODE})'
+    )
+
+    args = parser.parse_args()
+
+    global_json_path = Path(args.global_json) if args.global_json else resolve_global_json_path()
+    global_config = load_compiled_global_config(global_json_path)
+
+    _, path = build_nlp_artifact(global_config, args.out, args.pipeline_mode)
+    print(f"✅ Built artifact for {global_json_path} ({global_config.content_hash[:12]})")
+    print(f"   {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -31,11 +31,12 @@ if __name__ == "__main__":
         sys.path.insert(0, str(src_path))
 
 from luma.calendar.calendar_binder import bind_calendar
+from luma.calendar.timezones import localize_datetime as localize_to_timezone, lookup_timezone
 from luma.resolution.semantic_resolver import resolve_semantics
 from luma.grouping.appointment_grouper import group_appointment
 from luma.structure.interpreter import interpret_structure
 from luma.grouping.reservation_intent_resolver import ReservationIntentResolver
-from luma.extraction.matcher import EntityMatcher
+from luma.extraction.matcher_registry import get_entity_matcher
 from luma.clarification import render_clarification
 
 
@@ -56,22 +57,11 @@ def find_normalization_dir():
 
 
 def _localize_datetime(dt: datetime, timezone: str) -> datetime:
-    """Localize datetime to timezone."""
-    try:
-        from zoneinfo import ZoneInfo
-        tz = ZoneInfo(timezone)
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=tz)
-        return dt.astimezone(tz)
-    except Exception:
-        try:
-            import pytz
-            tz = pytz.timezone(timezone)
-            if dt.tzinfo is None:
-                return tz.localize(dt)
-            return dt.astimezone(tz)
-        except Exception:
-            return dt
+    """Localize datetime to timezone (unchanged if the timezone is unknown)."""
+    tz = lookup_timezone(timezone)
+    if tz is None:
+        return dt
+    return localize_to_timezone(dt, tz)
 
 
 def print_banner():
@@ -275,7 +265,7 @@ def run_pipeline(sentence: str, domain: str = "service", timezone: str = "UTC")
 
     # Stage 1: Entity Extraction
     try:
-        matcher = EntityMatcher(domain=domain, entity_file=entity_file)
+        matcher = get_entity_matcher(domain, entity_file)
         extraction_result = matcher.extract_with_parameterization(sentence)
         results["stages"]["extraction"] = extraction_result
     except Exception as e:
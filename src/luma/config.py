@@ -49,6 +49,9 @@ class LumaConfig:
     DEBUG_ENABLED: bool = DEBUG_NLP  # Alias for backward compatibility
     """Alias for DEBUG_NLP"""
     
+    ENABLE_TRACING: bool = os.getenv("ENABLE_TRACING", "false").lower() == "true"
+    """Attach per-request stage trace records to every response (as "trace")"""
+    
     # ========================================================================
     # Logging Settings
     # ========================================================================
@@ -68,6 +71,12 @@ class LumaConfig:
     LOG_PERFORMANCE_METRICS: bool = os.getenv("LOG_PERFORMANCE_METRICS", "true").lower() == "true"
     """Log extraction performance metrics (processing time, groups count, etc.)"""
     
+    ENABLE_METRICS: bool = os.getenv("ENABLE_METRICS", "true").lower() == "true"
+    """Collect per-stage latency histograms (exposed on /metrics)"""
+    
+    METRICS_WINDOW: int = int(os.getenv("METRICS_WINDOW", "2048"))
+    """Recent samples per histogram used for p50/p95/p99"""
+    
     # ========================================================================
     # LLM Settings
     # ========================================================================
@@ -101,6 +110,33 @@ class LumaConfig:
     API_DEBUG: bool = os.getenv("API_DEBUG", "false").lower() == "true"
     """Enable Flask debug mode (DO NOT use in production)"""
     
+    BATCH_SIZE: int = int(os.getenv("BATCH_SIZE", "64"))
+    """Default spaCy nlp.pipe batch size for /book/batch"""
+    
+    BATCH_N_PROCESS: int = int(os.getenv("BATCH_N_PROCESS", "1"))
+    """Default spaCy nlp.pipe process count for /book/batch"""
+    
+    BATCH_MAX_PROCESSES: int = int(os.getenv("BATCH_MAX_PROCESSES", "4"))
+    """Upper bound on n_process accepted by /book/batch"""
+    
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", "5000"))
+    """Maximum number of items accepted per /book/batch request"""
+    
+    ASGI_POOL_PROCESSES: int = int(os.getenv("ASGI_POOL_PROCESSES", "4"))
+    """Worker processes running pipeline stages under luma.asgi (0 = threads in the server process)"""
+    
+    ASGI_MAX_PENDING: int = int(os.getenv("ASGI_MAX_PENDING", "64"))
+    """Requests queued or running on the luma.asgi worker pool before new ones get 503"""
+    
+    GUNICORN_WORKERS: int = int(os.getenv("GUNICORN_WORKERS", "4"))
+    """Worker processes started by luma/gunicorn.conf.py"""
+    
+    GUNICORN_PRELOAD: bool = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+    """Load the pipeline in the gunicorn master and fork workers from it (copy-on-write sharing)"""
+    
+    GUNICORN_TIMEOUT: int = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+    """Seconds before gunicorn restarts a silent worker"""
+    
     # ========================================================================
     # Fuzzy Matching Settings
     # ========================================================================
@@ -118,6 +154,24 @@ class LumaConfig:
     WARMUP_ON_STARTUP: bool = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
     """Preload models on startup (slower startup, faster requests)"""
     
+    SPACY_PIPELINE_MODE: str = os.getenv("SPACY_PIPELINE_MODE", "full").lower()
+    """spaCy components to load: 'full' (en_core_web_sm as-is) or 'ruler_only' (tokenizer + entity ruler + NER)"""
+    
+    USE_NLP_ARTIFACT: bool = os.getenv("USE_NLP_ARTIFACT", "true").lower() == "true"
+    """Load the entity ruler pipeline from a prebuilt on-disk artifact (built on first use)"""
+    
+    NLP_ARTIFACT_DIR: Optional[str] = os.getenv("NLP_ARTIFACT_DIR")
+    """Directory for spaCy pipeline artifacts (default: luma/store/nlp_artifacts)"""
+    
+    ENABLE_RESULT_CACHE: bool = os.getenv("ENABLE_RESULT_CACHE", "true").lower() == "true"
+    """Reuse extraction/structure/grouping/semantic results for repeated normalized texts"""
+    
+    RESULT_CACHE_SIZE: int = int(os.getenv("RESULT_CACHE_SIZE", "4096"))
+    """Maximum number of cached stage results (LRU eviction)"""
+    
+    RESULT_CACHE_TTL_SECONDS: float = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "3600"))
+    """Seconds before a cached stage result expires"""
+    
     # ========================================================================
     # Helper Methods
     # ========================================================================
@@ -151,6 +205,7 @@ class LumaConfig:
             "",
             "Debug:",
             f"  Debug Logging:      {'✅ Enabled' if self.DEBUG_NLP else '❌ Disabled'}",
+            f"  Request Tracing:    {'✅ Enabled' if self.ENABLE_TRACING else '❌ Disabled'}",
             "",
         ]
         
@@ -170,6 +225,8 @@ class LumaConfig:
             "API:",
             f"  Host:               {self.API_HOST}",
             f"  Port:               {self.API_PORT}",
+            f"  ASGI Worker Pool:   {self.ASGI_POOL_PROCESSES or 'threads'} (max {self.ASGI_MAX_PENDING} pending)",
+            f"  Gunicorn Workers:   {self.GUNICORN_WORKERS} ({'preload' if self.GUNICORN_PRELOAD else 'no preload'})",
             "",
             "Logging:",
             f"  Level:              {self.LOG_LEVEL}",
@@ -177,10 +234,14 @@ class LumaConfig:
             f"  File:               {self.LOG_FILE or 'None'}",
             f"  Request Logging:    {'✅ Enabled' if self.ENABLE_REQUEST_LOGGING else '❌ Disabled'}",
             f"  Performance Logs:   {'✅ Enabled' if self.LOG_PERFORMANCE_METRICS else '❌ Disabled'}",
+            f"  Stage Metrics:      {'✅ Enabled' if self.ENABLE_METRICS else '❌ Disabled'}",
             "",
             "Performance:",
             f"  Lazy Load:          {'✅ Yes' if self.LAZY_LOAD_MODELS else '❌ No'}",
             f"  Warmup:             {'✅ Yes' if self.WARMUP_ON_STARTUP else '❌ No'}",
+            f"  spaCy Pipeline:     {self.SPACY_PIPELINE_MODE}",
+            f"  NLP Artifact:       {'✅ Yes' if self.USE_NLP_ARTIFACT else '❌ No'}",
+            f"  Result Cache:       {f'✅ {self.RESULT_CACHE_SIZE} entries, {self.RESULT_CACHE_TTL_SECONDS:g}s TTL' if self.ENABLE_RESULT_CACHE else '❌ Disabled'}",
             "",
             "=" * 60,
         ])
@@ -5,15 +5,33 @@ Extracts entities from raw text using spaCy and fuzzy matching,
 then parameterizes the sentence for NER classification.
 
 Modular structure:
-- normalization.py: Text normalization utilities
+- normalization.py: Text normalization utilities (incl. fused single-pass normalizer)
+- phrase_trie.py: Token trie for longest-match phrase normalization
 - entity_loading.py: Entity loading and pattern building
 - entity_processing.py: Entity extraction and canonicalization
 - matcher.py: Main EntityMatcher class
+- matcher_registry.py: Process-wide shared EntityMatcher instances
+- global_config.py: Single-parse compiled global.v2.json snapshot
 """
 
 # Main class
 from .matcher import EntityMatcher
 
+# Shared matcher registry
+from .matcher_registry import (
+    get_entity_matcher,
+    warm_entity_matchers,
+    is_registry_warm,
+    clear_entity_matcher_registry,
+)
+
+# Compiled global config
+from .global_config import (
+    CompiledGlobalConfig,
+    load_compiled_global_config,
+    clear_global_config_cache,
+)
+
 # Normalization utilities
 from .normalization import (
     normalize_hyphens,
@@ -21,7 +39,12 @@ from .normalization import (
     normalize_orthography,
     post_normalize_parameterized_text,
     normalize_natural_language_variants,
+    normalize_to_tokens,
+    FusedNormalizer,
+    build_orthography_trie,
+    build_variant_trie,
 )
+from .phrase_trie import PhraseTrie
 
 # Vocabulary normalization (new structure)
 from .vocabulary_normalization import (
@@ -60,12 +83,28 @@ __all__ = [
     # Main classes
     "EntityMatcher",
 
+    # Shared matcher registry
+    "get_entity_matcher",
+    "warm_entity_matchers",
+    "is_registry_warm",
+    "clear_entity_matcher_registry",
+
+    # Compiled global config
+    "CompiledGlobalConfig",
+    "load_compiled_global_config",
+    "clear_global_config_cache",
+
     # Normalization
     "normalize_hyphens",
     "pre_normalization",
     "normalize_orthography",
     "post_normalize_parameterized_text",
     "normalize_natural_language_variants",
+    "normalize_to_tokens",
+    "FusedNormalizer",
+    "build_orthography_trie",
+    "build_variant_trie",
+    "PhraseTrie",
 
     # Vocabulary normalization
     "load_vocabularies",
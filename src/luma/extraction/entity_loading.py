@@ -65,6 +65,11 @@ def load_global_noise_set(global_json_path: Path) -> Set[str]:
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_global_noise_set(data)
+
+
+def parse_global_noise_set(data: Dict[str, Any]) -> Set[str]:
+    """Extract the noise set from already-parsed global JSON data."""
     # New structure: normalization.noise.values
     noise_values = data.get("normalization", {}).get(
         "noise", {}).get("values", [])
@@ -527,6 +532,11 @@ def load_global_orthography_rules(global_json_path: Path) -> Dict[str, str]:
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_global_orthography_rules(data)
+
+
+def parse_global_orthography_rules(data: Dict[str, Any]) -> Dict[str, str]:
+    """Compile orthography rules from already-parsed global JSON data."""
     # New structure: normalization.orthography
     orthography = data.get("normalization", {}).get("orthography", {})
 
@@ -573,6 +583,11 @@ def load_global_service_families(global_json_path: Path) -> Dict[str, Dict[str,
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_global_service_families(data)
+
+
+def parse_global_service_families(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Extract service families from already-parsed global JSON data."""
     service_families = data.get("service_families", {})
 
     # Remove metadata keys
@@ -629,6 +644,52 @@ def build_service_family_synonym_map(service_families: Dict[str, Dict[str, Any]]
     return synonym_map
 
 
+def build_natural_language_variant_map(
+    service_families: Dict[str, Dict[str, Any]]
+) -> Dict[str, str]:
+    """
+    Build natural language variant map from service families.
+
+    Maps service family synonyms to a preferred natural language form (first synonym).
+    This map is used to normalize variants like "hair cut" → "haircut".
+
+    CRITICAL: This map MUST NOT contain canonical IDs (e.g., "beauty_and_wellness.haircut").
+    It only maps natural language variants to other natural language forms.
+
+    Example:
+        service_families: {
+            "beauty_and_wellness": {
+                "haircut": {"synonym": ["haircut", "hair trim"]}
+            }
+        }
+        Maps: "haircut" → "haircut", "hair trim" → "haircut"
+        (Uses first synonym as preferred form)
+    """
+    variant_map = {}
+
+    for _category, families in service_families.items():
+        if not isinstance(families, dict):
+            continue
+
+        for _family_id, family_data in families.items():
+            if not isinstance(family_data, dict):
+                continue
+
+            synonyms = family_data.get("synonym", [])
+            if not isinstance(synonyms, list) or not synonyms:
+                continue
+
+            # Use first synonym as the preferred natural language form
+            preferred_form = synonyms[0].lower()
+
+            # Map all synonyms (including preferred) to preferred form
+            for synonym in synonyms:
+                if isinstance(synonym, str):
+                    variant_map[synonym.lower()] = preferred_form
+
+    return variant_map
+
+
 def build_service_family_patterns(service_families: Dict[str, Dict[str, Any]]) -> List[Dict[str, str]]:
     """
     Build spaCy EntityRuler patterns for service families.
@@ -678,6 +739,11 @@ def load_global_entity_types(global_json_path: Path) -> Dict[str, Any]:
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_global_entity_types(data)
+
+
+def parse_global_entity_types(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract entity_types from already-parsed global JSON data."""
     return data.get("entity_types", {})
 
 
@@ -1080,7 +1146,61 @@ def customize_tokenizer(nlp):
 # Init
 # -------------------------------------------------------------------
 
-def init_nlp_with_service_families(global_json_path: Path):
+# Pipeline modes for the base model:
+# - "full": complete en_core_web_sm (tagger, parser, lemmatizer, NER, ...)
+# - "ruler_only": tokenizer + entity ruler + NER. Luma only reads doc.ents
+#   and token text, so the tagger, parser and lemmatizer are skipped. NER
+#   stays: it labels DATE/TIME spans the ruler patterns miss, and
+#   extract_entities_from_doc reads those labels.
+PIPELINE_MODE_FULL = "full"
+PIPELINE_MODE_RULER_ONLY = "ruler_only"
+PIPELINE_MODES = (PIPELINE_MODE_FULL, PIPELINE_MODE_RULER_ONLY)
+
+RULER_ONLY_EXCLUDE = [
+    "tok2vec", "tagger", "parser", "senter",
+    "attribute_ruler", "lemmatizer",
+]
+
+
+def load_base_nlp(pipeline_mode: str = PIPELINE_MODE_FULL):
+    """
+    Load en_core_web_sm with the custom tokenizer for the given pipeline mode.
+
+    Raises:
+        ValueError: If pipeline_mode is unknown
+    """
+    if pipeline_mode not in PIPELINE_MODES:
+        raise ValueError(
+            f"Unsupported pipeline mode: {pipeline_mode}. Must be one of: {list(PIPELINE_MODES)}")
+    if not SPACY_AVAILABLE:
+        raise ImportError(
+            "Install spaCy: pip install spacy && python -m spacy download en_core_web_sm"
+        )
+
+    if pipeline_mode == PIPELINE_MODE_RULER_ONLY:
+        nlp = spacy.load("en_core_web_sm", exclude=RULER_ONLY_EXCLUDE)
+    else:
+        nlp = spacy.load("en_core_web_sm")
+    nlp.tokenizer = customize_tokenizer(nlp)
+    return nlp
+
+
+def add_entity_ruler(nlp, patterns: List[Dict[str, Any]]):
+    """Add the entity ruler ahead of statistical NER (if present) and load patterns."""
+    if "ner" in nlp.pipe_names:
+        ruler = nlp.add_pipe("entity_ruler", before="ner",
+                             config={"overwrite_ents": True})
+    else:
+        ruler = nlp.add_pipe("entity_ruler", config={"overwrite_ents": True})
+    ruler.add_patterns(patterns)
+    return ruler
+
+
+def init_nlp_with_service_families(
+    global_json_path: Path,
+    global_config=None,
+    pipeline_mode: str = PIPELINE_MODE_FULL
+):
     """
     Initialize spaCy with entity ruler for service families, dates, times, and durations.
 
@@ -1091,18 +1211,21 @@ def init_nlp_with_service_families(global_json_path: Path):
     4. Service family extraction
 
     Updated to use global service_families and entity_types instead of tenant entities.
-    """
-    if not SPACY_AVAILABLE:
-        raise ImportError(
-            "Install spaCy: pip install spacy && python -m spacy download en_core_web_sm"
-        )
 
-    nlp = spacy.load("en_core_web_sm")
-    nlp.tokenizer = customize_tokenizer(nlp)
+    If global_config (CompiledGlobalConfig) is given, its already-parsed
+    entity_types and service_families are used instead of re-reading the file.
+
+    pipeline_mode selects the base model components ("full" or "ruler_only").
+    """
+    nlp = load_base_nlp(pipeline_mode)
 
     # Load entity types and service families from global JSON
-    entity_types = load_global_entity_types(global_json_path)
-    service_families = load_global_service_families(global_json_path)
+    if global_config is not None:
+        entity_types = global_config.entity_types
+        service_families = global_config.service_families
+    else:
+        entity_types = load_global_entity_types(global_json_path)
+        service_families = load_global_service_families(global_json_path)
 
     # Build patterns in extraction order (date_absolute → date → time_window → time → duration → service_family)
     all_patterns = []
@@ -1130,9 +1253,7 @@ def init_nlp_with_service_families(global_json_path: Path):
     # 5. Service family patterns (last - lowest priority)
     all_patterns.extend(build_service_family_patterns(service_families))
 
-    ruler = nlp.add_pipe("entity_ruler", before="ner",
-                         config={"overwrite_ents": True})
-    ruler.add_patterns(all_patterns)
+    add_entity_ruler(nlp, all_patterns)
 
     return nlp, service_families
 
@@ -1172,6 +1293,11 @@ def load_global_vocabularies(global_json_path: Path) -> Dict[str, Any]:
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_global_vocabularies(data)
+
+
+def parse_global_vocabularies(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract normalization.vocabularies from already-parsed global JSON data."""
     vocabularies = data.get("normalization", {}).get("vocabularies", {})
     return vocabularies
 
@@ -1185,6 +1311,11 @@ def load_relative_date_offsets(global_json_path: Path) -> Dict[str, int]:
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_relative_date_offsets(data)
+
+
+def parse_relative_date_offsets(data: Dict[str, Any]) -> Dict[str, int]:
+    """Build relative date offsets from already-parsed global JSON data."""
     relative_dates = data.get("entity_types", {}).get(
         "date", {}).get("relative", [])
     offsets = {}
@@ -1210,6 +1341,11 @@ def load_time_window_bounds(global_json_path: Path) -> Dict[str, Dict[str, str]]
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_time_window_bounds(data)
+
+
+def parse_time_window_bounds(data: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    """Build time window bounds from already-parsed global JSON data."""
     time_keywords = data.get("entity_types", {}).get(
         "time", {}).get("keywords", [])
     bounds = {}
@@ -1236,6 +1372,51 @@ def load_month_names(global_json_path: Path) -> Dict[str, int]:
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
+    return parse_month_names(data)
+
+
+def parse_month_names(data: Dict[str, Any]) -> Dict[str, int]:
+    """Extract month name to number mapping from already-parsed global JSON data."""
     entity_types = data.get("entity_types", {})
     months = entity_types.get("date", {}).get("month", {}).get("to_number", {})
     return months
+
+
+def build_month_variant_map(global_vocabularies: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Build month variant -> canonical map from normalization.vocabularies.months.
+
+    Canonical names map to themselves and take precedence over variants;
+    a variant listed under several canonicals maps to the first one.
+    """
+    months_dict = global_vocabularies.get("months", {})
+    if not isinstance(months_dict, dict):
+        return {}
+
+    variant_map: Dict[str, str] = {}
+    for canonical, variants in months_dict.items():
+        if isinstance(variants, list):
+            for variant in variants:
+                if isinstance(variant, str):
+                    variant_map.setdefault(variant, canonical)
+    for canonical in months_dict:
+        variant_map[canonical] = canonical
+    return variant_map
+
+
+def build_month_number_map(
+    month_variant_map: Dict[str, str],
+    month_names: Dict[str, int]
+) -> Dict[str, int]:
+    """
+    Build month surface form (canonical or variant) -> month number map.
+
+    A form resolves through month_variant_map first and is then looked up in
+    month_names; forms whose canonical has no number are left out.
+    """
+    month_numbers: Dict[str, int] = {}
+    for form in list(month_names) + list(month_variant_map):
+        canonical = month_variant_map.get(form, form)
+        if canonical in month_names:
+            month_numbers[form] = month_names[canonical]
+    return month_numbers
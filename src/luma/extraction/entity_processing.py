@@ -28,7 +28,7 @@ def add_entity(
     })
 
 
-def extract_entities_from_doc(nlp, text: str) -> Dict[str, List]:
+def extract_entities_from_doc(nlp, text: str, doc=None) -> Dict[str, List]:
     """
     Extract SERVICE_FAMILY / DATE / DATE_ABSOLUTE / TIME / TIME_WINDOW / DURATION entities from spaCy doc.
 
@@ -38,8 +38,11 @@ def extract_entities_from_doc(nlp, text: str) -> Dict[str, List]:
     TIME_WINDOW represents coarse time ranges (morning, afternoon, etc.).
     TIME represents precise clock times (9 am, 12:30 pm, etc.).
     Noise is NOT extracted - it's not an entity.
+
+    If doc is given (e.g. from nlp.pipe), it is used instead of running nlp(text).
     """
-    doc = nlp(text)
+    if doc is None:
+        doc = nlp(text)
 
     result = {
         "services": [],  # Kept for compatibility - contains SERVICE_FAMILY entities
@@ -0,0 +1,175 @@
+"""
+Compiled global normalization config.
+
+global.v2.json used to be re-read by every stage: EntityMatcher parsed it
+five times, spaCy init parsed it again, and the calendar binder and semantic
+resolver each kept their own caches. CompiledGlobalConfig is a single snapshot
+built from one json.load(), holding every derived map the stages need.
+
+Snapshots are cached per (path, mtime), so every stage that points at the same
+file shares the same object. Treat all fields as read-only.
+"""
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Set, Tuple, Union
+
+from luma.config import debug_print
+
+from .entity_loading import (
+    parse_global_noise_set,
+    parse_global_orthography_rules,
+    parse_global_service_families,
+    parse_global_entity_types,
+    parse_global_vocabularies,
+    parse_relative_date_offsets,
+    parse_time_window_bounds,
+    parse_month_names,
+    build_month_variant_map,
+    build_month_number_map,
+    build_service_family_synonym_map,
+    build_natural_language_variant_map,
+)
+from .vocabulary_normalization import (
+    parse_vocabularies,
+    compile_vocabulary_maps,
+    validate_vocabularies,
+)
+
+
+@dataclass(frozen=True)
+class CompiledGlobalConfig:
+    """
+    Immutable snapshot of global.v2.json and its derived maps.
+
+    Attributes:
+        path: Source file
+        content_hash: sha256 of the raw file bytes
+        service_families: service_families section
+        variant_map: Natural language variant -> preferred form
+        service_family_map: Synonym -> canonical service family ID
+        noise_set: Noise tokens
+        orthography_rules: Compiled orthography map
+        vocabularies: Synonym/typo vocabularies (EntityMatcher, semantic resolver)
+        synonym_map: Compiled synonym -> canonical map
+        typo_map: Compiled typo -> canonical map
+        all_canonicals: All vocabulary canonicals
+        entity_types: entity_types section
+        global_vocabularies: normalization.vocabularies section
+        relative_date_offsets: Relative date -> day offset
+        time_window_bounds: Time window -> {start, end}
+        month_names: Month name -> number
+        month_variant_map: Month variant ("jan") -> canonical ("january")
+        month_numbers: Month canonical or variant -> number
+        weekday_to_number: Weekday -> number (calendar binding)
+    """
+    path: Path
+    content_hash: str
+    service_families: Dict[str, Dict[str, Any]]
+    variant_map: Dict[str, str]
+    service_family_map: Dict[str, str]
+    noise_set: Set[str]
+    orthography_rules: Dict[str, str]
+    vocabularies: Dict[str, Dict[str, Dict[str, Any]]]
+    synonym_map: Dict[str, str]
+    typo_map: Dict[str, str]
+    all_canonicals: Set[str]
+    entity_types: Dict[str, Any]
+    global_vocabularies: Dict[str, Any]
+    relative_date_offsets: Dict[str, int]
+    time_window_bounds: Dict[str, Dict[str, str]]
+    month_names: Dict[str, int]
+    month_variant_map: Dict[str, str]
+    month_numbers: Dict[str, int]
+    weekday_to_number: Dict[str, int]
+
+
+def compile_global_config(
+    data: Dict[str, Any],
+    path: Path,
+    content_hash: str = ""
+) -> CompiledGlobalConfig:
+    """
+    Build a CompiledGlobalConfig from already-parsed global JSON data.
+
+    Vocabularies are validated once here instead of by each consumer.
+
+    Raises:
+        ValueError: If vocabulary validation fails
+    """
+    service_families = parse_global_service_families(data)
+    entity_types = parse_global_entity_types(data)
+    vocabularies = parse_vocabularies(data)
+
+    validate_vocabularies(vocabularies, entity_types, service_families)
+    synonym_map, typo_map, all_canonicals = compile_vocabulary_maps(
+        vocabularies)
+
+    global_vocabularies = parse_global_vocabularies(data)
+    month_names = parse_month_names(data)
+    month_variant_map = build_month_variant_map(global_vocabularies)
+
+    return CompiledGlobalConfig(
+        path=path,
+        content_hash=content_hash,
+        service_families=service_families,
+        variant_map=build_natural_language_variant_map(service_families),
+        service_family_map=build_service_family_synonym_map(service_families),
+        noise_set=parse_global_noise_set(data),
+        orthography_rules=parse_global_orthography_rules(data),
+        vocabularies=vocabularies,
+        synonym_map=synonym_map,
+        typo_map=typo_map,
+        all_canonicals=all_canonicals,
+        entity_types=entity_types,
+        global_vocabularies=global_vocabularies,
+        relative_date_offsets=parse_relative_date_offsets(data),
+        time_window_bounds=parse_time_window_bounds(data),
+        month_names=month_names,
+        month_variant_map=month_variant_map,
+        month_numbers=build_month_number_map(month_variant_map, month_names),
+        weekday_to_number=global_vocabularies.get(
+            "weekdays", {}).get("to_number", {}),
+    )
+
+
+# (resolved path) -> (mtime_ns, config)
+_CONFIG_CACHE: Dict[str, Tuple[int, CompiledGlobalConfig]] = {}
+_CONFIG_LOCK = threading.Lock()
+
+
+def load_compiled_global_config(global_json_path: Union[str, Path]) -> CompiledGlobalConfig:
+    """
+    Return the shared CompiledGlobalConfig for a global JSON file.
+
+    The file is parsed once and reused until its mtime changes.
+    """
+    path = Path(global_json_path).resolve()
+    mtime_ns = path.stat().st_mtime_ns
+    key = str(path)
+
+    entry = _CONFIG_CACHE.get(key)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+
+    with _CONFIG_LOCK:
+        entry = _CONFIG_CACHE.get(key)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1]
+
+        raw = path.read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+        config = compile_global_config(
+            data, path, hashlib.sha256(raw).hexdigest())
+        debug_print(
+            f"[GlobalConfig] Compiled {path.name} ({config.content_hash[:12]})")
+        _CONFIG_CACHE[key] = (mtime_ns, config)
+        return config
+
+
+def clear_global_config_cache() -> None:
+    """Drop all cached config snapshots (tests and config reloads)."""
+    with _CONFIG_LOCK:
+        _CONFIG_CACHE.clear()
@@ -6,33 +6,18 @@ Service and reservation entity matcher for DialogCart.
 Extracts and parameterizes entities for service-based appointment booking
 and reservation systems.
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 
 from luma.config import debug_print
+from luma.metrics import StageTimings, timed_stage
 
-from .normalization import (
-    normalize_hyphens,
-    pre_normalization,
-    normalize_orthography,
-    normalize_natural_language_variants,
-)
+from .normalization import FusedNormalizer
 
-from .vocabulary_normalization import (
-    load_vocabularies,
-    compile_vocabulary_maps,
-    normalize_vocabularies,
-    validate_vocabularies,
-)
+from .entity_loading import build_natural_language_variant_map
 
-from .entity_loading import (
-    init_nlp_with_service_families,
-    load_global_noise_set,
-    load_global_orthography_rules,
-    load_global_service_families,
-    build_service_family_synonym_map,
-    load_global_entity_types,
-)
+from .global_config import CompiledGlobalConfig, load_compiled_global_config
+from .nlp_artifact import load_or_build_nlp
 
 from .entity_processing import (
     extract_entities_from_doc,
@@ -54,50 +39,39 @@ DOMAIN_ENTITY_WHITELIST = {
 }
 
 
-def _build_natural_language_variant_map_from_service_families(
-    service_families: Dict[str, Dict[str, Any]]
-) -> Dict[str, str]:
-    """
-    Build natural language variant map from service families.
+# Kept for callers that imported the old private helper
+_build_natural_language_variant_map_from_service_families = build_natural_language_variant_map
 
-    Maps service family synonyms to a preferred natural language form (first synonym).
-    This map is used to normalize variants like "hair cut" → "haircut".
 
-    CRITICAL: This map MUST NOT contain canonical IDs (e.g., "beauty_and_wellness.haircut").
-    It only maps natural language variants to other natural language forms.
-
-    Example:
-        service_families: {
-            "beauty_and_wellness": {
-                "haircut": {"synonym": ["haircut", "hair trim"]}
-            }
-        }
-        Maps: "haircut" → "haircut", "hair trim" → "haircut"
-        (Uses first synonym as preferred form)
+def resolve_global_json_path(entity_file: Optional[str] = None) -> Path:
     """
-    variant_map = {}
-
-    for _category, families in service_families.items():
-        if not isinstance(families, dict):
-            continue
+    Locate global.v2.json for an entity file.
 
-        for _family_id, family_data in families.items():
-            if not isinstance(family_data, dict):
-                continue
+    global.v2.json is expected next to entity_file. Without an entity file,
+    the standard luma/store/normalization/ location is used.
 
-            synonyms = family_data.get("synonym", [])
-            if not isinstance(synonyms, list) or not synonyms:
-                continue
-
-            # Use first synonym as the preferred natural language form
-            preferred_form = synonyms[0].lower()
-
-            # Map all synonyms (including preferred) to preferred form
-            for synonym in synonyms:
-                if isinstance(synonym, str):
-                    variant_map[synonym.lower()] = preferred_form
-
-    return variant_map
+    Raises:
+        ValueError: If global.v2.json cannot be found
+    """
+    entity_path = Path(entity_file).resolve() if entity_file else None
+    if entity_path:
+        # Look for global.v2.json in same directory
+        global_json_path = entity_path.parent / "global.v2.json"
+    else:
+        # Try to find global.v2.json in standard location
+        # This is a fallback - ideally entity_file should point to a file in the normalization directory
+        # From matcher.py: parent = extraction/, parent.parent = luma/, so luma/store/normalization/
+        script_dir = Path(__file__).parent
+        global_json_path = script_dir.parent / \
+            "store" / "normalization" / "global.v2.json"
+        if not global_json_path.exists():
+            global_json_path = None
+
+    if not global_json_path or not global_json_path.exists():
+        raise ValueError(
+            "global.v2.json not found. Please provide entity_file pointing to a file in the normalization directory.")
+
+    return global_json_path
 
 
 class EntityMatcher:
@@ -112,13 +86,16 @@ class EntityMatcher:
         self,
         domain: str,
         entity_file: Optional[str] = None,
-        lazy_load_spacy: bool = False
+        lazy_load_spacy: bool = False,
+        global_config: Optional[CompiledGlobalConfig] = None
     ):
         """
         Args:
             domain: "service" | "reservation"
             entity_file: Path to entity JSON file
             lazy_load_spacy: Skip spaCy init (testing)
+            global_config: Pre-compiled global config (loaded from
+                global.v2.json next to entity_file if omitted)
         """
         if domain not in DOMAIN_ENTITY_WHITELIST:
             raise ValueError(
@@ -126,68 +103,52 @@ class EntityMatcher:
 
         self.domain = domain
 
-        # Find global JSON file (required for service families)
-        entity_path = Path(entity_file).resolve() if entity_file else None
-        if entity_path:
-            # Look for global.v2.json in same directory
-            global_json_path = entity_path.parent / "global.v2.json"
-        else:
-            # Try to find global.v2.json in standard location
-            # This is a fallback - ideally entity_file should point to a file in the normalization directory
-            # From matcher.py: parent = extraction/, parent.parent = luma/, so luma/store/normalization/
-            script_dir = Path(__file__).parent
-            global_json_path = script_dir.parent / \
-                "store" / "normalization" / "global.v2.json"
-            if not global_json_path.exists():
-                global_json_path = None
-
-        if not global_json_path or not global_json_path.exists():
-            raise ValueError(
-                "global.v2.json not found. Please provide entity_file pointing to a file in the normalization directory.")
-
-        # Load global service families (GLOBAL semantic concepts)
-        self.service_families = load_global_service_families(global_json_path)
+        # Find and compile global JSON (parsed once, shared across stages)
+        if global_config is None:
+            global_config = load_compiled_global_config(
+                resolve_global_json_path(entity_file))
+        self.global_config = global_config
         debug_print(
             "[EntityMatcher] Loaded service families from global JSON 2")
 
-        # Build natural language variant map from service families
-        # This maps variants to preferred natural language forms (NOT canonical IDs)
-        self.variant_map = _build_natural_language_variant_map_from_service_families(
-            self.service_families)
+        # Global service families (GLOBAL semantic concepts)
+        self.service_families = global_config.service_families
 
-        # Build service family synonym map (for canonicalization)
-        self.service_family_map = build_service_family_synonym_map(
-            self.service_families)
+        # Natural language variant map (variants -> preferred forms, NOT canonical IDs)
+        self.variant_map = global_config.variant_map
 
-        # Load global normalization (orthography, noise, vocabularies)
-        self.noise_set = load_global_noise_set(global_json_path)
-        self.orthography_rules = load_global_orthography_rules(
-            global_json_path)
+        # Service family synonym map (for canonicalization)
+        self.service_family_map = global_config.service_family_map
 
-        # Load vocabularies with synonyms and typos
-        vocabularies = load_vocabularies(global_json_path)
-        self.vocabularies = vocabularies
-        entity_types = load_global_entity_types(global_json_path)
-        service_families = load_global_service_families(global_json_path)
+        # Global normalization (orthography, noise, vocabularies)
+        self.noise_set = global_config.noise_set
+        self.orthography_rules = global_config.orthography_rules
 
-        # Validate vocabularies
-        validate_vocabularies(vocabularies, entity_types, service_families)
+        # Vocabularies with synonyms and typos (validated at compile time)
+        self.vocabularies = global_config.vocabularies
+        self.synonym_map = global_config.synonym_map
+        self.typo_map = global_config.typo_map
+        self.all_canonicals = global_config.all_canonicals
 
-        # Compile vocabulary maps
-        self.synonym_map, self.typo_map, self.all_canonicals = compile_vocabulary_maps(
-            vocabularies)
+        # Single-pass normalizer over the orthography/vocabulary/variant maps
+        self.normalizer = FusedNormalizer(
+            self.orthography_rules,
+            self.synonym_map,
+            self.typo_map,
+            self.variant_map
+        )
 
-        # Load global entity types (date, time, duration)
-        self.entity_types = load_global_entity_types(global_json_path)
+        # Global entity types (date, time, duration)
+        self.entity_types = global_config.entity_types
 
         # Tenant entities are unused (kept for backward compatibility)
         self.entities = []
         self.service_map = {}  # Empty - service families use service_family_map instead
 
-        # spaCy init with service families
+        # spaCy init with service families (from the on-disk artifact when available)
         self.nlp = None
         if not lazy_load_spacy:
-            self.nlp, _ = init_nlp_with_service_families(global_json_path)
+            self.nlp = load_or_build_nlp(global_config)
 
     # ------------------------------------------------------------------
     # Public API
@@ -196,7 +157,8 @@ class EntityMatcher:
     def extract_with_parameterization(
         self,
         text: str,
-        debug_units: bool = False
+        debug_units: bool = False,
+        timings: Optional[StageTimings] = None
     ) -> Dict[str, Any]:
         """
         Main extraction entry point.
@@ -208,27 +170,151 @@ class EntityMatcher:
         4. Build parameterized sentence
         5. Domain-specific filtering
         6. Return domain-native output
+
+        Args:
+            text: Raw input text
+            debug_units: Include unit debugging info in the result
+            timings: Records "normalization", "spacy" and "parameterization"
+                stage durations when given
         """
         if self.nlp is None:
             raise RuntimeError("spaCy not initialized")
 
         # 1️⃣ Normalize (natural language only - NO canonical IDs)
-        # Pipeline order: lowercase → orthography → vocabulary (synonyms + typos) → noise removal
-        text = normalize_hyphens(text)
-        normalized = pre_normalization(text)  # lowercase, unicode, etc.
-        # Apply orthographic normalization (surface-form standardization)
-        normalized = normalize_orthography(normalized, self.orthography_rules)
-        # Apply vocabulary normalization (synonyms and typos → canonical)
-        normalized, normalized_from_correction = normalize_vocabularies(
-            normalized, self.synonym_map, self.typo_map
-        )
-        # Apply natural language variant normalization (synonym mapping for services)
-        normalized = normalize_natural_language_variants(
-            normalized, self.variant_map)
+        with timed_stage(timings, "normalization"):
+            normalized, normalized_from_correction = self.normalize(text)
+
+        return self.extract_normalized(
+            normalized, normalized_from_correction, debug_units, timings)
+
+    def extract_normalized(
+        self,
+        normalized: str,
+        normalized_from_correction: bool,
+        debug_units: bool = False,
+        timings: Optional[StageTimings] = None
+    ) -> Dict[str, Any]:
+        """
+        Steps 2-6 of extract_with_parameterization for already normalized text.
+
+        The result depends only on the arguments (and the compiled config),
+        which is what lets the pipeline cache it by normalized text.
+        """
+        if self.nlp is None:
+            raise RuntimeError("spaCy not initialized")
 
         # 2️⃣ Extract entities from spaCy doc
-        raw_result, doc = extract_entities_from_doc(self.nlp, normalized)
+        with timed_stage(timings, "spacy"):
+            raw_result, doc = extract_entities_from_doc(self.nlp, normalized)
 
+        with timed_stage(timings, "parameterization"):
+            return self.build_result(
+                normalized, normalized_from_correction, raw_result, doc, debug_units)
+
+    def extract_batch(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Extract entities for many texts, streaming docs through nlp.pipe().
+
+        Each text is normalized individually; spaCy then processes the
+        normalized texts in batches. Results are returned in input order.
+        A text that fails normalization or result building yields its
+        exception in place of a result, so one bad input does not fail
+        the batch.
+
+        Args:
+            texts: Raw input texts
+            batch_size: nlp.pipe batch size
+            n_process: nlp.pipe worker processes
+
+        Returns:
+            List of extraction results (or exceptions), one per text
+        """
+        normalized_texts: List[Union[Tuple[str, bool], Exception]] = []
+        for text in texts:
+            try:
+                normalized_texts.append(self.normalize(text))
+            except Exception as e:  # noqa: BLE001
+                normalized_texts.append(e)
+        return self.extract_normalized_batch(
+            normalized_texts, batch_size=batch_size, n_process=n_process)
+
+    def extract_normalized_batch(
+        self,
+        normalized_texts: List[Union[Tuple[str, bool], Exception]],
+        batch_size: int = 64,
+        n_process: int = 1
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        extract_batch for texts already passed through normalize().
+
+        Args:
+            normalized_texts: (normalized text, normalized_from_correction)
+                per text, or the exception normalize() raised (returned as
+                that text's result)
+            batch_size: nlp.pipe batch size
+            n_process: nlp.pipe worker processes
+
+        Returns:
+            List of extraction results (or exceptions), one per text
+        """
+        if self.nlp is None:
+            raise RuntimeError("spaCy not initialized")
+
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(normalized_texts)
+        pending = []  # (index, normalized, normalized_from_correction)
+        for index, item in enumerate(normalized_texts):
+            if isinstance(item, Exception):
+                results[index] = item
+            else:
+                pending.append((index, *item))
+
+        docs = self.nlp.pipe(
+            (normalized for _, normalized, _ in pending),
+            batch_size=batch_size,
+            n_process=n_process
+        )
+        for (index, normalized, normalized_from_correction), doc in zip(pending, docs):
+            try:
+                raw_result, doc = extract_entities_from_doc(
+                    self.nlp, normalized, doc=doc)
+                results[index] = self.build_result(
+                    normalized, normalized_from_correction, raw_result, doc)
+            except Exception as e:  # noqa: BLE001
+                results[index] = e
+
+        return results
+
+    def normalize(self, text: str) -> Tuple[str, bool]:
+        """
+        Normalize raw text before spaCy (natural language only - no canonical IDs).
+
+        Returns:
+            Tuple of (normalized text, normalized_from_correction)
+        """
+        # Pipeline order: hyphens/unicode/lowercase → orthography
+        # → vocabulary (synonyms + typos) → natural language variants,
+        # fused into one tokenization (see FusedNormalizer)
+        return self.normalizer.normalize(text)
+
+    def build_result(
+        self,
+        normalized: str,
+        normalized_from_correction: bool,
+        raw_result: Dict[str, Any],
+        doc,
+        debug_units: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Build the domain-native extraction result from a processed spaCy doc.
+
+        Covers canonicalization, parameterization and domain filtering
+        (steps 3-6 of extract_with_parameterization).
+        """
         # 3️⃣ Map SERVICE_FAMILY entities to canonical service family IDs
         service_families = []
         if "services" in raw_result:
@@ -0,0 +1,112 @@
+"""
+Process-wide EntityMatcher registry.
+
+Building an EntityMatcher loads spaCy, builds the entity ruler and parses
+global.v2.json, which is far too expensive to do per request. The registry
+builds each matcher once per worker and hands out the shared instance.
+
+Matchers are keyed by (domain, entity_file, global.v2.json mtime), so editing
+the global config transparently triggers a rebuild on the next lookup.
+"""
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from luma.config import debug_print
+
+from .matcher import EntityMatcher, resolve_global_json_path
+
+
+# (domain, entity_file, lazy_load_spacy) -> (global.v2.json mtime_ns, matcher)
+_REGISTRY: Dict[Tuple[str, str, bool], Tuple[int, EntityMatcher]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _registry_key(
+    domain: str,
+    entity_file: Optional[str],
+    lazy_load_spacy: bool
+) -> Tuple[Tuple[str, str, bool], int]:
+    """Build the registry key and the current global.v2.json mtime."""
+    global_json_path = resolve_global_json_path(entity_file)
+    mtime_ns = global_json_path.stat().st_mtime_ns
+    return (domain, str(entity_file or ""), lazy_load_spacy), mtime_ns
+
+
+def get_entity_matcher(
+    domain: str,
+    entity_file: Optional[str] = None,
+    lazy_load_spacy: bool = False
+) -> EntityMatcher:
+    """
+    Return the shared EntityMatcher for a domain and entity file.
+
+    The matcher is built on first use and reused afterwards. If global.v2.json
+    has been modified since the matcher was built, a new one is built and
+    replaces the stale entry.
+
+    Args:
+        domain: "service" | "reservation"
+        entity_file: Path to entity JSON file (global.v2.json lives next to it)
+        lazy_load_spacy: Skip spaCy init (testing)
+
+    Returns:
+        Shared EntityMatcher instance (must be treated as read-only)
+    """
+    key, mtime_ns = _registry_key(domain, entity_file, lazy_load_spacy)
+
+    # Fast path: no locking once the matcher is warm
+    entry = _REGISTRY.get(key)
+    if entry is not None and entry[0] == mtime_ns:
+        return entry[1]
+
+    with _REGISTRY_LOCK:
+        # Another thread may have built it while we waited for the lock
+        entry = _REGISTRY.get(key)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1]
+
+        debug_print(
+            f"[EntityMatcherRegistry] Building matcher for domain={domain} entity_file={entity_file}")
+        matcher = EntityMatcher(
+            domain=domain,
+            entity_file=entity_file,
+            lazy_load_spacy=lazy_load_spacy
+        )
+        _REGISTRY[key] = (mtime_ns, matcher)
+        return matcher
+
+
+def warm_entity_matchers(
+    domains: Iterable[str],
+    entity_file: Optional[str] = None
+) -> int:
+    """
+    Build matchers for the given domains ahead of the first request.
+
+    Returns:
+        Number of matchers available after warmup
+    """
+    for domain in domains:
+        get_entity_matcher(domain, entity_file)
+    return len(_REGISTRY)
+
+
+def is_registry_warm() -> bool:
+    """Return True if at least one spaCy-backed matcher has been built."""
+    return any(not lazy for (_domain, _file, lazy) in _REGISTRY)
+
+
+def registry_info() -> Dict[str, Any]:
+    """Summarize registry contents for health reporting."""
+    return {
+        "warm": is_registry_warm(),
+        "matchers": sorted(
+            {domain for (domain, _file, lazy) in _REGISTRY if not lazy}
+        ),
+    }
+
+
+def clear_entity_matcher_registry() -> None:
+    """Drop all cached matchers (tests and config reloads)."""
+    with _REGISTRY_LOCK:
+        _REGISTRY.clear()
@@ -0,0 +1,228 @@
+"""
+Precompiled spaCy pipeline artifacts for the entity ruler.
+
+init_nlp_with_service_families() regenerates every date/time/duration and
+service family pattern on each startup. This module serializes the configured
+pipeline (tokenizer, components and ruler patterns) to disk once and loads it
+directly afterwards.
+
+Artifacts are keyed by the global JSON content hash, the spaCy pipeline mode,
+the spaCy and base model versions, and ARTIFACT_VERSION. Any change to global.v2.json produces a new
+key, so a stale artifact is never loaded; it is simply rebuilt.
+
+Layout:
+    <artifact_dir>/<key>/           spaCy nlp.to_disk() output
+    <artifact_dir>/<key>/luma_artifact.json   build metadata
+"""
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from luma.config import config, debug_print
+
+from .entity_loading import (
+    SPACY_AVAILABLE,
+    spacy,
+    customize_tokenizer,
+    init_nlp_with_service_families,
+)
+from .global_config import CompiledGlobalConfig
+
+
+# Bump when pattern building or the artifact layout changes
+ARTIFACT_VERSION = 2
+
+BASE_MODEL = "en_core_web_sm"
+METADATA_FILE = "luma_artifact.json"
+
+
+def default_artifact_dir() -> Path:
+    """Artifact directory from config, or luma/store/nlp_artifacts."""
+    if config.NLP_ARTIFACT_DIR:
+        return Path(config.NLP_ARTIFACT_DIR)
+    return Path(__file__).parent.parent / "store" / "nlp_artifacts"
+
+
+def _base_model_version() -> str:
+    """Installed version of the base spaCy model ("unknown" if not packaged)."""
+    try:
+        return spacy.util.get_package_version(BASE_MODEL) or "unknown"
+    except Exception:
+        return "unknown"
+
+
+def _pipeline_mode(pipeline_mode: Optional[str]) -> str:
+    """Explicit pipeline mode, or the configured default."""
+    return pipeline_mode or config.SPACY_PIPELINE_MODE
+
+
+def artifact_metadata(
+    global_config: CompiledGlobalConfig,
+    pipeline_mode: Optional[str] = None
+) -> Dict[str, Any]:
+    """Metadata that must match for an artifact to be reused."""
+    return {
+        "artifact_version": ARTIFACT_VERSION,
+        "content_hash": global_config.content_hash,
+        "pipeline_mode": _pipeline_mode(pipeline_mode),
+        "spacy_version": spacy.__version__ if SPACY_AVAILABLE else None,
+        "base_model": BASE_MODEL,
+        "base_model_version": _base_model_version() if SPACY_AVAILABLE else None,
+    }
+
+
+def artifact_key(metadata: Dict[str, Any]) -> str:
+    """Directory name for an artifact built with the given metadata."""
+    return "-".join([
+        f"v{metadata['artifact_version']}",
+        metadata["content_hash"][:16],
+        metadata["pipeline_mode"],
+        f"spacy{metadata['spacy_version']}",
+        f"{metadata['base_model']}{metadata['base_model_version']}",
+    ])
+
+
+def artifact_path(
+    global_config: CompiledGlobalConfig,
+    artifact_dir: Optional[Path] = None,
+    pipeline_mode: Optional[str] = None
+) -> Path:
+    """Location of the artifact for a compiled global config."""
+    artifact_dir = Path(artifact_dir) if artifact_dir else default_artifact_dir()
+    return artifact_dir / artifact_key(artifact_metadata(global_config, pipeline_mode))
+
+
+def save_nlp_artifact(
+    nlp,
+    global_config: CompiledGlobalConfig,
+    artifact_dir: Optional[Path] = None,
+    pipeline_mode: Optional[str] = None
+) -> Path:
+    """
+    Serialize a configured pipeline to disk.
+
+    The artifact is written to a temporary directory and renamed into place,
+    so concurrent workers never observe a partial artifact.
+
+    Returns:
+        Artifact path
+    """
+    target = artifact_path(global_config, artifact_dir, pipeline_mode)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_dir = Path(tempfile.mkdtemp(
+        prefix=f".{target.name}.", dir=str(target.parent)))
+    try:
+        nlp.to_disk(tmp_dir)
+        metadata = artifact_metadata(global_config, pipeline_mode)
+        metadata["source"] = str(global_config.path)
+        with open(tmp_dir / METADATA_FILE, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+        try:
+            os.rename(tmp_dir, target)
+        except OSError:
+            # Another worker finished first; its artifact is equivalent
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    debug_print(f"[NlpArtifact] Saved {target}")
+    return target
+
+
+def build_nlp_artifact(
+    global_config: CompiledGlobalConfig,
+    artifact_dir: Optional[Path] = None,
+    pipeline_mode: Optional[str] = None
+):
+    """
+    Build the entity ruler pipeline and serialize it to disk.
+
+    Returns:
+        Tuple of (nlp, artifact path)
+    """
+    if not SPACY_AVAILABLE:
+        raise ImportError(
+            "Install spaCy: pip install spacy && python -m spacy download en_core_web_sm"
+        )
+
+    pipeline_mode = _pipeline_mode(pipeline_mode)
+    nlp, _ = init_nlp_with_service_families(
+        global_config.path, global_config=global_config, pipeline_mode=pipeline_mode)
+    return nlp, save_nlp_artifact(nlp, global_config, artifact_dir, pipeline_mode)
+
+
+def load_nlp_artifact(
+    global_config: CompiledGlobalConfig,
+    artifact_dir: Optional[Path] = None,
+    pipeline_mode: Optional[str] = None
+):
+    """
+    Load a previously built pipeline for this config.
+
+    Returns:
+        nlp, or None if no matching artifact exists
+    """
+    if not SPACY_AVAILABLE:
+        raise ImportError(
+            "Install spaCy: pip install spacy && python -m spacy download en_core_web_sm"
+        )
+
+    path = artifact_path(global_config, artifact_dir, pipeline_mode)
+    metadata_path = path / METADATA_FILE
+    if not metadata_path.exists():
+        return None
+
+    with open(metadata_path, "r", encoding="utf-8") as f:
+        stored = json.load(f)
+    expected = artifact_metadata(global_config, pipeline_mode)
+    if any(stored.get(k) != v for k, v in expected.items()):
+        debug_print(f"[NlpArtifact] Metadata mismatch, ignoring {path}")
+        return None
+
+    nlp = spacy.load(path)
+    # Callables are not serialized; reinstall the custom tokenizer rules
+    nlp.tokenizer = customize_tokenizer(nlp)
+    debug_print(f"[NlpArtifact] Loaded {path}")
+    return nlp
+
+
+def load_or_build_nlp(
+    global_config: CompiledGlobalConfig,
+    artifact_dir: Optional[Path] = None,
+    pipeline_mode: Optional[str] = None
+):
+    """
+    Return the entity ruler pipeline for a compiled global config.
+
+    Loads the on-disk artifact when one matches the config hash, otherwise
+    builds the pipeline and saves it for the next start. With
+    USE_NLP_ARTIFACT disabled, the pipeline is always built in memory.
+
+    pipeline_mode defaults to config.SPACY_PIPELINE_MODE.
+    """
+    pipeline_mode = _pipeline_mode(pipeline_mode)
+    if not config.USE_NLP_ARTIFACT:
+        nlp, _ = init_nlp_with_service_families(
+            global_config.path, global_config=global_config, pipeline_mode=pipeline_mode)
+        return nlp
+
+    try:
+        nlp = load_nlp_artifact(global_config, artifact_dir, pipeline_mode)
+        if nlp is not None:
+            return nlp
+    except Exception as e:
+        debug_print(f"[NlpArtifact] Failed to load artifact, rebuilding: {e}")
+
+    nlp, _ = init_nlp_with_service_families(
+        global_config.path, global_config=global_config, pipeline_mode=pipeline_mode)
+    try:
+        save_nlp_artifact(nlp, global_config, artifact_dir, pipeline_mode)
+    except OSError as e:
+        # Read-only store: keep the in-memory pipeline
+        debug_print(f"[NlpArtifact] Could not write artifact: {e}")
+    return nlp
@@ -10,11 +10,36 @@ Supports entity types:
 """
 import re
 import unicodedata
-from typing import Dict
+from typing import Dict, List, Tuple
 
 # ===== CONFIGURATION =====
 from luma.config import debug_print
 
+from .phrase_trie import PhraseTrie
+
+
+# ===== PRECOMPILED PATTERNS =====
+_DASH_CHARS_RE = re.compile(r"[‐-‒–—−]")
+_HYPHEN_SPACING_RE = re.compile(r"\s*-\s*")
+_DASH_SPACING_RE = re.compile(r"\s*[-–—−]\s*")
+_POSSESSIVE_RE = re.compile(r"(\w)'s\b")
+_INNER_APOSTROPHE_RE = re.compile(r"(\w)'(\w)")
+_DIGIT_LETTER_RE = re.compile(r"(\d)([a-zA-Z])")
+_LETTER_DIGIT_RE = re.compile(r"([a-zA-Z])(\d)")
+# Both digit/letter splits in one pass (each boundary gets one space)
+_DIGIT_LETTER_BOUNDARY_RE = re.compile(r"(?<=\d)(?=[a-zA-Z])|(?<=[a-zA-Z])(?=\d)")
+_PUNCT_BEFORE_TEXT_RE = re.compile(r"([.!?;:,])(?=\S)")
+_PUNCT_AFTER_TEXT_RE = re.compile(r"(?<=\S)([.!?;:,])")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_PLACEHOLDER_PATTERN = r"(servicetoken|roomtypetoken|amenitytoken|datetoken|timetoken|durationtoken)"
+_CONSECUTIVE_PLACEHOLDERS_RE = re.compile(
+    rf"({_PLACEHOLDER_PATTERN})(?={_PLACEHOLDER_PATTERN})")
+_PLACEHOLDER_LETTER_RE = re.compile(rf"({_PLACEHOLDER_PATTERN})([a-zA-Z])")
+_LETTER_PLACEHOLDER_RE = re.compile(rf"([a-zA-Z])({_PLACEHOLDER_PATTERN})")
+_PLACEHOLDER_PUNCT_RE = re.compile(rf"({_PLACEHOLDER_PATTERN})([.,!?;:])")
+_PUNCT_PLACEHOLDER_RE = re.compile(rf"([.,!?;:])({_PLACEHOLDER_PATTERN})")
+
 
 def normalize_hyphens(text: str) -> str:
     """
@@ -22,8 +47,8 @@ def normalize_hyphens(text: str) -> str:
     remove spaces around them.
     """
     text = unicodedata.normalize("NFKC", text)
-    text = re.sub(r"[‐-‒–—−]", "-", text)
-    text = re.sub(r"\s*-\s*", "-", text)
+    text = _DASH_CHARS_RE.sub("-", text)
+    text = _HYPHEN_SPACING_RE.sub("-", text)
     return text
 
 
@@ -40,23 +65,23 @@ def pre_normalization(text: str) -> str:
     text = unicodedata.normalize("NFKC", text)
 
     # 2️⃣ Normalize hyphen spacing
-    text = re.sub(r"\s*[-–—−]\s*", "-", text)
+    text = _DASH_SPACING_RE.sub("-", text)
 
     # 3️⃣ Normalize apostrophes / possessives
     text = text.replace("`", "'")
-    text = re.sub(r"(\w)'s\b", r"\1s", text)
-    text = re.sub(r"(\w)'(\w)", r"\1\2", text)
+    text = _POSSESSIVE_RE.sub(r"\1s", text)
+    text = _INNER_APOSTROPHE_RE.sub(r"\1\2", text)
 
     # 4️⃣ Split digits and letters (12pm → 12 pm)
-    text = re.sub(r"(\d)([a-zA-Z])", r"\1 \2", text)
-    text = re.sub(r"([a-zA-Z])(\d)", r"\1 \2", text)
+    text = _DIGIT_LETTER_RE.sub(r"\1 \2", text)
+    text = _LETTER_DIGIT_RE.sub(r"\1 \2", text)
 
     # 5️⃣ Add spaces around punctuation
-    text = re.sub(r"([.!?;:,])(?=\S)", r"\1 ", text)
-    text = re.sub(r"(?<=\S)([.!?;:,])", r" \1", text)
+    text = _PUNCT_BEFORE_TEXT_RE.sub(r"\1 ", text)
+    text = _PUNCT_AFTER_TEXT_RE.sub(r" \1", text)
 
     # 6️⃣ Normalize spaces
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
 
     # 7️⃣ Lowercase
     text = text.lower()
@@ -73,25 +98,19 @@ def post_normalize_parameterized_text(text: str) -> str:
     - servicetoken, roomtypetoken, amenitytoken
     - datetoken, timetoken, durationtoken
     """
-    placeholder_pattern = r"(servicetoken|roomtypetoken|amenitytoken|datetoken|timetoken|durationtoken)"
-
     # 1️⃣ Split consecutive placeholders
-    text = re.sub(
-        rf"({placeholder_pattern})(?={placeholder_pattern})",
-        r"\1 ",
-        text,
-    )
+    text = _CONSECUTIVE_PLACEHOLDERS_RE.sub(r"\1 ", text)
 
     # 2️⃣ Space between placeholder and letters
-    text = re.sub(rf"({placeholder_pattern})([a-zA-Z])", r"\1 \2", text)
-    text = re.sub(rf"([a-zA-Z])({placeholder_pattern})", r"\1 \2", text)
+    text = _PLACEHOLDER_LETTER_RE.sub(r"\1 \2", text)
+    text = _LETTER_PLACEHOLDER_RE.sub(r"\1 \2", text)
 
     # 3️⃣ Space around punctuation
-    text = re.sub(rf"({placeholder_pattern})([.,!?;:])", r"\1 \2", text)
-    text = re.sub(rf"([.,!?;:])({placeholder_pattern})", r"\1 \2", text)
+    text = _PLACEHOLDER_PUNCT_RE.sub(r"\1 \2", text)
+    text = _PUNCT_PLACEHOLDER_RE.sub(r"\1 \2", text)
 
     # 4️⃣ Collapse spaces
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
 
     # 5️⃣ Lowercase
     text = text.lower()
@@ -281,3 +300,186 @@ def normalize_natural_language_variants(
 
     debug_print("normalized (natural language only):", normalized)
     return " ".join(normalized)
+
+
+# ===== FUSED NORMALIZATION =====
+
+def normalize_to_tokens(text: str) -> List[str]:
+    """
+    Fused normalize_hyphens + pre_normalization, returning the token list.
+
+    Same output as pre_normalization(normalize_hyphens(text)).split():
+    - NFKC runs once, and is skipped for ASCII input (a no-op there)
+    - The second dash-spacing pass is dropped (normalize_hyphens already
+      leaves only bare "-" with no surrounding whitespace)
+    - Both digit/letter splits run as one lookaround pass
+    - Whitespace collapsing and stripping fall out of str.split()
+    """
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+    text = _DASH_CHARS_RE.sub("-", text)
+    text = _HYPHEN_SPACING_RE.sub("-", text)
+
+    text = text.replace("`", "'")
+    if "'" in text:
+        text = _POSSESSIVE_RE.sub(r"\1s", text)
+        text = _INNER_APOSTROPHE_RE.sub(r"\1\2", text)
+
+    text = _DIGIT_LETTER_BOUNDARY_RE.sub(" ", text)
+
+    text = _PUNCT_BEFORE_TEXT_RE.sub(r"\1 ", text)
+    text = _PUNCT_AFTER_TEXT_RE.sub(r" \1", text)
+
+    return text.lower().split()
+
+
+def build_orthography_trie(rules: Dict[str, str]) -> PhraseTrie:
+    """
+    Compile orthography rules (variant → preferred) into a token trie.
+
+    Matches what normalize_orthography picks: the longest variant, and for
+    variants with the same words the first one in rule order.
+    """
+    trie = PhraseTrie()
+    for variant, preferred in rules.items():
+        trie.add(variant.lower().split(), preferred)
+    return trie
+
+
+def build_variant_trie(variant_map: Dict[str, str], max_n: int = 5) -> PhraseTrie:
+    """
+    Compile a natural language variant map into a token trie.
+
+    Only keys normalize_natural_language_variants can match are kept: at most
+    max_n words joined by single spaces.
+    """
+    trie = PhraseTrie()
+    for variant, preferred in variant_map.items():
+        words = variant.split(" ")
+        if len(words) <= max_n and all(word.split() == [word] for word in words):
+            trie.add(words, preferred)
+    return trie
+
+
+class FusedNormalizer:
+    """
+    Single-pass replacement for the EntityMatcher normalization chain:
+
+        normalize_hyphens → pre_normalization → normalize_orthography
+        → normalize_vocabularies → normalize_natural_language_variants
+
+    The text is tokenized once and the orthography, vocabulary and variant
+    passes run on one shared token list. Orthography rules and natural
+    language variants are compiled into token tries, so each position costs
+    at most one walk of the longest phrase, however many rules there are.
+
+    Output is identical to the chain above, including its quirks (rule
+    order ties, replacement slices applied at the original token index),
+    which test_normalization.py checks against the chain.
+    """
+
+    def __init__(
+        self,
+        orthography_rules: Dict[str, str],
+        synonym_map: Dict[str, str],
+        typo_map: Dict[str, str],
+        variant_map: Dict[str, str],
+        max_n: int = 5,
+    ):
+        self.has_orthography_rules = bool(orthography_rules)
+        self.orthography_trie = build_orthography_trie(orthography_rules)
+        self.synonym_map = synonym_map
+        self.typo_map = typo_map
+        self.variant_trie = build_variant_trie(variant_map, max_n)
+        self.max_n = max_n
+
+    def normalize(self, text: str) -> Tuple[str, bool]:
+        """
+        Normalize raw text before spaCy.
+
+        Returns:
+            Tuple of (normalized text, normalized_from_correction)
+        """
+        tokens = normalize_to_tokens(text)
+        if self.has_orthography_rules:
+            tokens = self._apply_orthography(tokens)
+        normalized_from_correction = False
+        if self.synonym_map or self.typo_map:
+            tokens, normalized_from_correction = self._apply_vocabularies(tokens)
+        tokens = self._apply_variants(tokens)
+
+        result = " ".join(tokens)
+        debug_print("normalized (natural language only):", result)
+        return result, normalized_from_correction
+
+    __call__ = normalize
+
+    def _apply_orthography(self, words: List[str]) -> List[str]:
+        """normalize_orthography on a token list."""
+        normalized = words[:]
+        skip_until = -1
+
+        for i in range(len(words)):
+            if i < skip_until:
+                continue
+
+            match = self.orthography_trie.longest_match(words, i)
+            if match is None:
+                continue
+
+            matched_len, matched_replacement = match
+            if matched_replacement:
+                normalized[i:i + matched_len] = matched_replacement.lower().split()
+                skip_until = i + matched_len
+
+        return normalized
+
+    def _apply_vocabularies(self, words: List[str]) -> Tuple[List[str], bool]:
+        """normalize_vocabularies on a token list (typos take precedence)."""
+        normalized: List[str] = []
+        normalized_from_correction = False
+
+        for word in words:
+            word_lower = word.lower()
+            canonical = None
+            if word_lower in self.typo_map:
+                canonical = self.typo_map[word_lower]
+                normalized_from_correction = True
+            elif word_lower in self.synonym_map:
+                canonical = self.synonym_map[word_lower]
+
+            if canonical:
+                if word and word[0].isupper():
+                    canonical = canonical.capitalize()
+                # Multi-word canonicals become several tokens for the next pass
+                normalized.extend(canonical.split())
+            else:
+                normalized.append(word)
+
+        return normalized, normalized_from_correction
+
+    def _apply_variants(self, tokens: List[str]) -> List[str]:
+        """normalize_natural_language_variants on a token list."""
+        words = [token.lower() for token in tokens]
+        normalized = words[:]
+        skip_until = -1
+
+        for i in range(len(words)):
+            if i < skip_until:
+                continue
+
+            match = self.variant_trie.longest_match(words, i, self.max_n)
+            if match is None:
+                continue
+
+            matched_len, matched_value = match
+            if i + matched_len == len(words):
+                # The chain tries n = max_n first, and a span running to
+                # the end of the text matches for every n >= its length
+                matched_len = self.max_n
+
+            if matched_value:
+                normalized[i: i + matched_len] = [matched_value]
+                skip_until = i + matched_len
+
+        return normalized
@@ -0,0 +1,80 @@
+"""
+Token-level phrase trie for longest-match normalization.
+
+Multi-word rules ("hair cut" → "haircut") are stored as token paths so a
+match at one position walks at most as many tokens as the longest phrase,
+independent of how many phrases the trie holds.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Key under which a node stores its value (cannot collide with a token)
+_VALUE = object()
+
+
+class PhraseTrie:
+    """
+    Trie over token sequences.
+
+    Values are stored with a sentinel, so falsy values ("", None) still count
+    as matches - callers decide what a falsy replacement means.
+    """
+
+    def __init__(self):
+        self._root: Dict[Any, Any] = {}
+        self.max_depth = 0
+
+    def add(self, tokens: Sequence[str], value: Any) -> bool:
+        """
+        Add a phrase. The first value added for a token sequence wins.
+
+        Returns:
+            True if the phrase was added, False if it was already present
+        """
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if _VALUE in node:
+            return False
+        node[_VALUE] = value
+        self.max_depth = max(self.max_depth, len(tokens))
+        return True
+
+    def longest_match(
+        self,
+        tokens: List[str],
+        start: int,
+        max_len: Optional[int] = None
+    ) -> Optional[Tuple[int, Any]]:
+        """
+        Longest phrase matching tokens[start:].
+
+        The empty phrase, when added, matches everywhere with length 0.
+
+        Returns:
+            (length in tokens, value), or None if nothing matches
+        """
+        node = self._root
+        match = (0, node[_VALUE]) if _VALUE in node else None
+        end = len(tokens)
+        if max_len is not None:
+            end = min(end, start + max_len)
+
+        for index in range(start, end):
+            node = node.get(tokens[index])
+            if node is None:
+                break
+            if _VALUE in node:
+                match = (index - start + 1, node[_VALUE])
+        return match
+
+    def __len__(self) -> int:
+        count = 0
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            for key, child in node.items():
+                if key is _VALUE:
+                    count += 1
+                else:
+                    stack.append(child)
+        return count
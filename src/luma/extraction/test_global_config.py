@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test cases for the compiled global config snapshot.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # extraction/
+luma_dir = script_dir.parent  # luma/
+src_dir = luma_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.extraction.global_config import (  # noqa: E402
+    load_compiled_global_config,
+    clear_global_config_cache,
+)
+from luma.extraction.entity_loading import (  # noqa: E402
+    load_global_service_families,
+    load_global_noise_set,
+    load_global_orthography_rules,
+    load_relative_date_offsets,
+    load_time_window_bounds,
+    load_month_names,
+)
+from luma.extraction.matcher import EntityMatcher  # noqa: E402
+
+
+GLOBAL_CONFIG = {
+    "service_families": {
+        "beauty_and_wellness": {
+            "haircut": {"synonym": ["haircut", "hair cut"]}
+        }
+    },
+    "entity_types": {
+        "date": {
+            "relative": [{"value": "tomorrow"}],
+            "month": {"to_number": {"january": 1}}
+        },
+        "time": {
+            "keywords": [{"value": "morning", "start": "08:00", "end": "12:00"}]
+        }
+    },
+    "normalization": {
+        "noise": {"values": ["please"]},
+        "orthography": {"haircut": ["hair-cut"]},
+        "vocabularies": {
+            "weekdays": {"to_number": {"monday": 0}},
+            "months": {"january": ["jan"]}
+        }
+    }
+}
+
+
+def _write_global_json(tmp_path: Path) -> Path:
+    path = tmp_path / "global.v2.json"
+    path.write_text(json.dumps(GLOBAL_CONFIG), encoding="utf-8")
+    return path
+
+
+def test_compiled_config_matches_individual_loaders(tmp_path):
+    """Every derived map equals what the per-section loaders produce."""
+    clear_global_config_cache()
+    path = _write_global_json(tmp_path)
+
+    config = load_compiled_global_config(path)
+
+    assert config.service_families == load_global_service_families(path)
+    assert config.noise_set == load_global_noise_set(path)
+    assert config.orthography_rules == load_global_orthography_rules(path)
+    assert config.relative_date_offsets == load_relative_date_offsets(path)
+    assert config.time_window_bounds == load_time_window_bounds(path)
+    assert config.month_names == load_month_names(path)
+    assert config.month_variant_map == {"jan": "january", "january": "january"}
+    assert config.month_numbers == {"jan": 1, "january": 1}
+    assert config.weekday_to_number == {"monday": 0}
+    assert config.variant_map["hair cut"] == "haircut"
+    assert config.service_family_map["hair cut"] == "beauty_and_wellness.haircut"
+    assert len(config.content_hash) == 64
+
+
+def test_compiled_config_is_shared_until_file_changes(tmp_path):
+    """The snapshot is reused per path and rebuilt after the file changes."""
+    clear_global_config_cache()
+    path = _write_global_json(tmp_path)
+
+    first = load_compiled_global_config(path)
+    assert load_compiled_global_config(str(path)) is first
+
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_compiled_global_config(path) is not first
+
+
+def test_entity_matcher_uses_injected_config(tmp_path):
+    """EntityMatcher takes its maps from an injected snapshot."""
+    clear_global_config_cache()
+    config = load_compiled_global_config(_write_global_json(tmp_path))
+
+    matcher = EntityMatcher(
+        domain="service", lazy_load_spacy=True, global_config=config)
+
+    assert matcher.global_config is config
+    assert matcher.service_family_map is config.service_family_map
+    assert matcher.orthography_rules is config.orthography_rules
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test cases for the shared EntityMatcher registry.
+
+Uses lazy_load_spacy so the registry can be exercised without spaCy models.
+"""
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # extraction/
+luma_dir = script_dir.parent  # luma/
+src_dir = luma_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.extraction.matcher_registry import (  # noqa: E402
+    get_entity_matcher,
+    clear_entity_matcher_registry,
+    is_registry_warm,
+)
+
+
+GLOBAL_CONFIG = {
+    "service_families": {
+        "beauty_and_wellness": {
+            "haircut": {"synonym": ["haircut", "hair cut"]}
+        }
+    },
+    "entity_types": {},
+    "normalization": {}
+}
+
+
+def _write_normalization_dir(tmp_path: Path) -> str:
+    """Write a minimal normalization directory and return the entity file path."""
+    (tmp_path / "global.v2.json").write_text(json.dumps(GLOBAL_CONFIG), encoding="utf-8")
+    entity_file = tmp_path / "101.v1.json"
+    entity_file.write_text("{}", encoding="utf-8")
+    return str(entity_file)
+
+
+def test_registry_returns_shared_instance(tmp_path):
+    """Same (domain, entity_file) yields the same matcher instance."""
+    clear_entity_matcher_registry()
+    entity_file = _write_normalization_dir(tmp_path)
+
+    first = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    second = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+
+    assert first is second
+    assert first.service_family_map["hair cut"] == "beauty_and_wellness.haircut"
+
+
+def test_registry_separates_domains(tmp_path):
+    """Each domain gets its own matcher."""
+    clear_entity_matcher_registry()
+    entity_file = _write_normalization_dir(tmp_path)
+
+    service = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    reservation = get_entity_matcher("reservation", entity_file, lazy_load_spacy=True)
+
+    assert service is not reservation
+    assert service.domain == "service"
+    assert reservation.domain == "reservation"
+
+
+def test_registry_rebuilds_when_global_config_changes(tmp_path):
+    """Touching global.v2.json invalidates the cached matcher."""
+    clear_entity_matcher_registry()
+    entity_file = _write_normalization_dir(tmp_path)
+
+    first = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+
+    global_json = tmp_path / "global.v2.json"
+    stat = global_json.stat()
+    os.utime(global_json, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    assert second is not first
+    assert get_entity_matcher("service", entity_file, lazy_load_spacy=True) is second
+
+
+def test_lazy_matchers_do_not_count_as_warm(tmp_path):
+    """Only spaCy-backed matchers mark the registry as warm."""
+    clear_entity_matcher_registry()
+    entity_file = _write_normalization_dir(tmp_path)
+
+    get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    assert not is_registry_warm()
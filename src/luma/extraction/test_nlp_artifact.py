@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test cases for the precompiled spaCy entity ruler artifact.
+"""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # extraction/
+luma_dir = script_dir.parent  # luma/
+src_dir = luma_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.extraction.global_config import (  # noqa: E402
+    load_compiled_global_config,
+    clear_global_config_cache,
+)
+from luma.extraction.nlp_artifact import (  # noqa: E402
+    artifact_path,
+    build_nlp_artifact,
+    load_nlp_artifact,
+)
+
+
+GLOBAL_CONFIG = {
+    "service_families": {
+        "beauty_and_wellness": {
+            "haircut": {"synonym": ["haircut", "hair cut"]}
+        }
+    },
+    "entity_types": {},
+    "normalization": {}
+}
+
+
+def _write_global_json(tmp_path: Path, config=GLOBAL_CONFIG) -> Path:
+    path = tmp_path / "global.v2.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    return path
+
+
+def _require_base_model():
+    spacy = pytest.importorskip("spacy")
+    if not spacy.util.is_package("en_core_web_sm"):
+        pytest.skip("en_core_web_sm not installed")
+
+
+def test_artifact_path_changes_with_global_config(tmp_path):
+    """Editing global.v2.json must map to a different artifact."""
+    clear_global_config_cache()
+    first = load_compiled_global_config(_write_global_json(tmp_path))
+
+    edited = dict(GLOBAL_CONFIG, entity_types={"date": {}})
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    second = load_compiled_global_config(_write_global_json(other_dir, edited))
+
+    artifact_dir = tmp_path / "artifacts"
+    assert artifact_path(first, artifact_dir) != artifact_path(second, artifact_dir)
+    assert artifact_path(first, artifact_dir) == artifact_path(first, artifact_dir)
+
+
+def test_missing_artifact_returns_none(tmp_path):
+    """No artifact on disk means the caller must build."""
+    _require_base_model()
+    clear_global_config_cache()
+    global_config = load_compiled_global_config(_write_global_json(tmp_path))
+
+    assert load_nlp_artifact(global_config, tmp_path / "artifacts") is None
+
+
+def test_artifact_round_trip_matches_fresh_pipeline(tmp_path):
+    """A loaded artifact extracts the same entities as the freshly built pipeline."""
+    _require_base_model()
+    clear_global_config_cache()
+    global_config = load_compiled_global_config(_write_global_json(tmp_path))
+    artifact_dir = tmp_path / "artifacts"
+
+    built, path = build_nlp_artifact(global_config, artifact_dir)
+    loaded = load_nlp_artifact(global_config, artifact_dir)
+
+    assert path.exists()
+    assert loaded is not None
+    text = "book a hair cut at 10am"
+    assert [(e.text, e.label_) for e in loaded(text).ents] == \
+        [(e.text, e.label_) for e in built(text).ents]
+    assert [t.text for t in loaded(text)] == [t.text for t in built(text)]
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Golden-output tests for the fused single-pass normalizer.
+
+FusedNormalizer must return exactly what the original normalization chain
+(normalize_hyphens → pre_normalization → normalize_orthography →
+normalize_vocabularies → normalize_natural_language_variants) returns, for
+the extraction test sentences and for inputs that hit the chain's edge cases.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # extraction/
+luma_dir = script_dir.parent  # luma/
+src_dir = luma_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.extraction.normalization import (  # noqa: E402
+    FusedNormalizer,
+    normalize_hyphens,
+    pre_normalization,
+    normalize_orthography,
+    normalize_natural_language_variants,
+    normalize_to_tokens,
+)
+from luma.extraction.vocabulary_normalization import (  # noqa: E402
+    compile_vocabulary_maps,
+    normalize_vocabularies,
+)
+from luma.extraction.entity_loading import build_natural_language_variant_map  # noqa: E402
+from luma.extraction.phrase_trie import PhraseTrie  # noqa: E402
+
+
+SERVICE_FAMILIES = {
+    "beauty_and_wellness": {
+        "haircut": {"synonym": ["haircut", "hair cut", "hair trim"]},
+        "beard": {"synonym": ["beard trim", "beard"]},
+        "manicure": {"synonym": ["manicure", "mani", "nail job"]},
+        "massage": {"synonym": ["hot stone massage", "massage", "full body massage"]},
+    }
+}
+
+VOCABULARIES = {
+    "relative_dates": {
+        "tomorrow": {"synonyms": ["tmr"], "typos": ["tommorow", "tomorow"]},
+        "tonight": {"synonyms": ["tonite"], "typos": []},
+        "next week": {"synonyms": ["nextweek"], "typos": ["nxt week"]},
+    },
+    "time_windows": {
+        "morning": {"synonyms": ["am hours"], "typos": ["mornign"]},
+    },
+    "weekdays": {
+        "monday": {"synonyms": ["mon"], "typos": ["munday"]},
+        "friday": {"synonyms": ["fri"], "typos": []},
+    },
+}
+
+# Multi-word, length-changing, tied and empty rules exercise the chain's quirks
+ORTHOGRAPHY_RULES = {
+    "pick up": "pickup",
+    "b day": "birthday",
+    "hair cut": "haircut",
+    "tmrw": "to morrow",
+    "a m": "am",
+    "p m": "pm",
+    "blank": "",
+    "week end": "weekend",
+    "this week end": "this weekend",
+}
+
+# Sentences from test_date_extraction.py, test.py and luma/test.py
+SENTENCES = [
+    "book me for haircut today",
+    "schedule appointment tomorrow",
+    "book next week",
+    "tonight please",
+    "book me for haircut on 15th dec",
+    "schedule on 15 dec",
+    "appointment on 15 december",
+    "book 15th december 2025",
+    "on 5 jan",
+    "on 25th feb",
+    "book dec 15",
+    "schedule dec 15th",
+    "appointment december 15",
+    "book december 15th 2025",
+    "on jan 5",
+    "on feb 25th",
+    "book on 15/12",
+    "schedule 15/12/2025",
+    "appointment 15-12-2025",
+    "book 5/1",
+    "on 25-2-2025",
+    "book haircut tomorrow morning at 9am",
+    "schedule on 15th dec at 2pm",
+    "book today or 15th dec",
+    "appointment tomorrow or dec 15",
+    "book on 15th dec 2025 at 9am for one hour",
+    "schedule haircut and beard trim on 15th dec",
+    "book me in for haircut tommorow mornign at 9am",
+    "on 15/12/2025 please",
+    "book on 32nd dec",
+    "schedule on 15/13/2025",
+    "appointment on dec 32",
+    "hair cut booking for today 5.30pm",
+    "hair cut booking for today 5.30 pm",
+    "hair cut booking for today 5pm",
+    "hair cut booking for today 5 pm",
+    "hair cut booking for today 5:30pm",
+    "hair cut booking for today 5:30 pm",
+    "hair cut booking for today 10am",
+    "hair cut booking for today 10 am",
+]
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "Book A HAIR CUT Tmrw @ 5PM!!",
+    "book hair cut — tomorrow – 3pm",
+    "book 9 – 10am",
+    "book 10 ‐ 11 am, then a mani",
+    "ｂｏｏｋ ＨＡＩＲ ＣＵＴ",
+    "ﬁx my beard trim",
+    "it's mike's b day tmrw",
+    "rock'n'roll hair`s cut",
+    "a'b'c d'e",
+    "pick up hair cut tmrw hair cut hair cut",
+    "tmrw tmrw hair cut b day b day",
+    "blank hair cut blank",
+    "this week end or the week end",
+    "nxt week nextweek tonite",
+    "full body massage and hot stone massage",
+    "hot stone massage hot stone massage mani",
+    "hair trim at 5 p m on mon or fri",
+    "book a1b2c3 at x9y",
+    "ab12cd 3:30pm.7,8;9?",
+    "..hello,,world!!",
+    "tab\tseparated\nnew line nbsp emsp",
+    "Zürich café résumé",
+    "İstanbul ǅemal",
+    "12pm-1pm",
+    "mon - fri",
+]
+
+
+def legacy_normalize(text, orthography_rules, synonym_map, typo_map, variant_map):
+    """The original EntityMatcher.normalize chain."""
+    text = normalize_hyphens(text)
+    normalized = pre_normalization(text)
+    normalized = normalize_orthography(normalized, orthography_rules)
+    normalized, normalized_from_correction = normalize_vocabularies(
+        normalized, synonym_map, typo_map)
+    normalized = normalize_natural_language_variants(normalized, variant_map)
+    return normalized, normalized_from_correction
+
+
+@pytest.fixture(scope="module")
+def maps():
+    synonym_map, typo_map, _ = compile_vocabulary_maps(VOCABULARIES)
+    variant_map = build_natural_language_variant_map(SERVICE_FAMILIES)
+    return ORTHOGRAPHY_RULES, synonym_map, typo_map, variant_map
+
+
+@pytest.mark.parametrize("text", SENTENCES + EDGE_CASES)
+def test_fused_normalizer_matches_chain(maps, text):
+    """Golden output: fused normalizer == original chain."""
+    assert FusedNormalizer(*maps).normalize(text) == legacy_normalize(text, *maps)
+
+
+@pytest.mark.parametrize("text", SENTENCES + EDGE_CASES)
+def test_fused_normalizer_matches_chain_without_rules(text):
+    """Empty maps short-circuit the same way the chain does."""
+    assert FusedNormalizer({}, {}, {}, {}).normalize(text) == \
+        legacy_normalize(text, {}, {}, {}, {})
+
+
+@pytest.mark.parametrize("text", SENTENCES + EDGE_CASES)
+def test_normalize_to_tokens_matches_pre_normalization(text):
+    """The fused string passes tokenize like the two original functions."""
+    assert normalize_to_tokens(text) == pre_normalization(normalize_hyphens(text)).split()
+
+
+def test_typo_sets_normalized_from_correction(maps):
+    normalizer = FusedNormalizer(*maps)
+    assert normalizer.normalize("book tommorow")[1] is True
+    assert normalizer.normalize("book tmr")[1] is False
+
+
+def test_fused_normalizer_matches_chain_with_unusual_keys():
+    """Empty, falsy, over-long and double-spaced keys behave like the chain."""
+    orthography_rules = dict(ORTHOGRAPHY_RULES, **{
+        "": "zz top", "Hair Cut": "first wins", "hair  cut": "dup",
+        "a b c d e f g": "long"})
+    synonym_map, typo_map, _ = compile_vocabulary_maps(VOCABULARIES)
+    variant_map = dict(build_natural_language_variant_map(SERVICE_FAMILIES), **{
+        "": "never", "beard": "", "a b c d e f": "six", "hot  stone": "dbl",
+        "to morrow": "tomorrow", "top mani": "tm"})
+    maps = (orthography_rules, synonym_map, typo_map, variant_map)
+
+    normalizer = FusedNormalizer(*maps)
+    for text in SENTENCES + EDGE_CASES + ["a b c d e f g beard", "a b c d e f", "zz top mani"]:
+        assert normalizer.normalize(text) == legacy_normalize(text, *maps)
+
+
+def test_fused_normalizer_matches_chain_with_large_variant_map(maps):
+    """Thousands of tenant synonyms: same output as the per-n-gram lookup."""
+    orthography_rules, synonym_map, typo_map, variant_map = maps
+    large_map = dict(variant_map)
+    for i in range(5000):
+        large_map[f"service {i} deluxe"] = f"service{i}"
+        large_map[f"hair cut {i}"] = "haircut"
+    large_maps = (orthography_rules, synonym_map, typo_map, large_map)
+
+    normalizer = FusedNormalizer(*large_maps)
+    for text in SENTENCES + ["book service 42 deluxe and hair cut 7 at 5pm", "hair cut 4999"]:
+        assert normalizer.normalize(text) == legacy_normalize(text, *large_maps)
+
+
+def test_phrase_trie_longest_match():
+    trie = PhraseTrie()
+    trie.add(["hair"], "hair")
+    trie.add(["hair", "cut"], "haircut")
+    assert not trie.add(["hair", "cut"], "ignored")
+    trie.add(["beard"], "")
+
+    tokens = ["a", "hair", "cut", "beard"]
+    assert trie.longest_match(tokens, 0) is None
+    assert trie.longest_match(tokens, 1) == (2, "haircut")
+    assert trie.longest_match(tokens, 1, max_len=1) == (1, "hair")
+    assert trie.longest_match(tokens, 3) == (1, "")
+    assert trie.max_depth == 2
+    assert len(trie) == 3
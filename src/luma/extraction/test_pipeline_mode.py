@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Parity tests for the trimmed ("ruler_only") spaCy pipeline mode.
+
+Runs the luma test sentences through EntityMatcher with the full
+en_core_web_sm pipeline and with the ruler-only pipeline and requires
+identical extraction output. Skipped when spaCy, the base model or
+global.v2.json are not available.
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # extraction/
+luma_dir = script_dir.parent  # luma/
+src_dir = luma_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.extraction.entity_loading import (  # noqa: E402
+    PIPELINE_MODE_FULL,
+    PIPELINE_MODE_RULER_ONLY,
+    load_base_nlp,
+    init_nlp_with_service_families,
+)
+from luma.extraction.global_config import load_compiled_global_config  # noqa: E402
+from luma.extraction.matcher import EntityMatcher, resolve_global_json_path  # noqa: E402
+
+
+# Sentences from test_date_extraction_isolated.py and luma/test.py
+SENTENCES = [
+    "book me for haircut today",
+    "schedule appointment tomorrow",
+    "book next week",
+    "tonight please",
+    "book me for haircut on 15th dec",
+    "schedule on 15 dec",
+    "appointment on 15 december",
+    "book 15th december 2025",
+    "on 5 jan",
+    "book dec 15",
+    "schedule dec 15th",
+    "book december 15th 2025",
+    "on feb 25th",
+    "book on 15/12",
+    "schedule 15/12/2025",
+    "appointment 15-12-2025",
+    "book today or 15th dec",
+    "appointment tomorrow or dec 15",
+    "schedule haircut and beard trim on 15th dec",
+    "on 15/12/2025 please",
+    "book haircut tomorrow at 9am",
+    "book me in for a hair cut next friday at 3 pm",
+    "haircut tomorrow morning",
+    "book a massage for 2 hours on monday afternoon",
+    "schedule beard trim between 10am and 12pm",
+    "book haircut and manicure this weekend",
+    # Dates and times the ruler patterns miss: only statistical NER labels them
+    "book a haircut the day after tomorrow",
+    "schedule a massage in two weeks",
+    "book beard trim at noon on christmas eve",
+    "appointment first thing on the 3rd of next month",
+]
+
+
+@pytest.fixture(scope="module")
+def matchers():
+    """EntityMatchers sharing one config, one per pipeline mode."""
+    spacy = pytest.importorskip("spacy")
+    if not spacy.util.is_package("en_core_web_sm"):
+        pytest.skip("en_core_web_sm not installed")
+    try:
+        global_json_path = resolve_global_json_path()
+    except ValueError:
+        pytest.skip("global.v2.json not available")
+
+    global_config = load_compiled_global_config(global_json_path)
+    result = {}
+    for mode in (PIPELINE_MODE_FULL, PIPELINE_MODE_RULER_ONLY):
+        matcher = EntityMatcher(
+            domain="service", lazy_load_spacy=True, global_config=global_config)
+        matcher.nlp, _ = init_nlp_with_service_families(
+            global_config.path, global_config=global_config, pipeline_mode=mode)
+        result[mode] = matcher
+    return result
+
+
+def test_unknown_pipeline_mode_is_rejected():
+    """Typos in SPACY_PIPELINE_MODE fail loudly instead of loading the full model."""
+    with pytest.raises(ValueError):
+        load_base_nlp("ruler")
+
+
+def test_ruler_only_excludes_statistical_components(matchers):
+    """The entity ruler and statistical NER remain in the trimmed pipeline."""
+    nlp = matchers[PIPELINE_MODE_RULER_ONLY].nlp
+    assert nlp.pipe_names == ["entity_ruler", "ner"]
+
+
+@pytest.mark.parametrize("sentence", SENTENCES)
+def test_ruler_only_matches_full_pipeline(matchers, sentence):
+    """Extraction output is identical in both pipeline modes."""
+    full = matchers[PIPELINE_MODE_FULL].extract_with_parameterization(sentence)
+    trimmed = matchers[PIPELINE_MODE_RULER_ONLY].extract_with_parameterization(sentence)
+    assert trimmed == full
@@ -31,6 +31,11 @@ def load_vocabularies(global_json_path: Path) -> Dict[str, Dict[str, Dict[str, A
     with open(global_json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
     
+    return parse_vocabularies(data)
+
+
+def parse_vocabularies(data: Dict[str, Any]) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Extract vocabularies from already-parsed global JSON data."""
     vocabularies = data.get("normalization", {}).get(
         "normalization", {}).get("vocabularies", {})
     return vocabularies
@@ -11,7 +11,8 @@ Determines user intent from:
 NO ML. NO embeddings. NO NER dependency.
 """
 import re
-from typing import Tuple, Dict, Any, List
+from functools import lru_cache
+from typing import Tuple, Dict, Any, List, Pattern
 
 
 # Canonical intents (locked - 10 production intents)
@@ -33,6 +34,19 @@ MEDIUM_CONFIDENCE = 0.85
 LOW_CONFIDENCE = 0.75
 
 
+@lru_cache(maxsize=64)
+def compile_rule_family(patterns: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile a rule family into one case-insensitive alternation.
+
+    A family only answers "does any pattern match?", so a single search over
+    (?:p1)|(?:p2)|... gives the same result as searching each pattern in turn,
+    in one scan of the sentence. Compiled families are cached by content.
+    """
+    return re.compile(
+        "|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
 class ReservationIntentResolver:
     """
     Rule-based intent resolver for appointment/reservation booking.
@@ -334,10 +348,9 @@ class ReservationIntentResolver:
 
     def _matches_patterns(self, sentence: str, patterns: List[str]) -> bool:
         """Check if sentence matches any of the given regex patterns."""
-        for pattern in patterns:
-            if re.search(pattern, sentence, re.IGNORECASE):
-                return True
-        return False
+        if not patterns:
+            return False
+        return compile_rule_family(tuple(patterns)).search(sentence) is not None
 
     def _is_question(self, sentence: str) -> bool:
         """Check if sentence is a question (ends with ? or contains question words)."""
@@ -413,6 +413,34 @@ def test_rule_priority():
     print("  [OK] Rule priority: PASSED")
 
 
+def test_compiled_rule_families_match_per_pattern_search():
+    """Compiled rule families agree with searching each pattern individually."""
+    import re
+
+    resolver = ReservationIntentResolver()
+    families = [
+        value for name, value in vars(resolver).items()
+        if name.endswith("_patterns")
+    ]
+    sentences = [
+        "i want to pay", "cancel my appointment", "can't make it tomorrow",
+        "move my booking to tomorrow", "Change Date to next week",
+        "are you available tomorrow?", "what times are available?",
+        "when is my appointment", "what does the facial include",
+        "how much does a haircut cost", "what services do you offer",
+        "which is better", "hello", "book me a haircut tomorrow",
+        "Can I get a haircut and beard trim tomorrow at 1pm?", "",
+    ]
+
+    for sentence in sentences:
+        for patterns in families:
+            expected = any(re.search(p, sentence, re.IGNORECASE) for p in patterns)
+            assert resolver._matches_patterns(sentence, patterns) == expected, \
+                f"Mismatch for '{sentence}' on {patterns}"
+
+    print("  [OK] Compiled rule families: PASSED")
+
+
 def main():
     """Run all test cases."""
     print("=" * 70)
@@ -433,6 +461,7 @@ def main():
     test_recommendation_intent()
     test_unknown_intent()
     test_rule_priority()
+    test_compiled_rule_families_match_per_pattern_search()
 
     print()
     print("=" * 70)
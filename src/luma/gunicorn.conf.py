@@ -0,0 +1,66 @@
+"""
+Gunicorn configuration for the Luma Flask API (luma/api.py)
+
+    cd src
+    gunicorn -c luma/gunicorn.conf.py luma.api:app
+
+With GUNICORN_PRELOAD (the default) the master imports the app and builds
+the intent resolver, the shared entity matchers (spaCy + entity ruler) and
+the compiled global config once, then forks the workers. The workers share
+those pages copy-on-write, so memory no longer grows by a full model per
+worker.
+
+The garbage collector is disabled while the master loads and the loaded
+objects are moved to the permanent generation with gc.freeze() before
+forking. Otherwise the first collection in each worker writes to every
+object's GC header and copies the pages they share.
+
+With GUNICORN_PRELOAD=false each worker initializes the pipeline itself
+after it is forked (needed for code reloads via HUP).
+
+Settings: GUNICORN_WORKERS, GUNICORN_PRELOAD, GUNICORN_TIMEOUT, HOST, PORT.
+Measure per-worker memory with: python -m luma.benchmarks.worker_memory
+"""
+import gc
+import sys
+from pathlib import Path
+
+# Gunicorn loads this file before it puts the working directory on sys.path
+src_path = Path(__file__).resolve().parent.parent
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+from luma.config import config  # noqa: E402
+
+bind = f"{config.API_HOST}:{config.API_PORT}"
+workers = config.GUNICORN_WORKERS
+preload_app = config.GUNICORN_PRELOAD
+timeout = config.GUNICORN_TIMEOUT
+
+if preload_app:
+    # Keep the collector away from the objects the master is about to load
+    gc.disable()
+
+
+def _init_pipeline() -> None:
+    """Initialize luma.api's pipeline components in this process."""
+    from luma import api
+
+    if api.intent_resolver is None and not api.init_pipeline():
+        raise RuntimeError("Failed to start API - pipeline initialization failed")
+
+
+def when_ready(server):
+    """Master, after the app is preloaded and before the first fork."""
+    if not preload_app:
+        return
+    _init_pipeline()
+    gc.freeze()
+    gc.enable()
+    server.log.info(f"Pipeline preloaded; {gc.get_freeze_count()} objects frozen for copy-on-write sharing")
+
+
+def post_worker_init(worker):
+    """Worker, after the app is loaded (initializes here without preload)."""
+    if not preload_app:
+        _init_pipeline()
@@ -0,0 +1,57 @@
+"""
+Luma response encoding
+
+Encodes /book responses straight to JSON bytes. Uses orjson when it is
+installed (datetimes, dates and times are emitted natively as ISO-8601,
+naive values as UTC) and falls back to the standard library json module
+with the same output rules.
+
+Both servers send the bytes as-is, so a response is walked once by the
+encoder instead of by jsonify and our own serializers.
+
+Usage:
+    from luma.json_response import dumps
+
+    body = dumps(response)   # bytes, compact separators
+"""
+import json
+from datetime import date, datetime, time, timezone
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+MIMETYPE = "application/json"
+
+
+def _default(value: Any) -> Any:
+    """Encode types the JSON encoder does not handle natively."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+if ORJSON_AVAILABLE:
+    _ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+else:
+    _ENCODER = json.JSONEncoder(
+        default=_default, ensure_ascii=False, separators=(",", ":"))
+
+    def dumps(obj: Any) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        return _ENCODER.encode(obj).encode("utf-8")
@@ -0,0 +1,241 @@
+"""
+Luma pipeline latency metrics
+
+In-process latency histograms for the booking pipeline stages
+(normalization, spaCy, parameterization, intent, structure, grouping,
+semantic, calendar) and for whole API requests.
+
+Each histogram keeps Prometheus-style cumulative buckets (aggregatable
+across workers) plus a sliding window of recent samples for p50/p95/p99.
+Metrics are per process: with several API workers, every worker serves its
+own /metrics and the scraper aggregates the buckets.
+
+Usage:
+    from luma.metrics import metrics, new_stage_timings
+
+    timings = new_stage_timings()
+    with timings.stage("intent"):
+        ...
+    timings.to_dict()              # {"intent": 0.42}  (milliseconds)
+    metrics.render_prometheus()    # text exposition format
+"""
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from luma.config import config
+
+
+# Pipeline stages in execution order
+STAGES = (
+    "normalization",
+    "spacy",
+    "parameterization",
+    "intent",
+    "structure",
+    "grouping",
+    "semantic",
+    "calendar",
+)
+
+# Upper bounds in seconds (Prometheus "le" labels); +Inf is implicit
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+# intents/api/latency.py keeps a copy for the intent classifier image, which
+# does not contain this package; change both together
+class LatencyHistogram:
+    """Thread-safe latency histogram with a sliding quantile window."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, window: int = 2048):
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_counts = [0] * len(self.buckets)
+        self._samples = deque(maxlen=window)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        with self._lock:
+            self._count += 1
+            self._sum += seconds
+            self._samples.append(seconds)
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    self._bucket_counts[index] += 1
+                    break
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Consistent copy of the histogram state.
+
+        Returns:
+            {"count", "sum", "buckets": [(le, cumulative count)], "quantiles": {q: seconds}}
+        """
+        with self._lock:
+            count = self._count
+            total = self._sum
+            bucket_counts = list(self._bucket_counts)
+            samples = sorted(self._samples)
+
+        cumulative: List[Tuple[float, int]] = []
+        running = 0
+        for bound, bucket_count in zip(self.buckets, bucket_counts):
+            running += bucket_count
+            cumulative.append((bound, running))
+
+        quantiles = {}
+        if samples:
+            for q in QUANTILES:
+                # Nearest-rank quantile over the recent window
+                rank = max(math.ceil(q * len(samples)) - 1, 0)
+                quantiles[q] = samples[rank]
+
+        return {"count": count, "sum": total, "buckets": cumulative, "quantiles": quantiles}
+
+
+class MetricsRegistry:
+    """Process-wide collection of stage and request latency histograms."""
+
+    def __init__(self, window: int = 2048):
+        self.window = window
+        self._stages: Dict[str, LatencyHistogram] = {}
+        self._requests: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def _histogram(self, family: Dict[str, LatencyHistogram], key: str) -> LatencyHistogram:
+        histogram = family.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = family.setdefault(key, LatencyHistogram(window=self.window))
+        return histogram
+
+    def observe_stage(self, stage: str, seconds: float) -> None:
+        """Record the duration of one pipeline stage."""
+        self._histogram(self._stages, stage).observe(seconds)
+
+    def observe_request(self, endpoint: str, seconds: float) -> None:
+        """Record the duration of one API request."""
+        self._histogram(self._requests, endpoint).observe(seconds)
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, object]]]:
+        """{"stages": {stage: snapshot}, "requests": {endpoint: snapshot}}."""
+        # Copy under the lock: another thread may be adding a histogram
+        with self._lock:
+            stages = sorted(self._stages.items(), key=_stage_order)
+            requests = sorted(self._requests.items())
+        return {
+            "stages": {name: h.snapshot() for name, h in stages},
+            "requests": {name: h.snapshot() for name, h in requests},
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all histograms in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        _render_family(
+            lines, "luma_stage_duration_seconds", "stage",
+            "Duration of luma pipeline stages.", snapshot["stages"])
+        _render_family(
+            lines, "luma_request_duration_seconds", "endpoint",
+            "Duration of luma API requests.", snapshot["requests"])
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Drop all recorded samples (tests)."""
+        with self._lock:
+            self._stages.clear()
+            self._requests.clear()
+
+
+class StageTimings:
+    """
+    Stage durations for one request.
+
+    Every timed stage is also observed in the registry (when given), so
+    per-request timings and the process histograms always agree.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry
+        self.durations: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block as stage `name` (recorded even if the block raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add an externally measured duration for stage `name`."""
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        if self.registry is not None:
+            self.registry.observe_stage(name, seconds)
+
+    def to_dict(self) -> Dict[str, float]:
+        """Stage durations in milliseconds, in pipeline order."""
+        return {
+            name: round(seconds * 1000, 3)
+            for name, seconds in sorted(self.durations.items(), key=_stage_order)
+        }
+
+
+def timed_stage(timings: Optional[StageTimings], name: str):
+    """timings.stage(name), or a no-op context when timings is None."""
+    if timings is None:
+        return nullcontext()
+    return timings.stage(name)
+
+
+def new_stage_timings() -> StageTimings:
+    """StageTimings feeding the process registry (unless ENABLE_METRICS is off)."""
+    return StageTimings(metrics if config.ENABLE_METRICS else None)
+
+
+def _stage_order(item) -> Tuple[int, str]:
+    name = item[0]
+    return (STAGES.index(name) if name in STAGES else len(STAGES), name)
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != float("inf") else "+Inf"
+
+
+def _render_family(
+    lines: List[str],
+    name: str,
+    label: str,
+    help_text: str,
+    snapshots: Dict[str, Dict[str, object]]
+) -> None:
+    """Append one histogram family and its quantile summary."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for key, snap in snapshots.items():
+        for bound, count in snap["buckets"]:
+            lines.append(f'{name}_bucket{{{label}="{key}",le="{_format_value(bound)}"}} {count}')
+        lines.append(f'{name}_bucket{{{label}="{key}",le="+Inf"}} {snap["count"]}')
+        lines.append(f'{name}_sum{{{label}="{key}"}} {_format_value(snap["sum"])}')
+        lines.append(f'{name}_count{{{label}="{key}"}} {snap["count"]}')
+
+    quantile_name = f"{name}_quantile"
+    lines.append(f"# HELP {quantile_name} {help_text[:-1]} (p50/p95/p99 over recent samples).")
+    lines.append(f"# TYPE {quantile_name} gauge")
+    for key, snap in snapshots.items():
+        for q, seconds in snap["quantiles"].items():
+            lines.append(f'{quantile_name}{{{label}="{key}",quantile="{q}"}} {_format_value(seconds)}')
+
+
+# Global registry (per process)
+metrics = MetricsRegistry(window=config.METRICS_WINDOW)
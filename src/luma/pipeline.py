@@ -0,0 +1,606 @@
+"""
+Luma booking pipeline (framework-free)
+
+Runs the six pipeline stages for a single request or a batch of requests:
+extraction → intent → structure → grouping → semantic → calendar,
+followed by clarification rendering.
+
+Stage durations are recorded in the luma.metrics histograms (served on
+/metrics) and can be returned per response with include_timings.
+
+With include_trace (or ENABLE_TRACING), the structured trace records the
+stages emit through luma.tracing are returned per response as "trace".
+
+Stages 1 and 3-5 depend only on the normalized text and are reused from
+luma.result_cache for repeated utterances; intent (raw sentence) and
+calendar binding (now/timezone) always run.
+
+Stage results stay objects until the response is built. With fields (or
+compact, i.e. COMPACT_STAGES) a successful response converts and returns
+only the requested stages; failures return every stage for debugging. A
+stage that fails to convert fails its request like a stage error.
+
+The REST APIs (luma/api.py on Flask, luma/asgi.py on ASGI) are thin HTTP
+layers over these functions and share request validation and /info here.
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from luma.calendar.calendar_binder import _load_config as _load_calendar_config, bind_calendar
+from luma.calendar.timezones import localize_datetime as localize_to_timezone, lookup_timezone
+from luma.resolution.semantic_resolver import _load_global_config as _load_semantic_config, resolve_semantics
+from luma.grouping.appointment_grouper import group_appointment
+from luma.structure.interpreter import interpret_structure
+from luma.extraction.matcher import DOMAIN_ENTITY_WHITELIST
+from luma.extraction.matcher_registry import get_entity_matcher, warm_entity_matchers
+from luma.clarification import render_clarification
+from luma.config import config
+from luma.metrics import StageTimings, new_stage_timings
+from luma.result_cache import CachedStages, result_cache, stage_cache_key
+from luma.tracing import request_trace, trace
+
+
+def localize_datetime(dt: datetime, timezone: str) -> datetime:
+    """Localize datetime to timezone (unchanged if the timezone is unknown)."""
+    tz = lookup_timezone(timezone)
+    if tz is None:
+        return dt
+    return localize_to_timezone(dt, tz)
+
+
+def find_normalization_dir() -> Optional[Path]:
+    """Find the normalization directory."""
+    current_file = Path(__file__).resolve()
+    store_dir = current_file.parent / "store" / "normalization"
+    if store_dir.exists():
+        return store_dir
+    src_dir = current_file.parent.parent
+    intents_norm = src_dir / "intents" / "normalization"
+    if intents_norm.exists():
+        return intents_norm
+    return None
+
+
+def get_entity_file() -> Optional[str]:
+    """Return the entity file path used to locate global.v2.json, or None."""
+    normalization_dir = find_normalization_dir()
+    if not normalization_dir:
+        return None
+    return str(normalization_dir / "101.v1.json")
+
+
+def warm_pipeline(entity_file: Optional[str]) -> int:
+    """
+    Load everything the stages would otherwise build on first request.
+
+    Builds the shared entity matchers (spaCy + entity ruler) for every domain
+    and the compiled global config held by the semantic and calendar stages.
+    Servers call this before forking workers so the workers share the loaded
+    state copy-on-write instead of each building their own.
+
+    Returns:
+        Number of entity matchers built
+    """
+    count = warm_entity_matchers(DOMAIN_ENTITY_WHITELIST.keys(), entity_file)
+    _load_semantic_config()
+    _load_calendar_config()
+    return count
+
+
+def api_info() -> Dict[str, Any]:
+    """Body of the /info endpoint."""
+    return {
+        "name": "Luma Service/Reservation Booking API",
+        "version": "1.0.0",
+        "description": "Service and reservation booking processing with entity extraction, intent resolution, semantic resolution, and calendar binding",
+        "endpoints": {
+            "/book": {
+                "method": "POST",
+                "description": "Process service/reservation booking request",
+                "parameters": {
+                    "text": "string (required) - Booking request text",
+                    "domain": "string (optional) - 'service' or 'reservation' (default: 'service')",
+                    "timezone": "string (optional) - Timezone for calendar binding (default: 'UTC')",
+                    "debug": "bool (optional) - Include per-stage timings_ms and trace records in the response",
+                }
+            },
+            "/book/batch": {
+                "method": "POST",
+                "description": "Process many booking requests; each item gets its own result or error",
+                "parameters": {
+                    "items": "list (required) - Items of {text, domain, timezone} as for /book",
+                    "batch_size": f"int (optional) - spaCy nlp.pipe batch size (default: {config.BATCH_SIZE})",
+                    "n_process": f"int (optional) - spaCy nlp.pipe processes (default: {config.BATCH_N_PROCESS})",
+                    "debug": "bool (optional) - Include per-stage timings_ms and trace records in each result",
+                }
+            },
+            "/health": {
+                "method": "GET",
+                "description": "Health check"
+            },
+            "/metrics": {
+                "method": "GET",
+                "description": "Per-stage latency histograms and result cache counters (Prometheus text format)"
+            },
+            "/info": {
+                "method": "GET",
+                "description": "API information"
+            }
+        },
+        "configuration": {
+            "port": config.API_PORT,
+        }
+    }
+
+
+# Response stages, in pipeline order
+RESPONSE_STAGES = ("extraction", "intent", "structure", "grouping", "semantic", "calendar")
+
+# Stages kept in compact responses (what callers act on)
+COMPACT_STAGES = ("intent", "calendar")
+
+# Stages held as result objects until the response is built
+_STAGE_SERIALIZERS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "structure": lambda structure: structure.to_dict()["structure"],
+    "semantic": lambda semantic_result: semantic_result.to_dict(),
+    "calendar": lambda calendar_result: calendar_result.to_dict(),
+}
+
+
+def validate_booking_item(item: Any) -> Optional[str]:
+    """
+    Validate a booking request body.
+
+    Returns:
+        Error message, or None if the item is valid
+    """
+    if not isinstance(item, dict) or "text" not in item:
+        return "Missing 'text' parameter in request body"
+    text = item["text"]
+    if not text or not isinstance(text, str):
+        return "'text' must be a non-empty string"
+    for name in ("domain", "timezone"):
+        if name in item and not isinstance(item[name], str):
+            return f"'{name}' must be a string"
+    return None
+
+
+def parse_response_fields(data: Dict[str, Any]) -> Tuple[Optional[Tuple[str, ...]], Optional[str]]:
+    """
+    Stages requested with "fields" (or "compact") in a request body.
+
+    Returns:
+        (stage names in pipeline order, None); (None, None) for all stages;
+        or (None, error message)
+    """
+    fields = data.get("fields")
+    if fields is None:
+        return (COMPACT_STAGES if data.get("compact") else None), None
+    if not isinstance(fields, list) or not all(isinstance(name, str) for name in fields):
+        return None, "'fields' must be a list of stage names"
+    unknown = sorted(set(fields) - set(RESPONSE_STAGES))
+    if unknown:
+        return None, f"Unknown fields: {', '.join(unknown)} (choose from {', '.join(RESPONSE_STAGES)})"
+    return tuple(name for name in RESPONSE_STAGES if name in fields), None
+
+
+def parse_batch_request(data: Any) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Validate a /book/batch request body.
+
+    Returns:
+        ({"items", "batch_size", "n_process", "debug", "fields"}, None) if valid,
+        otherwise (None, error message)
+
+    Raises:
+        ValueError: If batch_size or n_process is not an integer
+    """
+    items = data.get("items") if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        return None, "'items' must be a non-empty list"
+    if len(items) > config.BATCH_MAX_ITEMS:
+        return None, f"Too many items: {len(items)} (max {config.BATCH_MAX_ITEMS})"
+
+    batch_size = int(data.get("batch_size", config.BATCH_SIZE))
+    n_process = int(data.get("n_process", config.BATCH_N_PROCESS))
+    if batch_size < 1 or not 1 <= n_process <= config.BATCH_MAX_PROCESSES:
+        return None, f"'batch_size' must be >= 1 and 'n_process' between 1 and {config.BATCH_MAX_PROCESSES}"
+
+    fields, error = parse_response_fields(data)
+    if error:
+        return None, error
+
+    return {
+        "items": items,
+        "batch_size": batch_size,
+        "n_process": n_process,
+        "debug": bool(data.get("debug", False)),
+        "fields": fields,
+    }, None
+
+
+def build_clarification(semantic_result, calendar_result) -> Dict[str, Any]:
+    """Build the response clarification block from semantic/calendar results."""
+    for result in (semantic_result, calendar_result):
+        if result.needs_clarification and result.clarification:
+            try:
+                message = render_clarification(result.clarification)
+                return {
+                    "needed": True,
+                    "reason": result.clarification.reason.value,
+                    "message": message
+                }
+            except Exception:
+                return {
+                    "needed": True,
+                    "reason": result.clarification.reason.value
+                }
+    return {"needed": False}
+
+
+def process_booking(
+    text: str,
+    intent_resolver,
+    entity_file: str,
+    domain: str = "service",
+    timezone: str = "UTC",
+    extraction_result: Optional[Dict[str, Any]] = None,
+    extraction_error: Optional[Exception] = None,
+    include_timings: bool = False,
+    cache_key: Optional[Tuple] = None,
+    include_trace: bool = False,
+    fields: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Run all pipeline stages for one booking request.
+
+    Stages stop at the first failure; the failing stage records its error in
+    results["stages"] and the response has success=False.
+
+    Args:
+        text: Booking request text
+        intent_resolver: ReservationIntentResolver instance
+        entity_file: Entity file used to locate global.v2.json
+        domain: "service" | "reservation"
+        timezone: Timezone for calendar binding
+        extraction_result: Precomputed stage 1 result (batch processing)
+        extraction_error: Precomputed stage 1 failure (batch processing)
+        include_timings: Add per-stage durations (ms) as "timings_ms"
+        cache_key: Result cache key for a precomputed extraction_result
+            (batch processing); stages 1-5 are stored under it on success
+        include_trace: Add the request's trace records as "trace"
+            (always on with ENABLE_TRACING)
+        fields: Stages to return in a successful response (None = all);
+            the others are never converted to dicts
+
+    Returns:
+        {"success": bool, "data": results, "clarification": {...}}
+        (clarification only on success)
+    """
+    timings = new_stage_timings()
+    with request_trace(include_trace or config.ENABLE_TRACING) as records:
+        response = _run_stages(
+            text, intent_resolver, entity_file, domain, timezone,
+            extraction_result, extraction_error, timings, cache_key)
+    stages = response["data"]["stages"]
+    response["data"]["stages"], serialized_ok = _serialize_stages(
+        stages, fields if response["success"] else None)
+    if response["success"] and not serialized_ok:
+        # Fails like a stage error: success=False, every stage returned
+        response = {"success": False, "data": response["data"]}
+        response["data"]["stages"], _ = _serialize_stages(stages, None)
+    if include_timings:
+        response["timings_ms"] = timings.to_dict()
+    if records is not None:
+        response["trace"] = records.to_list()
+    return response
+
+
+def _serialize_stages(
+    stages: Dict[str, Any],
+    fields: Optional[Sequence[str]]
+) -> Tuple[Dict[str, Any], bool]:
+    """
+    Convert the stage results in fields (None = all) to response dicts.
+
+    A stage whose serializer raises is replaced by {"error": ...} in stages
+    and in the result.
+
+    Returns:
+        (serialized stages, False if a serializer failed)
+    """
+    names = stages if fields is None else [name for name in fields if name in stages]
+    serialized = {}
+    ok = True
+    for name in names:
+        value = stages[name]
+        serializer = _STAGE_SERIALIZERS.get(name)
+        # Failed stages already hold {"error": ...}
+        if serializer is not None and not isinstance(value, dict):
+            try:
+                value = serializer(value)
+            except Exception as e:
+                value = stages[name] = {"error": str(e)}
+                ok = False
+        serialized[name] = value
+    return serialized, ok
+
+
+def _run_stages(
+    text: str,
+    intent_resolver,
+    entity_file: str,
+    domain: str,
+    timezone: str,
+    extraction_result: Optional[Dict[str, Any]],
+    extraction_error: Optional[Exception],
+    timings: StageTimings,
+    cache_key: Optional[Tuple]
+) -> Dict[str, Any]:
+    """
+    Stages 1-6 of process_booking, timed into `timings`.
+
+    results["stages"] holds the structure, semantic and calendar result
+    objects; process_booking converts the ones it returns.
+    """
+    now = localize_datetime(datetime.now(), timezone)
+
+    results = {
+        "input": {
+            "sentence": text,
+            "domain": domain,
+            "timezone": timezone,
+            "now": now.isoformat()
+        },
+        "stages": {}
+    }
+
+    # Stage 1: Entity Extraction (cached together with stages 3-5)
+    cached = None
+    try:
+        if extraction_error is not None:
+            raise extraction_error
+        if extraction_result is None:
+            matcher = get_entity_matcher(domain, entity_file)
+            with timings.stage("normalization"):
+                normalized, normalized_from_correction = matcher.normalize(text)
+            cache_key = result_cache_key(
+                matcher, normalized, normalized_from_correction, domain)
+            if cache_key is not None:
+                cached = result_cache.get(cache_key)
+                trace("extraction", "result_cache", hit=cached is not None)
+            if cached is not None:
+                extraction_result = cached.extraction
+            else:
+                extraction_result = matcher.extract_normalized(
+                    normalized, normalized_from_correction, timings=timings)
+        results["stages"]["extraction"] = extraction_result
+    except Exception as e:
+        results["stages"]["extraction"] = {"error": str(e)}
+        return {"success": False, "data": results}
+
+    # Stage 2: Intent Resolution
+    try:
+        with timings.stage("intent"):
+            intent, confidence = intent_resolver.resolve_intent(text, extraction_result)
+        results["stages"]["intent"] = {"intent": intent, "confidence": confidence}
+        trace("intent", "resolved", intent=intent, confidence=confidence)
+    except Exception as e:
+        results["stages"]["intent"] = {"error": str(e)}
+        return {"success": False, "data": results}
+
+    # Stages 3-5
+    if cached is not None:
+        results["stages"]["structure"] = cached.structure
+        results["stages"]["grouping"] = cached.grouping
+        semantic_result = cached.semantic_result
+        results["stages"]["semantic"] = semantic_result
+    else:
+        semantic_result = _resolve_booking(extraction_result, results, timings)
+        if semantic_result is None:
+            return {"success": False, "data": results}
+        if cache_key is not None:
+            result_cache.put(cache_key, CachedStages(
+                extraction=extraction_result,
+                structure=results["stages"]["structure"],
+                grouping=results["stages"]["grouping"],
+                semantic_result=semantic_result
+            ))
+
+    # Stage 6: Calendar Binding
+    try:
+        with timings.stage("calendar"):
+            calendar_result = bind_calendar(
+                semantic_result,
+                now,
+                timezone,
+                intent=intent,
+                entities=extraction_result
+            )
+        results["stages"]["calendar"] = calendar_result
+    except Exception as e:
+        results["stages"]["calendar"] = {"error": str(e)}
+        return {"success": False, "data": results}
+
+    return {
+        "success": True,
+        "data": results,
+        "clarification": build_clarification(semantic_result, calendar_result)
+    }
+
+
+def _resolve_booking(
+    extraction_result: Dict[str, Any],
+    results: Dict[str, Any],
+    timings: StageTimings
+):
+    """
+    Stages 3-5 (structure, grouping, semantic) into results["stages"]
+    (structure and semantic as result objects).
+
+    Returns:
+        SemanticResolutionResult, or None if a stage failed (its error is
+        recorded in results["stages"])
+    """
+    # Stage 3: Structural Interpretation
+    try:
+        psentence = extraction_result.get('psentence', '')
+        with timings.stage("structure"):
+            structure = interpret_structure(psentence, extraction_result)
+        results["stages"]["structure"] = structure
+    except Exception as e:
+        results["stages"]["structure"] = {"error": str(e)}
+        return None
+
+    # Stage 4: Appointment Grouping
+    try:
+        with timings.stage("grouping"):
+            grouped_result = group_appointment(extraction_result, structure)
+        results["stages"]["grouping"] = grouped_result
+    except Exception as e:
+        results["stages"]["grouping"] = {"error": str(e)}
+        return None
+
+    # Stage 5: Semantic Resolution
+    try:
+        with timings.stage("semantic"):
+            semantic_result = resolve_semantics(grouped_result, extraction_result)
+        results["stages"]["semantic"] = semantic_result
+    except Exception as e:
+        results["stages"]["semantic"] = {"error": str(e)}
+        return None
+
+    return semantic_result
+
+
+def result_cache_key(
+    matcher,
+    normalized: str,
+    normalized_from_correction: bool,
+    domain: str
+) -> Optional[Tuple]:
+    """
+    Result cache key for a normalized text, or None when caching is off.
+
+    Clears the cache first if the matcher's global config hash changed.
+    """
+    if not config.ENABLE_RESULT_CACHE:
+        return None
+    config_hash = matcher.global_config.content_hash
+    result_cache.bind_config(config_hash)
+    return stage_cache_key(normalized, normalized_from_correction, domain, config_hash)
+
+
+def process_booking_batch(
+    items: List[Any],
+    intent_resolver,
+    entity_file: str,
+    batch_size: int = 64,
+    n_process: int = 1,
+    include_timings: bool = False,
+    include_trace: bool = False,
+    fields: Optional[Sequence[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run the pipeline for many booking requests.
+
+    Items are grouped by domain and normalized once; their extraction runs
+    through EntityMatcher.extract_normalized_batch() (nlp.pipe), except for
+    texts whose stage results are already cached. The remaining stages run per item. Every
+    item gets its own response; invalid or failing items never fail the
+    batch.
+
+    Args:
+        items: List of {"text", "domain", "timezone"} dicts
+        intent_resolver: ReservationIntentResolver instance
+        entity_file: Entity file used to locate global.v2.json
+        batch_size: nlp.pipe batch size
+        n_process: nlp.pipe worker processes
+        include_timings: Add per-stage durations (ms) to each item response.
+            Batched extraction is not split per item, so only stages 2-6
+            are reported (and recorded in the stage histograms).
+        include_trace: Add each item's trace records as "trace"
+        fields: Stages to return in each successful item response (None = all)
+
+    Returns:
+        One response per item, in input order, each with its "index"
+    """
+    responses: List[Optional[Dict[str, Any]]] = [None] * len(items)
+
+    # Validate and group by domain
+    by_domain: Dict[str, List[int]] = {}
+    for index, item in enumerate(items):
+        error = validate_booking_item(item)
+        if error:
+            responses[index] = {"success": False, "error": error}
+            continue
+        by_domain.setdefault(item.get("domain", "service"), []).append(index)
+
+    # Stage 1 for each domain through nlp.pipe (cached texts skip it)
+    extractions: Dict[int, Any] = {}
+    cache_keys: Dict[int, Optional[Tuple]] = {}
+    for domain, indices in by_domain.items():
+        matcher = None
+        pending = []
+        try:
+            matcher = get_entity_matcher(domain, entity_file)
+            normalized_texts = []
+            for index in indices:
+                normalized = _normalize_batch_text(matcher, items[index]["text"])
+                key = _batch_cache_key(matcher, normalized, domain)
+                if key is not None and result_cache.contains(key):
+                    continue  # process_booking reads it from the cache
+                cache_keys[index] = key
+                pending.append(index)
+                normalized_texts.append(normalized)
+            batch = matcher.extract_normalized_batch(
+                normalized_texts,
+                batch_size=batch_size,
+                n_process=n_process
+            ) if pending else []
+        except Exception as e:  # noqa: BLE001
+            # Cached items are still answered; without a matcher, all fail
+            if matcher is None:
+                pending = indices
+            batch = [e] * len(pending)
+        extractions.update(zip(pending, batch))
+
+    # Stages 2-6 per item
+    for indices in by_domain.values():
+        for index in indices:
+            item = items[index]
+            extraction = extractions.get(index)
+            is_error = isinstance(extraction, Exception)
+            responses[index] = process_booking(
+                item["text"],
+                intent_resolver,
+                entity_file,
+                domain=item.get("domain", "service"),
+                timezone=item.get("timezone", "UTC"),
+                extraction_result=None if is_error else extraction,
+                extraction_error=extraction if is_error else None,
+                include_timings=include_timings,
+                cache_key=None if is_error else cache_keys.get(index),
+                include_trace=include_trace,
+                fields=fields
+            )
+
+    for index, response in enumerate(responses):
+        response["index"] = index
+    return responses
+
+
+def _normalize_batch_text(matcher, text: str) -> Any:
+    """matcher.normalize(text), or the exception it raised."""
+    try:
+        return matcher.normalize(text)
+    except Exception as e:  # noqa: BLE001 - extract_normalized_batch reports it
+        return e
+
+
+def _batch_cache_key(matcher, normalized: Any, domain: str) -> Optional[Tuple]:
+    """Result cache key for a _normalize_batch_text result (None if it failed)."""
+    if isinstance(normalized, Exception):
+        return None
+    return result_cache_key(matcher, *normalized, domain)
@@ -7,23 +7,17 @@ Decides what the user means without binding to actual calendar dates.
 This layer answers: "What does the user mean?"
 NOT: "What actual dates does this correspond to?"
 """
-# Provenance marker to verify loaded module version
-from ..extraction.vocabulary_normalization import (
-    load_vocabularies,
-    compile_vocabulary_maps,
-    normalize_vocabularies,
-)
-from ..extraction.entity_loading import (
-    load_global_vocabularies,
-    load_global_entity_types,
+from ..extraction.vocabulary_normalization import normalize_vocabularies
+from ..extraction.global_config import (
+    CompiledGlobalConfig,
+    load_compiled_global_config,
 )
 from ..clarification import Clarification, ClarificationReason
-from ..config import debug_print
+from ..tracing import trace
 import re
 from typing import Dict, Any, Optional, Tuple, Set, List
 from pathlib import Path
 from dataclasses import dataclass
-print("DEBUG: semantic_resolver loaded from", __file__)
 
 
 def _get_global_config_path() -> Path:
@@ -43,37 +37,30 @@ def _get_global_config_path() -> Path:
     return Path(__file__).parent.parent / "store" / "normalization" / "global.v2.json"
 
 
-# Lazy-loaded config (loaded on first use)
-_VOCAB_CACHE: Dict[str, Any] = {}
-# (synonym_map, typo_map, all_canonicals)
-_VOCAB_MAPS_CACHE: Tuple[Dict[str, str], Dict[str, str], Set[str]] = None
-_ENTITY_TYPES_CACHE: Dict[str, Any] = {}
+def _load_global_config() -> CompiledGlobalConfig:
+    """
+    The compiled global config, shared with the other stages.
+
+    load_compiled_global_config caches it and recompiles when the file's
+    mtime changes, so an edited global.v2.json reaches this stage too.
+    """
+    return load_compiled_global_config(_get_global_config_path())
 
 
 def _load_vocabularies() -> Dict[str, Any]:
-    """Load and cache vocabularies from JSON."""
-    if not _VOCAB_CACHE:
-        config_path = _get_global_config_path()
-        _VOCAB_CACHE.update(load_global_vocabularies(config_path))
-    return _VOCAB_CACHE
+    """Get global vocabularies from the compiled config."""
+    return _load_global_config().global_vocabularies
 
 
 def _load_entity_types() -> Dict[str, Any]:
-    """Load and cache entity_types from JSON."""
-    if not _ENTITY_TYPES_CACHE:
-        config_path = _get_global_config_path()
-        _ENTITY_TYPES_CACHE.update(load_global_entity_types(config_path))
-    return _ENTITY_TYPES_CACHE
+    """Get entity_types from the compiled config."""
+    return _load_global_config().entity_types
 
 
 def _load_vocabulary_maps() -> Tuple[Dict[str, str], Dict[str, str], Set[str]]:
-    """Load and cache vocabulary maps (synonyms and typos) from JSON."""
-    global _VOCAB_MAPS_CACHE
-    if _VOCAB_MAPS_CACHE is None:
-        config_path = _get_global_config_path()
-        vocabularies = load_vocabularies(config_path)
-        _VOCAB_MAPS_CACHE = compile_vocabulary_maps(vocabularies)
-    return _VOCAB_MAPS_CACHE
+    """Get compiled vocabulary maps (synonyms and typos)."""
+    config = _load_global_config()
+    return config.synonym_map, config.typo_map, config.all_canonicals
 
 
 @dataclass
@@ -558,12 +545,8 @@ def _resolve_date_semantics(
     Returns:
         Dict with "mode", "refs", and optional "needs_clarification" flag
     """
-    print(
-        "DEBUG[semantic]: enter _resolve_date_semantics "
-        f"keys={list(entities.keys())} "
-        f"osentence={entities.get('osentence')} "
-        f"psentence={entities.get('psentence')}"
-    )
+    trace("semantic", "date_semantics_input",
+          osentence=entities.get("osentence"), psentence=entities.get("psentence"))
     dates = entities.get("dates", [])
     dates_absolute = entities.get("dates_absolute", [])
 
@@ -575,22 +558,14 @@ def _resolve_date_semantics(
         for m in modifier_values
         if isinstance(m, str) and m.strip()
     ]
-    print(
-        "DEBUG[semantic]: modifier_values raw =",
-        modifier_values,
-        type(modifier_values)
-    )
     date_modifiers: List[str] = []
     if osentence and modifier_values:
         for mod in modifier_values:
             if isinstance(mod, str):
                 if re.search(rf"\b{re.escape(mod.lower())}\b", osentence):
                     date_modifiers.append(mod.lower())
-    print(
-        "DEBUG[semantic]: after modifiers "
-        f"sentence={osentence} "
-        f"date_modifiers={date_modifiers}"
-    )
+    trace("semantic", "date_modifiers",
+          modifier_values=modifier_values, date_modifiers=date_modifiers)
 
     # Normalize date texts (handle misspellings)
     normalized_dates = [_normalize_date_text(d.get("text", "")) for d in dates]
@@ -618,11 +593,8 @@ def _resolve_date_semantics(
             if _is_locale_ambiguous(date_text):
                 # Will be flagged in _check_ambiguity
                 pass
-            print(
-                "DEBUG[semantic]: RETURN ABSOLUTE_SINGLE "
-                f"date_refs={[normalized_absolute[0]]} "
-                f"date_modifiers={date_modifiers}"
-            )
+            trace("semantic", "date_rule", rule="ABSOLUTE_SINGLE",
+                  date_refs=[normalized_absolute[0]], date_modifiers=date_modifiers)
             return {
                 "mode": "single_day",
                 "refs": [normalized_absolute[0]],  # Use normalized text
@@ -631,11 +603,8 @@ def _resolve_date_semantics(
         elif len(dates_absolute) >= 2:
             # Multiple absolute dates → check for range marker
             if structure.get("date_type") == "range" or "between" in str(structure).lower() or "from" in str(structure).lower():
-                print(
-                    "DEBUG[semantic]: RETURN ABSOLUTE_RANGE "
-                    f"date_refs={normalized_absolute[:2]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="ABSOLUTE_RANGE",
+                      date_refs=normalized_absolute[:2], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",
                     "refs": normalized_absolute[:2],  # Use normalized text
@@ -643,11 +612,8 @@ def _resolve_date_semantics(
                 }
             else:
                 # Ambiguous - will be flagged
-                print(
-                    "DEBUG[semantic]: RETURN ABSOLUTE_RANGE_AMBIG "
-                    f"date_refs={normalized_absolute[:2]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="ABSOLUTE_RANGE_AMBIG",
+                      date_refs=normalized_absolute[:2], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",  # Default to range, but flag ambiguity
                     "refs": normalized_absolute[:2],  # Use normalized text
@@ -661,11 +627,8 @@ def _resolve_date_semantics(
 
             # Check for fine-grained modifiers (early/mid/end) → always range
             if _has_fine_grained_modifier(date_text):
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_FINE_GRAINED "
-                    f"date_refs={[normalized_dates[0]]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_FINE_GRAINED",
+                      date_refs=[normalized_dates[0]], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",
                     "refs": [normalized_dates[0]],  # Use normalized text
@@ -674,11 +637,8 @@ def _resolve_date_semantics(
 
             # Simple relative days → single_day
             if _is_simple_relative_day(date_text):
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_SIMPLE "
-                    f"date_refs={[normalized_dates[0]]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_SIMPLE",
+                      date_refs=[normalized_dates[0]], date_modifiers=date_modifiers)
                 return {
                     "mode": "single_day",
                     "refs": [normalized_dates[0]],  # Use normalized text
@@ -687,11 +647,8 @@ def _resolve_date_semantics(
 
             # Week-based → range
             if _is_week_based(date_text):
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_WEEK_BASED "
-                    f"date_refs={[normalized_dates[0]]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_WEEK_BASED",
+                      date_refs=[normalized_dates[0]], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",
                     "refs": [normalized_dates[0]],  # Use normalized text
@@ -700,11 +657,8 @@ def _resolve_date_semantics(
 
             # Weekend → range
             if _is_weekend_reference(date_text):
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_WEEKEND "
-                    f"date_refs={[normalized_dates[0]]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_WEEKEND",
+                      date_refs=[normalized_dates[0]], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",
                     "refs": [normalized_dates[0]],  # Use normalized text
@@ -713,11 +667,8 @@ def _resolve_date_semantics(
 
             # Specific weekday → single_day
             if _is_specific_weekday(date_text):
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_WEEKDAY "
-                    f"date_refs={[normalized_dates[0]]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_WEEKDAY",
+                      date_refs=[normalized_dates[0]], date_modifiers=date_modifiers)
                 return {
                     "mode": "single_day",
                     "refs": [normalized_dates[0]],  # Use normalized text
@@ -726,11 +677,8 @@ def _resolve_date_semantics(
 
             # Month-relative → range (full month)
             if _is_month_relative(date_text):
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_MONTH "
-                    f"date_refs={[normalized_dates[0]]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_MONTH",
+                      date_refs=[normalized_dates[0]], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",
                     "refs": [normalized_dates[0]],  # Use normalized text
@@ -738,11 +686,8 @@ def _resolve_date_semantics(
                 }
 
             # Default: single_day
-            print(
-                "DEBUG[semantic]: RETURN RELATIVE_DEFAULT "
-                f"date_refs={[normalized_dates[0]]} "
-                f"date_modifiers={date_modifiers}"
-            )
+            trace("semantic", "date_rule", rule="RELATIVE_DEFAULT",
+                  date_refs=[normalized_dates[0]], date_modifiers=date_modifiers)
             return {
                 "mode": "single_day",
                 "refs": [normalized_dates[0]],  # Use normalized text
@@ -751,11 +696,8 @@ def _resolve_date_semantics(
         elif len(dates) >= 2:
             # Multiple relative dates → check for range marker
             if structure.get("date_type") == "range" or "between" in str(structure).lower() or "from" in str(structure).lower():
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_MULTI_RANGE "
-                    f"date_refs={normalized_dates[:2]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_MULTI_RANGE",
+                      date_refs=normalized_dates[:2], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",
                     "refs": normalized_dates[:2],  # Use normalized text
@@ -763,11 +705,8 @@ def _resolve_date_semantics(
                 }
             else:
                 # Ambiguous - will be flagged
-                print(
-                    "DEBUG[semantic]: RETURN RELATIVE_MULTI_AMBIG "
-                    f"date_refs={normalized_dates[:2]} "
-                    f"date_modifiers={date_modifiers}"
-                )
+                trace("semantic", "date_rule", rule="RELATIVE_MULTI_AMBIG",
+                      date_refs=normalized_dates[:2], date_modifiers=date_modifiers)
                 return {
                     "mode": "range",  # Default to range, but flag ambiguity
                     "refs": normalized_dates[:2],  # Use normalized text
@@ -777,11 +716,8 @@ def _resolve_date_semantics(
     # Rule 4: Mixed absolute and relative
     if dates_absolute and dates:
         # Absolute takes precedence
-        print(
-            "DEBUG[semantic]: RETURN MIXED_ABSOLUTE_RELATIVE "
-            f"date_refs={[normalized_absolute[0]]} "
-            f"date_modifiers={date_modifiers}"
-        )
+        trace("semantic", "date_rule", rule="MIXED_ABSOLUTE_RELATIVE",
+              date_refs=[normalized_absolute[0]], date_modifiers=date_modifiers)
         return {
             "mode": "single_day",
             "refs": [normalized_absolute[0]],  # Use normalized text
@@ -789,11 +725,8 @@ def _resolve_date_semantics(
         }
 
     # Rule 5: No dates
-    print(
-        "DEBUG[semantic]: RETURN NO_DATES "
-        f"date_refs=[] "
-        f"date_modifiers={date_modifiers}"
-    )
+    trace("semantic", "date_rule", rule="NO_DATES",
+          date_refs=[], date_modifiers=date_modifiers)
     return {
         "mode": "flexible",
         "refs": [],
@@ -821,13 +754,9 @@ def _check_ambiguity(
     Returns:
         Clarification object or None
     """
-    debug_print(
-        "DEBUG[semantic]: enter _check_ambiguity "
-        f"osentence={entities.get('osentence')} "
-        f"psentence={entities.get('psentence')} "
-        f"date_refs={date_resolution.get('refs', [])} "
-        f"date_modifiers={date_resolution.get('modifiers', [])}"
-    )
+    trace("semantic", "check_ambiguity_input",
+          date_refs=date_resolution.get("refs", []),
+          date_modifiers=date_resolution.get("modifiers", []))
 
     dates = entities.get("dates", [])
     dates_absolute = entities.get("dates_absolute", [])
@@ -0,0 +1,159 @@
+"""
+Luma stage result cache
+
+Bounded LRU/TTL cache for the time-independent pipeline stages. Extraction,
+structure, grouping and semantic resolution depend only on the normalized
+text, so repeated utterances ("book haircut tomorrow at 2pm") reuse them.
+Intent resolution reads the raw sentence and calendar binding reads
+`now`/timezone, so both rerun on every request.
+
+Keys are (normalized text, normalized_from_correction, domain, global config
+hash). When the global.v2.json hash changes, the cache is cleared.
+
+Usage:
+    from luma.result_cache import result_cache
+
+    result_cache.stats()   # {"hits": ..., "misses": ..., "hit_rate": ..., ...}
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from luma.config import config
+
+
+@dataclass(frozen=True)
+class CachedStages:
+    """Outputs of the time-independent stages for one normalized text."""
+    extraction: Dict[str, Any]
+    structure: Any  # StructureResult
+    grouping: Dict[str, Any]
+    semantic_result: Any  # SemanticResolutionResult
+
+
+class LRUTTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after ttl_seconds.
+
+    Values are deep-copied on put and get, so callers can mutate what they
+    receive without corrupting the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 4096,
+        ttl_seconds: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._config_hash: Optional[str] = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value (a copy), or None on miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() >= entry[0]:
+                del self._entries[key]
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def contains(self, key: Hashable) -> bool:
+        """True if key has a live entry (does not count as a hit or miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and self._clock() < entry[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a copy of value, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def bind_config(self, config_hash: str) -> None:
+        """Clear the cache when the global config hash differs from the last one seen."""
+        with self._lock:
+            if config_hash == self._config_hash:
+                return
+            if self._config_hash is not None:
+                self._invalidations += 1
+            self._config_hash = config_hash
+            self._entries.clear()
+
+    def clear(self) -> None:
+        """Drop all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._config_hash = None
+            self._hits = self._misses = 0
+            self._evictions = self._expirations = self._invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit-rate and size statistics."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": config.ENABLE_RESULT_CACHE,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+            }
+
+    def render_prometheus(self) -> str:
+        """Statistics in the Prometheus text exposition format."""
+        stats = self.stats()
+        lines = []
+        for name in ("hits", "misses", "evictions", "expirations", "invalidations"):
+            metric = f"luma_result_cache_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {stats[name]}")
+        lines.append("# TYPE luma_result_cache_size gauge")
+        lines.append(f"luma_result_cache_size {stats['size']}")
+        return "\n".join(lines) + "\n"
+
+
+def stage_cache_key(
+    normalized: str,
+    normalized_from_correction: bool,
+    domain: str,
+    config_hash: str
+) -> Tuple[str, bool, str, str]:
+    """Cache key for the time-independent stages of one request."""
+    return (normalized, normalized_from_correction, domain, config_hash)
+
+
+# Global cache (per process)
+result_cache = LRUTTLCache(
+    maxsize=config.RESULT_CACHE_SIZE,
+    ttl_seconds=config.RESULT_CACHE_TTL_SECONDS
+)
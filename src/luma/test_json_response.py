@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test cases for response encoding and CalendarBindingResult serialization.
+"""
+import json
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # luma/
+src_dir = script_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.calendar.calendar_binder import CalendarBindingResult  # noqa: E402
+from luma.clarification import Clarification, ClarificationReason  # noqa: E402
+from luma.json_response import dumps  # noqa: E402
+
+
+def test_dumps_is_compact_utf8_json():
+    body = {"success": True, "data": {"input": {"sentence": "réserver demain"}}}
+    encoded = dumps(body)
+    assert isinstance(encoded, bytes)
+    assert b": " not in encoded and b", " not in encoded
+    assert json.loads(encoded) == body
+
+
+def test_dumps_emits_datetimes_natively():
+    aware = datetime(2025, 12, 17, 14, 0, tzinfo=timezone(timedelta(hours=-5)))
+    decoded = json.loads(dumps({
+        "naive": datetime(2025, 12, 17, 14, 0),
+        "aware": aware,
+        "date": date(2025, 12, 17),
+    }))
+    assert decoded == {
+        "naive": "2025-12-17T14:00:00+00:00",
+        "aware": "2025-12-17T14:00:00-05:00",
+        "date": "2025-12-17",
+    }
+
+
+def _legacy_to_dict(result):
+    """CalendarBindingResult.to_dict before the flat fast path."""
+    return {
+        "calendar_booking": result._serialize_value(result.calendar_booking),
+        "needs_clarification": result.needs_clarification,
+        "clarification": result.clarification.to_dict() if result.clarification else None,
+    }
+
+
+def test_calendar_result_to_dict_matches_recursive_walk():
+    bookings = [
+        {
+            "services": [{"text": "haircut", "canonical": "beauty.haircut", "span": [2, 3]}],
+            "date_range": {"start_date": "2025-12-17", "end_date": "2025-12-17"},
+            "time_range": {"start_time": "14:00", "end_time": "14:00"},
+            "datetime_range": {"start": "2025-12-17T14:00:00+00:00", "end": "2025-12-17T14:00:00+00:00"},
+            "duration": None,
+        },
+        {
+            "services": [],
+            "date_range": None,
+            "time_range": None,
+            "datetime_range": None,
+            "duration": {"minutes": 90, "unit": "minutes"},
+        },
+        {
+            # Values the binder never produces still take the recursive path
+            "services": [{"text": "massage", "canonical": None}, "massage"],
+            "date_range": {"start_date": datetime(2025, 12, 17, 9, 0), "end_date": None},
+            "datetime_range": {"start": "2025-12-17T09:00:00+00:00", "end": None},
+            "duration": 60,
+            "notes": ("extra", {"at": datetime(2025, 12, 17)}),
+        },
+    ]
+    for booking in bookings:
+        result = CalendarBindingResult(calendar_booking=booking)
+        assert result.to_dict() == _legacy_to_dict(result)
+
+    clarified = CalendarBindingResult(
+        calendar_booking=bookings[0],
+        needs_clarification=True,
+        clarification=Clarification(
+            reason=ClarificationReason.CONFLICTING_SIGNALS,
+            data={"validation_error": "end date before start date"}))
+    assert clarified.to_dict() == _legacy_to_dict(clarified)
+    assert json.loads(dumps(clarified.to_dict())) == clarified.to_dict()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test cases for the pipeline latency histograms and Prometheus rendering.
+"""
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # luma/
+src_dir = script_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.metrics import LatencyHistogram, MetricsRegistry, StageTimings, timed_stage  # noqa: E402
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = LatencyHistogram(buckets=(0.01, 0.1), window=100)
+    for ms in range(1, 101):
+        histogram.observe(ms / 1000)
+
+    snap = histogram.snapshot()
+    assert snap["count"] == 100
+    assert snap["buckets"] == [(0.01, 10), (0.1, 100)]
+    assert snap["quantiles"] == {0.5: 0.05, 0.95: 0.095, 0.99: 0.099}
+
+
+def test_quantile_window_keeps_recent_samples():
+    histogram = LatencyHistogram(window=10)
+    for _ in range(100):
+        histogram.observe(1.0)
+    for _ in range(10):
+        histogram.observe(0.001)
+
+    snap = histogram.snapshot()
+    assert snap["count"] == 110
+    assert snap["quantiles"][0.99] == 0.001
+
+
+def test_stage_timings_feed_registry_in_pipeline_order():
+    registry = MetricsRegistry()
+    timings = StageTimings(registry)
+    with timings.stage("calendar"):
+        pass
+    timings.record("normalization", 0.002)
+    with timed_stage(None, "spacy"):
+        pass
+
+    assert list(timings.to_dict()) == ["normalization", "calendar"]
+    assert timings.to_dict()["normalization"] == 2.0
+    assert list(registry.snapshot()["stages"]) == ["normalization", "calendar"]
+
+
+def test_render_prometheus():
+    registry = MetricsRegistry()
+    registry.observe_stage("intent", 0.003)
+    registry.observe_request("/book", 0.2)
+
+    text = registry.render_prometheus()
+    assert "# TYPE luma_stage_duration_seconds histogram" in text
+    assert 'luma_stage_duration_seconds_bucket{stage="intent",le="0.0025"} 0' in text
+    assert 'luma_stage_duration_seconds_bucket{stage="intent",le="0.005"} 1' in text
+    assert 'luma_stage_duration_seconds_bucket{stage="intent",le="+Inf"} 1' in text
+    assert 'luma_stage_duration_seconds_count{stage="intent"} 1' in text
+    assert 'luma_stage_duration_seconds_quantile{stage="intent",quantile="0.99"} 0.003' in text
+    assert 'luma_request_duration_seconds_count{endpoint="/book"} 1' in text
+    assert text.endswith("\n")
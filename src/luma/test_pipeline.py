@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+Test cases for the framework-free booking pipeline (batch processing).
+
+Uses a whitespace-tokenizing stand-in for spaCy so batching, ordering and
+per-item error isolation can be tested without spaCy models.
+"""
+import json
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # luma/
+src_dir = script_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.extraction.matcher_registry import (  # noqa: E402
+    get_entity_matcher,
+    clear_entity_matcher_registry,
+)
+from luma.pipeline import (  # noqa: E402
+    COMPACT_STAGES,
+    parse_batch_request,
+    parse_response_fields,
+    process_booking_batch,
+    validate_booking_item,
+)
+
+
+GLOBAL_CONFIG = {
+    "service_families": {
+        "beauty_and_wellness": {
+            "haircut": {"synonym": ["haircut", "hair cut"]}
+        }
+    },
+    "entity_types": {},
+    "normalization": {}
+}
+
+
+class _Token:
+    def __init__(self, text):
+        self.text = text
+
+
+class _Doc:
+    def __init__(self, text):
+        self.tokens = [_Token(t) for t in text.split()]
+        self.ents = []
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+
+class _WhitespaceNlp:
+    """Minimal nlp stand-in: whitespace tokens, no entities."""
+
+    def __init__(self):
+        self.pipe_calls = []
+
+    def __call__(self, text):
+        return _Doc(text)
+
+    def pipe(self, texts, batch_size=1, n_process=1):
+        texts = list(texts)
+        self.pipe_calls.append((len(texts), batch_size, n_process))
+        return (_Doc(text) for text in texts)
+
+
+class _StubIntentResolver:
+    def resolve_intent(self, text, extraction_result):
+        return "CREATE_BOOKING", "high"
+
+
+def _entity_file(tmp_path: Path) -> str:
+    (tmp_path / "global.v2.json").write_text(json.dumps(GLOBAL_CONFIG), encoding="utf-8")
+    entity_file = tmp_path / "101.v1.json"
+    entity_file.write_text("{}", encoding="utf-8")
+    return str(entity_file)
+
+
+def test_validate_booking_item():
+    assert validate_booking_item({"text": "book haircut"}) is None
+    assert validate_booking_item({}) == "Missing 'text' parameter in request body"
+    assert validate_booking_item({"text": ""}) == "'text' must be a non-empty string"
+    assert validate_booking_item("book haircut") is not None
+    assert validate_booking_item({"text": "book haircut", "domain": ["x"]}) == "'domain' must be a string"
+    assert validate_booking_item({"text": "book haircut", "timezone": {}}) == "'timezone' must be a string"
+
+
+def test_parse_batch_request():
+    batch, error = parse_batch_request({"items": [{"text": "book haircut"}], "batch_size": "8"})
+    assert error is None
+    assert batch["batch_size"] == 8 and batch["debug"] is False
+
+    assert parse_batch_request({"items": []}) == (None, "'items' must be a non-empty list")
+    assert parse_batch_request([{"text": "book haircut"}])[0] is None
+    assert parse_batch_request({"items": [{}], "n_process": 0})[0] is None
+    assert parse_batch_request({"items": [{}], "compact": True})[0]["fields"] == COMPACT_STAGES
+
+
+def test_parse_response_fields():
+    assert parse_response_fields({}) == (None, None)
+    assert parse_response_fields({"compact": True}) == (COMPACT_STAGES, None)
+    # Pipeline order, whatever the request order
+    assert parse_response_fields({"fields": ["calendar", "extraction"]}) == (("extraction", "calendar"), None)
+    assert parse_response_fields({"fields": []}) == ((), None)
+    assert parse_response_fields({"fields": "calendar"})[1] == "'fields' must be a list of stage names"
+    assert parse_response_fields({"fields": ["calendar", "nlp"]})[1].startswith("Unknown fields: nlp")
+
+
+def test_extract_batch_matches_single_extraction(tmp_path):
+    """nlp.pipe results equal per-text extraction, in input order."""
+    clear_entity_matcher_registry()
+    matcher = get_entity_matcher("service", _entity_file(tmp_path), lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    texts = ["book a hair cut", "haircut tomorrow please", "cancel"]
+    batch = matcher.extract_batch(texts, batch_size=2)
+
+    assert batch == [matcher.extract_with_parameterization(t) for t in texts]
+    assert matcher.nlp.pipe_calls == [(3, 2, 1)]
+
+
+def test_batch_normalizes_each_text_once(tmp_path, monkeypatch):
+    """The normalized text used for the cache key is the one extracted."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    from luma.result_cache import result_cache
+    result_cache.clear()
+    normalized = []
+    normalize = matcher.normalize
+
+    def counting_normalize(text):
+        normalized.append(text)
+        return normalize(text)
+
+    monkeypatch.setattr(matcher, "normalize", counting_normalize)
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+
+    texts = ["book haircut tomorrow", "book a hair cut"]
+    results = process_booking_batch([{"text": t} for t in texts], _StubIntentResolver(), entity_file)
+
+    assert [r["data"]["stages"]["extraction"] for r in results] == \
+        matcher.extract_batch(texts)
+    assert normalized == texts * 2  # once for the batch, once for extract_batch above
+
+
+def test_batch_isolates_failing_items(tmp_path, monkeypatch):
+    """Invalid items and unsupported domains fail alone; indices are preserved."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+
+    items = [
+        {"text": ""},
+        {"text": "book haircut", "domain": "unknown"},
+        {"text": "book haircut"},
+        {"text": "book haircut", "domain": ["x"]},
+    ]
+    results = process_booking_batch(items, _StubIntentResolver(), entity_file)
+
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert results[0] == {"success": False, "error": "'text' must be a non-empty string", "index": 0}
+    assert results[1]["success"] is False
+    assert "Unsupported domain" in results[1]["data"]["stages"]["extraction"]["error"]
+    # The valid item got through extraction and intent resolution
+    assert results[2]["data"]["stages"]["extraction"]["psentence"]
+    assert results[2]["data"]["stages"]["intent"]["intent"] == "CREATE_BOOKING"
+    # A non-hashable domain fails its own item, not the batch
+    assert results[3] == {"success": False, "error": "'domain' must be a string", "index": 3}
+
+
+def test_batch_extraction_failure_spares_cached_items(tmp_path, monkeypatch):
+    """Items answered from the result cache survive a failing nlp.pipe batch."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    from luma.result_cache import result_cache
+    result_cache.clear()
+
+    class _Calendar:
+        needs_clarification = False
+        clarification = None
+
+        def to_dict(self):
+            return {"calendar_booking": {"services": []}}
+
+    def failing_batch(*args, **kwargs):
+        raise RuntimeError("nlp.pipe failed")
+
+    monkeypatch.setattr(pipeline, "resolve_semantics", lambda grouped, extraction: _SemanticResult())
+    monkeypatch.setattr(pipeline, "bind_calendar", lambda *args, **kwargs: _Calendar())
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+    assert pipeline.process_booking("haircut today", _StubIntentResolver(), entity_file)["success"]
+    monkeypatch.setattr(matcher, "extract_normalized_batch", failing_batch)
+
+    results = process_booking_batch(
+        [{"text": "haircut today"}, {"text": "book a hair cut"}], _StubIntentResolver(), entity_file)
+
+    assert results[0]["success"] is True
+    assert results[1]["success"] is False
+    assert results[1]["data"]["stages"]["extraction"] == {"error": "nlp.pipe failed"}
+    result_cache.clear()
+
+
+def test_process_booking_reports_stage_timings(tmp_path, monkeypatch):
+    """include_timings returns per-stage ms and feeds the stage histograms."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    from luma.metrics import metrics
+    metrics.reset()
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+
+    response = pipeline.process_booking(
+        "book haircut tomorrow", _StubIntentResolver(), entity_file, include_timings=True)
+
+    stages = list(response["timings_ms"])
+    assert stages[:6] == [
+        "normalization", "spacy", "parameterization", "intent", "structure", "grouping"]
+    assert all(ms >= 0 for ms in response["timings_ms"].values())
+    assert set(metrics.snapshot()["stages"]) == set(stages)
+
+    # Timings are opt-in
+    assert "timings_ms" not in pipeline.process_booking(
+        "book haircut tomorrow", _StubIntentResolver(), entity_file)
+
+
+def test_process_booking_returns_trace(tmp_path, monkeypatch, capsys):
+    """include_trace returns structured stage records and prints nothing."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+    monkeypatch.setattr(pipeline.config, "DEBUG_ENABLED", False)
+
+    response = pipeline.process_booking(
+        "book haircut tomorrow", _StubIntentResolver(), entity_file, include_trace=True)
+
+    events = [(record["stage"], record["event"]) for record in response["trace"]]
+    assert ("intent", "resolved") in events
+    assert capsys.readouterr().err == ""
+
+    # Traces are opt-in
+    assert "trace" not in pipeline.process_booking(
+        "book haircut tomorrow", _StubIntentResolver(), entity_file)
+
+
+class _SemanticResult:
+    needs_clarification = False
+    clarification = None
+
+    def to_dict(self):
+        return {"resolved_booking": {"services": ["haircut"]}}
+
+
+def test_repeated_text_reuses_cached_stages(tmp_path, monkeypatch):
+    """Stages 1-5 are cached by normalized text; intent and calendar rerun."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    from luma.result_cache import result_cache
+    result_cache.clear()
+    calls = {"extract": 0, "semantic": 0, "calendar": 0}
+    extract_normalized = matcher.extract_normalized
+
+    def counting_extract(*args, **kwargs):
+        calls["extract"] += 1
+        return extract_normalized(*args, **kwargs)
+
+    def fake_semantics(grouped, extraction):
+        calls["semantic"] += 1
+        return _SemanticResult()
+
+    class _Calendar:
+        needs_clarification = False
+        clarification = None
+
+        def to_dict(self):
+            return {"calendar_booking": {"now": calls["calendar"]}}
+
+    def fake_calendar(semantic_result, now, timezone, intent=None, entities=None):
+        calls["calendar"] += 1
+        return _Calendar()
+
+    monkeypatch.setattr(matcher, "extract_normalized", counting_extract)
+    monkeypatch.setattr(pipeline, "resolve_semantics", fake_semantics)
+    monkeypatch.setattr(pipeline, "bind_calendar", fake_calendar)
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+
+    first = pipeline.process_booking("book haircut tomorrow", _StubIntentResolver(), entity_file)
+    second = pipeline.process_booking("Book  HAIRCUT tomorrow", _StubIntentResolver(), entity_file)
+
+    assert first["success"] and second["success"]
+    assert calls == {"extract": 1, "semantic": 1, "calendar": 2}
+    for stage in ("extraction", "intent", "structure", "grouping", "semantic"):
+        assert second["data"]["stages"][stage] == first["data"]["stages"][stage]
+    assert second["data"]["input"]["sentence"] == "Book  HAIRCUT tomorrow"
+    assert result_cache.stats()["hits"] == 1
+
+    # Batch items reuse the same entries and skip nlp.pipe
+    results = process_booking_batch([{"text": "book haircut tomorrow"}], _StubIntentResolver(), entity_file)
+    assert results[0]["success"]
+    assert matcher.nlp.pipe_calls == []
+    assert calls["extract"] == 1
+
+
+def test_fields_select_and_skip_stage_serialization(tmp_path, monkeypatch):
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    from luma.result_cache import result_cache
+    result_cache.clear()
+    serialized = []
+
+    class _Semantic(_SemanticResult):
+        def to_dict(self):
+            serialized.append("semantic")
+            return super().to_dict()
+
+    class _Calendar:
+        needs_clarification = False
+        clarification = None
+
+        def to_dict(self):
+            serialized.append("calendar")
+            return {"calendar_booking": {"services": []}}
+
+    monkeypatch.setattr(pipeline, "resolve_semantics", lambda grouped, extraction: _Semantic())
+    monkeypatch.setattr(pipeline, "bind_calendar", lambda *args, **kwargs: _Calendar())
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+
+    full = pipeline.process_booking("book haircut tomorrow", _StubIntentResolver(), entity_file)
+    assert list(full["data"]["stages"]) == list(pipeline.RESPONSE_STAGES)
+    assert serialized == ["semantic", "calendar"]
+
+    serialized.clear()
+    compact = pipeline.process_booking(
+        "book haircut tomorrow", _StubIntentResolver(), entity_file, fields=COMPACT_STAGES)
+
+    assert list(compact["data"]["stages"]) == list(COMPACT_STAGES)
+    for stage in COMPACT_STAGES:
+        assert compact["data"]["stages"][stage] == full["data"]["stages"][stage]
+    assert compact["clarification"] == full["clarification"]
+    assert serialized == ["calendar"]
+
+    results = process_booking_batch(
+        [{"text": "book haircut tomorrow"}, {}], _StubIntentResolver(), entity_file, fields=("calendar",))
+    assert list(results[0]["data"]["stages"]) == ["calendar"]
+    assert not results[1]["success"]
+
+
+def test_serialization_failure_is_a_stage_error(tmp_path, monkeypatch):
+    """A serializer that raises fails its own item, not the batch."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    from luma.result_cache import result_cache
+    result_cache.clear()
+
+    class _Calendar:
+        needs_clarification = False
+        clarification = None
+
+        def to_dict(self):
+            raise ValueError("cannot serialize")
+
+    monkeypatch.setattr(pipeline, "resolve_semantics", lambda grouped, extraction: _SemanticResult())
+    monkeypatch.setattr(pipeline, "bind_calendar", lambda *args, **kwargs: _Calendar())
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+
+    results = process_booking_batch(
+        [{"text": "book haircut tomorrow"}, {"text": "book haircut"}],
+        _StubIntentResolver(), entity_file, fields=COMPACT_STAGES)
+
+    assert [r["index"] for r in results] == [0, 1]
+    for result in results:
+        assert result["success"] is False
+        assert "clarification" not in result
+        assert result["data"]["stages"]["calendar"] == {"error": "cannot serialize"}
+        # Like other failures, every stage is returned
+        assert list(result["data"]["stages"]) == list(pipeline.RESPONSE_STAGES)
+
+
+def test_process_booking_ignores_non_string_timezone(tmp_path, monkeypatch):
+    """A bad timezone value falls back like an unknown name instead of raising."""
+    clear_entity_matcher_registry()
+    entity_file = _entity_file(tmp_path)
+    matcher = get_entity_matcher("service", entity_file, lazy_load_spacy=True)
+    matcher.nlp = _WhitespaceNlp()
+
+    import luma.pipeline as pipeline
+    monkeypatch.setattr(
+        pipeline, "get_entity_matcher",
+        lambda domain, entity_file: get_entity_matcher(domain, entity_file, lazy_load_spacy=True))
+
+    response = pipeline.process_booking(
+        "book haircut", _StubIntentResolver(), entity_file, timezone=["UTC"])
+    assert response["data"]["stages"]["intent"]["intent"] == "CREATE_BOOKING"
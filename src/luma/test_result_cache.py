@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test cases for the LRU/TTL stage result cache.
+"""
+import sys
+from pathlib import Path
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # luma/
+src_dir = script_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.result_cache import LRUTTLCache, stage_cache_key  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_hit_rate():
+    cache = LRUTTLCache(maxsize=2, ttl_seconds=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (2, 1, 0.6667)
+
+
+def test_entries_expire_after_ttl():
+    clock = _Clock()
+    cache = LRUTTLCache(maxsize=10, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 4.9
+    assert cache.contains("a")
+    clock.now = 5.0
+    assert not cache.contains("a")
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_values_are_isolated_from_callers():
+    cache = LRUTTLCache()
+    value = {"services": ["haircut"]}
+    cache.put("a", value)
+    value["services"].append("massage")
+
+    first = cache.get("a")
+    first["services"].clear()
+    assert cache.get("a") == {"services": ["haircut"]}
+
+
+def test_config_change_invalidates():
+    cache = LRUTTLCache()
+    cache.bind_config("hash-1")
+    cache.put(stage_cache_key("book haircut", False, "service", "hash-1"), 1)
+    cache.bind_config("hash-1")
+    assert cache.stats()["size"] == 1
+
+    cache.bind_config("hash-2")
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 1
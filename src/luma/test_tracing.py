@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test cases for per-request pipeline tracing.
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # luma/
+src_dir = script_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.config import config  # noqa: E402
+from luma.tracing import RequestTrace, request_trace, trace  # noqa: E402
+
+
+def test_trace_is_a_silent_noop_without_active_trace(monkeypatch, capsys):
+    monkeypatch.setattr(config, "DEBUG_ENABLED", False)
+    trace("calendar", "dates_bound", date_range={"start_date": "2025-12-17"})
+    captured = capsys.readouterr()
+    assert captured.out == "" and captured.err == ""
+
+
+def test_request_trace_collects_records_in_order():
+    with request_trace() as records:
+        trace("intent", "resolved", intent="CREATE_BOOKING")
+        trace("calendar", "dates_bound", date_range=None)
+
+    assert [(r["stage"], r["event"]) for r in records.to_list()] == [
+        ("intent", "resolved"), ("calendar", "dates_bound")]
+    assert records.to_list()[0]["intent"] == "CREATE_BOOKING"
+    assert all(r["t_ms"] >= 0 for r in records.to_list())
+
+    # Records stop at the end of the block
+    trace("intent", "resolved", intent="IGNORED")
+    assert len(records.to_list()) == 2
+
+
+def test_request_trace_disabled_yields_none():
+    with request_trace(enabled=False) as records:
+        trace("intent", "resolved", intent="CREATE_BOOKING")
+    assert records is None
+
+
+def test_nested_traces_are_isolated():
+    with request_trace() as outer:
+        trace("pipeline", "outer")
+        with request_trace() as inner:
+            trace("pipeline", "inner")
+        trace("pipeline", "outer_again")
+
+    assert [r["event"] for r in outer.to_list()] == ["outer", "outer_again"]
+    assert [r["event"] for r in inner.to_list()] == ["inner"]
+
+
+def test_records_are_bounded():
+    records = RequestTrace(max_records=2)
+    for i in range(5):
+        records.add("semantic", "date_rule", {"i": i})
+    assert records.to_list()[-1] == {"stage": "trace", "event": "dropped", "count": 3}
+    assert len(records.to_list()) == 3
+
+
+def test_debug_mode_prints_through_debug_print(monkeypatch, capsys):
+    monkeypatch.setattr(config, "DEBUG_ENABLED", True)
+    trace("calendar", "times_bound", time_range=None)
+    assert "DEBUG[calendar]: times_bound" in capsys.readouterr().out
+
+
+def test_bind_calendar_traces_instead_of_printing(monkeypatch, capsys):
+    from luma.calendar.calendar_binder import bind_calendar
+
+    class _Semantic:
+        needs_clarification = False
+        clarification = None
+        resolved_booking = {"services": []}
+
+    monkeypatch.setattr(config, "DEBUG_ENABLED", False)
+    with request_trace() as records:
+        bind_calendar(_Semantic(), datetime(2025, 12, 16, 10, 0), intent="GREETING")
+
+    assert records.to_list()[0]["event"] == "intent_guard_skipped"
+    assert records.to_list()[0]["intent"] == "GREETING"
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test cases for the bounded worker pool used by the ASGI server.
+"""
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+# Add src directory to path for imports
+script_dir = Path(__file__).parent.resolve()  # luma/
+src_dir = script_dir.parent  # src/
+
+src_path = str(src_dir)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from luma.worker_pool import BoundedWorkerPool, PoolSaturated  # noqa: E402
+
+
+def _fail():
+    raise ValueError("boom")
+
+
+def _die():
+    os._exit(1)
+
+
+def test_process_mode_runs_in_worker_processes():
+    pool = BoundedWorkerPool(processes=2, max_pending=4)
+    pool.start()
+    try:
+        pid = asyncio.run(pool.run(os.getpid))
+    finally:
+        pool.shutdown()
+
+    assert pid != os.getpid()
+    assert pool.stats()["completed"] == 1
+
+
+def test_dead_worker_re_forks_the_pool():
+    pool = BoundedWorkerPool(processes=1, max_pending=4)
+    pool.start()
+    try:
+        with pytest.raises(BrokenProcessPool):
+            asyncio.run(pool.run(_die))
+        assert not pool.broken
+        # The next job runs on a fresh worker
+        pid = asyncio.run(pool.run(os.getpid))
+    finally:
+        pool.shutdown()
+
+    assert pid != os.getpid()
+    stats = pool.stats()
+    assert stats["restarts"] == 1
+    assert stats["failed"] == 1 and stats["completed"] == 1
+
+
+def test_broken_pool_is_reported_until_restarted():
+    pool = BoundedWorkerPool(processes=1, max_pending=4)
+    pool.start()
+    try:
+        future = pool._executor.submit(_die)
+        with pytest.raises(BrokenProcessPool):
+            future.result(timeout=10)
+        assert pool.broken and pool.stats()["broken"]
+        pool.restart()
+        assert not pool.broken
+        assert asyncio.run(pool.run(pow, 2, 3)) == 8
+    finally:
+        pool.shutdown()
+
+
+def test_thread_mode_runs_without_processes():
+    pool = BoundedWorkerPool(processes=0, max_pending=4)
+    pool.start()
+    assert asyncio.run(pool.run(pow, 2, 10)) == 1024
+    assert pool.stats()["mode"] == "threads"
+
+
+def test_saturated_pool_rejects_new_jobs():
+    pool = BoundedWorkerPool(processes=0, max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        first = asyncio.ensure_future(pool.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        assert pool.stats()["pending"] == 1
+        with pytest.raises(PoolSaturated):
+            await pool.run(pow, 2, 2)
+        release.set()
+        return await first
+
+    assert asyncio.run(scenario()) is True
+    stats = pool.stats()
+    assert stats["rejected"] == 1
+    assert stats["pending"] == 0 and stats["completed"] == 1
+
+
+def test_failed_jobs_are_counted_and_reraised():
+    pool = BoundedWorkerPool(processes=0, max_pending=2)
+    with pytest.raises(ValueError):
+        asyncio.run(pool.run(_fail))
+    assert pool.stats()["failed"] == 1
+    assert pool.stats()["pending"] == 0
+
+
+def test_render_prometheus():
+    text = BoundedWorkerPool(processes=2, max_pending=8).render_prometheus()
+    assert "# TYPE luma_worker_pool_pending gauge" in text
+    assert "luma_worker_pool_max_pending 8" in text
+    assert "luma_worker_pool_rejected_total 0" in text
+
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        BoundedWorkerPool(processes=-1, max_pending=4)
+    with pytest.raises(ValueError):
+        BoundedWorkerPool(processes=1, max_pending=0)
@@ -0,0 +1,92 @@
+"""
+Luma pipeline tracing
+
+Per-request structured trace records (stage inputs, decisions and outputs)
+that can be returned with the response instead of being printed.
+
+A trace is active only inside `request_trace()`. Outside of one, `trace()`
+is a context-variable read and a return: no formatting, no I/O. Call sites
+pass values the stage has already computed; don't build fields only for
+the trace.
+
+With DEBUG_NLP=1 and no active trace, records are printed through
+debug_print (the CLI and local debugging behaviour).
+
+Usage:
+    from luma.tracing import request_trace, trace
+
+    with request_trace() as records:
+        trace("calendar", "dates_bound", date_range=date_range)
+    records.to_list()   # [{"stage": "calendar", "event": "dates_bound", ...}]
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from luma.config import config, debug_print
+
+
+# Records kept per request (a runaway loop must not grow a response unbounded)
+MAX_RECORDS = 512
+
+
+class RequestTrace:
+    """Trace records collected for one request."""
+
+    def __init__(self, max_records: int = MAX_RECORDS):
+        self.max_records = max_records
+        self.records: List[Dict[str, Any]] = []
+        self.dropped = 0
+        self._start = time.perf_counter()
+
+    def add(self, stage: str, event: str, fields: Dict[str, Any]) -> None:
+        """Append one record, stamped with ms since the trace started."""
+        if len(self.records) >= self.max_records:
+            self.dropped += 1
+            return
+        record = {
+            "stage": stage,
+            "event": event,
+            "t_ms": round((time.perf_counter() - self._start) * 1000, 3),
+        }
+        record.update(fields)
+        self.records.append(record)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Records in emission order (plus a marker if some were dropped)."""
+        if not self.dropped:
+            return list(self.records)
+        return self.records + [{"stage": "trace", "event": "dropped", "count": self.dropped}]
+
+
+_current_trace: ContextVar[Optional[RequestTrace]] = ContextVar(
+    "luma_request_trace", default=None)
+
+
+def trace(stage: str, event: str, **fields: Any) -> None:
+    """Record a trace event for the current request (no-op when inactive)."""
+    current = _current_trace.get()
+    if current is not None:
+        current.add(stage, event, fields)
+    elif config.DEBUG_ENABLED:
+        debug_print(f"DEBUG[{stage}]: {event} {fields}")
+
+
+@contextmanager
+def request_trace(enabled: bool = True) -> Iterator[Optional[RequestTrace]]:
+    """
+    Collect trace records for the enclosed block.
+
+    Yields:
+        The RequestTrace, or None when enabled is False
+    """
+    if not enabled:
+        yield None
+        return
+    current = RequestTrace()
+    token = _current_trace.set(current)
+    try:
+        yield current
+    finally:
+        _current_trace.reset(token)
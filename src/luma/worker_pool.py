@@ -0,0 +1,180 @@
+"""
+Luma bounded worker pool
+
+Runs CPU-bound pipeline work off the asyncio event loop on a fixed set of
+worker processes, with backpressure.
+
+Workers are forked after the parent has loaded the spaCy pipelines and
+entity matchers, so they share that memory copy-on-write instead of
+loading a model each. With processes=0 the work runs on the event loop's
+default thread pool instead (development, platforms without fork).
+
+At most max_pending jobs may be queued or running; beyond that run()
+raises PoolSaturated and the caller answers 503 instead of queueing
+without bound.
+
+If a worker process dies (OOM kill, crash in native code) the executor
+is broken for good: its jobs fail with BrokenProcessPool. run() then forks
+a fresh set of workers, and `broken` reports the state to /health until
+that succeeds.
+
+Usage:
+    pool = BoundedWorkerPool(processes=4, max_pending=64)
+    pool.start()                       # fork now, after models are loaded
+    result = await pool.run(fn, arg)   # raises PoolSaturated when full
+    pool.render_prometheus()
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+
+class PoolSaturated(Exception):
+    """Raised when a BoundedWorkerPool already has max_pending jobs."""
+
+
+class BoundedWorkerPool:
+    """
+    Process pool with a pending-job limit and queue-depth counters.
+
+    run() and the counters are used from the event loop thread only.
+    """
+
+    def __init__(self, processes: int, max_pending: int):
+        if processes < 0:
+            raise ValueError(f"processes must be >= 0, got {processes}")
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be >= 1, got {max_pending}")
+        self.processes = processes
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._restarts = 0
+
+    @property
+    def uses_processes(self) -> bool:
+        """True if jobs run in forked worker processes."""
+        return self.processes > 0
+
+    def start(self) -> None:
+        """
+        Fork the worker processes now (call after models are loaded).
+
+        Uses the fork start method where available so workers inherit the
+        loaded pipelines; elsewhere workers start fresh and load lazily.
+        """
+        if not self.uses_processes or self._executor is not None:
+            return
+        self._executor = self._create_executor()
+        # One no-op per worker forces every process to start up front
+        for future in [self._executor.submit(os.getpid) for _ in range(self.processes)]:
+            future.result()
+
+    def _create_executor(self) -> Executor:
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        return ProcessPoolExecutor(max_workers=self.processes, mp_context=context)
+
+    @property
+    def broken(self) -> bool:
+        """True if a worker process died and the pool has not been re-forked yet."""
+        # ProcessPoolExecutor sets _broken once a worker exits unexpectedly
+        return bool(getattr(self._executor, "_broken", False))
+
+    def restart(self, broken: Optional[Executor] = None) -> None:
+        """
+        Replace the executor with freshly forked workers.
+
+        Args:
+            broken: The executor a job found broken; nothing is done if it
+                was already replaced
+        """
+        if broken is not None and broken is not self._executor:
+            return
+        old = self._executor
+        # If forking fails the broken executor stays, so `broken` stays True
+        self._executor = self._create_executor()
+        self._restarts += 1
+        if old is not None:
+            old.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) on the pool and await its result.
+
+        Raises:
+            PoolSaturated: If max_pending jobs are already queued or running
+        """
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise PoolSaturated(
+                f"Worker pool is full ({self._pending} pending, max {self.max_pending})")
+
+        if self.broken:
+            self.restart()
+
+        self._pending += 1
+        self._submitted += 1
+        loop = asyncio.get_running_loop()
+        executor = self._executor
+        try:
+            result = await loop.run_in_executor(executor, functools.partial(fn, *args))
+        except BrokenProcessPool:
+            self._failed += 1
+            # A worker died: this executor can never run another job
+            self.restart(executor)
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+        self._completed += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and job counters."""
+        workers = self.processes if self.uses_processes else None
+        running = min(self._pending, workers) if workers else self._pending
+        return {
+            "mode": "processes" if self.uses_processes else "threads",
+            "processes": self.processes,
+            "max_pending": self.max_pending,
+            "pending": self._pending,
+            "running": running,
+            "queued": self._pending - running,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "restarts": self._restarts,
+            "broken": self.broken,
+        }
+
+    def render_prometheus(self) -> str:
+        """Queue depth and job counters in the Prometheus text exposition format."""
+        stats = self.stats()
+        lines = []
+        for name in ("pending", "running", "queued", "max_pending"):
+            metric = f"luma_worker_pool_{name}"
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {stats[name]}")
+        for name in ("submitted", "completed", "failed", "rejected", "restarts"):
+            metric = f"luma_worker_pool_{name}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {stats[name]}")
+        return "\n".join(lines) + "\n"